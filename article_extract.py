@@ -0,0 +1,251 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Article HTML → fields extraction (BeautifulSoup / lxml).
+
+Shared by the orchestrator (``article_fetcher``) and by the fetcher worker
+subprocesses (``cffi_worker`` / ``requests_worker`` / ``playwright_worker``).
+Workers import this module lazily, only when a request asks for
+worker-side extraction, so a plain raw-HTML worker never pays for bs4.
+
+Worker-side extraction
+----------------------
+A request's *options* dict may carry:
+
+  ``extract``   (bool) — parse the page inside the worker and return
+                         ``fields`` + ``has_content`` instead of the HTML.
+  ``raw_html``  (bool) — with ``extract``, also keep ``html`` in the result
+                         (debugging / callers that need the page itself).
+
+``apply_worker_options(result, url, options)`` implements both flags so the
+three workers stay identical.
+"""
+
+import logging
+import re
+
+from bs4 import BeautifulSoup
+
+logger = logging.getLogger(__name__)
+
+__all__ = [
+    "apply_worker_options",
+    "html_has_content",
+    "is_paywall_content",
+    "parse_and_extract",
+    "parse_html",
+    "soup_to_fields",
+]
+
+
+
+def html_has_content(html: str | None) -> bool:
+    """Quick heuristic: ≥2 real paragraphs → page has readable content.
+
+    Uses regex instead of BeautifulSoup so we can scan the FULL HTML without
+    the 15 KB truncation that caused false negatives on large news pages
+    (BBC, IndiaToday, FoxNews, etc.) where article text starts after 30-50 KB
+    of <head>, scripts and navigation markup.
+
+    NOTE: CPU-bound (DOTALL regex on raw HTML). Call via
+    ``await loop.run_in_executor(None, html_has_content, html)``
+    when inside an async context.
+    """
+    if not html:
+        return False
+    count = 0
+    for m in re.finditer(r'<p[^>]*>(.*?)</p>', html, re.S | re.I):
+        if len(re.sub(r'<[^>]+>', '', m.group(1)).strip()) > 50:
+            count += 1
+            if count >= 2:
+                return True
+    return False
+
+
+def parse_and_extract(html: str, url: str) -> dict | None:
+    """Parse HTML and extract article fields in one executor-friendly call.
+
+    Combines ``parse_html`` + ``soup_to_fields`` so both CPU-bound steps
+    run in the thread-pool executor without returning a BeautifulSoup object
+    (which is not safe to pass between threads).
+    """
+    soup = parse_html(html, url)
+    if soup is None:
+        return None
+    return soup_to_fields(soup)
+
+
+def parse_html(html: str, url: str = '') -> 'BeautifulSoup | None':
+    for parser in ('lxml', 'html.parser'):
+        try:
+            return BeautifulSoup(html, parser)
+        except Exception as e:
+            if parser == 'html.parser':
+                logger.debug("All HTML parsers failed for %s: %s", url, e)
+    return None
+
+
+def _extract_author(soup) -> str | None:
+    for meta_attr in [
+        {'property': 'article:author'},
+        {'name': 'author'},
+        {'property': 'og:article:author'},
+    ]:
+        tag = soup.find('meta', attrs=meta_attr)
+        if tag and tag.get('content'):
+            return tag.get('content').strip()
+    author_tag = soup.find(attrs={'itemprop': 'author'})
+    if author_tag:
+        name_tag = author_tag.find(attrs={'itemprop': 'name'})
+        if name_tag:
+            return name_tag.get_text().strip()
+        return author_tag.get_text().strip()
+    for class_name in ['author', 'article-author', 'byline', 'author-name']:
+        tag = soup.find(class_=re.compile(class_name, re.I))
+        if tag:
+            text = re.sub(r'^by\s+', '', tag.get_text().strip(), flags=re.I)
+            if text and len(text) < 100:
+                return text
+    return None
+
+
+def _extract_time(soup) -> str | None:
+    for meta_attr in [
+        {'property': 'article:published_time'},
+        {'name': 'publishdate'},
+        {'property': 'og:published_time'},
+        {'name': 'date'},
+    ]:
+        tag = soup.find('meta', attrs=meta_attr)
+        if tag and tag.get('content'):
+            return tag.get('content').strip()
+    time_tag = soup.find('time')
+    if time_tag:
+        return time_tag.get('datetime') or time_tag.get_text().strip()
+    time_tag = soup.find(attrs={'itemprop': 'datePublished'})
+    if time_tag:
+        return time_tag.get('content') or time_tag.get_text().strip()
+    return None
+
+
+def _extract_description(soup) -> str | None:
+    og = soup.find('meta', property='og:description')
+    if og and og.get('content'):
+        return og.get('content').strip()
+    meta = soup.find('meta', attrs={'name': 'description'})
+    if meta and meta.get('content'):
+        return meta.get('content').strip()
+    for class_name in ['article-summary', 'article-lead', 'lead', 'summary', 'article-description']:
+        tag = soup.find(class_=re.compile(class_name, re.I))
+        if tag:
+            text = tag.get_text().strip()
+            if len(text) > 20:
+                return text
+    return None
+
+
+def _extract_content(soup) -> str | None:
+    paragraphs = []
+    for selector in [
+        {'class_': re.compile(r'article-content|article-body|entry-content|post-content', re.I)},
+        {'attrs': {'itemprop': 'articleBody'}},
+        {'name': 'article'},
+    ]:
+        container = soup.find(**selector)
+        if container:
+            p_tags = container.find_all('p', recursive=True)
+            paragraphs = [p.get_text().strip() for p in p_tags
+                          if len(p.get_text().strip()) > 30]
+            if paragraphs:
+                break
+    if not paragraphs:
+        paragraphs = [p.get_text().strip() for p in soup.find_all('p')
+                      if len(p.get_text().strip()) > 50]
+    if paragraphs:
+        return '\n\n'.join(paragraphs)[:50000]
+    return None
+
+
+_PAYWALL_PHRASES = (
+    'subscribe now to read',
+    'subscribe to read',
+    'subscribe to continue',
+    'subscribe for full access',
+    'you can save this article by registering',
+    'sign in to read',
+    'sign up to read',
+    'create a free account to read',
+    'create an account to read',
+    'log in to read',
+    'login to read',
+    'to read this article',
+    'to continue reading',
+    'unlock this article',
+    'already a subscriber',
+    'become a subscriber',
+    'purchase a subscription',
+)
+
+
+def is_paywall_content(text: str | None) -> bool:
+    """Return True if the text appears to be a paywall / subscription gate."""
+    if not text:
+        return False
+    sample = text[:600].lower()
+    return any(phrase in sample for phrase in _PAYWALL_PHRASES)
+
+
+def soup_to_fields(soup) -> dict:
+    content = _extract_content(soup)
+    description = _extract_description(soup)
+    paywall = is_paywall_content(content) or is_paywall_content(description)
+    if paywall:
+        logger.debug("[fetch] paywall content detected — discarding")
+        content = None
+        description = None
+    return {
+        'author':         _extract_author(soup),
+        'published_time': _extract_time(soup),
+        'description':    description,
+        'content':        content,
+        '_paywall':       paywall,
+    }
+
+
+# ---------------------------------------------------------------------------
+# Worker-side extraction
+# ---------------------------------------------------------------------------
+
+def apply_worker_options(result: dict, url: str, options: dict | None) -> dict:
+    """
+    Post-process a worker ``_fetch()`` result according to *options*.
+
+    With ``options['extract']`` a successful result gains:
+
+      ``fields``       — ``parse_and_extract()`` output (or None on parse failure)
+      ``has_content``  — ``html_has_content()`` of the page
+      ``html_len``     — size of the page that was parsed (chars)
+
+    and ``html`` is dropped unless ``options['raw_html']`` is also set, so
+    only a few KB cross the process boundary instead of the whole page.
+    Without ``extract`` the result is returned unchanged (raw-HTML protocol).
+    """
+    opts = options or {}
+    if not opts.get('extract'):
+        return result
+    html = result.get('html')
+    if result.get('success') and html:
+        try:
+            result['fields'] = parse_and_extract(html, url)
+        except Exception as e:
+            logger.debug("Worker-side extraction failed for %s: %s", url, e)
+            result['fields'] = None
+        result['has_content'] = html_has_content(html)
+        result['html_len']    = len(html)
+    else:
+        result['fields']      = None
+        result['has_content'] = False
+        result['html_len']    = 0
+    if not opts.get('raw_html'):
+        result['html'] = None
+    return result
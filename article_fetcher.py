@@ -20,6 +20,8 @@ Orchestration logic (fetch())
        b. primary had a temporary error (network/timeout)
        c. primary succeeded but returned a JS skeleton with no real content
   3. Parse HTML  →  extract author/time/description/content
+     (done inside the worker process — see article_extract; only the
+     extracted fields cross the queue unless ``raw_html`` is requested)
 
 Public API
 ----------
@@ -38,13 +40,19 @@ import multiprocessing
 import re
 import threading
 import uuid
-
-from bs4 import BeautifulSoup
+from typing import Optional
+from urllib.parse import urlsplit
 
 import cffi_worker
 import requests_worker
 import playwright_worker
 from loop_watchdog import watchdog as _watchdog
+from dns_cache import resolver as _dns
+# HTML → fields extraction, shared with the worker subprocesses
+from article_extract import (
+    html_has_content  as _html_has_content,
+    parse_and_extract as _parse_and_extract,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -68,9 +76,12 @@ class _ProcessFetcher:
 
     Worker protocol
     ---------------
-    request:  ``(req_id: str, url: str, timeout: int)``
+    request:  ``(req_id: str, url: str, timeout: int, options: dict)``
             | ``None``   ← shutdown sentinel
     response: ``(req_id: str, result: dict)``
+
+    ``options['extract']`` makes the worker return extracted ``fields``
+    instead of the page HTML (see ``article_extract.apply_worker_options``).
     """
 
     _PROCESS_NAME = 'fetcher'
@@ -231,7 +242,7 @@ class _CffiFetcher(_ProcessFetcher):
     def _make_process(self, ctx, req_q, resp_q):
         return ctx.Process(
             target=cffi_worker.worker,
-            args=(req_q, resp_q),
+            args=(req_q, resp_q, cffi_worker.CFFI_INFLIGHT_PER_WORKER),
             daemon=True,
             name=self._PROCESS_NAME,
         )
@@ -244,20 +255,35 @@ class _RequestsFetcher(_ProcessFetcher):
     def _make_process(self, ctx, req_q, resp_q):
         return ctx.Process(
             target=requests_worker.worker,
-            args=(req_q, resp_q),
+            args=(req_q, resp_q, requests_worker.REQUESTS_INFLIGHT_PER_WORKER),
             daemon=True,
             name=self._PROCESS_NAME,
         )
 
 
 class _PlaywrightFetcher(_ProcessFetcher):
+    """Each process drives several pages of one persistent Chromium, so the
+    process count and page settings are read from playwright_worker at start."""
+
     _PROCESS_NAME = 'playwright-fetch'
     _PUMP_NAME    = 'playwright-pump'
 
+    def _ensure_started(self) -> None:
+        if not self._started:
+            self._pool_size = max(1, playwright_worker.PLAYWRIGHT_PROCESSES)
+        super()._ensure_started()
+
     def _make_process(self, ctx, req_q, resp_q):
         return ctx.Process(
             target=playwright_worker.worker,
-            args=(req_q, resp_q),
+            args=(
+                req_q, resp_q,
+                playwright_worker.PLAYWRIGHT_PAGES_PER_WORKER,
+                playwright_worker.PLAYWRIGHT_MAX_PAGES_PER_BROWSER,
+                playwright_worker.PLAYWRIGHT_MAX_BROWSER_MB,
+                playwright_worker.PLAYWRIGHT_CONTEXT_REUSE,
+                playwright_worker.blocking_config(),
+            ),
             daemon=True,
             name=self._PROCESS_NAME,
         )
@@ -265,12 +291,13 @@ class _PlaywrightFetcher(_ProcessFetcher):
 
 # Module-level singletons — started lazily on first use.
 # pool_size controls how many worker processes run per backend:
-#   cffi      — fast HTTP/TLS, I/O-bound → 4 workers
-#   requests  — stdlib fallback           → 2 workers
-#   playwright — headless Chrome, RAM-heavy → 4 workers (~300 MB each)
+#   cffi      — fast HTTP/TLS, I/O-bound → 4 workers × CFFI_INFLIGHT_PER_WORKER
+#   requests  — stdlib fallback           → 2 workers × REQUESTS_INFLIGHT_PER_WORKER
+#   playwright — one persistent Chromium per process, several pages each;
+#                sized by PLAYWRIGHT_PROCESSES × PLAYWRIGHT_PAGES_PER_WORKER
 _cffi       = _CffiFetcher(pool_size=4)
 _requests   = _RequestsFetcher(pool_size=2)
-_playwright = _PlaywrightFetcher(pool_size=6)  # 6 headless Chromium workers (~300 MB each)
+_playwright = _PlaywrightFetcher()
 
 
 def start_all() -> None:
@@ -288,180 +315,57 @@ def shutdown_all() -> None:
 
 
 # ---------------------------------------------------------------------------
-# HTML parsing helpers (run in the orchestrator process, not in workers)
+# Worker-side extraction
 # ---------------------------------------------------------------------------
 
-def _html_has_content(html: str | None) -> bool:
-    """Quick heuristic: ≥2 real paragraphs → page has readable content.
+# Workers parse the page themselves and return only the extracted fields, so
+# BeautifulSoup never runs in this process and the IPC payload is a few KB
+# instead of the whole page.  Add ``'raw_html': True`` to get the page too.
+_EXTRACT_OPTS: dict = {'extract': True}
 
-    Uses regex instead of BeautifulSoup so we can scan the FULL HTML without
-    the 15 KB truncation that caused false negatives on large news pages
-    (BBC, IndiaToday, FoxNews, etc.) where article text starts after 30-50 KB
-    of <head>, scripts and navigation markup.
 
-    NOTE: CPU-bound (DOTALL regex on raw HTML). Call via
-    ``await loop.run_in_executor(None, _html_has_content, html)``
-    when inside an async context.
+async def _worker_options(url: str) -> Optional[dict]:
     """
-    if not html:
-        return False
-    count = 0
-    for m in re.finditer(r'<p[^>]*>(.*?)</p>', html, re.S | re.I):
-        if len(re.sub(r'<[^>]+>', '', m.group(1)).strip()) > 50:
-            count += 1
-            if count >= 2:
-                return True
-    return False
-
-
-def _parse_and_extract(html: str, url: str) -> dict | None:
-    """Parse HTML and extract article fields in one executor-friendly call.
-
-    Combines ``_parse_html`` + ``_soup_to_fields`` so both CPU-bound steps
-    run in the thread-pool executor without returning a BeautifulSoup object
-    (which is not safe to pass between threads).
+    ``_EXTRACT_OPTS`` plus the host's addresses from the shared DNS cache
+    (``options['dns']``, pinned by the worker), or None when the host is
+    NXDOMAIN.  Transient resolver failures leave resolution to the worker.
     """
-    soup = _parse_html(html, url)
-    if soup is None:
+    host = (urlsplit(url).hostname or '').lower()
+    try:
+        addrs = await _dns.lookup(host)
+    except OSError:
+        return _EXTRACT_OPTS
+    if addrs is None:
         return None
-    return _soup_to_fields(soup)
-
-
-def _parse_html(html: str, url: str = '') -> 'BeautifulSoup | None':
-    for parser in ('lxml', 'html.parser'):
-        try:
-            return BeautifulSoup(html, parser)
-        except Exception as e:
-            if parser == 'html.parser':
-                logger.debug("All HTML parsers failed for %s: %s", url, e)
-    return None
-
-
-def _extract_author(soup) -> str | None:
-    for meta_attr in [
-        {'property': 'article:author'},
-        {'name': 'author'},
-        {'property': 'og:article:author'},
-    ]:
-        tag = soup.find('meta', attrs=meta_attr)
-        if tag and tag.get('content'):
-            return tag.get('content').strip()
-    author_tag = soup.find(attrs={'itemprop': 'author'})
-    if author_tag:
-        name_tag = author_tag.find(attrs={'itemprop': 'name'})
-        if name_tag:
-            return name_tag.get_text().strip()
-        return author_tag.get_text().strip()
-    for class_name in ['author', 'article-author', 'byline', 'author-name']:
-        tag = soup.find(class_=re.compile(class_name, re.I))
-        if tag:
-            text = re.sub(r'^by\s+', '', tag.get_text().strip(), flags=re.I)
-            if text and len(text) < 100:
-                return text
-    return None
-
-
-def _extract_time(soup) -> str | None:
-    for meta_attr in [
-        {'property': 'article:published_time'},
-        {'name': 'publishdate'},
-        {'property': 'og:published_time'},
-        {'name': 'date'},
-    ]:
-        tag = soup.find('meta', attrs=meta_attr)
-        if tag and tag.get('content'):
-            return tag.get('content').strip()
-    time_tag = soup.find('time')
-    if time_tag:
-        return time_tag.get('datetime') or time_tag.get_text().strip()
-    time_tag = soup.find(attrs={'itemprop': 'datePublished'})
-    if time_tag:
-        return time_tag.get('content') or time_tag.get_text().strip()
-    return None
-
-
-def _extract_description(soup) -> str | None:
-    og = soup.find('meta', property='og:description')
-    if og and og.get('content'):
-        return og.get('content').strip()
-    meta = soup.find('meta', attrs={'name': 'description'})
-    if meta and meta.get('content'):
-        return meta.get('content').strip()
-    for class_name in ['article-summary', 'article-lead', 'lead', 'summary', 'article-description']:
-        tag = soup.find(class_=re.compile(class_name, re.I))
-        if tag:
-            text = tag.get_text().strip()
-            if len(text) > 20:
-                return text
-    return None
-
-
-def _extract_content(soup) -> str | None:
-    paragraphs = []
-    for selector in [
-        {'class_': re.compile(r'article-content|article-body|entry-content|post-content', re.I)},
-        {'attrs': {'itemprop': 'articleBody'}},
-        {'name': 'article'},
-    ]:
-        container = soup.find(**selector)
-        if container:
-            p_tags = container.find_all('p', recursive=True)
-            paragraphs = [p.get_text().strip() for p in p_tags
-                          if len(p.get_text().strip()) > 30]
-            if paragraphs:
-                break
-    if not paragraphs:
-        paragraphs = [p.get_text().strip() for p in soup.find_all('p')
-                      if len(p.get_text().strip()) > 50]
-    if paragraphs:
-        return '\n\n'.join(paragraphs)[:50000]
-    return None
-
-
-_PAYWALL_PHRASES = (
-    'subscribe now to read',
-    'subscribe to read',
-    'subscribe to continue',
-    'subscribe for full access',
-    'you can save this article by registering',
-    'sign in to read',
-    'sign up to read',
-    'create a free account to read',
-    'create an account to read',
-    'log in to read',
-    'login to read',
-    'to read this article',
-    'to continue reading',
-    'unlock this article',
-    'already a subscriber',
-    'become a subscriber',
-    'purchase a subscription',
-)
+    _, ttl = _dns.peek(host)
+    return {**_EXTRACT_OPTS, 'dns': {'host': host, 'addrs': addrs, 'ttl': ttl}}
 
 
-def _is_paywall_content(text: str | None) -> bool:
-    """Return True if the text appears to be a paywall / subscription gate."""
-    if not text:
-        return False
-    sample = text[:600].lower()
-    return any(phrase in sample for phrase in _PAYWALL_PHRASES)
-
-
-def _soup_to_fields(soup) -> dict:
-    content = _extract_content(soup)
-    description = _extract_description(soup)
-    paywall = _is_paywall_content(content) or _is_paywall_content(description)
-    if paywall:
-        logger.debug("[fetch] paywall content detected — discarding")
-        content = None
-        description = None
-    return {
-        'author':         _extract_author(soup),
-        'published_time': _extract_time(soup),
-        'description':    description,
-        'content':        content,
-        '_paywall':       paywall,
-    }
+
+def _has_extracted(raw: dict) -> bool:
+    """True when *raw* came back from a worker in extraction mode."""
+    return 'fields' in raw
+
+
+def _fields_sync(raw: dict, url: str) -> dict | None:
+    """Fields of a successful worker result — worker-extracted or parsed here."""
+    if _has_extracted(raw):
+        return dict(raw['fields']) if raw['fields'] is not None else None
+    html = raw.get('html')
+    return _parse_and_extract(html, url) if html else None
+
+
+async def _fields_async(raw: dict, url: str) -> dict | None:
+    """Async twin of ``_fields_sync``; raw-HTML results are parsed in the executor."""
+    if _has_extracted(raw) or not raw.get('html'):
+        return _fields_sync(raw, url)
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(None, _parse_and_extract, raw['html'], url)
+
+
+def _page_ok(raw: dict) -> bool:
+    """Successful fetch that produced either HTML or extracted fields."""
+    return bool(raw.get('success') and (raw.get('html') or _has_extracted(raw)))
 
 
 # ---------------------------------------------------------------------------
@@ -533,10 +437,16 @@ class ArticleContentFetcher:
             result['error_type'] = ERROR_PERMANENT
             return result
 
+        opts = await _worker_options(sanitized)
+        if opts is None:
+            result['error_code'] = 'NXDOMAIN'
+            result['error_type'] = ERROR_PERMANENT
+            return result
+
         # Primary backend
-        primary = await _cffi.fetch_async(sanitized, self.timeout)
+        primary = await _cffi.fetch_async(sanitized, self.timeout, options=opts)
         if not primary['success'] and primary['error_code'] == 'UNAVAILABLE':
-            primary = await _requests.fetch_async(sanitized, self.timeout)
+            primary = await _requests.fetch_async(sanitized, self.timeout, options=opts)
 
         best = primary
 
@@ -546,24 +456,27 @@ class ArticleContentFetcher:
         try_pw = primary['error_code'] in _BOT_BLOCKED_CODES or (
             not primary['success'] and primary['error_type'] == ERROR_TEMPORARY
         )
-        if not try_pw and primary.get('success') and primary.get('html'):
-            has_content = await loop.run_in_executor(
-                None, _html_has_content, primary['html']
-            )
+        if not try_pw and _page_ok(primary):
+            if 'has_content' in primary:
+                has_content = primary['has_content']
+            else:
+                has_content = await loop.run_in_executor(
+                    None, _html_has_content, primary['html']
+                )
             try_pw = not has_content
         if try_pw:
             logger.debug("[fetch-async] playwright fallback (primary=%s): %s",
                          primary['error_code'] or 'no content', sanitized)
-            pw = await _playwright.fetch_async(sanitized, self.timeout)
+            pw = await _playwright.fetch_async(sanitized, self.timeout, options=opts)
             if pw['success']:
                 best = pw
             elif not primary['success'] and pw['error_type'] == ERROR_PERMANENT:
                 best = pw
 
-        # Parse HTML in executor (CPU-bound: lxml parse + BeautifulSoup traversal)
-        html = best.get('html')
-        if best['success'] and html:
-            fields = await loop.run_in_executor(None, _parse_and_extract, html, sanitized)
+        # Fields were extracted in the worker; raw-HTML results are parsed in
+        # the executor (CPU-bound: lxml parse + BeautifulSoup traversal)
+        if _page_ok(best):
+            fields = await _fields_async(best, sanitized)
             if fields is not None:
                 paywall_detected = fields.pop('_paywall', False)
                 result.update(fields)
@@ -573,12 +486,10 @@ class ArticleContentFetcher:
                 if paywall_detected:
                     logger.debug("[fetch-async] nojs retry after paywall: %s", sanitized)
                     nojs = await _playwright.fetch_async(
-                        sanitized, self.timeout, options={'nojs': True}
+                        sanitized, self.timeout, options={**opts, 'nojs': True}
                     )
-                    if nojs.get('success') and nojs.get('html'):
-                        nojs_fields = await loop.run_in_executor(
-                            None, _parse_and_extract, nojs['html'], sanitized
-                        )
+                    if _page_ok(nojs):
+                        nojs_fields = await _fields_async(nojs, sanitized)
                         if nojs_fields is not None:
                             nojs_fields.pop('_paywall', None)
                             if nojs_fields.get('content'):
@@ -622,9 +533,9 @@ class ArticleContentFetcher:
             return result
 
         # Primary backend: cffi → requests
-        primary = _cffi.fetch_sync(sanitized, self.timeout)
+        primary = _cffi.fetch_sync(sanitized, self.timeout, options=_EXTRACT_OPTS)
         if not primary['success'] and primary['error_code'] == 'UNAVAILABLE':
-            primary = _requests.fetch_sync(sanitized, self.timeout)
+            primary = _requests.fetch_sync(sanitized, self.timeout, options=_EXTRACT_OPTS)
 
         best = primary
 
@@ -632,23 +543,23 @@ class ArticleContentFetcher:
         try_pw = (
             primary['error_code'] in _BOT_BLOCKED_CODES
             or (not primary['success'] and primary['error_type'] == ERROR_TEMPORARY)
-            or (primary['success'] and not _html_has_content(primary.get('html')))
+            or (primary['success'] and not primary.get(
+                'has_content', _html_has_content(primary.get('html'))
+            ))
         )
         if try_pw:
             logger.debug("[fetch] playwright fallback (primary=%s): %s",
                          primary['error_code'] or 'no content', sanitized)
-            pw = _playwright.fetch_sync(sanitized, self.timeout)
+            pw = _playwright.fetch_sync(sanitized, self.timeout, options=_EXTRACT_OPTS)
             if pw['success']:
                 best = pw
             elif not primary['success'] and pw['error_type'] == ERROR_PERMANENT:
                 best = pw
 
-        # Parse HTML
-        html = best.get('html')
-        if best['success'] and html:
-            soup = _parse_html(html, sanitized)
-            if soup:
-                fields = _soup_to_fields(soup)
+        # Extracted fields (worker-side, or parsed here for raw-HTML results)
+        if _page_ok(best):
+            fields = _fields_sync(best, sanitized)
+            if fields is not None:
                 paywall_detected = fields.pop('_paywall', False)
                 result.update(fields)
                 result['success'] = True
@@ -661,12 +572,11 @@ class ArticleContentFetcher:
                 if paywall_detected:
                     logger.debug("[fetch] nojs retry after paywall: %s", sanitized)
                     nojs = _playwright.fetch_sync(
-                        sanitized, self.timeout, options={'nojs': True}
+                        sanitized, self.timeout, options={**_EXTRACT_OPTS, 'nojs': True}
                     )
-                    if nojs.get('success') and nojs.get('html'):
-                        nojs_soup = _parse_html(nojs['html'], sanitized)
-                        if nojs_soup:
-                            nojs_fields = _soup_to_fields(nojs_soup)
+                    if _page_ok(nojs):
+                        nojs_fields = _fields_sync(nojs, sanitized)
+                        if nojs_fields is not None:
                             nojs_fields.pop('_paywall', None)
                             if nojs_fields.get('content'):
                                 result.update(nojs_fields)
@@ -705,7 +615,7 @@ async def fetch_article_content_async(url: str, timeout: int = 10) -> dict:
 
 async def _fetch_and_parse_one(backend: _ProcessFetcher, url: str, timeout: int) -> dict:
     """
-    Fetch with a single backend subprocess and parse the HTML.
+    Fetch with a single backend subprocess; the worker extracts the fields.
     Returns the same shape as ArticleContentFetcher.fetch_async() but only
     attempts the one backend — no fallback chain.
     """
@@ -716,12 +626,20 @@ async def _fetch_and_parse_one(backend: _ProcessFetcher, url: str, timeout: int)
         'error_type': None, 'sanitized_url': None,
     }
     sanitized = _sanitize_url(url)
-    raw = await backend.fetch_async(sanitized, timeout)
+    opts = await _worker_options(sanitized)
+    if opts is None:
+        result['error_code'] = 'NXDOMAIN'
+        result['error_type'] = ERROR_PERMANENT
+        return result
+    raw = await backend.fetch_async(sanitized, timeout, options=opts)
     result['error_code'] = raw.get('error_code')
     result['error_type'] = raw.get('error_type')
-    if raw.get('success') and raw.get('html'):
-        loop = asyncio.get_running_loop()
-        fields = await loop.run_in_executor(None, _parse_and_extract, raw['html'], sanitized)
+    if raw.get('net'):
+        result['net'] = raw['net']          # playwright resource-filter report
+    if raw.get('error_code') in (429, 503):
+        result['retry_after'] = raw.get('retry_after')
+    if _page_ok(raw):
+        fields = await _fields_async(raw, sanitized)
         if fields is not None:
             fields.pop('_paywall', None)
             result.update(fields)
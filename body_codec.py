@@ -0,0 +1,158 @@
+"""
+body_codec.py — Compressed storage format for article bodies.
+
+``gm_article_bodies.content`` / ``translated_content`` hold either plain
+TEXT (the original format, still written while the codec is off or no
+dictionary exists yet) or a BLOB whose first byte is a format version:
+
+    0x01  zstd frame; the frame header carries the dictionary id
+          (0 = no dictionary), looked up in ``gm_body_dicts``
+
+The storage class tells the formats apart, so old and new rows coexist and
+the rollout is gradual: writers compress new bodies once a dictionary is
+trained, and a background job recompresses the rest (news_db).
+
+Article bodies are short and share a lot of boilerplate (bylines, cookie
+notices, "read more"), so a dictionary trained on our own corpus gets far
+better ratios than plain zstd on single rows.
+
+``zstandard`` is optional.  Without it the codec stays off; reading a
+compressed row then raises ``RuntimeError``.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import threading
+from typing import Iterable, Optional, Union
+
+try:
+    import zstandard as _zstd
+    _HAS_ZSTD = True
+except ImportError:
+    _zstd = None
+    _HAS_ZSTD = False
+
+logger = logging.getLogger(__name__)
+
+# Overridable after import (wxAsyncNewsGather assigns its decouple config)
+BODY_CODEC:        str = os.environ.get('BODY_CODEC', 'plain')                # plain | zstd
+BODY_ZSTD_LEVEL:   int = int(os.environ.get('BODY_ZSTD_LEVEL', 9))
+BODY_DICT_SIZE:    int = int(os.environ.get('BODY_DICT_SIZE', 112640))         # bytes (110 KB)
+BODY_DICT_SAMPLES: int = int(os.environ.get('BODY_DICT_SAMPLES', 5000))        # bodies used to train
+BODY_MIN_BYTES:    int = int(os.environ.get('BODY_MIN_BYTES', 64))             # shorter bodies stay plain
+
+VERSION_ZSTD = 1
+
+BodyValue = Union[str, bytes, None]
+
+
+def available() -> bool:
+    return _HAS_ZSTD
+
+
+def train_dictionary(samples: list[str], size: int = 0) -> tuple[int, bytes]:
+    """Train a zstd dictionary on *samples*; returns ``(dict_id, data)``.  CPU-bound."""
+    if not _HAS_ZSTD:
+        raise RuntimeError("zstandard is not installed")
+    d = _zstd.train_dictionary(
+        size or BODY_DICT_SIZE, [s.encode('utf-8') for s in samples],
+        level=BODY_ZSTD_LEVEL,
+    )
+    return d.dict_id(), d.as_bytes()
+
+
+class BodyCodec:
+    """
+    Encoder / decoder for one database's bodies.  Dictionaries are loaded
+    with ``add_dict``; the last one added with ``active=True`` is used for
+    compression.  zstd (de)compressors are not thread-safe, so each thread
+    (aiosqlite connection threads, ``asyncio.to_thread`` workers) gets its own.
+    """
+
+    def __init__(self) -> None:
+        self._dicts: dict[int, object] = {}
+        self._active: Optional[int] = None
+        self._local = threading.local()
+        self.enabled = False         # compress on write (BODY_CODEC=zstd + dictionary)
+
+    @property
+    def active_dict(self) -> Optional[int]:
+        return self._active
+
+    @property
+    def has_dicts(self) -> bool:
+        return bool(self._dicts)
+
+    def add_dict(self, dict_id: int, data: bytes, active: bool = False) -> None:
+        if not _HAS_ZSTD:
+            return
+        self._dicts[dict_id] = _zstd.ZstdCompressionDict(data)
+        if active or self._active is None:
+            self._active = dict_id
+        self._local = threading.local()          # drop per-thread (de)compressors
+
+    def load_dicts(self, rows: Iterable[tuple[int, bytes]]) -> None:
+        """``(dict_id, data)`` rows, oldest first — the newest becomes active."""
+        for dict_id, data in rows:
+            self.add_dict(dict_id, data, active=True)
+
+    # ── per-thread zstd objects ───────────────────────────────────────────────
+
+    def _compressor(self):
+        c = getattr(self._local, 'compressor', None)
+        if c is None:
+            c = _zstd.ZstdCompressor(
+                level=BODY_ZSTD_LEVEL, dict_data=self._dicts[self._active],
+                write_checksum=False,
+            )
+            self._local.compressor = c
+        return c
+
+    def _decompressor(self, dict_id: int):
+        cache = getattr(self._local, 'decompressors', None)
+        if cache is None:
+            cache = self._local.decompressors = {}
+        d = cache.get(dict_id)
+        if d is None:
+            if dict_id and dict_id not in self._dicts:
+                raise RuntimeError(f"body dictionary {dict_id} not loaded")
+            d = _zstd.ZstdDecompressor(dict_data=self._dicts.get(dict_id))
+            cache[dict_id] = d
+        return d
+
+    # ── codec ─────────────────────────────────────────────────────────────────
+
+    def encode(self, text: BodyValue) -> BodyValue:
+        """Stored form of *text*: compressed when enabled and worth it, else unchanged."""
+        if not self.enabled or self._active is None or not isinstance(text, str):
+            return text
+        raw = text.encode('utf-8')
+        if len(raw) < BODY_MIN_BYTES:
+            return text
+        packed = bytes((VERSION_ZSTD,)) + self._compressor().compress(raw)
+        return packed if len(packed) < len(raw) else text
+
+    def decode(self, value: BodyValue) -> Optional[str]:
+        """Text of a stored body (plain TEXT passes through)."""
+        if value is None or isinstance(value, str):
+            return value
+        value = bytes(value)
+        if not value:
+            return ""
+        if value[0] != VERSION_ZSTD:
+            raise ValueError(f"unknown body format version {value[0]}")
+        if not _HAS_ZSTD:
+            raise RuntimeError("compressed article body but zstandard is not installed")
+        frame = value[1:]
+        dict_id = _zstd.get_frame_parameters(frame).dict_id
+        return self._decompressor(dict_id).decompress(frame).decode('utf-8')
+
+    def safe_decode(self, value: BodyValue) -> Optional[str]:
+        """decode() that logs and returns None instead of raising (index rebuilds, API reads)."""
+        try:
+            return self.decode(value)
+        except Exception as e:
+            logger.warning(f"⚠️  body decode failed: {e}")
+            return None
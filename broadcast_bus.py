@@ -0,0 +1,177 @@
+"""
+broadcast_bus.py — In-process publish/subscribe for live API push.
+
+Writer stages publish batches of freshly committed rows; every connected
+push client (``GET /api/stream``) holds a ``Subscription`` with its own
+bounded queue and optional source filter.  Nothing here touches the
+database — idle clients cost one parked coroutine each.
+
+Events
+------
+Each event is a plain dict::
+
+    {"seq": 42, "type": "articles",     "ts": <max inserted_at_ms>,   "items": [...]}
+    {"seq": 43, "type": "translations", "ts": <max translated_at_ms>, "items": [...]}
+
+``seq`` is a process-wide monotonically increasing id (used as the SSE
+``id:`` so a reconnecting client can send ``Last-Event-ID``).  The last
+``history`` events are kept in a ring buffer for that resume path; clients
+that were away longer resume from the DB with their ``since`` cursor.
+
+Back-pressure
+-------------
+``publish()`` never awaits.  A subscriber whose queue is full is marked
+``lagged`` and closed — its stream ends and the client reconnects with its
+cursor, which is cheaper than buffering unboundedly for a stalled socket.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from collections import deque
+from typing import Iterable, Optional
+
+logger = logging.getLogger(__name__)
+
+EVENT_ARTICLES     = "articles"
+EVENT_TRANSLATIONS = "translations"
+
+
+class Subscription:
+    """One connected client: a bounded queue plus its filters."""
+
+    def __init__(
+        self,
+        bus: "BroadcastBus",
+        *,
+        sources: Optional[Iterable[str]] = None,
+        types: Optional[Iterable[str]] = None,
+        maxsize: int = 256,
+    ) -> None:
+        self._bus    = bus
+        self.sources = frozenset(sources) if sources else None
+        self.types   = frozenset(types) if types else None
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=maxsize)
+        self.lagged  = False
+        self.closed  = False
+
+    def _filter(self, event: dict) -> Optional[dict]:
+        """Return *event* narrowed to this client's filters, or None to skip it."""
+        if self.types is not None and event["type"] not in self.types:
+            return None
+        if self.sources is None or event["type"] != EVENT_ARTICLES:
+            # Translation items carry no id_source — clients drop unknown ids
+            return event
+        items = [i for i in event["items"] if i.get("id_source") in self.sources]
+        if not items:
+            return None
+        return {**event, "items": items}
+
+    def _offer(self, event: dict) -> None:
+        ev = self._filter(event)
+        if ev is None or self.closed:
+            return
+        try:
+            self.queue.put_nowait(ev)
+        except asyncio.QueueFull:
+            self.lagged = True
+            logger.info("📡 Push subscriber lagged (queue full) — closing stream")
+            self.close()
+
+    async def get(self, timeout: Optional[float] = None) -> Optional[dict]:
+        """Next event, or None on timeout / when the subscription was closed."""
+        if self.closed and self.queue.empty():
+            return None
+        try:
+            ev = await asyncio.wait_for(self.queue.get(), timeout=timeout)
+        except asyncio.TimeoutError:
+            return None
+        return ev
+
+    def close(self) -> None:
+        if self.closed:
+            return
+        self.closed = True
+        self._bus._subs.discard(self)
+        try:
+            self.queue.put_nowait(None)   # wake a parked get()
+        except asyncio.QueueFull:
+            pass
+
+
+class BroadcastBus:
+    """Fan-out of committed-row batches to live API subscribers."""
+
+    def __init__(self, history: int = 1024, queue_size: int = 256) -> None:
+        self._subs: set[Subscription] = set()
+        self._history: deque[dict] = deque(maxlen=history)
+        self._queue_size = queue_size
+        self._seq        = 0
+        self._published  = 0
+        self._dropped    = 0
+
+    # ── publishing ────────────────────────────────────────────────────────────
+
+    def publish(self, event_type: str, items: list[dict], ts: int) -> None:
+        """Publish one batch; O(subscribers), never blocks."""
+        if not items:
+            return
+        self._seq += 1
+        event = {"seq": self._seq, "type": event_type, "ts": ts, "items": items}
+        self._history.append(event)
+        self._published += 1
+        for sub in list(self._subs):
+            sub._offer(event)
+            if sub.lagged:
+                self._dropped += 1
+
+    # ── subscribing ───────────────────────────────────────────────────────────
+
+    def subscribe(
+        self,
+        *,
+        sources: Optional[Iterable[str]] = None,
+        types: Optional[Iterable[str]] = None,
+        after_seq: Optional[int] = None,
+    ) -> tuple[Subscription, bool]:
+        """
+        Register a subscriber.  With *after_seq* the buffered events newer
+        than it are queued first; the returned flag is False when the ring
+        no longer reaches back that far (caller must resume from the DB).
+        """
+        replay: list[dict] = []
+        resumed = True
+        if after_seq is not None:
+            oldest = self._history[0]["seq"] if self._history else self._seq + 1
+            # A seq beyond ours comes from a previous process — not resumable
+            resumed = oldest - 1 <= after_seq <= self._seq
+            if resumed:
+                replay = [e for e in self._history if e["seq"] > after_seq]
+        sub = Subscription(
+            self, sources=sources, types=types,
+            maxsize=self._queue_size + len(replay),
+        )
+        for event in replay:
+            sub._offer(event)
+        self._subs.add(sub)
+        return sub, resumed
+
+    # ── introspection ─────────────────────────────────────────────────────────
+
+    @property
+    def last_seq(self) -> int:
+        return self._seq
+
+    def to_dict(self) -> dict:
+        return {
+            "subscribers": len(self._subs),
+            "published":   self._published,
+            "last_seq":    self._seq,
+            "history":     len(self._history),
+            "dropped":     self._dropped,
+        }
+
+
+# Global singleton — shared by the writer stages and the API
+bus = BroadcastBus()
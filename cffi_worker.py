@@ -6,25 +6,54 @@ HTTP fetcher worker — ``curl_cffi`` with Chrome TLS fingerprint impersonation.
 Bypasses Cloudflare and similar bot-blockers that reject connections based on
 TLS JA3/JA4 fingerprints.
 
+One ``AsyncSession`` per process keeps a keep-alive connection cache per
+host (HTTP/2 when the server negotiates it, as Chrome would) and runs up to
+``CFFI_INFLIGHT_PER_WORKER`` requests concurrently.  The session never
+stores cookies (``discard_cookies``), so every fetch starts with an empty
+jar like the old one-shot ``get()``; cookies set along one fetch's redirect
+chain (consent / anti-bot) still apply within that transfer, because
+libcurl's cookie engine is per transfer, and never leak into another.
+libcurl resolves hosts itself and shares one DNS cache across the session's
+handles; ``CFFI_DNS_CACHE_TTL`` stretches its 60 s default so repeat hosts
+skip the lookup.
+
 Spawned by ``article_fetcher._CffiFetcher._make_process()``.
 
 Protocol
 --------
-request:  ``(req_id: str, url: str, timeout: int)``
+request:  ``(req_id: str, url: str, timeout: int[, options: dict])``
         | ``None``   ← shutdown sentinel
 response: ``(req_id: str, result: dict)``
 
 result keys: html, success, error_code, error_type
+  + retry_after  raw ``Retry-After`` header on HTTP 429 / 503
+  + fields, has_content, html_len  when ``options['extract']`` is set
+    (html is then None unless ``options['raw_html']`` — see article_extract)
 """
 
+import asyncio
 import multiprocessing
+import os
 import signal
+import threading
 
 ERROR_PERMANENT = 'permanent'
 ERROR_TEMPORARY = 'temporary'
 
 _PERMANENT_HTTP_CODES = frozenset({401, 402, 403, 404, 406, 410, 451})
 
+# Concurrent requests per worker process — overridable after import
+CFFI_INFLIGHT_PER_WORKER: int = int(os.environ.get('CFFI_INFLIGHT_PER_WORKER', 10))
+# libcurl DNS cache lifetime in seconds — overridable after import
+CFFI_DNS_CACHE_TTL: int = int(os.environ.get('CFFI_DNS_CACHE_TTL', 300))
+
+_IMPERSONATE = 'chrome120'
+_HEADERS = {
+    'Accept-Language': 'pt-BR,pt;q=0.8,en-US;q=0.5,en;q=0.3',
+    'Referer': 'https://www.google.com/',
+    'Sec-Fetch-Site': 'cross-site',
+}
+
 
 def _classify(status: int) -> str:
     return ERROR_PERMANENT if status in _PERMANENT_HTTP_CODES else ERROR_TEMPORARY
@@ -58,65 +87,126 @@ def _decode(response) -> str:
         return response.content.decode('utf-8', errors='ignore')
 
 
-def _fetch(url: str, timeout: int) -> dict:
-    out = {'html': None, 'success': False, 'error_code': None, 'error_type': None}
+def _error_result(e: Exception, out: dict, url: str) -> dict:
+    """Fill *out* with the error code / type for a curl_cffi exception."""
     try:
-        import curl_cffi.requests as cffi_req
         from curl_cffi.requests import exceptions as cffi_exc
+        if isinstance(e, cffi_exc.HTTPError):
+            resp = getattr(e, 'response', None)
+            code = getattr(resp, 'status_code', None)
+            out['error_code'] = code
+            out['error_type'] = _classify(code) if isinstance(code, int) else ERROR_TEMPORARY
+            if code in (429, 503):
+                out['retry_after'] = (getattr(resp, 'headers', None) or {}).get('Retry-After')
+        elif isinstance(e, cffi_exc.Timeout):
+            out['error_code'] = 'TIMEOUT'
+            out['error_type'] = ERROR_TEMPORARY
+        elif isinstance(e, cffi_exc.RequestException):
+            out['error_code'] = 'REQUEST_ERROR'
+            out['error_type'] = ERROR_TEMPORARY
+        else:
+            out['error_code'] = 'ERROR'
+            out['error_type'] = ERROR_TEMPORARY
+    except ImportError:
+        out['error_code'] = 'ERROR'
+        out['error_type'] = ERROR_TEMPORARY
+    print(f"[cffi-worker] {type(e).__name__} ({out['error_code']}) {url[:80]}", flush=True)
+    return out
 
-        resp = cffi_req.get(
-            url,
-            impersonate='chrome120',
-            headers={
-                'Accept-Language': 'pt-BR,pt;q=0.8,en-US;q=0.5,en;q=0.3',
-                'Referer': 'https://www.google.com/',
-                'Sec-Fetch-Site': 'cross-site',
-            },
-            timeout=timeout,
-        )
+
+async def _fetch(session, url: str, timeout: int) -> dict:
+    """GET *url* through the shared *session* (pooled connections)."""
+    out = {'html': None, 'success': False, 'error_code': None, 'error_type': None}
+    try:
+        resp = await session.get(url, headers=_HEADERS, timeout=timeout)
         resp.raise_for_status()
         out['html']    = _decode(resp)
         out['success'] = True
         print(f"[cffi-worker] OK {url[:80]}", flush=True)
-    except ImportError as e:
-        out['error_code'] = 'UNAVAILABLE'
-        out['error_type'] = ERROR_TEMPORARY
-        print(f"[cffi-worker] curl_cffi not available: {e}", flush=True)
     except Exception as e:
-        # Re-import to catch cffi exceptions by type at runtime
-        try:
-            from curl_cffi.requests import exceptions as cffi_exc
-            if isinstance(e, cffi_exc.HTTPError):
-                resp = getattr(e, 'response', None)
-                code = getattr(resp, 'status_code', None)
-                out['error_code'] = code
-                out['error_type'] = _classify(code) if isinstance(code, int) else ERROR_TEMPORARY
-            elif isinstance(e, cffi_exc.Timeout):
-                out['error_code'] = 'TIMEOUT'
-                out['error_type'] = ERROR_TEMPORARY
-            elif isinstance(e, cffi_exc.RequestException):
-                out['error_code'] = 'REQUEST_ERROR'
-                out['error_type'] = ERROR_TEMPORARY
-            else:
-                out['error_code'] = 'ERROR'
-                out['error_type'] = ERROR_TEMPORARY
-        except ImportError:
-            out['error_code'] = 'ERROR'
-            out['error_type'] = ERROR_TEMPORARY
-        print(f"[cffi-worker] {type(e).__name__} ({out['error_code']}) {url[:80]}", flush=True)
+        _error_result(e, out, url)
     return out
 
 
+async def _serve(
+    req_q: "multiprocessing.Queue",
+    resp_q: "multiprocessing.Queue",
+    inflight: int,
+) -> None:
+    """Run up to *inflight* fetches concurrently on one AsyncSession."""
+    from curl_cffi.requests import AsyncSession
+
+    loop  = asyncio.get_running_loop()
+    inbox: asyncio.Queue = asyncio.Queue()
+    # Only take a request off the shared queue when a slot is free, so idle
+    # sibling processes get the rest.
+    free  = threading.Semaphore(inflight)
+
+    def _reader() -> None:
+        while True:
+            free.acquire()
+            try:
+                item = req_q.get()
+            except (EOFError, OSError):
+                item = None
+            loop.call_soon_threadsafe(inbox.put_nowait, item)
+            if item is None:
+                return
+
+    async def _handle(item: tuple) -> None:
+        req_id, url, timeout = item[0], item[1], item[2]
+        options = item[3] if len(item) > 3 else {}
+        try:
+            result = await _fetch(session, url, timeout)
+            if options.get('extract'):
+                # Parse here so only the extracted fields cross the queue
+                from article_extract import apply_worker_options
+                result = await asyncio.to_thread(apply_worker_options, result, url, options)
+        except Exception as e:
+            result = _error_result(e, {'html': None, 'success': False,
+                                       'error_code': None, 'error_type': None}, url)
+        try:
+            resp_q.put((req_id, result))
+        finally:
+            free.release()
+
+    # discard_cookies: responses never write to the shared jar, so concurrent
+    # fetches cannot see (or wipe) each other's cookies
+    kwargs = dict(impersonate=_IMPERSONATE, max_clients=inflight, discard_cookies=True)
+    try:
+        from curl_cffi import CurlOpt
+        session = AsyncSession(
+            **kwargs, curl_options={CurlOpt.DNS_CACHE_TIMEOUT: CFFI_DNS_CACHE_TTL},
+        )
+    except (ImportError, TypeError):        # curl_cffi without curl_options
+        session = AsyncSession(**kwargs)
+    threading.Thread(target=_reader, daemon=True, name='cffi-reader').start()
+    print(f"[cffi-worker] Ready ({inflight} in flight, pooled session)", flush=True)
+    tasks: set[asyncio.Task] = set()
+    try:
+        while True:
+            item = await inbox.get()
+            if item is None:
+                break
+            task = asyncio.create_task(_handle(item))
+            tasks.add(task)
+            task.add_done_callback(tasks.discard)
+        if tasks:
+            await asyncio.gather(*tasks, return_exceptions=True)
+    finally:
+        await session.close()
+
+
 def worker(
     req_q: "multiprocessing.Queue",
     resp_q: "multiprocessing.Queue",
+    inflight: int = CFFI_INFLIGHT_PER_WORKER,
 ) -> None:
     signal.signal(signal.SIGINT, signal.SIG_IGN)
 
     # Verify availability at start-up
     try:
         import curl_cffi.requests  # noqa: F401
-        print("[cffi-worker] Ready", flush=True)
     except ImportError as e:
         print(f"[cffi-worker] curl_cffi not installed: {e}", flush=True)
         # Stay alive and return UNAVAILABLE for all requests so the
@@ -135,13 +225,4 @@ def worker(
             }))
         return
 
-    while True:
-        try:
-            item = req_q.get()
-        except (EOFError, OSError):
-            break
-        if item is None:
-            break
-        req_id, url, timeout = item[0], item[1], item[2]
-        result = _fetch(url, timeout)
-        resp_q.put((req_id, result))
+    asyncio.run(_serve(req_q, resp_q, max(1, inflight)))
@@ -0,0 +1,319 @@
+"""
+dns_cache.py — Shared, TTL-respecting DNS cache for all outbound HTTP.
+
+Every aiohttp session in the collector is built on ``connector()``, whose
+``TCPConnector`` resolves through the process-wide ``resolver`` instead of
+aiohttp's own 10-second cache and a ``getaddrinfo`` thread per lookup.
+
+Lookups
+-------
+* **aiodns** (c-ares) when installed — fully async, and answers carry the
+  record TTL, which is honoured (clamped to ``[DNS_CACHE_MIN_TTL,
+  DNS_CACHE_MAX_TTL]``).
+* Otherwise ``loop.getaddrinfo`` (default executor) with ``DNS_DEFAULT_TTL``.
+
+Concurrent lookups of the same host share one query.  NXDOMAIN is cached
+for ``DNS_NEGATIVE_TTL`` and surfaces as ``lookup() → None`` /
+``NXDomainError``, which the collector feeds into its source and domain
+blocking.  Transient failures (SERVFAIL, timeouts) are never cached.
+
+Fetch workers
+-------------
+The fetch subprocesses cannot share this cache directly.
+``article_fetcher`` resolves the article host here first — an NXDOMAIN host
+never reaches a worker at all — and sends the answer along as
+``options['dns']``.  ``requests_worker`` pins it via ``pinned_hosts``
+instead of a blocking libc lookup; libcurl (cffi) and Chromium (playwright)
+resolve asynchronously with their own per-process caches.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import ipaddress
+import logging
+import os
+import socket
+import threading
+import time
+from collections import OrderedDict
+from typing import Optional
+
+try:
+    from aiohttp.abc import AbstractResolver as _ResolverBase
+except ImportError:                     # only the worker-side pin is needed
+    _ResolverBase = object              # type: ignore[misc,assignment]
+
+try:
+    import aiodns
+    _HAS_AIODNS = True
+except ImportError:
+    aiodns = None                       # type: ignore[assignment]
+    _HAS_AIODNS = False
+
+logger = logging.getLogger(__name__)
+
+# Overridable after import (wxAsyncNewsGather assigns its decouple config)
+DNS_CACHE_SIZE:    int   = int(os.environ.get('DNS_CACHE_SIZE', 50000))
+DNS_CACHE_MIN_TTL: float = float(os.environ.get('DNS_CACHE_MIN_TTL', 60))
+DNS_CACHE_MAX_TTL: float = float(os.environ.get('DNS_CACHE_MAX_TTL', 3600))
+DNS_DEFAULT_TTL:   float = float(os.environ.get('DNS_DEFAULT_TTL', 300))    # no TTL from getaddrinfo
+DNS_NEGATIVE_TTL:  float = float(os.environ.get('DNS_NEGATIVE_TTL', 900))   # NXDOMAIN
+DNS_USE_AIODNS:    bool  = os.environ.get('DNS_USE_AIODNS', '1') not in ('0', 'false', 'False')
+
+# c-ares status codes (aiodns.error.DNSError.args[0])
+_ARES_ENODATA   = 1
+_ARES_ENOTFOUND = 4
+
+
+class NXDomainError(socket.gaierror):
+    """The name does not exist (cached negative answer)."""
+
+    def __init__(self, host: str) -> None:
+        super().__init__(socket.EAI_NONAME, f"NXDOMAIN: {host}")
+        self.host = host
+
+
+def _is_ip(host: str) -> bool:
+    try:
+        ipaddress.ip_address(host)
+        return True
+    except ValueError:
+        return False
+
+
+def _family_of(ip: str) -> int:
+    return socket.AF_INET6 if ':' in ip else socket.AF_INET
+
+
+class DNSCache(_ResolverBase):
+    """Async resolver with a TTL-bounded LRU and negative caching."""
+
+    def __init__(self) -> None:
+        # host → (expires_monotonic, [ip, …]) — an empty list means NXDOMAIN
+        self._entries: OrderedDict[str, tuple[float, list[str]]] = OrderedDict()
+        self._inflight: dict[str, asyncio.Future] = {}
+        self._aiodns = None
+        self._aiodns_loop = None
+        # counters
+        self.hits      = 0
+        self.misses    = 0
+        self.negative  = 0       # NXDOMAIN answers (fresh + cached)
+        self.failures  = 0       # transient errors, not cached
+
+    # ── cache ─────────────────────────────────────────────────────────────────
+
+    def _get(self, host: str) -> Optional[list[str]]:
+        entry = self._entries.get(host)
+        if entry is None:
+            return None
+        if entry[0] <= time.monotonic():
+            del self._entries[host]
+            return None
+        self._entries.move_to_end(host)
+        return entry[1]
+
+    def _put(self, host: str, addrs: list[str], ttl: float) -> None:
+        self._entries[host] = (time.monotonic() + ttl, addrs)
+        self._entries.move_to_end(host)
+        while len(self._entries) > DNS_CACHE_SIZE:
+            self._entries.popitem(last=False)
+
+    def peek(self, host: str) -> tuple[Optional[list[str]], float]:
+        """Cached ``(addrs, seconds_left)`` without querying (``addrs`` None on miss)."""
+        entry = self._entries.get(host)
+        if entry is None:
+            return None, 0.0
+        left = entry[0] - time.monotonic()
+        return (entry[1], left) if left > 0 else (None, 0.0)
+
+    def is_nxdomain(self, host: str) -> bool:
+        return self._get(host) == []
+
+    # ── lookup ────────────────────────────────────────────────────────────────
+
+    async def lookup(self, host: str) -> Optional[list[str]]:
+        """
+        IP addresses for *host*, or ``None`` when it does not exist.
+        Raises ``OSError`` on transient resolver failures.
+        """
+        host = (host or '').lower().rstrip('.')
+        if not host or _is_ip(host):
+            return [host] if host else None
+        addrs = self._get(host)
+        if addrs is not None:
+            self.hits += 1
+            if not addrs:
+                self.negative += 1
+            return addrs or None
+        fut = self._inflight.get(host)
+        if fut is None:
+            self.misses += 1
+            fut = asyncio.ensure_future(self._query(host))
+            self._inflight[host] = fut
+            fut.add_done_callback(lambda _f, h=host: self._inflight.pop(h, None))
+        addrs = await asyncio.shield(fut)
+        return addrs or None
+
+    async def _query(self, host: str) -> list[str]:
+        try:
+            if _HAS_AIODNS and DNS_USE_AIODNS:
+                addrs, ttl = await self._query_aiodns(host)
+            else:
+                addrs, ttl = await self._query_getaddrinfo(host)
+        except NXDomainError:
+            self.negative += 1
+            self._put(host, [], DNS_NEGATIVE_TTL)
+            logger.debug(f"🕳️  DNS: {host} does not exist (cached {DNS_NEGATIVE_TTL:.0f}s)")
+            return []
+        except OSError:
+            self.failures += 1
+            raise
+        self._put(host, addrs, min(max(ttl, DNS_CACHE_MIN_TTL), DNS_CACHE_MAX_TTL))
+        return addrs
+
+    async def _query_aiodns(self, host: str) -> tuple[list[str], float]:
+        loop = asyncio.get_running_loop()
+        if self._aiodns is None or self._aiodns_loop is not loop:
+            self._aiodns = aiodns.DNSResolver(loop=loop)
+            self._aiodns_loop = loop
+        addrs: list[str] = []
+        ttls: list[float] = []
+        for qtype in ('A', 'AAAA'):
+            try:
+                answers = await self._aiodns.query(host, qtype)
+            except aiodns.error.DNSError as e:
+                code = e.args[0] if e.args else None
+                if code in (_ARES_ENOTFOUND, _ARES_ENODATA):
+                    continue
+                if addrs:
+                    break           # have A records; AAAA failure is harmless
+                raise OSError(f"DNS lookup failed for {host}: {e}") from e
+            for a in answers:
+                addrs.append(a.host)
+                ttls.append(float(getattr(a, 'ttl', DNS_DEFAULT_TTL) or DNS_DEFAULT_TTL))
+        if not addrs:
+            # NXDOMAIN, or a name with no address records — same outcome for HTTP
+            raise NXDomainError(host)
+        return addrs, min(ttls)
+
+    async def _query_getaddrinfo(self, host: str) -> tuple[list[str], float]:
+        loop = asyncio.get_running_loop()
+        try:
+            infos = await loop.getaddrinfo(host, None, type=socket.SOCK_STREAM)
+        except socket.gaierror as e:
+            if e.errno in (socket.EAI_NONAME, getattr(socket, 'EAI_NODATA', socket.EAI_NONAME)):
+                raise NXDomainError(host) from e
+            raise
+        addrs: list[str] = []
+        for fam, _, _, _, sa in infos:
+            if sa[0] not in addrs:
+                addrs.append(sa[0])
+        return addrs, DNS_DEFAULT_TTL
+
+    # ── aiohttp AbstractResolver ──────────────────────────────────────────────
+
+    async def resolve(self, host: str, port: int = 0, family: int = socket.AF_INET) -> list[dict]:
+        addrs = await self.lookup(host)
+        if addrs is None:
+            raise NXDomainError(host)
+        out = [
+            {
+                'hostname': host, 'host': ip, 'port': port,
+                'family': _family_of(ip), 'proto': 0,
+                'flags': socket.AI_NUMERICHOST,
+            }
+            for ip in addrs
+            if family in (0, socket.AF_UNSPEC) or _family_of(ip) == family
+        ]
+        if not out:
+            raise OSError(f"No {socket.AddressFamily(family).name} address for {host}")
+        return out
+
+    async def close(self) -> None:
+        # Shared by every connector — outlives any single session
+        return None
+
+    # ── introspection ─────────────────────────────────────────────────────────
+
+    def to_dict(self) -> dict:
+        now = time.monotonic()
+        negative = sum(1 for exp, a in self._entries.values() if not a and exp > now)
+        lookups = self.hits + self.misses
+        return {
+            "backend":   "aiodns" if (_HAS_AIODNS and DNS_USE_AIODNS) else "getaddrinfo",
+            "entries":   len(self._entries),
+            "nxdomain_cached": negative,
+            "hits":      self.hits,
+            "misses":    self.misses,
+            "hit_rate":  round(self.hits / lookups, 3) if lookups else None,
+            "negative":  self.negative,
+            "failures":  self.failures,
+            "inflight":  len(self._inflight),
+        }
+
+
+def connector(**kwargs):
+    """``aiohttp.TCPConnector`` resolving through the shared cache."""
+    import aiohttp
+    kwargs.setdefault('use_dns_cache', False)     # ours honours TTLs
+    return aiohttp.TCPConnector(resolver=resolver, **kwargs)
+
+
+# ---------------------------------------------------------------------------
+# Worker side — host pins consulted before libc
+# ---------------------------------------------------------------------------
+
+class PinnedHosts:
+    """
+    Process-local ``host → IPs`` map wrapped around ``socket.getaddrinfo``.
+    Fed from ``options['dns']`` by the fetch workers; hosts without a live
+    pin fall through to libc unchanged.
+    """
+
+    def __init__(self) -> None:
+        self._pins: dict[str, tuple[float, list[str]]] = {}
+        self._lock = threading.Lock()
+        self._orig = None
+
+    def install(self) -> None:
+        if self._orig is None:
+            self._orig = socket.getaddrinfo
+            socket.getaddrinfo = self._getaddrinfo
+
+    def pin(self, hint: Optional[dict]) -> None:
+        """Apply ``{'host': …, 'addrs': [...], 'ttl': seconds}`` from the parent."""
+        if not hint or not hint.get('addrs'):
+            return
+        expires = time.monotonic() + float(hint.get('ttl') or DNS_DEFAULT_TTL)
+        with self._lock:
+            self._pins[hint['host']] = (expires, list(hint['addrs']))
+            if len(self._pins) > 4096:
+                now = time.monotonic()
+                self._pins = {h: p for h, p in self._pins.items() if p[0] > now}
+
+    def _getaddrinfo(self, host, port, family=0, type=0, proto=0, flags=0):
+        key = host.decode() if isinstance(host, bytes) else host
+        with self._lock:
+            pin = self._pins.get(key.lower().rstrip('.')) if key else None
+        if pin and pin[0] > time.monotonic():
+            try:
+                nport = int(port or 0)
+            except (TypeError, ValueError):
+                nport = None            # service name — let libc map it
+            if nport is not None:
+                out = []
+                for ip in pin[1]:
+                    fam = _family_of(ip)
+                    if family not in (0, socket.AF_UNSPEC) and fam != family:
+                        continue
+                    sa = (ip, nport) if fam == socket.AF_INET else (ip, nport, 0, 0)
+                    out.append((fam, type or socket.SOCK_STREAM,
+                                proto or socket.IPPROTO_TCP, '', sa))
+                if out:
+                    return out
+        return self._orig(host, port, family, type, proto, flags)
+
+
+resolver = DNSCache()
+pinned_hosts = PinnedHosts()
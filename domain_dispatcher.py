@@ -0,0 +1,222 @@
+"""
+domain_dispatcher.py — Per-host politeness between the enrichment feeder and
+the tier queues.
+
+The backfill feeder pulls pending articles in ``published_at_gmt`` order, so
+a burst from one site would otherwise put dozens of requests to the same host
+in flight at once.  Every article goes through ``DomainDispatcher.add()``
+instead of straight onto its tier queue; ``run()`` releases them with
+
+  * a per-host concurrency cap (queued + in-flight, shared by all tiers);
+  * a per-host token bucket (``rate`` requests/s, ``burst`` tokens);
+  * a per-host cool-down after HTTP 429 / 503, honouring ``Retry-After``
+    (exponential default when the header is missing);
+  * round-robin across hosts — one article per eligible host per pass — so
+    a large backlog for one site never starves the others.
+
+Lanes
+-----
+Each tier is a *lane* (``'cffi'``, ``'requests'``, ``'playwright'``) mapped
+to its output queue in ``run()``.  Host state is shared across lanes, so the
+cap holds for a host no matter which tier is fetching from it.
+
+The tier handler must call ``done(host, …)`` exactly once per released
+article.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from collections import deque
+from email.utils import parsedate_to_datetime
+from typing import Any, Optional
+from urllib.parse import urlparse
+
+logger = logging.getLogger(__name__)
+
+
+def host_of(url: str) -> str:
+    """Hostname without ``www.`` (same key as the enrichment block tracking)."""
+    try:
+        return (urlparse(url).hostname or '').removeprefix('www.')
+    except Exception:
+        return ''
+
+
+def parse_retry_after(value: Any) -> Optional[float]:
+    """``Retry-After`` as seconds from now — delta-seconds or an HTTP-date."""
+    if value is None or value == '':
+        return None
+    try:
+        return max(0.0, float(value))
+    except (TypeError, ValueError):
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(str(value)).timestamp() - time.time())
+    except (TypeError, ValueError, IndexError):
+        return None
+
+
+class _Host:
+    __slots__ = ('tokens', 'stamp', 'in_flight', 'cool_until', 'strikes', 'pending')
+
+    def __init__(self, burst: float, now: float) -> None:
+        self.tokens     = burst
+        self.stamp      = now
+        self.in_flight  = 0
+        self.cool_until = 0.0
+        self.strikes    = 0
+        self.pending: deque[tuple[str, Any]] = deque()
+
+
+class DomainDispatcher:
+    """Fair, rate-limited release of articles to the enrichment tier queues."""
+
+    def __init__(
+        self,
+        *,
+        per_host: int = 2,
+        rate: float = 1.0,
+        burst: float = 3.0,
+        default_cooldown: float = 30.0,
+        max_cooldown: float = 600.0,
+    ) -> None:
+        self.per_host         = max(1, per_host)
+        self.rate             = max(0.001, rate)
+        self.burst            = max(1.0, burst)
+        self.default_cooldown = default_cooldown
+        self.max_cooldown     = max_cooldown
+        self._hosts: dict[str, _Host] = {}
+        self._ring:  dict[str, None]  = {}      # hosts with pending items, insertion-ordered
+        self._lane_pending: dict[str, int] = {}
+        self._wake = asyncio.Event()
+        # counters
+        self.dispatched = 0
+        self.throttled  = 0
+
+    # ── feeder side ───────────────────────────────────────────────────────────
+
+    def add(self, lane: str, host: str, item: Any) -> None:
+        now = time.monotonic()
+        h = self._hosts.get(host)
+        if h is None:
+            h = self._hosts[host] = _Host(self.burst, now)
+        h.pending.append((lane, item))
+        self._ring[host] = None
+        self._lane_pending[lane] = self._lane_pending.get(lane, 0) + 1
+        self._wake.set()
+
+    def pending(self, lane: str) -> int:
+        """Articles of *lane* held back by politeness (not yet on the tier queue)."""
+        return self._lane_pending.get(lane, 0)
+
+    # ── handler side ──────────────────────────────────────────────────────────
+
+    def done(self, host: str, *, throttled: bool = False, retry_after: Any = None) -> None:
+        """Release a host slot; on 429 / 503 start the host's cool-down."""
+        h = self._hosts.get(host)
+        if h is None:
+            return
+        h.in_flight = max(0, h.in_flight - 1)
+        if throttled:
+            h.strikes += 1
+            self.throttled += 1
+            delay = parse_retry_after(retry_after)
+            if delay is None:
+                delay = self.default_cooldown * (2 ** (h.strikes - 1))
+            delay = min(delay, self.max_cooldown)
+            h.cool_until = max(h.cool_until, time.monotonic() + delay)
+            h.tokens = 0.0
+            logger.info(f"🐢 Enrich: {host} throttled — cooling down {delay:.0f}s")
+        else:
+            h.strikes = 0
+        self._wake.set()
+
+    # ── dispatch loop ─────────────────────────────────────────────────────────
+
+    def _wait_for(self, h: _Host, now: float) -> Optional[float]:
+        """Seconds until *h* may send (0 = now, None = when a slot frees up)."""
+        if h.in_flight >= self.per_host:
+            return None
+        if h.cool_until > now:
+            return h.cool_until - now
+        h.tokens = min(self.burst, h.tokens + (now - h.stamp) * self.rate)
+        h.stamp  = now
+        if h.tokens >= 1.0:
+            return 0.0
+        return (1.0 - h.tokens) / self.rate
+
+    async def run(self, outputs: dict) -> None:
+        """Release articles to ``outputs[lane]`` until cancelled."""
+        while True:
+            now = time.monotonic()
+            next_wake: Optional[float] = None
+            released = False
+            for host in list(self._ring):
+                h = self._hosts[host]
+                wait = self._wait_for(h, now)
+                if wait == 0.0:
+                    lane, item = h.pending.popleft()
+                    h.tokens    -= 1.0
+                    h.in_flight += 1
+                    self._lane_pending[lane] -= 1
+                    outputs[lane].put_nowait(item)
+                    self.dispatched += 1
+                    released = True
+                    if not h.pending:
+                        del self._ring[host]
+                    else:
+                        # Move to the back: next pass serves the other hosts first
+                        del self._ring[host]
+                        self._ring[host] = None
+                elif wait is not None:
+                    next_wake = wait if next_wake is None else min(next_wake, wait)
+            if released:
+                await asyncio.sleep(0)
+                continue
+            self._prune(now)
+            self._wake.clear()
+            try:
+                await asyncio.wait_for(self._wake.wait(), timeout=next_wake)
+            except asyncio.TimeoutError:
+                pass
+
+    def _prune(self, now: float) -> None:
+        """Forget idle hosts whose bucket is full and cool-down is over."""
+        if len(self._hosts) < 4096:
+            return
+        for host in [
+            k for k, h in self._hosts.items()
+            if not h.pending and not h.in_flight and h.cool_until <= now
+            and h.tokens + (now - h.stamp) * self.rate >= self.burst
+        ]:
+            del self._hosts[host]
+
+    # ── introspection ─────────────────────────────────────────────────────────
+
+    def to_dict(self) -> dict:
+        now = time.monotonic()
+        cooling = sorted(
+            ((k, h.cool_until - now) for k, h in self._hosts.items() if h.cool_until > now),
+            key=lambda kv: -kv[1],
+        )
+        busiest = sorted(
+            ((k, len(h.pending)) for k, h in self._hosts.items() if h.pending),
+            key=lambda kv: -kv[1],
+        )[:10]
+        return {
+            "hosts":          len(self._hosts),
+            "hosts_waiting":  len(self._ring),
+            "pending":        dict(self._lane_pending),
+            "in_flight":      sum(h.in_flight for h in self._hosts.values()),
+            "dispatched":     self.dispatched,
+            "throttled":      self.throttled,
+            "cooling":        {k: round(s, 1) for k, s in cooling[:10]},
+            "cooling_hosts":  len(cooling),
+            "top_backlog":    dict(busiest),
+            "per_host":       self.per_host,
+            "rate":           self.rate,
+            "burst":          self.burst,
+        }
@@ -71,8 +71,9 @@ _TIMEOUT_THRESHOLD: int = 5
 
 # HTTP error codes that indicate a source should be (eventually) blocked.
 # Only PERMANENT errors count — 500/503 are temporary server-side outages
-# and must NOT push a domain toward a permanent block.
-_BLOCKING_ERROR_CODES = {401, 402, 403, 406, 410}
+# and must NOT push a domain toward a permanent block.  'NXDOMAIN' comes from
+# the shared DNS cache (dns_cache) when the article host does not exist.
+_BLOCKING_ERROR_CODES = {401, 402, 403, 406, 410, 'NXDOMAIN'}
 
 ArticleDict = Dict[str, Any]
 
@@ -131,6 +132,11 @@ class EnrichmentWorker:
         # Separate from _error_counts so HTTP errors and timeouts don't mix.
         self._timeout_counts: dict[str, int] = {}
 
+        # Playwright resource-filter totals (results carrying a ``net`` report)
+        self.net_totals: dict[str, int] = {
+            'fetches': 0, 'blocked': 0, 'bytes_loaded': 0, 'bytes_saved_est': 0,
+        }
+
         self.logger = logging.getLogger(__name__)
 
     # ------------------------------------------------------------------
@@ -244,6 +250,17 @@ class EnrichmentWorker:
             else:
                 result = await fetch_article_content_async(url, self.timeout)
 
+            net = result.get('net') if result else None
+            if net:
+                self.net_totals['fetches']         += 1
+                self.net_totals['blocked']         += net.get('blocked', 0)
+                self.net_totals['bytes_loaded']    += net.get('bytes_loaded', 0)
+                self.net_totals['bytes_saved_est'] += net.get('bytes_saved_est', 0)
+
+            # Rate limiting: surface to the caller's per-host dispatcher
+            if result and result.get('error_code') in (429, 503):
+                article['_throttled'] = result.get('retry_after') or ''
+
             # Track blocking errors in-memory and surface to caller.
             # Store by domain so _backfill_consumer can persist the domain block.
             if result and result.get('error_code') in _BLOCKING_ERROR_CODES:
@@ -76,6 +76,7 @@ from __future__ import annotations
 import asyncio
 import functools
 import importlib
+import multiprocessing
 import os
 import time
 import traceback
@@ -226,6 +227,10 @@ class ExecWorkerPool:
                      Default: ``os.cpu_count()``  (e.g. 80 on your system)
     thread_workers : size of the ``ThreadPoolExecutor``
                      Default: ``min(32, cpu_count * 4)``
+    mp_context     : multiprocessing start method for the CPU pool
+                     (``"spawn"``, ``"forkserver"``, ``"fork"``).
+                     Default: platform default.  Use ``"spawn"`` from a
+                     process that already runs threads (aiosqlite, pumps).
 
     All errors are captured in ``TaskResult.error`` — ``submit()`` never raises
     (unless the pool was not started).
@@ -235,10 +240,12 @@ class ExecWorkerPool:
         self,
         cpu_workers:    int | None = None,
         thread_workers: int | None = None,
+        mp_context:     str | None = None,
     ) -> None:
         n = os.cpu_count() or 4
         self._n_cpu    = cpu_workers    if cpu_workers    is not None else n
         self._n_thread = thread_workers if thread_workers is not None else min(32, n * 4)
+        self._mp_context = mp_context
         self._proc_pool:   Optional[ProcessPoolExecutor] = None
         self._thread_pool: Optional[ThreadPoolExecutor]  = None
         self._stats: dict[TaskKind, _KindStats] = {k: _KindStats() for k in TaskKind}
@@ -250,7 +257,8 @@ class ExecWorkerPool:
         """Create executor pools.  Returns ``self`` for chaining."""
         if self._started:
             return self
-        self._proc_pool   = ProcessPoolExecutor(max_workers=self._n_cpu)
+        ctx = multiprocessing.get_context(self._mp_context) if self._mp_context else None
+        self._proc_pool   = ProcessPoolExecutor(max_workers=self._n_cpu, mp_context=ctx)
         self._thread_pool = ThreadPoolExecutor(max_workers=self._n_thread)
         self._started = True
         return self
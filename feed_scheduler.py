@@ -0,0 +1,410 @@
+"""
+feed_scheduler.py — Per-feed adaptive polling scheduler for the RSS collector.
+
+Instead of fetching every RSS source once per fixed global cycle, each feed
+carries its own *next-due* time in a min-heap.  The Stage-1 driver in
+``NewsGather.collect_rss_feeds`` pops whatever is due, fetches it, and the
+outcome feeds back into that feed's next interval:
+
+    interval  = 1 / publish_rate            (EWMA of new articles per second)
+              ≤ max_growth × previous interval
+              ≥ Cache-Control max-age / Expires / Retry-After
+              × 2^consecutive_errors        (error back-off)
+              clamped to [min_interval, max_interval], ±jitter
+
+Signals used for the publish rate
+---------------------------------
+* New articles actually inserted since the previous poll (Stage 4 reports
+  them via ``record_new_articles``; Stage 1 folds them into the EWMA on the
+  next poll).  A 304 or an all-duplicates poll counts as zero new articles,
+  so quiet feeds back off naturally.  A feed's first observation is blended
+  with a prior of one article per ``default_interval``, and the interval grows
+  at most ``max_growth``× per poll, so one quiet poll never jumps a feed
+  straight to ``max_interval``.
+* Gaps between ``published_at_gmt`` values of the feed's entries
+  (``observe_publish_times``) — used to seed the rate before the first few
+  polls have been observed.
+* Historical article counts from the DB (``seed_rates``) at startup.
+
+All methods are synchronous and called from the asyncio event-loop thread
+only, so no locking is needed.
+"""
+
+from __future__ import annotations
+
+import heapq
+import random
+import statistics
+import time
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Iterable, Mapping, Optional
+
+__all__ = [
+    "FeedScheduler",
+    "FeedState",
+    "cache_lifetime",
+    "retry_after_seconds",
+]
+
+
+# ---------------------------------------------------------------------------
+# HTTP header helpers
+# ---------------------------------------------------------------------------
+
+def _http_date_delta(value: str, now: float) -> Optional[float]:
+    """Seconds from *now* until the HTTP-date *value* (None if unparsable)."""
+    try:
+        dt = parsedate_to_datetime(value)
+    except (TypeError, ValueError, IndexError):
+        return None
+    if dt is None:
+        return None
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return dt.timestamp() - now
+
+
+def cache_lifetime(headers: Mapping[str, str], now: Optional[float] = None) -> Optional[float]:
+    """
+    Freshness lifetime (seconds) advertised by a response, or None.
+
+    ``Cache-Control: max-age`` wins over ``Expires`` (RFC 9111 §4.2.1).
+    ``no-cache`` / ``no-store`` yield 0.
+    """
+    if not headers:
+        return None
+    now = time.time() if now is None else now
+    cc = headers.get("Cache-Control") or headers.get("cache-control") or ""
+    if cc:
+        directives = [d.strip().lower() for d in cc.split(",")]
+        if "no-cache" in directives or "no-store" in directives:
+            return 0.0
+        for d in directives:
+            if d.startswith("max-age="):
+                try:
+                    return max(0.0, float(d.split("=", 1)[1].strip('"')))
+                except ValueError:
+                    break
+    expires = headers.get("Expires") or headers.get("expires")
+    if expires:
+        delta = _http_date_delta(expires, now)
+        if delta is not None:
+            return max(0.0, delta)
+    return None
+
+
+def retry_after_seconds(headers: Mapping[str, str], now: Optional[float] = None) -> Optional[float]:
+    """Parse ``Retry-After`` (delta-seconds or HTTP-date) into seconds, or None."""
+    if not headers:
+        return None
+    value = headers.get("Retry-After") or headers.get("retry-after")
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    delta = _http_date_delta(value, time.time() if now is None else now)
+    return max(0.0, delta) if delta is not None else None
+
+
+# ---------------------------------------------------------------------------
+# Per-feed state
+# ---------------------------------------------------------------------------
+
+@dataclass
+class FeedState:
+    """Scheduling state for one RSS source."""
+    source:       dict                     # {'id', 'name', 'url', 'language'}
+    next_due:     float = 0.0              # time.time() when the feed should be polled
+    interval:     float = 0.0              # last computed interval (s)
+    rate:         Optional[float] = None   # EWMA new articles / second
+    last_poll:    Optional[float] = None   # time.time() of the last completed poll
+    new_since_poll: int = 0                # articles inserted since last_poll (from Stage 4)
+    errors:       int = 0                  # consecutive failed polls
+    polls:        int = 0
+    not_modified: int = 0
+    floor_s:      float = 0.0              # lower bound from cache headers / Retry-After
+    in_flight:    bool = False
+    generation:   int = 0                  # invalidates stale heap entries
+
+    def to_dict(self, now: float) -> dict:
+        return {
+            "id":          self.source.get("id"),
+            "interval_s":  round(self.interval, 1),
+            "next_due_in_s": round(self.next_due - now, 1),
+            "rate_per_h":  round(self.rate * 3600, 2) if self.rate is not None else None,
+            "errors":      self.errors,
+            "polls":       self.polls,
+            "not_modified": self.not_modified,
+        }
+
+
+# ---------------------------------------------------------------------------
+# FeedScheduler
+# ---------------------------------------------------------------------------
+
+class FeedScheduler:
+    """
+    Min-heap of feeds keyed by next-due time.
+
+    Parameters
+    ----------
+    default_interval:
+        Interval for feeds with no history yet (normally RSS_CYCLE_INTERVAL).
+    min_interval / max_interval:
+        Hard clamps for any computed interval.
+    alpha:
+        EWMA smoothing factor for the publish rate.  With 0.3 each empty poll
+        multiplies the interval by ~1.4, so quiet feeds back off geometrically.
+    target_new:
+        Number of new articles we aim to find per poll.
+    jitter:
+        Relative ± jitter applied to every interval so feeds sharing a host
+        do not synchronise.
+    max_growth:
+        Largest factor by which the rate-derived interval may grow from one
+        poll to the next (error back-off and cache floors are not limited).
+    """
+
+    def __init__(
+        self,
+        default_interval: float = 900.0,
+        min_interval:     float = 120.0,
+        max_interval:     float = 6 * 3600.0,
+        *,
+        alpha:             float = 0.3,
+        target_new:        float = 1.0,
+        jitter:            float = 0.1,
+        max_error_backoff: int   = 6,
+        max_growth:        float = 2.0,
+    ) -> None:
+        self.default_interval  = default_interval
+        self.min_interval      = min_interval
+        self.max_interval      = max_interval
+        self.alpha             = alpha
+        self.target_new        = target_new
+        self.jitter            = jitter
+        self.max_error_backoff = max_error_backoff
+        self.max_growth        = max_growth
+        self._feeds: dict[str, FeedState] = {}
+        self._heap:  list[tuple[float, int, str]] = []   # (next_due, generation, id_source)
+
+    # ------------------------------------------------------------------ #
+    # Membership                                                           #
+    # ------------------------------------------------------------------ #
+
+    def sync(self, sources: Iterable[dict], now: Optional[float] = None) -> tuple[int, int]:
+        """
+        Make the scheduled set equal to *sources*.
+
+        New feeds become due immediately; vanished feeds (deleted or newly
+        fetch_blocked) are dropped.  Existing feeds keep their state but get
+        the fresh source dict (URL / language changes).
+        Returns ``(added, removed)``.
+        """
+        now = time.time() if now is None else now
+        incoming = {s["id"]: s for s in sources}
+        removed = [sid for sid in self._feeds if sid not in incoming]
+        for sid in removed:
+            del self._feeds[sid]       # stale heap entries are skipped on pop
+        added = 0
+        for sid, src in incoming.items():
+            st = self._feeds.get(sid)
+            if st is None:
+                st = FeedState(source=src, interval=self.default_interval)
+                self._feeds[sid] = st
+                self._push(st, now)
+                added += 1
+            else:
+                st.source = src
+        return added, len(removed)
+
+    def seed_rates(self, rates: Mapping[str, float]) -> None:
+        """Seed the publish rate (articles / second) from DB history."""
+        for sid, rate in rates.items():
+            st = self._feeds.get(sid)
+            if st is not None and st.rate is None and rate > 0:
+                st.rate = rate
+
+    def __len__(self) -> int:
+        return len(self._feeds)
+
+    # ------------------------------------------------------------------ #
+    # Driver API                                                           #
+    # ------------------------------------------------------------------ #
+
+    def pop_due(self, limit: int, now: Optional[float] = None) -> list[dict]:
+        """Return up to *limit* due source dicts, most overdue first."""
+        now = time.time() if now is None else now
+        out: list[dict] = []
+        while self._heap and len(out) < limit:
+            due, gen, sid = self._heap[0]
+            st = self._feeds.get(sid)
+            if st is None or st.generation != gen or st.in_flight:
+                heapq.heappop(self._heap)          # stale entry
+                continue
+            if due > now:
+                break
+            heapq.heappop(self._heap)
+            st.in_flight = True
+            out.append(st.source)
+        return out
+
+    def seconds_until_next(self, now: Optional[float] = None) -> Optional[float]:
+        """Seconds until the earliest feed becomes due (None if nothing is scheduled)."""
+        now = time.time() if now is None else now
+        while self._heap:
+            due, gen, sid = self._heap[0]
+            st = self._feeds.get(sid)
+            if st is None or st.generation != gen or st.in_flight:
+                heapq.heappop(self._heap)
+                continue
+            return max(0.0, due - now)
+        return None
+
+    def due_count(self, now: Optional[float] = None) -> int:
+        now = time.time() if now is None else now
+        return sum(
+            1 for st in self._feeds.values()
+            if not st.in_flight and st.next_due <= now
+        )
+
+    # ------------------------------------------------------------------ #
+    # Feedback from the pipeline                                           #
+    # ------------------------------------------------------------------ #
+
+    def record_new_articles(self, source_id: str, count: int) -> None:
+        """Stage 4: *count* articles from this feed were actually inserted."""
+        st = self._feeds.get(source_id)
+        if st is not None and count > 0:
+            st.new_since_poll += count
+
+    def observe_publish_times(self, source_id: str, published_gmt: Iterable[str]) -> None:
+        """
+        Stage 2: seed the rate from the median gap between entry publish times
+        while the feed has no poll history yet.
+        """
+        st = self._feeds.get(source_id)
+        if st is None or st.rate is not None:
+            return
+        stamps = []
+        for s in published_gmt:
+            if not s:
+                continue
+            try:
+                dt = datetime.fromisoformat(s.replace("Z", "+00:00"))
+            except ValueError:
+                continue
+            if dt.tzinfo is None:
+                dt = dt.replace(tzinfo=timezone.utc)
+            stamps.append(dt.timestamp())
+        if len(stamps) < 2:
+            return
+        stamps.sort()
+        gaps = [b - a for a, b in zip(stamps, stamps[1:]) if b > a]
+        if gaps:
+            st.rate = 1.0 / max(statistics.median(gaps), 1.0)
+
+    def record_poll(
+        self,
+        source_id: str,
+        outcome: str,
+        headers: Optional[Mapping[str, str]] = None,
+        now: Optional[float] = None,
+    ) -> Optional[float]:
+        """
+        Stage 1: a poll finished with *outcome* ∈ {'ok', 'not_modified', 'error'}.
+
+        Folds the articles inserted since the previous poll into the rate
+        EWMA, applies cache / Retry-After floors and error back-off, and
+        re-inserts the feed into the heap.  Returns the new interval.
+        """
+        now = time.time() if now is None else now
+        st = self._feeds.get(source_id)
+        if st is None:
+            return None
+        st.in_flight = False
+        st.polls += 1
+
+        if outcome == "error":
+            st.errors += 1
+        else:
+            st.errors = 0
+            if outcome == "not_modified":
+                st.not_modified += 1
+            if st.last_poll is not None:
+                elapsed = max(now - st.last_poll, 1.0)
+                observed = st.new_since_poll / elapsed
+                # No history yet: blend with a prior of one article per
+                # default interval instead of trusting a single observation
+                prior = st.rate if st.rate is not None else (
+                    self.target_new / self.default_interval
+                )
+                st.rate = self.alpha * observed + (1.0 - self.alpha) * prior
+            st.new_since_poll = 0
+            st.last_poll = now
+
+        floor = cache_lifetime(headers or {}, now) or 0.0
+        retry = retry_after_seconds(headers or {}, now) or 0.0
+        st.floor_s = max(floor, retry)
+
+        self._push(st, now)
+        return st.interval
+
+    # ------------------------------------------------------------------ #
+    # Introspection                                                        #
+    # ------------------------------------------------------------------ #
+
+    def to_dict(self, now: Optional[float] = None) -> dict:
+        now = time.time() if now is None else now
+        intervals = sorted(st.interval for st in self._feeds.values())
+        nxt = self.seconds_until_next(now)
+        return {
+            "feeds":          len(self._feeds),
+            "due":            self.due_count(now),
+            "in_flight":      sum(1 for st in self._feeds.values() if st.in_flight),
+            "backing_off":    sum(1 for st in self._feeds.values() if st.errors),
+            "next_due_in_s":  round(nxt, 1) if nxt is not None else None,
+            "interval_min_s": round(intervals[0], 1) if intervals else None,
+            "interval_p50_s": round(intervals[len(intervals) // 2], 1) if intervals else None,
+            "interval_max_s": round(intervals[-1], 1) if intervals else None,
+        }
+
+    def busiest(self, n: int = 10, now: Optional[float] = None) -> list[dict]:
+        """The *n* feeds with the shortest current interval."""
+        now = time.time() if now is None else now
+        feeds = sorted(self._feeds.values(), key=lambda st: st.interval)[:n]
+        return [st.to_dict(now) for st in feeds]
+
+    # ------------------------------------------------------------------ #
+    # Internals                                                            #
+    # ------------------------------------------------------------------ #
+
+    def _compute_interval(self, st: FeedState) -> float:
+        if st.rate is not None and st.rate > 0:
+            interval = self.target_new / st.rate
+        elif st.rate is not None:
+            interval = self.max_interval
+        else:
+            interval = self.default_interval
+        if st.interval > 0:
+            interval = min(interval, st.interval * self.max_growth)
+        interval = max(interval, st.floor_s)
+        if st.errors:
+            interval *= 2 ** min(st.errors, self.max_error_backoff)
+        interval = min(max(interval, self.min_interval), self.max_interval)
+        if self.jitter:
+            interval *= 1.0 + random.uniform(-self.jitter, self.jitter)
+        return interval
+
+    def _push(self, st: FeedState, now: float) -> None:
+        if st.polls == 0 and st.last_poll is None and st.errors == 0:
+            # Never polled — due now, no interval wait
+            st.next_due = now
+        else:
+            st.interval = self._compute_interval(st)
+            st.next_due = now + st.interval
+        st.generation += 1
+        heapq.heappush(self._heap, (st.next_due, st.generation, st.source["id"]))
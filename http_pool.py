@@ -0,0 +1,145 @@
+"""
+http_pool.py — Service-scoped aiohttp client shared by every collector.
+
+One ``ClientSession`` on one ``TCPConnector`` serves RSS Stage 1, feed
+discovery, proxy-URL resolution, NewsAPI and MediaStack.  Its lifecycle is
+tied to ``run_all_collectors``: ``start()`` after the DB opens, ``close()``
+once every collector task has finished.  Entry points that call a collector
+directly (the test scripts) need not start it: the first ``session`` access
+inside the running loop does.
+
+* Keep-alive connections are pooled per host (``limit_per_host``) under a
+  global ``limit``, so a feed polled every few minutes — or a publisher
+  serving several feeds — reuses its open connection instead of paying a
+  fresh TCP + TLS handshake per poll.
+* The connector resolves through ``dns_cache`` (TTL-respecting, shared).
+* Per-request timeouts are the caller's business; the session itself has
+  none, so one slow collector can't impose its budget on the others.
+
+Pool stats come from aiohttp trace hooks (created / reused / queued
+connections) plus the connector's idle and in-use sets.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+from typing import Optional
+
+import aiohttp
+
+import dns_cache
+
+logger = logging.getLogger(__name__)
+
+# Overridable after import (wxAsyncNewsGather assigns its decouple config)
+HTTP_POOL_LIMIT:    int   = int(os.environ.get('HTTP_POOL_LIMIT', 100))
+HTTP_POOL_PER_HOST: int   = int(os.environ.get('HTTP_POOL_PER_HOST', 6))
+HTTP_KEEPALIVE_S:   float = float(os.environ.get('HTTP_KEEPALIVE_S', 60))
+
+
+class HttpPool:
+    """
+    Shared ``aiohttp.ClientSession`` with pool statistics, started by
+    ``start()`` or on the first ``session`` access.  After ``close()`` it
+    stays closed until ``start()`` is called again, so a collector finishing
+    late during shutdown cannot leak a fresh session.
+    """
+
+    def __init__(self) -> None:
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._connector: Optional[aiohttp.TCPConnector] = None
+        self._closed = False
+        # counters (trace hooks)
+        self.requests = 0
+        self.errors   = 0
+        self.created  = 0      # new TCP (+TLS) connections
+        self.reused   = 0      # requests served on a pooled keep-alive socket
+        self.queued   = 0      # requests that waited for a free slot
+
+    async def start(self) -> None:
+        self._closed = False
+        self._open()
+
+    def _open(self) -> aiohttp.ClientSession:
+        """Create the session unless one is open; call inside the running loop."""
+        if self._session is not None and not self._session.closed:
+            return self._session
+        trace = aiohttp.TraceConfig()
+        trace.on_request_start.append(self._on_request)
+        trace.on_request_exception.append(self._on_error)
+        trace.on_connection_create_end.append(self._on_create)
+        trace.on_connection_reuseconn.append(self._on_reuse)
+        trace.on_connection_queued_start.append(self._on_queued)
+        self._connector = dns_cache.connector(
+            limit=HTTP_POOL_LIMIT,
+            limit_per_host=HTTP_POOL_PER_HOST,
+            keepalive_timeout=HTTP_KEEPALIVE_S,
+        )
+        self._session = aiohttp.ClientSession(
+            connector=self._connector,
+            timeout=aiohttp.ClientTimeout(total=None),
+            trace_configs=[trace],
+        )
+        logger.info(
+            f"🌐 HTTP pool started (limit={HTTP_POOL_LIMIT}, "
+            f"per_host={HTTP_POOL_PER_HOST}, keepalive={HTTP_KEEPALIVE_S:.0f}s)"
+        )
+        return self._session
+
+    @property
+    def session(self) -> aiohttp.ClientSession:
+        if self._closed:
+            raise RuntimeError("HTTP pool closed")
+        return self._open()
+
+    async def close(self) -> None:
+        self._closed = True
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+        self._connector = None
+
+    # ── trace hooks ───────────────────────────────────────────────────────────
+
+    async def _on_request(self, session, ctx, params) -> None:
+        self.requests += 1
+
+    async def _on_error(self, session, ctx, params) -> None:
+        self.errors += 1
+
+    async def _on_create(self, session, ctx, params) -> None:
+        self.created += 1
+
+    async def _on_reuse(self, session, ctx, params) -> None:
+        self.reused += 1
+
+    async def _on_queued(self, session, ctx, params) -> None:
+        self.queued += 1
+
+    # ── introspection ─────────────────────────────────────────────────────────
+
+    def to_dict(self) -> dict:
+        conn = self._connector
+        idle = in_use = hosts = 0
+        if conn is not None and not conn.closed:
+            pooled = getattr(conn, '_conns', {}) or {}
+            idle   = sum(len(v) for v in pooled.values())
+            hosts  = len(pooled)
+            in_use = len(getattr(conn, '_acquired', ()) or ())
+        acquired = self.created + self.reused
+        return {
+            "started":       self._session is not None and not self._session.closed,
+            "open":          idle + in_use,
+            "in_use":        in_use,
+            "idle":          idle,
+            "idle_hosts":    hosts,
+            "created":       self.created,
+            "reused":        self.reused,
+            "reuse_ratio":   round(self.reused / acquired, 3) if acquired else None,
+            "queued":        self.queued,
+            "requests":      self.requests,
+            "errors":        self.errors,
+            "limit":         HTTP_POOL_LIMIT,
+            "limit_per_host": HTTP_POOL_PER_HOST,
+        }
@@ -301,6 +301,98 @@ class LoopLagSensor:
 lag_sensor = LoopLagSensor(interval=0.5, window=120)
 
 
+# ---------------------------------------------------------------------------
+# Latency histograms — per-endpoint request timing
+# ---------------------------------------------------------------------------
+
+class LatencyHistogram:
+    """
+    Cumulative fixed-bucket latency histogram (milliseconds).
+
+    Buckets are upper bounds; the last bucket catches everything above.
+    Percentiles are estimated as the upper bound of the bucket holding the
+    requested rank, which is what dashboards need and costs O(1) memory.
+    """
+
+    BUCKETS_MS = (1, 2, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, float('inf'))
+
+    def __init__(self) -> None:
+        self._counts = [0] * len(self.BUCKETS_MS)
+        self._n      = 0
+        self._sum_ms = 0.0
+        self._max_ms = 0.0
+
+    def observe(self, ms: float) -> None:
+        for i, bound in enumerate(self.BUCKETS_MS):
+            if ms <= bound:
+                self._counts[i] += 1
+                break
+        self._n      += 1
+        self._sum_ms += ms
+        if ms > self._max_ms:
+            self._max_ms = ms
+
+    def _percentile(self, p: float) -> Optional[float]:
+        if not self._n:
+            return None
+        rank, seen = p * self._n, 0
+        for bound, count in zip(self.BUCKETS_MS, self._counts):
+            seen += count
+            if seen >= rank:
+                return bound if bound != float('inf') else round(self._max_ms, 2)
+        return round(self._max_ms, 2)
+
+    def to_dict(self) -> dict:
+        return {
+            'count':   self._n,
+            'avg_ms':  round(self._sum_ms / self._n, 2) if self._n else None,
+            'max_ms':  round(self._max_ms, 2),
+            'p50_ms':  self._percentile(0.50),
+            'p95_ms':  self._percentile(0.95),
+            'p99_ms':  self._percentile(0.99),
+            'buckets': {
+                ('+inf' if b == float('inf') else f'le_{b:g}'): c
+                for b, c in zip(self.BUCKETS_MS, self._counts)
+            },
+        }
+
+
+class EndpointLatency:
+    """
+    Registry of ``LatencyHistogram`` per label (e.g. API endpoint path).
+
+        async with api_latency.span("/api/articles"):
+            ...
+    """
+
+    def __init__(self) -> None:
+        self._hists: Dict[str, LatencyHistogram] = {}
+
+    def observe(self, name: str, ms: float) -> None:
+        hist = self._hists.get(name)
+        if hist is None:
+            hist = self._hists[name] = LatencyHistogram()
+        hist.observe(ms)
+
+    @contextlib.asynccontextmanager
+    async def span(self, name: str) -> AsyncIterator[None]:
+        t0 = time.monotonic()
+        try:
+            yield
+        finally:
+            self.observe(name, (time.monotonic() - t0) * 1000.0)
+
+    def stats(self) -> Dict[str, dict]:
+        return {name: h.to_dict() for name, h in sorted(self._hists.items())}
+
+    def clear(self) -> None:
+        self._hists.clear()
+
+
+# Global singleton — request latency of the FastAPI endpoints
+api_latency = EndpointLatency()
+
+
 # ---------------------------------------------------------------------------
 # Stall probe — reusable for any worker type
 # ---------------------------------------------------------------------------
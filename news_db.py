@@ -6,10 +6,14 @@ A single aiosqlite connection is kept open for the lifetime of the process;
 every await goes through aiosqlite's internal work-queue (background SQLite
 thread), so the asyncio event loop is never blocked.
 
-A ``_write_lock`` (asyncio.Lock) serialises multi-statement atomic blocks —
-e.g. read-then-update sequences that must not be interleaved by another
-coroutine.  Single-statement DML (INSERT OR IGNORE, ON CONFLICT DO UPDATE,
-simple UPDATE/DELETE) does **not** need the lock.
+Hot-path writes go through a ``WriteCoalescer`` (group commit): callers
+await a future while a background task applies queued mutations one at a
+time and commits them together, once per ``max_delay_ms`` or ``max_ops``.
+Read-then-update blocks are submitted as a single ``run(fn)`` mutation, so
+they cannot be interleaved by another coalesced write.  Every write on the
+shared connection goes through the coalescer — a direct execute / commit
+there could commit half of a group in flight.  Only schema migrations run
+directly, before the coalescer starts.
 
 Usage
 -----
@@ -27,14 +31,128 @@ Usage
 from __future__ import annotations
 
 import asyncio
+import base64
+import binascii
+import contextlib
 import logging
+import os
+import sqlite3
 import time
-from typing import Any, Optional, TypedDict
+from collections import deque
+from datetime import datetime, timezone
+from typing import Any, AsyncIterator, Awaitable, Callable, Optional, TypedDict
 
 import aiosqlite
 
+import body_codec
+
 logger = logging.getLogger(__name__)
 
+# Multi-row INSERT limits: bound parameters per statement (raised from 999 in
+# SQLite 3.32) and RETURNING support (3.35).
+_SQLITE_MAX_VARS      = 32766 if sqlite3.sqlite_version_info >= (3, 32, 0) else 999
+_SQLITE_HAS_RETURNING = sqlite3.sqlite_version_info >= (3, 35, 0)
+
+API_READ_POOL_SIZE = 4   # read-only connections reserved for the FastAPI handlers
+
+EPOCH_BACKFILL_BATCH = 5000   # rows per published_at_epoch back-fill step (one coalesced write)
+
+# Article body layout (overridable after import — wxAsyncNewsGather assigns its decouple config)
+#   inline — writers keep content / translated_content in gm_articles
+#   table  — writers store them in gm_article_bodies, keeping gm_articles rows small
+# ARTICLE_BODIES_DB puts gm_article_bodies in a separate file ATTACHed as ``bodies``
+# (relative paths are resolved next to the main DB).  Reads always prefer the
+# body row and fall back to the inline columns, so either layout — or a DB half
+# way through scripts/split_article_bodies.py — reads the same.
+ARTICLE_BODY_STORE: str = os.environ.get('ARTICLE_BODY_STORE', 'inline')
+ARTICLE_BODIES_DB:  str = os.environ.get('ARTICLE_BODIES_DB', '')
+
+_BODY_COLUMNS = ("content", "translated_content")
+BODY_RECOMPRESS_BATCH = 1000  # body rows per recompression step (one coalesced write)
+FTS_REBUILD_BATCH     = 2000  # articles per read / decode / insert step of a search-index rebuild
+# gm_articles_fts triggers; the trg_bodies_* ones are retired (body text is now
+# indexed from Python) and only listed so they are dropped
+_FTS_TRIGGERS = (
+    "trg_articles_fts_insert", "trg_articles_fts_delete", "trg_articles_fts_update",
+    "trg_bodies_fts_insert", "trg_bodies_fts_update", "trg_bodies_fts_delete",
+)
+
+# Columns covered by the gm_articles_fts full-text index, with their bm25 weights
+_SEARCH_COLUMNS = (
+    ("title", 10.0), ("description", 5.0), ("content", 1.0),
+    ("translated_title", 10.0), ("translated_description", 5.0), ("translated_content", 1.0),
+)
+
+
+def gmt_to_epoch(gmt: Optional[str]) -> Optional[int]:
+    """
+    Unix seconds for an ISO ``published_at_gmt`` value, or None when it is
+    empty / unparsable.  Naive values are taken as UTC, matching SQLite's
+    ``strftime('%s', …)`` used by the safety-net triggers.
+    """
+    if not gmt:
+        return None
+    try:
+        dt = datetime.fromisoformat(gmt.replace("Z", "+00:00"))
+    except (TypeError, ValueError):
+        return None
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return int(dt.timestamp())
+
+
+def _with_epoch(article: dict) -> dict:
+    """*article* plus ``published_at_epoch`` derived from its published_at_gmt."""
+    if "published_at_gmt" not in article or "published_at_epoch" in article:
+        return article
+    return {**article, "published_at_epoch": gmt_to_epoch(article["published_at_gmt"])}
+
+
+def _fts_match_expr(query: str) -> str:
+    """
+    Turn free user text into a safe FTS5 MATCH expression: every term is
+    quoted (so operators / punctuation cannot raise syntax errors) and the
+    terms are ANDed.  A trailing ``*`` on a term keeps prefix matching.
+    """
+    terms = []
+    for tok in query.split():
+        prefix = tok.endswith("*")
+        tok = tok.rstrip("*").replace('"', '""')
+        if any(ch.isalnum() for ch in tok):   # bare punctuation indexes to nothing
+            terms.append(f'"{tok}"*' if prefix else f'"{tok}"')
+    return " ".join(terms)
+
+
+def _fts_values(row: str, body: str) -> str:
+    """
+    Stored values of one article's gm_articles_fts columns: *row* (a
+    gm_articles alias) supplies every column, *body* (a gm_article_bodies
+    alias) overrides the body columns when present.  Body values may still
+    be compressed — see _fts_decode_rows().
+    """
+    return ", ".join(
+        f"COALESCE({body}.{col}, {row}.{col})" if col in _BODY_COLUMNS else f"{row}.{col}"
+        for col, _ in _SEARCH_COLUMNS
+    )
+
+
+def _fts_decode_rows(
+    rows: list, decode: Callable[[Any], Optional[str]]
+) -> list[tuple]:
+    """
+    ``(rowid, *_fts_values)`` rows with the body columns passed through
+    *decode* (body_codec), ready to INSERT into gm_articles_fts.  The index
+    only ever holds plain text, so no SQL function is needed to maintain it.
+    """
+    body_at = [1 + i for i, (col, _) in enumerate(_SEARCH_COLUMNS) if col in _BODY_COLUMNS]
+    out = []
+    for r in rows:
+        r = list(r)
+        for i in body_at:
+            r[i] = decode(r[i])
+        out.append(tuple(r))
+    return out
+
 
 # ── Typed shapes for stable dict contracts ────────────────────────────────────
 
@@ -76,6 +194,253 @@ class TranslationValues(_TranslationRequired, total=False):
     translated_content:     str
 
 
+# ── Group-commit write coalescer ──────────────────────────────────────────────
+
+WRITE_COALESCE_MAX_OPS      = 256    # commit as soon as this many mutations are queued…
+WRITE_COALESCE_MAX_DELAY_MS = 25.0   # …or once the oldest one has waited this long
+
+
+class _WriteOp:
+    """One queued mutation: a statement (``sql``) or a callable (``fn``)."""
+    __slots__ = ("sql", "params", "many", "fn", "future", "enqueued_at")
+
+    def __init__(self, future: asyncio.Future, *, sql: Optional[str] = None,
+                 params: Any = (), many: bool = False,
+                 fn: Optional[Callable[[Any], Awaitable[Any]]] = None) -> None:
+        self.sql         = sql
+        self.params      = params
+        self.many        = many
+        self.fn          = fn
+        self.future      = future
+        self.enqueued_at = time.monotonic()
+
+
+class WriteCoalescer:
+    """
+    Group-commit service in front of a single write connection.
+
+    Writers call ``execute()`` (one statement, or ``executemany`` with
+    ``many=True``) or ``run(fn)`` (an ``async fn(conn)`` for multi-statement
+    or read-then-update blocks) and await the result.  A background task
+    applies queued mutations in submission order and commits them as one
+    transaction per ``max_delay_ms`` or ``max_ops``, whichever comes first.
+    Each future resolves only after COMMIT, so an awaited write is exactly
+    as durable as before — it just shares its fsync with its neighbours.
+
+    Each mutation runs inside its own SAVEPOINT: one that raises is rolled
+    back to that savepoint and fails only its own caller, while the rest of
+    the group still commits.  A failed COMMIT rolls the whole group back and
+    is raised in every caller of the group.
+    """
+
+    def __init__(
+        self,
+        conn_getter: Callable[[], aiosqlite.Connection],
+        *,
+        max_ops: int = WRITE_COALESCE_MAX_OPS,
+        max_delay_ms: float = WRITE_COALESCE_MAX_DELAY_MS,
+    ) -> None:
+        self._get_conn    = conn_getter
+        self.max_ops      = max(1, int(max_ops))
+        self.max_delay_ms = max(0.0, float(max_delay_ms))
+        self._queue: deque[_WriteOp] = deque()
+        self._wake  = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+        self._flushing: Optional[asyncio.Task] = None   # group being applied right now
+        self._stopping = False
+        # Metrics
+        self._commits     = 0
+        self._ops         = 0
+        self._op_errors   = 0
+        self._commit_errs = 0
+        self._max_batch   = 0
+        self._wait_ms_sum = 0.0
+        self._recent: deque[tuple[int, float]] = deque(maxlen=512)  # (size, commit_ms)
+
+    # ── lifecycle ─────────────────────────────────────────────────────────────
+
+    def start(self) -> None:
+        if self._task is None or self._task.done():
+            self._task = asyncio.get_event_loop().create_task(self._run())
+
+    async def stop(self) -> None:
+        """
+        Stop the background task, then flush whatever is still queued.  A group
+        being applied when stop() is called is finished (committed or rolled
+        back, its callers resolved) before the rest of the queue is drained.
+        """
+        task, self._task = self._task, None
+        if task is not None:
+            self._stopping = True
+            self._wake.set()
+            try:
+                await asyncio.gather(task, return_exceptions=True)
+            finally:
+                self._stopping = False
+        if self._flushing is not None:
+            await asyncio.gather(self._flushing, return_exceptions=True)
+        while self._queue:
+            await self._flush()
+
+    # ── submission ────────────────────────────────────────────────────────────
+
+    async def execute(self, sql: str, params: Any = (), *, many: bool = False) -> int:
+        """Queue one statement; returns its rowcount once committed."""
+        return await self._submit(sql=sql, params=params, many=many)
+
+    async def run(self, fn: Callable[[aiosqlite.Connection], Awaitable[Any]]) -> Any:
+        """Queue ``await fn(conn)``; returns its result once committed."""
+        return await self._submit(fn=fn)
+
+    async def _submit(self, **op: Any) -> Any:
+        if self._task is None:
+            self.start()
+        fut = asyncio.get_event_loop().create_future()
+        self._queue.append(_WriteOp(fut, **op))
+        # First op starts the group window; a full group flushes at once
+        if len(self._queue) == 1 or len(self._queue) >= self.max_ops:
+            self._wake.set()
+        return await fut
+
+    # ── background flusher ────────────────────────────────────────────────────
+
+    async def _run(self) -> None:
+        while not self._stopping:
+            await self._wake.wait()
+            self._wake.clear()
+            if self._stopping:
+                break                  # stop() drains the queue itself
+            if not self._queue:
+                continue
+            delay = self.max_delay_ms / 1000 - (time.monotonic() - self._queue[0].enqueued_at)
+            if delay > 0 and len(self._queue) < self.max_ops:
+                try:
+                    await asyncio.wait_for(self._wake.wait(), timeout=delay)
+                except asyncio.TimeoutError:
+                    pass
+                self._wake.clear()
+            # Shielded: cancelling this task must never abandon a group half
+            # applied — stop() awaits _flushing before draining the rest.
+            self._flushing = asyncio.ensure_future(self._flush())
+            try:
+                await asyncio.shield(self._flushing)
+            except Exception as exc:  # never let the flusher die
+                logger.error(f"WriteCoalescer flush error: {exc}", exc_info=True)
+            finally:
+                if self._flushing.done():
+                    self._flushing = None
+            if self._queue:
+                self._wake.set()
+
+    async def _flush(self) -> None:
+        batch = [self._queue.popleft() for _ in range(min(len(self._queue), self.max_ops))]
+        if not batch:
+            return
+        t0 = time.monotonic()
+        outcomes: list[tuple[Any, Optional[BaseException]]] = []
+        conn: Optional[aiosqlite.Connection] = None
+        try:
+            conn = self._get_conn()
+            if not conn.in_transaction:
+                await conn.execute("BEGIN")
+            for op in batch:
+                self._wait_ms_sum += (t0 - op.enqueued_at) * 1000
+                await conn.execute("SAVEPOINT coalesced_op")
+                try:
+                    if op.fn is not None:
+                        res = await op.fn(conn)
+                    elif op.many:
+                        res = (await conn.executemany(op.sql, op.params)).rowcount
+                    else:
+                        res = (await conn.execute(op.sql, op.params)).rowcount
+                except Exception as exc:
+                    # Undo whatever this op wrote before raising; the group goes on
+                    self._op_errors += 1
+                    await conn.execute("ROLLBACK TO coalesced_op")
+                    await conn.execute("RELEASE coalesced_op")
+                    outcomes.append((None, exc))
+                else:
+                    await conn.execute("RELEASE coalesced_op")
+                    outcomes.append((res, None))
+            await conn.commit()
+        except Exception as exc:
+            self._commit_errs += 1
+            outcomes = [(None, exc)] * len(batch)
+            if conn is not None:
+                with contextlib.suppress(Exception):
+                    await conn.rollback()
+        commit_ms = (time.monotonic() - t0) * 1000
+        self._commits  += 1
+        self._ops      += len(batch)
+        self._max_batch = max(self._max_batch, len(batch))
+        self._recent.append((len(batch), commit_ms))
+        for op, (res, exc) in zip(batch, outcomes):
+            if op.future.done():
+                continue   # caller was cancelled — the write still went in
+            if exc is not None:
+                op.future.set_exception(exc)
+            else:
+                op.future.set_result(res)
+
+    # ── introspection ─────────────────────────────────────────────────────────
+
+    def to_dict(self) -> dict:
+        """Knobs plus commit-size / commit-latency metrics (recent window)."""
+        sizes = sorted(b for b, _ in self._recent)
+        lats  = sorted(ms for _, ms in self._recent)
+
+        def _pct(vals: list, p: float) -> float:
+            return round(vals[min(len(vals) - 1, int(len(vals) * p))], 2) if vals else 0.0
+
+        return {
+            "max_ops":          self.max_ops,
+            "max_delay_ms":     self.max_delay_ms,
+            "queued":           len(self._queue),
+            "commits":          self._commits,
+            "ops":              self._ops,
+            "op_errors":        self._op_errors,
+            "commit_errors":    self._commit_errs,
+            "avg_batch":        round(self._ops / self._commits, 2) if self._commits else 0.0,
+            "max_batch":        self._max_batch,
+            "batch_p50":        _pct(sizes, 0.50),
+            "batch_p95":        _pct(sizes, 0.95),
+            "commit_ms_p50":    _pct(lats, 0.50),
+            "commit_ms_p95":    _pct(lats, 0.95),
+            "commit_ms_max":    round(lats[-1], 2) if lats else 0.0,
+            "avg_queue_wait_ms": round(self._wait_ms_sum / self._ops, 2) if self._ops else 0.0,
+        }
+
+
+# ── /api/articles keyset cursor ───────────────────────────────────────────────
+
+def encode_article_cursor(inserted_at_ms: int, article_id) -> str:
+    """
+    Opaque /api/articles cursor for the keyset ``(inserted_at_ms, id_article)``.
+    The id keeps its storage type (``b`` = BLOB from url_encode, ``s`` = text)
+    so the row-value comparison in the DB matches the stored values;
+    ``n`` (no id) means "everything after *inserted_at_ms*".
+    """
+    if article_id is None:
+        return f"{int(inserted_at_ms)}.n"
+    kind = 'b' if isinstance(article_id, (bytes, bytearray)) else 's'
+    raw  = bytes(article_id) if kind == 'b' else str(article_id).encode('utf-8')
+    return f"{int(inserted_at_ms)}.{kind}{base64.urlsafe_b64encode(raw).decode('ascii').rstrip('=')}"
+
+
+def decode_article_cursor(cursor: str) -> tuple[int, "bytes | str | None"]:
+    """Inverse of encode_article_cursor(); raises ValueError on a malformed cursor."""
+    ms, _, rest = cursor.partition('.')
+    if not ms.isdigit() or not rest or rest[0] not in 'bsn':
+        raise ValueError(f"malformed cursor {cursor!r}")
+    if rest == 'n':
+        return int(ms), None
+    try:
+        raw = base64.b64decode(rest[1:] + '=' * (-len(rest[1:]) % 4), altchars=b'-_', validate=True)
+        return int(ms), (raw if rest[0] == 'b' else raw.decode('utf-8'))
+    except (binascii.Error, UnicodeDecodeError) as e:
+        raise ValueError(f"malformed cursor {cursor!r}") from e
+
+
 class NewsDatabase:
     """Singleton async CRUD layer backed by aiosqlite."""
 
@@ -87,8 +452,31 @@ class NewsDatabase:
         self._db_path    = db_path
         self._conn:    Optional[aiosqlite.Connection] = None
         self._ro_conn: Optional[aiosqlite.Connection] = None  # read-only; never blocks writers
-        # Serialises multi-statement atomic blocks so coroutines cannot interleave
-        self._write_lock = asyncio.Lock()
+        # Group-commit writer shared by every hot-path write
+        self._writer = WriteCoalescer(lambda: self._c)
+        # Bounded pool of read-only connections for API handlers (lazy)
+        self._api_pool_size = API_READ_POOL_SIZE
+        self._api_pool_open = 0
+        self._api_idle: Optional[asyncio.Queue] = None
+        # Set by _migrate_search_index() — False when SQLite lacks FTS5
+        self._fts_available = False
+        # True once every pre-existing row has its published_at_epoch
+        self._epoch_backfilled = False
+        # Body layout (see ARTICLE_BODY_STORE / ARTICLE_BODIES_DB)
+        self._split_bodies = ARTICLE_BODY_STORE.strip().lower() == "table"
+        self._bodies_path  = ""
+        if ARTICLE_BODIES_DB:
+            self._bodies_path = (
+                ARTICLE_BODIES_DB if os.path.isabs(ARTICLE_BODIES_DB)
+                else os.path.join(os.path.dirname(os.path.abspath(db_path)), ARTICLE_BODIES_DB)
+            )
+        self._bodies = "bodies.gm_article_bodies" if self._bodies_path else "gm_article_bodies"
+        self._body_dicts = "bodies.gm_body_dicts" if self._bodies_path else "gm_body_dicts"
+        # Compressed bodies (body_codec) — _body_decode once any may exist
+        self._codec = body_codec.BodyCodec()
+        self._body_decode = False
+        self._codec_task: Optional[asyncio.Task] = None
+        self._epoch_task: Optional[asyncio.Task] = None
         # Cached queue stats — refreshed by refresh_stats_cache() every N seconds
         self._cached_stats: QueueStats = {
             "enriched": 0, "enrich_pending": 0, "enrich_failed": 0,
@@ -121,8 +509,13 @@ class NewsDatabase:
         await self._conn.execute("PRAGMA busy_timeout=60000")
         # Checkpoint automatically when WAL reaches 1000 pages (~4 MB)
         await self._conn.execute("PRAGMA wal_autocheckpoint=1000")
+        if self._bodies_path:
+            await self._conn.execute("ATTACH DATABASE ? AS bodies", (self._bodies_path,))
+            await self._conn.execute("PRAGMA bodies.journal_mode=WAL")
+            await self._conn.execute("PRAGMA bodies.synchronous=NORMAL")
         await self._migrate()
         await self._conn.commit()
+        self._writer.start()
         # Read-only connection: runs in its own aiosqlite thread — never queues
         # behind write operations. WAL mode allows concurrent readers + 1 writer.
         self._ro_conn = await aiosqlite.connect(
@@ -130,12 +523,19 @@ class NewsDatabase:
         )
         self._ro_conn.row_factory = aiosqlite.Row
         await self._ro_conn.execute("PRAGMA busy_timeout=5000")
+        await self._attach_bodies_ro(self._ro_conn)
         logger.info(f"✅ NewsDatabase connected: {self._db_path}")
         # Periodic WAL checkpoint task (every 5 min) to prevent WAL from growing unbounded
         import asyncio
         self._checkpoint_task: asyncio.Task = asyncio.get_event_loop().create_task(
             self._periodic_wal_checkpoint()
         )
+        if not self._epoch_backfilled:
+            self._epoch_task = asyncio.get_event_loop().create_task(
+                self._backfill_published_epoch()
+            )
+        if self._codec.enabled:
+            self._codec_task = asyncio.get_event_loop().create_task(self._recompress_bodies())
 
     async def _migrate(self) -> None:
         """Apply incremental schema migrations (idempotent)."""
@@ -197,6 +597,610 @@ class NewsDatabase:
                 """
             )
             logger.info(f"✅ Migration: stripped microseconds from {affected} published_at_gmt values")
+        # Conditional-GET validators per RSS feed (ETag / Last-Modified).
+        # Side table so gm_sources stays untouched by the hot Stage-1 writes.
+        await self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS gm_feed_validators (
+                id_source     TEXT PRIMARY KEY,
+                etag          TEXT,
+                last_modified TEXT,
+                updated_at_ms INTEGER
+            )
+            """
+        )
+        logger.debug("✅ Migration: gm_feed_validators ensured")
+        # Keyset order for the /api/articles cursor (inserted_at_ms, id_article)
+        await self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_articles_inserted_keyset "
+            "ON gm_articles(inserted_at_ms, id_article)"
+        )
+        logger.debug("✅ Migration: idx_articles_inserted_keyset ensured")
+        await self._migrate_source_stats()
+        await self._migrate_article_bodies()
+        await self._migrate_search_index()
+        await self._migrate_published_epoch()
+
+    async def _migrate_source_stats(self) -> None:
+        """
+        Per-source article aggregates, kept current by triggers on gm_articles
+        so every writer (RSS, enrichment, translation, ad-hoc scripts) updates
+        them without code changes.  Back-filled once when the table is created.
+
+        DELETE only decrements the counters; last_inserted_ms /
+        last_published_gmt are high-water marks and are not recomputed.
+        """
+        async with self._conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE type='table' AND name='gm_source_stats'"
+        ) as cur:
+            existed = await cur.fetchone() is not None
+        await self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS gm_source_stats (
+                id_source          TEXT PRIMARY KEY,
+                article_count      INTEGER NOT NULL DEFAULT 0,
+                enriched_count     INTEGER NOT NULL DEFAULT 0,
+                translated_count   INTEGER NOT NULL DEFAULT 0,
+                last_inserted_ms   INTEGER,
+                last_published_gmt TEXT
+            )
+            """
+        )
+        await self._conn.execute(
+            """
+            CREATE TRIGGER IF NOT EXISTS trg_source_stats_insert
+            AFTER INSERT ON gm_articles
+            WHEN NEW.id_source IS NOT NULL
+            BEGIN
+                INSERT INTO gm_source_stats (
+                    id_source, article_count, enriched_count, translated_count,
+                    last_inserted_ms, last_published_gmt
+                )
+                VALUES (
+                    NEW.id_source, 1, NEW.is_enriched = 1, NEW.is_translated = 1,
+                    NEW.inserted_at_ms, NEW.published_at_gmt
+                )
+                ON CONFLICT(id_source) DO UPDATE SET
+                    article_count      = article_count + 1,
+                    enriched_count     = enriched_count   + excluded.enriched_count,
+                    translated_count   = translated_count + excluded.translated_count,
+                    last_inserted_ms   = MAX(COALESCE(last_inserted_ms, 0),
+                                             COALESCE(excluded.last_inserted_ms, 0)),
+                    last_published_gmt = CASE
+                        WHEN last_published_gmt IS NULL
+                          OR excluded.last_published_gmt > last_published_gmt
+                        THEN excluded.last_published_gmt
+                        ELSE last_published_gmt
+                    END;
+            END
+            """
+        )
+        await self._conn.execute(
+            """
+            CREATE TRIGGER IF NOT EXISTS trg_source_stats_enriched
+            AFTER UPDATE OF is_enriched ON gm_articles
+            WHEN (OLD.is_enriched = 1) != (NEW.is_enriched = 1)
+            BEGIN
+                UPDATE gm_source_stats
+                SET enriched_count = enriched_count + (CASE WHEN NEW.is_enriched = 1 THEN 1 ELSE -1 END)
+                WHERE id_source = NEW.id_source;
+            END
+            """
+        )
+        await self._conn.execute(
+            """
+            CREATE TRIGGER IF NOT EXISTS trg_source_stats_translated
+            AFTER UPDATE OF is_translated ON gm_articles
+            WHEN (OLD.is_translated = 1) != (NEW.is_translated = 1)
+            BEGIN
+                UPDATE gm_source_stats
+                SET translated_count = translated_count + (CASE WHEN NEW.is_translated = 1 THEN 1 ELSE -1 END)
+                WHERE id_source = NEW.id_source;
+            END
+            """
+        )
+        await self._conn.execute(
+            """
+            CREATE TRIGGER IF NOT EXISTS trg_source_stats_delete
+            AFTER DELETE ON gm_articles
+            BEGIN
+                UPDATE gm_source_stats
+                SET article_count    = article_count - 1,
+                    enriched_count   = enriched_count   - (OLD.is_enriched = 1),
+                    translated_count = translated_count - (OLD.is_translated = 1)
+                WHERE id_source = OLD.id_source;
+            END
+            """
+        )
+        if not existed:
+            cur = await self._conn.execute(
+                """
+                INSERT INTO gm_source_stats (
+                    id_source, article_count, enriched_count, translated_count,
+                    last_inserted_ms, last_published_gmt
+                )
+                SELECT id_source, COUNT(*),
+                       SUM(is_enriched = 1), SUM(is_translated = 1),
+                       MAX(inserted_at_ms), MAX(published_at_gmt)
+                FROM gm_articles
+                WHERE id_source IS NOT NULL
+                GROUP BY id_source
+                """
+            )
+            logger.info(f"✅ Migration: gm_source_stats back-filled for {cur.rowcount} sources")
+        logger.debug("✅ Migration: gm_source_stats + triggers ensured")
+
+    async def _migrate_article_bodies(self) -> None:
+        """
+        gm_article_bodies — content / translated_content moved out of
+        gm_articles (ARTICLE_BODY_STORE='table'), so the hot queue and page
+        scans read small rows.  Always created, so readers can LEFT JOIN it
+        whatever the current layout.
+
+        With ARTICLE_BODIES_DB the table lives in the ATTACHed ``bodies``
+        file; a persistent trigger cannot reach another file, so the
+        delete-cascade trigger is TEMP (writer connection only) there.
+        """
+        await self._conn.execute(
+            f"""
+            CREATE TABLE IF NOT EXISTS {self._bodies} (
+                id_article         TEXT PRIMARY KEY,
+                content            TEXT,
+                translated_content TEXT
+            )
+            """
+        )
+        temp = "TEMP " if self._bodies_path else ""
+        if self._bodies_path:
+            # Triggers name the table unqualified, so a main-file copy would shadow it
+            async with self._conn.execute(
+                "SELECT 1 FROM sqlite_master WHERE type='table' AND name='gm_article_bodies'"
+            ) as cur:
+                shadow = await cur.fetchone() is not None
+            if shadow:
+                async with self._conn.execute("SELECT 1 FROM main.gm_article_bodies LIMIT 1") as cur:
+                    if await cur.fetchone() is None:
+                        await self._conn.execute("DROP TABLE main.gm_article_bodies")
+                    else:
+                        logger.error(
+                            "❌ main.gm_article_bodies has rows but ARTICLE_BODIES_DB is set — "
+                            "run scripts/split_article_bodies.py --restore first"
+                        )
+        await self._conn.execute(
+            f"""
+            CREATE TABLE IF NOT EXISTS {self._body_dicts} (
+                dict_id    INTEGER PRIMARY KEY,
+                created_ms INTEGER NOT NULL,
+                samples    INTEGER NOT NULL,
+                data       BLOB NOT NULL
+            )
+            """
+        )
+        async with self._conn.execute(
+            f"SELECT dict_id, data FROM {self._body_dicts} ORDER BY created_ms"
+        ) as cur:
+            dicts = await cur.fetchall()
+        self._codec.load_dicts((r[0], r[1]) for r in dicts)
+        want_zstd = body_codec.BODY_CODEC.strip().lower() == "zstd"
+        if want_zstd and not body_codec.available():
+            logger.warning("⚠️  BODY_CODEC=zstd but zstandard is not installed — bodies stay plain")
+        elif want_zstd and not self._split_bodies:
+            logger.warning("⚠️  BODY_CODEC=zstd needs ARTICLE_BODY_STORE=table — bodies stay plain")
+        self._codec.enabled = want_zstd and self._split_bodies and body_codec.available()
+        self._body_decode = self._codec.enabled or bool(dicts)
+        if dicts and not body_codec.available():
+            logger.error("❌ Compressed article bodies present but zstandard is not installed")
+        await self._conn.execute("DROP TRIGGER IF EXISTS main.trg_articles_body_delete")
+        await self._conn.execute(
+            f"""
+            CREATE {temp}TRIGGER IF NOT EXISTS trg_articles_body_delete
+            AFTER DELETE ON gm_articles
+            BEGIN
+                DELETE FROM gm_article_bodies WHERE id_article = OLD.id_article;
+            END
+            """
+        )
+        logger.debug(f"✅ Migration: {self._bodies} ensured")
+
+    @staticmethod
+    def _fts_trigger_sql() -> list[str]:
+        """
+        Persistent triggers keeping gm_articles_fts in step with gm_articles,
+        whichever process writes it.  Body columns that are NULL in the row
+        (split out to gm_article_bodies) keep their indexed text — those are
+        written by _index_bodies() from the plain text the service stores.
+        """
+        cols  = [c for c, _ in _SEARCH_COLUMNS]
+        names = ", ".join(cols)
+        new   = ", ".join(f"NEW.{c}" for c in cols)
+        sets  = ", ".join(
+            f"{c} = COALESCE(NEW.{c}, {c})" if c in _BODY_COLUMNS else f"{c} = NEW.{c}"
+            for c in cols
+        )
+        changed = " OR ".join(f"OLD.{c} IS NOT NEW.{c}" for c in cols)
+        return [
+            f"""
+            CREATE TRIGGER trg_articles_fts_insert
+            AFTER INSERT ON gm_articles
+            BEGIN
+                INSERT INTO gm_articles_fts (rowid, {names}) VALUES (NEW.rowid, {new});
+            END
+            """,
+            """
+            CREATE TRIGGER trg_articles_fts_delete
+            AFTER DELETE ON gm_articles
+            BEGIN
+                DELETE FROM gm_articles_fts WHERE rowid = OLD.rowid;
+            END
+            """,
+            f"""
+            CREATE TRIGGER trg_articles_fts_update
+            AFTER UPDATE OF {names} ON gm_articles
+            WHEN {changed}
+            BEGIN
+                UPDATE gm_articles_fts SET {sets} WHERE rowid = NEW.rowid;
+            END
+            """,
+        ]
+
+    async def _fill_search_index(self, conn: aiosqlite.Connection) -> int:
+        """
+        Refill gm_articles_fts from the effective text (body row first, inline
+        columns otherwise), FTS_REBUILD_BATCH articles at a time in rowid
+        order.  Compressed bodies are decoded in a worker thread; returns the
+        number of articles indexed.
+        """
+        cols = [c for c, _ in _SEARCH_COLUMNS]
+        select = (
+            f"SELECT a.rowid, {_fts_values('a', 'b')} FROM gm_articles a "
+            f"LEFT JOIN {self._bodies} b ON b.id_article = a.id_article "
+            f"WHERE a.rowid > ? ORDER BY a.rowid LIMIT ?"
+        )
+        insert = (
+            f"INSERT INTO gm_articles_fts (rowid, {', '.join(cols)}) "
+            f"VALUES ({', '.join('?' * (len(cols) + 1))})"
+        )
+        await conn.execute("DELETE FROM gm_articles_fts")
+        last = indexed = 0
+        while True:
+            async with conn.execute(select, (last, FTS_REBUILD_BATCH)) as cur:
+                rows = [tuple(r) for r in await cur.fetchall()]
+            if not rows:
+                return indexed
+            if self._body_decode:
+                rows = await asyncio.to_thread(_fts_decode_rows, rows, self._codec.safe_decode)
+            await conn.executemany(insert, rows)
+            last = rows[-1][0]
+            indexed += len(rows)
+
+    async def _migrate_search_index(self) -> None:
+        """
+        FTS5 index over gm_articles (original + translated title /
+        description / content).  The table keeps its own copy of the indexed
+        text, so it stays valid whichever table a body lives in, and FTS5's
+        'integrity-check' holds in every layout.
+
+        Triggers on gm_articles maintain it, so the RSS, enrichment and
+        translation writers — and other processes writing the same file —
+        need no code changes.  Split-out bodies are indexed at write time by
+        _index_bodies() with the plain text, before compression
+        (gm_article_bodies may live in another file, which a persistent
+        trigger cannot reach, and compressed values need body_codec).  Built once when the table is
+        created; an external-content index from older versions
+        (``content='gm_articles'``) is replaced.
+
+        The index is keyed by gm_articles.rowid; run rebuild_search_index()
+        after a VACUUM, which may renumber rowids.
+        """
+        cols = ", ".join(c for c, _ in _SEARCH_COLUMNS)
+        for name in _FTS_TRIGGERS:
+            await self._conn.execute(f"DROP TRIGGER IF EXISTS main.{name}")
+        async with self._conn.execute(
+            "SELECT sql FROM sqlite_master WHERE type='table' AND name='gm_articles_fts'"
+        ) as cur:
+            row = await cur.fetchone()
+        existed = row is not None
+        if existed and "content=" in row[0].replace(" ", "").lower():
+            logger.info("🔎 Migration: replacing external-content gm_articles_fts")
+            await self._conn.execute("DROP TABLE gm_articles_fts")
+            existed = False
+        try:
+            await self._conn.execute(
+                f"""
+                CREATE VIRTUAL TABLE IF NOT EXISTS gm_articles_fts USING fts5(
+                    {cols},
+                    tokenize='unicode61 remove_diacritics 2'
+                )
+                """
+            )
+        except sqlite3.OperationalError as e:
+            logger.warning(f"⚠️  FTS5 not available ({e}) — /api/search disabled")
+            return
+        for sql in self._fts_trigger_sql():
+            await self._conn.execute(sql)
+        if not existed:
+            logger.info("🔎 Migration: building gm_articles_fts (one-time)…")
+            indexed = await self._fill_search_index(self._conn)
+            logger.info(f"✅ Migration: gm_articles_fts built ({indexed} articles)")
+        self._fts_available = True
+        logger.debug("✅ Migration: gm_articles_fts + triggers ensured")
+
+    async def _migrate_published_epoch(self) -> None:
+        """
+        Integer ``published_at_epoch`` (Unix seconds of published_at_gmt) so
+        time filters and newest-first ordering are plain index range scans
+        instead of ``datetime(published_at_gmt)`` over every row.
+
+        insert_article(s) and update_gmt_batch() fill it in Python; the
+        triggers only fire for writers that leave it NULL (ad-hoc scripts,
+        the reader), so the hot path pays no extra UPDATE.  Rows that predate
+        the column are back-filled in the background by
+        _backfill_published_epoch(), resuming from gm_migrations.
+        """
+        try:
+            await self._conn.execute(
+                "ALTER TABLE gm_articles ADD COLUMN published_at_epoch INTEGER"
+            )
+            logger.info("✅ Migration: added published_at_epoch column")
+        except Exception:
+            pass  # column already exists — ignore
+        await self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_articles_published_epoch "
+            "ON gm_articles(published_at_epoch DESC)"
+        )
+        await self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_articles_source_epoch "
+            "ON gm_articles(id_source, published_at_epoch DESC)"
+        )
+        await self._conn.execute(
+            """
+            CREATE TRIGGER IF NOT EXISTS trg_articles_epoch_insert
+            AFTER INSERT ON gm_articles
+            WHEN NEW.published_at_epoch IS NULL AND NEW.published_at_gmt IS NOT NULL
+            BEGIN
+                UPDATE gm_articles
+                SET published_at_epoch = CAST(strftime('%s', NEW.published_at_gmt) AS INTEGER)
+                WHERE rowid = NEW.rowid;
+            END
+            """
+        )
+        await self._conn.execute(
+            """
+            CREATE TRIGGER IF NOT EXISTS trg_articles_epoch_update
+            AFTER UPDATE OF published_at_gmt ON gm_articles
+            WHEN NEW.published_at_gmt IS NOT OLD.published_at_gmt
+             AND NEW.published_at_epoch IS OLD.published_at_epoch
+            BEGIN
+                UPDATE gm_articles
+                SET published_at_epoch = CAST(strftime('%s', NEW.published_at_gmt) AS INTEGER)
+                WHERE rowid = NEW.rowid;
+            END
+            """
+        )
+        # Checkpoints for resumable data migrations: position is the next
+        # rowid upper bound (exclusive) still to visit, NULL before the start.
+        await self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS gm_migrations (
+                name     TEXT PRIMARY KEY,
+                position TEXT,
+                done     INTEGER NOT NULL DEFAULT 0
+            )
+            """
+        )
+        await self._conn.execute(
+            "INSERT OR IGNORE INTO gm_migrations (name) VALUES ('published_at_epoch')"
+        )
+        async with self._conn.execute(
+            "SELECT done FROM gm_migrations WHERE name = 'published_at_epoch'"
+        ) as cur:
+            row = await cur.fetchone()
+        self._epoch_backfilled = bool(row and row[0])
+        logger.debug("✅ Migration: published_at_epoch + indexes + triggers ensured")
+
+    async def _backfill_published_epoch(self) -> None:
+        """
+        Fill published_at_epoch for rows written before the column existed,
+        newest rowid first, EPOCH_BACKFILL_BATCH rows per coalesced write.
+        Each step stores its position in gm_migrations in the same commit,
+        so a restart resumes where the last one stopped.
+        """
+        try:
+            async with self._rc.execute(
+                "SELECT position FROM gm_migrations WHERE name = 'published_at_epoch'"
+            ) as cur:
+                row = await cur.fetchone()
+            if row and row[0] is not None:
+                hi = int(row[0])
+            else:
+                async with self._rc.execute("SELECT MAX(rowid) FROM gm_articles") as cur:
+                    top = await cur.fetchone()
+                hi = (top[0] or 0) + 1
+            logger.info(f"🕒 published_at_epoch back-fill: resuming below rowid {hi}")
+            filled = 0
+
+            async def _step(conn: aiosqlite.Connection, lo: int, hi: int) -> int:
+                cur = await conn.execute(
+                    """
+                    UPDATE gm_articles
+                    SET published_at_epoch = CAST(strftime('%s', published_at_gmt) AS INTEGER)
+                    WHERE rowid >= ? AND rowid < ?
+                      AND published_at_epoch IS NULL
+                      AND published_at_gmt IS NOT NULL
+                    """,
+                    (lo, hi),
+                )
+                await conn.execute(
+                    "UPDATE gm_migrations SET position = ? WHERE name = 'published_at_epoch'",
+                    (str(lo),),
+                )
+                return cur.rowcount
+
+            while hi > 1:
+                lo = max(1, hi - EPOCH_BACKFILL_BATCH)
+                filled += await self._writer.run(lambda c, lo=lo, hi=hi: _step(c, lo, hi))
+                hi = lo
+                await asyncio.sleep(0.05)          # let hot-path writes through
+            await self._writer.execute(
+                "UPDATE gm_migrations SET done = 1 WHERE name = 'published_at_epoch'"
+            )
+            self._epoch_backfilled = True
+            logger.info(f"✅ published_at_epoch back-fill complete ({filled} rows)")
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.warning(f"⚠️  published_at_epoch back-fill stopped: {e} (resumes on restart)")
+
+    async def _train_body_dict(self) -> bool:
+        """
+        Train the body_codec zstd dictionary on up to BODY_DICT_SAMPLES recent
+        bodies (¾ originals, ¼ translations) and store it in gm_body_dicts.
+        Returns False when there is too little text to train on yet.
+        """
+        n = body_codec.BODY_DICT_SAMPLES
+        samples: list[str] = []
+        conn = await self.open_ro_conn()
+        try:
+            for col, limit in (("content", n - n // 4), ("translated_content", n // 4)):
+                async with conn.execute(
+                    f"SELECT {col} FROM {self._bodies} "
+                    f"WHERE typeof({col}) = 'text' AND length({col}) >= ? "
+                    f"ORDER BY rowid DESC LIMIT ?",
+                    (body_codec.BODY_MIN_BYTES, limit),
+                ) as cur:
+                    samples.extend(r[0] for r in await cur.fetchall())
+        finally:
+            await conn.close()
+        if len(samples) < 100:
+            logger.info(
+                f"🗜️  Only {len(samples)} bodies to train the zstd dictionary on — "
+                f"bodies stay plain until a later start"
+            )
+            return False
+        dict_id, data = await asyncio.to_thread(body_codec.train_dictionary, samples)
+        await self._writer.execute(
+            f"INSERT OR REPLACE INTO {self._body_dicts} (dict_id, created_ms, samples, data) "
+            f"VALUES (?, ?, ?, ?)",
+            (dict_id, int(time.time() * 1000), len(samples), data),
+        )
+        self._codec.add_dict(dict_id, data, active=True)
+        logger.info(
+            f"🗜️  Body dictionary {dict_id} trained on {len(samples)} bodies "
+            f"({len(data) // 1024} KB)"
+        )
+        return True
+
+    def _encode_body_rows(self, rows: list) -> tuple[list[tuple], int, int]:
+        """
+        Compress the plain-text columns of ``(rowid, content, translated_content)``
+        rows (runs in a worker thread).  Returns the UPDATE parameters — guarded
+        by the old values — plus plain and stored byte totals.
+        """
+        updates: list[tuple] = []
+        plain = stored = 0
+        for rowid, content, translated in rows:
+            new_c = self._codec.encode(content)
+            new_t = self._codec.encode(translated)
+            if new_c is content and new_t is translated:
+                continue
+            for old, new in ((content, new_c), (translated, new_t)):
+                if isinstance(old, str):
+                    plain  += len(old.encode("utf-8"))
+                    stored += len(new) if isinstance(new, bytes) else len(new.encode("utf-8"))
+            updates.append((new_c, new_t, rowid, content, translated))
+        return updates, plain, stored
+
+    async def _recompress_bodies(self) -> None:
+        """
+        Convert plain-text bodies to the zstd codec in the background.
+
+        Trains the dictionary first when there is none (writers store plain
+        text until then), then walks gm_article_bodies newest rowid first,
+        BODY_RECOMPRESS_BATCH rows per coalesced write, checkpointing in
+        gm_migrations like the epoch back-fill.  Compression runs in a worker
+        thread; a row changed since it was read is left alone (its new value
+        was already written compressed).  The search index holds the plain
+        text, so nothing is re-indexed.
+        """
+        name = "body_codec_zstd"
+        try:
+            if self._codec.active_dict is None and not await self._train_body_dict():
+                return
+            await self._writer.execute(
+                "INSERT OR IGNORE INTO gm_migrations (name) VALUES (?)", (name,)
+            )
+            conn = await self.open_ro_conn()
+            try:
+                async with conn.execute(
+                    "SELECT position, done FROM gm_migrations WHERE name = ?", (name,)
+                ) as cur:
+                    row = await cur.fetchone()
+                if row and row[1]:
+                    return
+                if row and row[0] is not None:
+                    hi = int(row[0])
+                else:
+                    async with conn.execute(f"SELECT MAX(rowid) FROM {self._bodies}") as cur:
+                        top = await cur.fetchone()
+                    hi = (top[0] or 0) + 1
+                logger.info(f"🗜️  Body recompression: resuming below rowid {hi}")
+                converted = plain = stored = 0
+                steps = 0
+
+                async def _step(c: aiosqlite.Connection, updates: list, lo: int) -> None:
+                    if updates:
+                        await c.executemany(
+                            f"UPDATE {self._bodies} SET content = ?, translated_content = ? "
+                            f"WHERE rowid = ? AND content IS ? AND translated_content IS ?",
+                            updates,
+                        )
+                    await c.execute(
+                        "UPDATE gm_migrations SET position = ? WHERE name = ?", (str(lo), name)
+                    )
+
+                while hi > 1:
+                    lo = max(1, hi - BODY_RECOMPRESS_BATCH)
+                    async with conn.execute(
+                        f"SELECT rowid, content, translated_content FROM {self._bodies} "
+                        f"WHERE rowid >= ? AND rowid < ? "
+                        f"AND (typeof(content) = 'text' OR typeof(translated_content) = 'text')",
+                        (lo, hi),
+                    ) as cur:
+                        rows = await cur.fetchall()
+                    updates, p, st = await asyncio.to_thread(
+                        self._encode_body_rows, [tuple(r) for r in rows]
+                    )
+                    await self._writer.run(lambda c, u=updates, lo=lo: _step(c, u, lo))
+                    converted += len(updates)
+                    plain     += p
+                    stored    += st
+                    hi = lo
+                    steps += 1
+                    if steps % 100 == 0 and stored:
+                        logger.info(
+                            f"🗜️  Body recompression: {converted} rows, "
+                            f"{plain / stored:.1f}× ({plain / 1e6:.1f} → {stored / 1e6:.1f} MB)"
+                        )
+                    await asyncio.sleep(0.05)          # let hot-path writes through
+            finally:
+                await conn.close()
+            await self._writer.execute(
+                "UPDATE gm_migrations SET done = 1 WHERE name = ?", (name,)
+            )
+            ratio = f"{plain / stored:.1f}×" if stored else "n/a"
+            logger.info(
+                f"✅ Body recompression complete: {converted} rows, {ratio} "
+                f"({plain / 1e6:.1f} → {stored / 1e6:.1f} MB)"
+            )
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.warning(f"⚠️  Body recompression stopped: {e} (resumes on restart)")
+
+    async def rebuild_search_index(self) -> None:
+        """Rebuild gm_articles_fts from gm_articles + gm_article_bodies (e.g. after VACUUM)."""
+        indexed = await self._writer.run(self._fill_search_index)
+        logger.info(f"🔎 gm_articles_fts rebuilt ({indexed} articles)")
 
     async def open_ro_conn(self) -> "aiosqlite.Connection":
         """
@@ -215,8 +1219,19 @@ class NewsDatabase:
         conn.row_factory = aiosqlite.Row
         await conn.execute("PRAGMA busy_timeout=5000")
         await conn.execute("PRAGMA cache_size=-8192")   # 8 MB per worker conn
+        await self._attach_bodies_ro(conn)
         return conn
 
+    async def _attach_bodies_ro(self, conn: aiosqlite.Connection) -> None:
+        """
+        ATTACH the separate bodies file read-only (no-op when bodies live in
+        the main DB).
+        """
+        if self._bodies_path:
+            await conn.execute(
+                "ATTACH DATABASE ? AS bodies", (f"file:{self._bodies_path}?mode=ro",)
+            )
+
     async def _periodic_wal_checkpoint(self) -> None:
         """Cycle _ro_conn and run WAL checkpoint every 5 min to keep WAL small.
 
@@ -269,6 +1284,15 @@ class NewsDatabase:
                     f"{after // 1024 // 1024}MB "
                     f"(busy={busy} log={log} ckpt={checkpointed})"
                 )
+                if self._bodies_path:
+                    # Separate bodies file: same PASSIVE → TRUNCATE cycle
+                    ckpt_conn = await aiosqlite.connect(self._bodies_path, timeout=30.0)
+                    cur = await ckpt_conn.execute("PRAGMA wal_checkpoint(PASSIVE)")
+                    row = await cur.fetchone()
+                    if row and row[0] == 0:
+                        await ckpt_conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+                    await ckpt_conn.close()
+                    ckpt_conn = None
             except Exception as exc:
                 logger.warning(f"WAL checkpoint failed: {exc}")
                 if ckpt_conn is not None:
@@ -285,6 +1309,7 @@ class NewsDatabase:
                         )
                         conn.row_factory = aiosqlite.Row
                         await conn.execute("PRAGMA busy_timeout=5000")
+                        await self._attach_bodies_ro(conn)
                         self._ro_conn = conn
                     except Exception as exc2:
                         logger.error(f"Failed to reopen _ro_conn after checkpoint: {exc2}")
@@ -294,19 +1319,48 @@ class NewsDatabase:
 
         Articles with a future-dated published_at_gmt are excluded so that
         mis-dated records do not push the catch-up window into the future.
+        One seek on idx_articles_published_epoch; until the epoch back-fill
+        has finished, the old text comparison is used so a half-filled
+        column cannot move the catch-up window backwards.
         """
         assert self._ro_conn is not None
-        async with self._ro_conn.execute(
-            "SELECT MAX(published_at_gmt) FROM gm_articles "
-            "WHERE published_at_gmt IS NOT NULL AND published_at_gmt != '' "
-            "AND published_at_gmt <= strftime('%Y-%m-%dT%H:%M:%S+00:00', 'now')"
-        ) as cursor:
+        if self._epoch_backfilled:
+            sql, params = (
+                "SELECT published_at_gmt FROM gm_articles "
+                "WHERE published_at_epoch <= ? "
+                "ORDER BY published_at_epoch DESC LIMIT 1",
+                (int(time.time()),),
+            )
+        else:
+            sql, params = (
+                "SELECT MAX(published_at_gmt) FROM gm_articles "
+                "WHERE published_at_gmt IS NOT NULL AND published_at_gmt != '' "
+                "AND published_at_gmt <= strftime('%Y-%m-%dT%H:%M:%S+00:00', 'now')",
+                (),
+            )
+        async with self._ro_conn.execute(sql, params) as cursor:
             row = await cursor.fetchone()
         return row[0] if row and row[0] else None
 
     async def close(self) -> None:
         if hasattr(self, '_checkpoint_task') and self._checkpoint_task:
             self._checkpoint_task.cancel()
+        if self._epoch_task is not None:
+            self._epoch_task.cancel()
+            self._epoch_task = None
+        if self._codec_task is not None:
+            self._codec_task.cancel()
+            self._codec_task = None
+        if self._conn:
+            await self._writer.stop()
+        if self._api_idle is not None:
+            while not self._api_idle.empty():
+                try:
+                    await self._api_idle.get_nowait().close()
+                except Exception:
+                    pass
+            self._api_idle = None
+            self._api_pool_open = 0
         if self._ro_conn:
             await self._ro_conn.close()
             self._ro_conn = None
@@ -314,9 +1368,10 @@ class NewsDatabase:
             try:
                 # Use a fresh connection so TRUNCATE isn't blocked by an open
                 # write transaction on _conn.
-                ckpt_conn = await aiosqlite.connect(self._db_path, timeout=30.0)
-                await ckpt_conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
-                await ckpt_conn.close()
+                for path in filter(None, (self._db_path, self._bodies_path)):
+                    ckpt_conn = await aiosqlite.connect(path, timeout=30.0)
+                    await ckpt_conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+                    await ckpt_conn.close()
                 logger.debug("🗄️  WAL checkpoint (TRUNCATE) on close")
             except Exception:
                 pass
@@ -325,6 +1380,56 @@ class NewsDatabase:
             NewsDatabase._instance = None
             logger.info("✅ NewsDatabase connection closed")
 
+    def configure_write_coalescer(
+        self, max_ops: Optional[int] = None, max_delay_ms: Optional[float] = None
+    ) -> None:
+        """Tune the group-commit window (latency vs. throughput)."""
+        if max_ops is not None:
+            self._writer.max_ops = max(1, int(max_ops))
+        if max_delay_ms is not None:
+            self._writer.max_delay_ms = max(0.0, float(max_delay_ms))
+
+    def write_stats(self) -> dict:
+        """Group-commit metrics — exposed by GET /api/queues."""
+        return self._writer.to_dict()
+
+    def configure_api_read_pool(self, size: int) -> None:
+        """Cap the number of read-only connections the API may hold open."""
+        self._api_pool_size = max(1, int(size))
+
+    @contextlib.asynccontextmanager
+    async def _api_conn(self):
+        """
+        Borrow a read-only connection from the API pool.
+
+        Connections come from open_ro_conn() — each has its own aiosqlite
+        thread, so API queries never run on the event loop and never queue
+        behind collector reads on _ro_conn.  At most ``_api_pool_size`` are
+        opened; further requests wait for one to be returned.
+        """
+        if self._api_idle is None:
+            self._api_idle = asyncio.Queue()
+        if self._api_idle.empty() and self._api_pool_open < self._api_pool_size:
+            self._api_pool_open += 1
+            try:
+                conn = await self.open_ro_conn()
+            except Exception:
+                self._api_pool_open -= 1
+                raise
+        else:
+            conn = await self._api_idle.get()
+        try:
+            yield conn
+        finally:
+            self._api_idle.put_nowait(conn)
+
+    def api_pool_stats(self) -> dict:
+        return {
+            "size":  self._api_pool_size,
+            "open":  self._api_pool_open,
+            "idle":  self._api_idle.qsize() if self._api_idle is not None else 0,
+        }
+
     # ── Internal helper ───────────────────────────────────────────────────────
 
     @property
@@ -371,32 +1476,29 @@ class NewsDatabase:
                 "category", "language", "country")
         vals = tuple(source.get(c, "") or "" for c in cols)
         is_proxy = int(source.get("is_proxy_aggregator", 0) or 0)
-        cur = await self._c.execute(
+        rowcount = await self._writer.execute(
             "INSERT OR IGNORE INTO gm_sources "
             "(id_source, name, description, url, category, language, country, is_proxy_aggregator) "
             "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
             vals + (is_proxy,),
         )
-        await self._c.commit()
-        return cur.rowcount > 0
+        return rowcount > 0
 
     async def update_source_timezone(self, source_id: str, timezone: str) -> None:
         """Update the detected timezone for a source."""
-        await self._c.execute(
+        await self._writer.execute(
             "UPDATE gm_sources SET timezone=? WHERE id_source=?",
             (timezone, source_id),
         )
-        await self._c.commit()
 
     async def update_source_timezone_and_enable(
         self, source_id: str, timezone: str
     ) -> None:
-        """Set timezone and flip use_timezone=1 in a single commit."""
-        await self._c.execute(
+        """Set timezone and flip use_timezone=1 in a single statement."""
+        await self._writer.execute(
             "UPDATE gm_sources SET timezone=?, use_timezone=1 WHERE id_source=?",
             (timezone, source_id),
         )
-        await self._c.commit()
 
     async def get_source_block_status(self, source_id: str) -> tuple[int, int]:
         """Return (fetch_blocked, blocked_count) or (0, 0) if not found."""
@@ -415,25 +1517,28 @@ class NewsDatabase:
     ) -> None:
         """
         Increment blocked_count; auto-set fetch_blocked=1 when count reaches 3.
-        Uses _write_lock so the SELECT → UPDATE is atomic.
+        Runs as one coalesced mutation so the SELECT → UPDATE is atomic.
         """
-        async with self._write_lock:
-            async with self._c.execute(
+        async def _apply(conn: aiosqlite.Connection) -> Optional[tuple[int, int, int]]:
+            async with conn.execute(
                 "SELECT blocked_count, fetch_blocked FROM gm_sources WHERE id_source=?",
                 (source_id,),
             ) as cur:
                 row = await cur.fetchone()
             if row is None:
-                return
-            current_count, currently_blocked = row[0] or 0, row[1] or 0
-            new_count    = current_count + 1
+                return None
+            new_count    = (row[0] or 0) + 1
             should_block = 1 if new_count >= 3 else 0
-            await self._c.execute(
+            await conn.execute(
                 "UPDATE gm_sources SET blocked_count=?, fetch_blocked=? WHERE id_source=?",
                 (new_count, should_block, source_id),
             )
-            await self._c.commit()
+            return new_count, should_block, row[1] or 0
 
+        res = await self._writer.run(_apply)
+        if res is None:
+            return
+        new_count, should_block, currently_blocked = res
         if should_block == 1 and currently_blocked == 0:
             logger.warning(
                 f"🚫 [{source_name}] Blocklisted after {new_count} "
@@ -465,59 +1570,269 @@ class NewsDatabase:
         """
         Reset fetch_blocked=0 / blocked_count=0 and re-queue all non-enriched
         articles for the source.  Returns the number of articles re-queued.
-        Atomic: both UPDATEs are committed together under _write_lock.
+        Atomic: both UPDATEs run as one coalesced mutation.
         """
-        async with self._write_lock:
-            await self._c.execute(
+        async def _apply(conn: aiosqlite.Connection) -> int:
+            await conn.execute(
                 "UPDATE gm_sources SET fetch_blocked=0, blocked_count=0 WHERE id_source=?",
                 (source_id,),
             )
-            cur = await self._c.execute(
+            cur = await conn.execute(
                 "UPDATE gm_articles SET is_enriched=0 WHERE id_source=? AND is_enriched != 1",
                 (source_id,),
             )
-            await self._c.commit()
             return cur.rowcount
 
+        return await self._writer.run(_apply)
+
+    async def load_feed_validators(self) -> dict[str, dict]:
+        """Return ``{id_source: {'etag': …, 'last_modified': …}}`` for all feeds."""
+        async with self._rc.execute(
+            "SELECT id_source, etag, last_modified FROM gm_feed_validators"
+        ) as cur:
+            return {
+                r[0]: {"etag": r[1], "last_modified": r[2]}
+                for r in await cur.fetchall()
+            }
+
+    async def save_feed_validator(
+        self, source_id: str, etag: Optional[str], last_modified: Optional[str]
+    ) -> None:
+        """
+        Upsert the conditional-GET validators for one feed.
+        Passing both as None deletes the row (feed stops sending validators,
+        or its last body could not be stored and must be re-fetched in full).
+        """
+        if not etag and not last_modified:
+            await self._writer.execute(
+                "DELETE FROM gm_feed_validators WHERE id_source=?", (source_id,)
+            )
+        else:
+            await self._writer.execute(
+                """
+                INSERT INTO gm_feed_validators (id_source, etag, last_modified, updated_at_ms)
+                VALUES (?, ?, ?, ?)
+                ON CONFLICT(id_source) DO UPDATE SET
+                    etag          = excluded.etag,
+                    last_modified = excluded.last_modified,
+                    updated_at_ms = excluded.updated_at_ms
+                """,
+                (source_id, etag, last_modified, int(time.time() * 1000)),
+            )
+
+    async def fetch_source_publish_rates(self, window_days: int = 7) -> dict[str, float]:
+        """
+        Return ``{id_source: articles_per_second}`` for RSS sources over the
+        last *window_days*, used to seed the adaptive feed scheduler.
+        """
+        window_ms = window_days * 86_400_000
+        since_ms  = int(time.time() * 1000) - window_ms
+        async with self._rc.execute(
+            """
+            SELECT id_source, COUNT(*) FROM gm_articles
+            WHERE inserted_at_ms > ? AND id_source LIKE 'rss-%'
+            GROUP BY id_source
+            """,
+            (since_ms,),
+        ) as cur:
+            return {r[0]: r[1] / (window_ms / 1000) for r in await cur.fetchall()}
+
     # ═══════════════════════════════════════════════════════════════════════════
     # ARTICLES
     # ═══════════════════════════════════════════════════════════════════════════
 
+    def _split_body(self, article: dict) -> tuple[dict, dict]:
+        """
+        (row, body) — with ARTICLE_BODY_STORE='table' the body columns of
+        *article* move to *body*; otherwise *row* is *article* unchanged.
+        """
+        if not self._split_bodies:
+            return article, {}
+        row  = {k: v for k, v in article.items() if k not in _BODY_COLUMNS}
+        body = {k: article[k] for k in _BODY_COLUMNS if k in article}
+        return row, body
+
+    async def _insert_bodies(
+        self, conn: aiosqlite.Connection, bodies: list[tuple[Any, dict]]
+    ) -> None:
+        """Body rows of freshly inserted articles — (id_article, body) pairs; empty bodies skipped."""
+        enc   = self._codec.encode
+        plain = [
+            (id_article, *(body.get(c) or None for c in _BODY_COLUMNS))
+            for id_article, body in bodies
+            if any(body.get(c) for c in _BODY_COLUMNS)
+        ]
+        if plain:
+            await conn.executemany(
+                f"INSERT OR REPLACE INTO {self._bodies} "
+                f"(id_article, {', '.join(_BODY_COLUMNS)}) VALUES (?, ?, ?)",
+                [(id_article, *map(enc, vals)) for id_article, *vals in plain],
+            )
+            await self._index_bodies(conn, _BODY_COLUMNS, plain)
+
+    async def _index_bodies(
+        self, conn: aiosqlite.Connection, cols: tuple[str, ...], rows: list[tuple]
+    ) -> None:
+        """
+        Write plain-text body *cols* of ``(id_article, *values)`` rows into
+        gm_articles_fts — bodies kept out of gm_articles are invisible to
+        the FTS triggers.  Runs in the same transaction as the body write.
+        """
+        if not self._fts_available or not rows:
+            return
+        sets = ", ".join(f"{c} = ?" for c in cols)
+        await conn.executemany(
+            f"UPDATE gm_articles_fts SET {sets} "
+            f"WHERE rowid = (SELECT rowid FROM gm_articles WHERE id_article = ?)",
+            [(*vals, id_article) for id_article, *vals in rows],
+        )
+
+    async def _store_body(
+        self, conn: aiosqlite.Connection, id_article: Any, column: str, value: Optional[str]
+    ) -> None:
+        """
+        Set one body column of an existing article.  In split mode the value
+        goes to gm_article_bodies and the inline copy (if any) is cleared;
+        inline mode writes gm_articles directly.  Either way the search index
+        gets the new text (the FTS trigger keeps the old one on a NULL).
+        """
+        if not self._split_bodies:
+            await conn.execute(
+                f"UPDATE gm_articles SET {column} = ? WHERE id_article = ?",
+                (value, id_article),
+            )
+            if value is None:
+                await self._index_bodies(conn, (column,), [(id_article, None)])
+            return
+        await conn.execute(
+            f"INSERT INTO {self._bodies} (id_article, {column}) VALUES (?, ?) "
+            f"ON CONFLICT(id_article) DO UPDATE SET {column} = excluded.{column}",
+            (id_article, self._codec.encode(value)),
+        )
+        await conn.execute(
+            f"UPDATE gm_articles SET {column} = NULL "
+            f"WHERE id_article = ? AND {column} IS NOT NULL",
+            (id_article,),
+        )
+        await self._index_bodies(conn, (column,), [(id_article, value)])
+
+    async def _load_bodies(
+        self, conn: aiosqlite.Connection, ids: list, cols: tuple[str, ...] = _BODY_COLUMNS
+    ) -> dict:
+        """
+        id_article → {column: text} for *ids*: the gm_article_bodies value when
+        present, the inline gm_articles column otherwise.  Bodies are only
+        read — and decompressed — here, after the caller has picked its
+        (small) rows.
+        """
+        dec = self._codec.safe_decode
+        out: dict = {}
+        sel = ", ".join(f"COALESCE(b.{c}, a.{c}) AS {c}" for c in cols)
+        for i in range(0, len(ids), _SQLITE_MAX_VARS):
+            chunk = ids[i : i + _SQLITE_MAX_VARS]
+            async with conn.execute(
+                f"SELECT a.id_article, {sel} FROM gm_articles a "
+                f"LEFT JOIN {self._bodies} b ON b.id_article = a.id_article "
+                f"WHERE a.id_article IN ({', '.join('?' * len(chunk))})",
+                chunk,
+            ) as cur:
+                for r in await cur.fetchall():
+                    out[r[0]] = {c: dec(r[j + 1]) for j, c in enumerate(cols)}
+        return out
+
+    async def _attach_bodies(
+        self, conn: aiosqlite.Connection, rows: list[dict],
+        cols: tuple[str, ...] = _BODY_COLUMNS,
+    ) -> list[dict]:
+        """Fill *cols* of each row dict (keyed by ``id_article``) from _load_bodies()."""
+        if rows:
+            bodies = await self._load_bodies(conn, [r["id_article"] for r in rows], cols)
+            for r in rows:
+                r.update(bodies.get(r["id_article"]) or dict.fromkeys(cols))
+        return rows
+
     async def insert_article(self, article: dict) -> bool:
         """
         INSERT OR IGNORE article into gm_articles.
         Returns True if a new row was created, False if it already existed.
         """
+        article, body = self._split_body(_with_epoch(article))
         cols         = list(article.keys())
         placeholders = ", ".join("?" * len(cols))
         col_list     = ", ".join(cols)
-        cur = await self._c.execute(
-            f"INSERT OR IGNORE INTO gm_articles ({col_list}) VALUES ({placeholders})",
-            tuple(article[c] for c in cols),
-        )
-        await self._c.commit()
-        return cur.rowcount > 0
+
+        async def _apply(conn: aiosqlite.Connection) -> bool:
+            cur = await conn.execute(
+                f"INSERT OR IGNORE INTO gm_articles ({col_list}) VALUES ({placeholders})",
+                tuple(article[c] for c in cols),
+            )
+            inserted = cur.rowcount > 0
+            if inserted and body:
+                await self._insert_bodies(conn, [(article.get("id_article"), body)])
+            return inserted
+
+        return await self._writer.run(_apply)
 
     async def insert_articles_batch(self, articles: list[dict]) -> int:
         """
         INSERT OR IGNORE a list of articles in a single transaction.
         Returns the number of rows actually inserted (duplicates are silently ignored).
-        Much faster than calling insert_article() per row — one fsync instead of N.
+        Thin wrapper around insert_articles_bulk() for callers that only need a count.
+        """
+        return len(await self.insert_articles_bulk(articles))
+
+    async def insert_articles_bulk(self, articles: list[dict]) -> list[str]:
+        """
+        INSERT OR IGNORE *articles* with multi-row VALUES statements in one
+        transaction and return the ``title_hash`` of every row actually
+        inserted (duplicates — by id_article or title_hash — are skipped).
+
+        Each statement carries as many rows as the SQLite bound-parameter
+        limit allows, so a whole feed is usually a single statement and a
+        single commit.  All dicts must share the key set of ``articles[0]``.
+        With split bodies, the body rows of the inserted articles are written
+        in the same transaction.
         """
         if not articles:
-            return 0
-        cols         = list(articles[0].keys())
-        placeholders = ", ".join("?" * len(cols))
-        col_list     = ", ".join(cols)
-        sql          = f"INSERT OR IGNORE INTO gm_articles ({col_list}) VALUES ({placeholders})"
-        inserted     = 0
-        # No _write_lock needed: INSERT OR IGNORE is atomic per statement;
-        # the consumer is already serial and SQLite WAL handles concurrent readers.
-        for article in articles:
-            cur = await self._c.execute(sql, tuple(article[c] for c in cols))
-            inserted += cur.rowcount
-        await self._c.commit()
-        return inserted
+            return []
+        split    = [self._split_body(_with_epoch(a)) for a in articles]
+        articles = [row for row, _ in split]
+        bodies   = {row.get("id_article"): body for row, body in split if body}
+        cols     = list(articles[0].keys())
+        col_list = ", ".join(cols)
+        row_ph   = "(" + ", ".join("?" * len(cols)) + ")"
+
+        async def _apply(conn: aiosqlite.Connection) -> list[str]:
+            inserted: list[str] = []
+            new_ids: list = []
+            if _SQLITE_HAS_RETURNING:
+                per_stmt = max(1, _SQLITE_MAX_VARS // len(cols))
+                for i in range(0, len(articles), per_stmt):
+                    chunk  = articles[i : i + per_stmt]
+                    params = [a[c] for a in chunk for c in cols]
+                    async with conn.execute(
+                        f"INSERT OR IGNORE INTO gm_articles ({col_list}) "
+                        f"VALUES {', '.join([row_ph] * len(chunk))} "
+                        f"RETURNING title_hash, id_article",
+                        params,
+                    ) as cur:
+                        for r in await cur.fetchall():
+                            inserted.append(r[0])
+                            new_ids.append(r[1])
+            else:
+                sql = f"INSERT OR IGNORE INTO gm_articles ({col_list}) VALUES {row_ph}"
+                for article in articles:
+                    cur = await conn.execute(sql, tuple(article[c] for c in cols))
+                    if cur.rowcount > 0:
+                        inserted.append(article.get('title_hash'))
+                        new_ids.append(article.get('id_article'))
+            if bodies:
+                await self._insert_bodies(
+                    conn, [(i, bodies[i]) for i in new_ids if i in bodies]
+                )
+            return inserted
+
+        return await self._writer.run(_apply)
 
     async def find_by_title_hash(self, title_hash: str) -> Optional[dict]:
         """
@@ -525,18 +1840,24 @@ class NewsDatabase:
         content reuse), or None.
         """
         async with self._rc.execute(
-            """
-            SELECT author, description, content, urlToImage
-            FROM gm_articles
-            WHERE title_hash = ?
-              AND is_enriched = 1
-              AND content IS NOT NULL AND content != ''
+            f"""
+            SELECT a.author, a.description,
+                   COALESCE(b.content, a.content) AS content, a.urlToImage
+            FROM gm_articles a
+            LEFT JOIN {self._bodies} b ON b.id_article = a.id_article
+            WHERE a.title_hash = ?
+              AND a.is_enriched = 1
+              AND COALESCE(b.content, a.content) != ''
             LIMIT 1
             """,
             (title_hash,),
         ) as cur:
             row = await cur.fetchone()
-        return dict(row) if row else None
+        if not row:
+            return None
+        found = dict(row)
+        found["content"] = self._codec.safe_decode(found["content"])
+        return found
 
     async def find_by_title_hash_bulk(
         self,
@@ -590,7 +1911,7 @@ class NewsDatabase:
         async with self._rc.execute(
             """
             SELECT a.id_article, a.id_source, a.url, a.author,
-                   a.description, a.content, a.urlToImage,
+                   a.description, a.urlToImage,
                    a.enrich_try,
                    s.name AS source_name
             FROM gm_articles a
@@ -600,12 +1921,13 @@ class NewsDatabase:
               AND a.enrich_try <= 2
               AND a.url IS NOT NULL AND a.url != ''
               AND (s.fetch_blocked IS NULL OR s.fetch_blocked != 1)
-            ORDER BY a.published_at_gmt DESC
+            ORDER BY a.published_at_epoch DESC
             LIMIT ?
             """,
             (enrich_try, limit),
         ) as cur:
-            return [dict(r) for r in await cur.fetchall()]
+            rows = [dict(r) for r in await cur.fetchall()]
+        return await self._attach_bodies(self._rc, rows, ("content",))
 
     async def mark_enrich_attempt_failed(self, article_id: str, current_try: int) -> None:
         """
@@ -614,16 +1936,15 @@ class NewsDatabase:
         If current_try >= 2 (playwright failed) marks is_enriched=-1 (give up).
         """
         if current_try >= 2:
-            await self._c.execute(
+            await self._writer.execute(
                 "UPDATE gm_articles SET is_enriched = -1 WHERE id_article = ?",
                 (article_id,),
             )
         else:
-            await self._c.execute(
+            await self._writer.execute(
                 "UPDATE gm_articles SET enrich_try = enrich_try + 1 WHERE id_article = ?",
                 (article_id,),
             )
-        await self._c.commit()
 
     async def save_enriched_article(
         self,
@@ -634,32 +1955,46 @@ class NewsDatabase:
         content:      Optional[str],
         url_to_image: Optional[str],
         is_enriched:  int,
-        commit:       bool = True,
     ) -> None:
         """
         Persist enrichment results atomically.
         When is_enriched=1 the article is also reset to is_translated=0 so the
         translation pipeline picks it up on its next cycle.
-
-        Set commit=False to batch multiple writes and call self._c.commit()
-        manually afterwards — reduces fsync overhead under high write load.
         """
-        await self._c.execute(
-            """
-            UPDATE gm_articles
-            SET author      = COALESCE(?, author),
-                description = COALESCE(?, description),
-                content     = ?,
-                is_enriched = ?,
-                urlToImage  = COALESCE(?, urlToImage),
-                is_translated = CASE WHEN ? = 1 AND is_translated != 1 THEN 0 ELSE is_translated END
-            WHERE id_article = ?
-            """,
-            (author, description, content, is_enriched,
-             url_to_image, is_enriched, article_id),
-        )
-        if commit:
-            await self._c.commit()
+        if not self._split_bodies:
+            await self._writer.execute(
+                """
+                UPDATE gm_articles
+                SET author      = COALESCE(?, author),
+                    description = COALESCE(?, description),
+                    content     = ?,
+                    is_enriched = ?,
+                    urlToImage  = COALESCE(?, urlToImage),
+                    is_translated = CASE WHEN ? = 1 AND is_translated != 1 THEN 0 ELSE is_translated END
+                WHERE id_article = ?
+                """,
+                (author, description, content, is_enriched,
+                 url_to_image, is_enriched, article_id),
+            )
+            return
+
+        async def _apply(conn: aiosqlite.Connection) -> None:
+            await conn.execute(
+                """
+                UPDATE gm_articles
+                SET author      = COALESCE(?, author),
+                    description = COALESCE(?, description),
+                    is_enriched = ?,
+                    urlToImage  = COALESCE(?, urlToImage),
+                    is_translated = CASE WHEN ? = 1 AND is_translated != 1 THEN 0 ELSE is_translated END
+                WHERE id_article = ?
+                """,
+                (author, description, is_enriched,
+                 url_to_image, is_enriched, article_id),
+            )
+            await self._store_body(conn, article_id, "content", content)
+
+        await self._writer.run(_apply)
 
     async def save_enrichment_failure(
         self, article_id: str, has_content: bool
@@ -670,11 +2005,10 @@ class NewsDatabase:
         has_content=False → is_enriched=-1 (nothing useful; skip translation)
         """
         val = 1 if has_content else -1
-        await self._c.execute(
+        await self._writer.execute(
             "UPDATE gm_articles SET is_enriched=? WHERE id_article=?",
             (val, article_id),
         )
-        await self._c.commit()
 
     async def bulk_close_blocked_source_articles(self) -> None:
         """
@@ -683,19 +2017,21 @@ class NewsDatabase:
           - otherwise mark is_enriched=-1 to skip enrichment
         Prevents the backfill producer from wasting concurrency slots on dead sources.
         """
-        await self._c.execute(
-            """
+        await self._writer.execute(
+            f"""
             UPDATE gm_articles
             SET is_enriched = CASE
                 WHEN (description IS NOT NULL AND description != '')
-                  OR (content     IS NOT NULL AND content     != '') THEN 1
+                  OR (content     IS NOT NULL AND content     != '')
+                  OR EXISTS (SELECT 1 FROM {self._bodies} b
+                             WHERE b.id_article = gm_articles.id_article
+                               AND b.content != '') THEN 1
                 ELSE -1
             END
             WHERE is_enriched = 0
               AND id_source IN (SELECT id_source FROM gm_sources WHERE fetch_blocked = 1)
             """
         )
-        await self._c.commit()
 
     async def bulk_give_up_exhausted_articles(self) -> int:
         """
@@ -704,12 +2040,10 @@ class NewsDatabase:
         filters enrich_try <= 2), so they would otherwise be counted in enrich_pending
         forever without appearing in any tier.
         """
-        cur = await self._c.execute(
+        return await self._writer.execute(
             "UPDATE gm_articles SET is_enriched = -1 "
             "WHERE is_enriched = 0 AND enrich_try > 2"
         )
-        await self._c.commit()
-        return cur.rowcount
 
     async def fetch_pending_translation(self, batch_size: int) -> list[dict]:
         """
@@ -724,7 +2058,7 @@ class NewsDatabase:
         # Fetch up to half from each backend ordered by recency
         async with self._rc.execute(
             """
-            SELECT id_article, detected_language, title, description, content
+            SELECT id_article, detected_language, title, description
             FROM v_articles_pending_translation
             WHERE translate_backend = 'google'
             ORDER BY translate_without_enrichment DESC, inserted_at_ms DESC
@@ -736,7 +2070,7 @@ class NewsDatabase:
 
         async with self._rc.execute(
             """
-            SELECT id_article, detected_language, title, description, content
+            SELECT id_article, detected_language, title, description
             FROM v_articles_pending_translation
             WHERE translate_backend = 'nllb'
                OR translate_backend IS NULL
@@ -761,7 +2095,7 @@ class NewsDatabase:
             result.append(n)
         result.extend(google_rows[len(nllb_rows):])
         result.extend(nllb_rows[len(google_rows):])
-        return result
+        return await self._attach_bodies(self._rc, result, ("content",))
 
     async def bulk_skip_non_translatable(self) -> int:
         """
@@ -775,33 +2109,35 @@ class NewsDatabase:
 
         Returns the number of rows updated (skip + restore combined).
         """
-        # Skip non-translatable
-        cur_skip = await self._c.execute(
-            """
-            UPDATE gm_articles
-            SET is_translated = -1
-            WHERE is_translated = 0
-              AND (
-                  detected_language IS NULL
-                  OR detected_language NOT IN (
+        async def _apply(conn: aiosqlite.Connection) -> int:
+            # Skip non-translatable
+            cur_skip = await conn.execute(
+                """
+                UPDATE gm_articles
+                SET is_translated = -1
+                WHERE is_translated = 0
+                  AND (
+                      detected_language IS NULL
+                      OR detected_language NOT IN (
+                          SELECT language_code FROM languages WHERE translate = 1
+                      )
+                  )
+                """
+            )
+            # Restore articles incorrectly skipped when language was later enabled
+            cur_restore = await conn.execute(
+                """
+                UPDATE gm_articles
+                SET is_translated = 0
+                WHERE is_translated = -1
+                  AND detected_language IN (
                       SELECT language_code FROM languages WHERE translate = 1
                   )
-              )
-            """
-        )
-        # Restore articles incorrectly skipped when language was later enabled
-        cur_restore = await self._c.execute(
-            """
-            UPDATE gm_articles
-            SET is_translated = 0
-            WHERE is_translated = -1
-              AND detected_language IN (
-                  SELECT language_code FROM languages WHERE translate = 1
-              )
-            """
-        )
-        await self._c.commit()
-        return cur_skip.rowcount + cur_restore.rowcount
+                """
+            )
+            return cur_skip.rowcount + cur_restore.rowcount
+
+        return await self._writer.run(_apply)
 
     async def get_proxy_articles_pending_resolution(self, limit: int = 30) -> list[dict]:
         """Return articles with is_enriched=-2 (proxy URL not yet resolved)."""
@@ -816,18 +2152,26 @@ class NewsDatabase:
 
     async def resolve_proxy_article_url(self, id_article: bytes, real_url: str) -> None:
         """Update the article URL to the real (resolved) URL and queue for enrichment."""
-        await self._c.execute(
+        await self._writer.execute(
             "UPDATE gm_articles SET url = ?, is_enriched = 0 "
             "WHERE id_article = ? AND is_enriched = -2",
             (real_url, id_article),
         )
-        await self._c.commit()
 
-    async def save_translation(self, article_id: str, values: TranslationValues) -> None:
+    async def mark_proxy_article_unresolved(self, id_article: bytes) -> None:
+        """Give up on a proxy URL that could not be resolved (is_enriched=-1)."""
+        await self._writer.execute(
+            "UPDATE gm_articles SET is_enriched = -1 "
+            "WHERE id_article = ? AND is_enriched = -2",
+            (id_article,),
+        )
+
+    async def save_translation(self, article_id: str, values: TranslationValues) -> Optional[int]:
         """
         Persist translation results atomically.
         *values* must include 'is_translated' and may include
         translated_title, translated_description, translated_content.
+        Returns the translated_at_ms stamp written (None when not translated).
         """
         import time as _time
         _ALLOWED = frozenset({
@@ -841,20 +2185,31 @@ class NewsDatabase:
         if params.get("is_translated") == 1:
             params["translated_at_ms"] = int(_time.time() * 1000)
         params["_id"] = article_id
+        if self._split_bodies and "translated_content" in params:
+            body = params.pop("translated_content")
+            set_clause = ", ".join(f"{k}=:{k}" for k in params if k != "_id")
+
+            async def _apply(conn: aiosqlite.Connection) -> None:
+                await conn.execute(
+                    f"UPDATE gm_articles SET {set_clause} WHERE id_article=:_id", params
+                )
+                await self._store_body(conn, article_id, "translated_content", body)
+
+            await self._writer.run(_apply)
+            return params.get("translated_at_ms")
         set_clause = ", ".join(f"{k}=:{k}" for k in params if k != "_id")
-        await self._c.execute(
+        await self._writer.execute(
             f"UPDATE gm_articles SET {set_clause} WHERE id_article=:_id",
             params,
         )
-        await self._c.commit()
+        return params.get("translated_at_ms")
 
     async def update_translate_backend(self, language_code: str, backend: str) -> None:
         """Update translate_backend for a language after permanent failure auto-discovery."""
-        await self._c.execute(
+        await self._writer.execute(
             "UPDATE languages SET translate_backend=? WHERE language_code=?",
             (backend, language_code),
         )
-        await self._c.commit()
 
     async def fetch_articles_missing_gmt(
         self, source_id: str
@@ -877,16 +2232,17 @@ class NewsDatabase:
 
     async def update_gmt_batch(self, updates: list[GmtUpdate]) -> None:
         """
-        Bulk-update published_at_gmt.
+        Bulk-update published_at_gmt (and its published_at_epoch).
         Each element: {"article_id": str, "gmt_timestamp": str}
         """
         if not updates:
             return
-        await self._c.executemany(
-            "UPDATE gm_articles SET published_at_gmt=:gmt_timestamp WHERE id_article=:article_id",
-            updates,
+        await self._writer.execute(
+            "UPDATE gm_articles SET published_at_gmt=:gmt_timestamp, published_at_epoch=:epoch "
+            "WHERE id_article=:article_id",
+            [{**u, "epoch": gmt_to_epoch(u["gmt_timestamp"])} for u in updates],
+            many=True,
         )
-        await self._c.commit()
 
     # ═══════════════════════════════════════════════════════════════════════════
     # BLOCKED DOMAINS
@@ -906,10 +2262,10 @@ class NewsDatabase:
         Upsert blocked-domain counter.
         Returns (new_count, newly_became_blocked).
         Caller should call bulk_remove_pending_for_domain() when newly_became_blocked=True.
-        Uses _write_lock so UPSERT + SELECT are not interleaved.
+        UPSERT + SELECT run as one coalesced mutation so they are not interleaved.
         """
-        async with self._write_lock:
-            await self._c.execute(
+        async def _apply(conn: aiosqlite.Connection):
+            await conn.execute(
                 """
                 INSERT INTO gm_blocked_domains
                     (domain, blocked_count, is_blocked, last_error, updated_at)
@@ -925,12 +2281,13 @@ class NewsDatabase:
                 """,
                 (domain, str(error_code)),
             )
-            await self._c.commit()
-            async with self._c.execute(
+            async with conn.execute(
                 "SELECT blocked_count, is_blocked FROM gm_blocked_domains WHERE domain=?",
                 (domain,),
             ) as cur:
-                row = await cur.fetchone()
+                return await cur.fetchone()
+
+        row = await self._writer.run(_apply)
         count      = row[0] if row else 1
         is_blocked = bool(row[1]) if row else False
         return count, is_blocked
@@ -940,17 +2297,256 @@ class NewsDatabase:
         Set is_enriched=-1 for pending articles whose URL contains *domain*.
         Returns the number of articles removed from the enrichment queue.
         """
-        cur = await self._c.execute(
-            """
+        return await self._writer.execute(
+            f"""
             UPDATE gm_articles SET is_enriched = -1
             WHERE is_enriched = 0
               AND (content IS NULL OR content = '')
+              AND NOT EXISTS (SELECT 1 FROM {self._bodies} b
+                              WHERE b.id_article = gm_articles.id_article
+                                AND b.content != '')
               AND url LIKE ?
             """,
             (f"%{domain}%",),
         )
-        await self._c.commit()
-        return cur.rowcount
+
+    # ═══════════════════════════════════════════════════════════════════════════
+    # API READS  (FastAPI handlers — served from the bounded read-only pool)
+    # ═══════════════════════════════════════════════════════════════════════════
+
+    async def ping(self) -> bool:
+        """Cheap connectivity probe for /api/health."""
+        async with self._api_conn() as conn:
+            async with conn.execute("SELECT 1 FROM gm_articles LIMIT 1") as cur:
+                await cur.fetchone()
+        return True
+
+    async def fetch_articles_since(
+        self,
+        since_ms: int,
+        until_ms: int,
+        limit: int,
+        source_ids: Optional[list[str]] = None,
+    ) -> list[dict]:
+        """
+        Articles inserted in ``(since_ms, until_ms]``, newest first, excluding
+        future-dated ones (published_at_epoch — NULL means undated and is
+        kept).  Optionally restricted to *source_ids*.
+        """
+        sql = """
+            SELECT id_article, id_source, author, title, description, url,
+                   urlToImage, publishedAt, published_at_gmt, inserted_at_ms,
+                   translated_title, translated_description, is_translated
+            FROM gm_articles
+            WHERE inserted_at_ms > ? AND inserted_at_ms <= ?
+              AND (published_at_epoch IS NULL OR published_at_epoch <= ?)
+        """
+        params: list = [since_ms, until_ms, int(time.time())]
+        if source_ids:
+            sql += f" AND id_source IN ({', '.join('?' * len(source_ids))})"
+            params.extend(source_ids)
+        sql += " ORDER BY inserted_at_ms DESC LIMIT ?"
+        params.append(limit)
+        async with self._api_conn() as conn:
+            async with conn.execute(sql, params) as cur:
+                rows = [dict(r) for r in await cur.fetchall()]
+            return await self._attach_bodies(conn, rows, ("translated_content",))
+
+    @staticmethod
+    def _articles_after_sql(
+        after_ms: int, after_id: Any, until_ms: int, source_ids: Optional[list[str]]
+    ) -> tuple[str, list]:
+        """Keyset query: rows after ``(after_ms, after_id)`` up to *until_ms*, oldest first."""
+        sql = """
+            SELECT id_article, id_source, author, title, description, url,
+                   urlToImage, publishedAt, published_at_gmt, inserted_at_ms,
+                   translated_title, translated_description, is_translated
+            FROM gm_articles
+        """
+        if after_id is None:
+            sql += " WHERE inserted_at_ms > ?"
+            params: list = [after_ms]
+        else:
+            sql += " WHERE (inserted_at_ms, id_article) > (?, ?)"
+            params = [after_ms, after_id]
+        sql += """
+              AND inserted_at_ms <= ?
+              AND (published_at_epoch IS NULL OR published_at_epoch <= ?)
+        """
+        params.extend((until_ms, int(time.time())))
+        if source_ids:
+            sql += f" AND id_source IN ({', '.join('?' * len(source_ids))})"
+            params.extend(source_ids)
+        sql += " ORDER BY inserted_at_ms ASC, id_article ASC"
+        return sql, params
+
+    async def fetch_articles_after(
+        self,
+        after_ms: int,
+        after_id: Any,
+        until_ms: int,
+        limit: int,
+        source_ids: Optional[list[str]] = None,
+    ) -> list[dict]:
+        """
+        One keyset page for the /api/articles cursor: articles whose
+        ``(inserted_at_ms, id_article)`` is greater than the cursor (only
+        ``inserted_at_ms > after_ms`` when *after_id* is None), oldest first.
+        Unlike fetch_articles_since(), a burst larger than *limit* is walked
+        page by page instead of losing its older part.
+        """
+        sql, params = self._articles_after_sql(after_ms, after_id, until_ms, source_ids)
+        sql += " LIMIT ?"
+        params.append(limit)
+        async with self._api_conn() as conn:
+            async with conn.execute(sql, params) as cur:
+                rows = [dict(r) for r in await cur.fetchall()]
+            return await self._attach_bodies(conn, rows, ("translated_content",))
+
+    async def iter_articles_after(
+        self,
+        after_ms: int,
+        after_id: Any,
+        until_ms: int,
+        chunk: int,
+        source_ids: Optional[list[str]] = None,
+    ) -> AsyncIterator[list[dict]]:
+        """
+        Same rows as fetch_articles_after() without a limit, yielded in
+        lists of *chunk* from one open cursor (``fetchmany``), so memory
+        stays flat however many rows match.  Runs on a private read-only
+        connection — a slow consumer never holds an API pool slot.
+        """
+        sql, params = self._articles_after_sql(after_ms, after_id, until_ms, source_ids)
+        conn = await self.open_ro_conn()
+        try:
+            async with conn.execute(sql, params) as cur:
+                while True:
+                    rows = await cur.fetchmany(chunk)
+                    if not rows:
+                        break
+                    yield await self._attach_bodies(
+                        conn, [dict(r) for r in rows], ("translated_content",)
+                    )
+        finally:
+            await conn.close()
+
+    async def fetch_translation_updates(
+        self, since_ms: int, limit: int, after_id: Any = None
+    ) -> list[dict]:
+        """
+        Articles translated after *since_ms*, oldest first.  With *after_id*
+        the page starts after ``(since_ms, after_id)`` instead, so a caller
+        can walk more than *limit* translations sharing one millisecond.
+        """
+        if after_id is None:
+            where, params = "translated_at_ms > ?", [since_ms]
+        else:
+            where, params = "(translated_at_ms, id_article) > (?, ?)", [since_ms, after_id]
+        params.append(limit)
+        async with self._api_conn() as conn:
+            async with conn.execute(
+                f"""
+                SELECT id_article, translated_title, translated_description,
+                       translated_at_ms
+                FROM gm_articles
+                WHERE {where} AND is_translated = 1
+                ORDER BY translated_at_ms ASC, id_article ASC
+                LIMIT ?
+                """,
+                params,
+            ) as cur:
+                rows = [dict(r) for r in await cur.fetchall()]
+            return await self._attach_bodies(conn, rows, ("translated_content",))
+
+    async def fetch_latest_inserted(self) -> tuple[int, int]:
+        """Return ``(MAX(inserted_at_ms), COUNT(*))`` over timestamped articles."""
+        async with self._api_conn() as conn:
+            async with conn.execute(
+                "SELECT MAX(inserted_at_ms), COUNT(*) FROM gm_articles "
+                "WHERE inserted_at_ms IS NOT NULL"
+            ) as cur:
+                row = await cur.fetchone()
+        return ((row[0] or 0), (row[1] or 0)) if row else (0, 0)
+
+    async def fetch_sources_with_counts(self) -> list[dict]:
+        """
+        Sources that have at least one article, with their aggregates from
+        gm_source_stats (trigger-maintained — no scan of gm_articles).
+        """
+        async with self._api_conn() as conn:
+            async with conn.execute(
+                """
+                SELECT s.id_source, s.name, s.category, s.language,
+                       st.article_count, st.enriched_count, st.translated_count,
+                       st.last_inserted_ms, st.last_published_gmt
+                FROM gm_source_stats st
+                JOIN gm_sources s ON s.id_source = st.id_source
+                WHERE st.article_count > 0
+                ORDER BY s.name
+                """
+            ) as cur:
+                return [dict(r) for r in await cur.fetchall()]
+
+    @property
+    def search_available(self) -> bool:
+        return self._fts_available
+
+    async def search_articles(
+        self,
+        query: str,
+        *,
+        limit: int,
+        offset: int = 0,
+        source_ids: Optional[list[str]] = None,
+        languages: Optional[list[str]] = None,
+        since_ms: Optional[int] = None,
+        until_ms: Optional[int] = None,
+    ) -> list[dict]:
+        """
+        Full-text search over original and translated text, best match first
+        (``score`` = negated bm25, titles weighted highest).  Filters: source
+        ids, detected language, inserted_at_ms window.  Future-dated articles
+        are excluded as in fetch_articles_since().
+        """
+        match = _fts_match_expr(query)
+        if not match:
+            return []
+        weights = ", ".join(str(w) for _, w in _SEARCH_COLUMNS)
+        sql = f"""
+            SELECT a.id_article, a.id_source, a.author, a.title, a.description, a.url,
+                   a.urlToImage, a.publishedAt, a.published_at_gmt, a.inserted_at_ms,
+                   a.detected_language, a.translated_title, a.translated_description,
+                   a.is_translated,
+                   -bm25(gm_articles_fts, {weights}) AS score,
+                   -- best column may be an empty body: fall back to description
+                   COALESCE(
+                       NULLIF(snippet(gm_articles_fts, -1, '<b>', '</b>', '…', 16), ''),
+                       snippet(gm_articles_fts, 1, '<b>', '</b>', '…', 16)
+                   ) AS snippet
+            FROM gm_articles_fts
+            JOIN gm_articles a ON a.rowid = gm_articles_fts.rowid
+            WHERE gm_articles_fts MATCH ?
+              AND (a.published_at_epoch IS NULL OR a.published_at_epoch <= ?)
+        """
+        params: list = [match, int(time.time())]
+        if source_ids:
+            sql += f" AND a.id_source IN ({', '.join('?' * len(source_ids))})"
+            params.extend(source_ids)
+        if languages:
+            sql += f" AND a.detected_language IN ({', '.join('?' * len(languages))})"
+            params.extend(languages)
+        if since_ms is not None:
+            sql += " AND a.inserted_at_ms >= ?"
+            params.append(since_ms)
+        if until_ms is not None:
+            sql += " AND a.inserted_at_ms <= ?"
+            params.append(until_ms)
+        sql += " ORDER BY score DESC LIMIT ? OFFSET ?"
+        params.extend((limit, offset))
+        async with self._api_conn() as conn:
+            async with conn.execute(sql, params) as cur:
+                return [dict(r) for r in await cur.fetchall()]
 
     # ═══════════════════════════════════════════════════════════════════════════
     # QUEUE STATS  (used by GET /api/queues)
@@ -8,6 +8,7 @@ internal DB wiring changes:
   ?          →  $1, $2, $3 positional placeholders
   INSERT OR IGNORE  →  INSERT … ON CONFLICT DO NOTHING
   _write_lock (asyncio.Lock)  →  removed (PostgreSQL MVCC handles concurrency)
+  WriteCoalescer              →  same group commit; each mutation in a SAVEPOINT
   _ro_conn / open_ro_conn()   →  removed (pool connections are all concurrent)
   PRAGMAs     →  removed
 
@@ -32,9 +33,12 @@ Usage
 from __future__ import annotations
 
 import asyncio
+import contextlib
 import logging
+import re
 import time
-from typing import Any, Optional, TypedDict
+from collections import deque
+from typing import Any, AsyncIterator, Awaitable, Callable, Optional, TypedDict
 
 import asyncpg
 
@@ -82,6 +86,221 @@ def _row_to_dict(record: asyncpg.Record) -> dict:
     return dict(record)
 
 
+def _status_rowcount(status: Optional[str]) -> int:
+    """Row count from an asyncpg command tag (``"UPDATE 3"`` → 3), -1 if none."""
+    try:
+        return int(status.split()[-1]) if status else -1
+    except ValueError:
+        return -1
+
+
+# ── Group-commit write coalescer (same contract as news_db.WriteCoalescer) ────
+
+WRITE_COALESCE_MAX_OPS      = 256
+WRITE_COALESCE_MAX_DELAY_MS = 25.0
+
+API_READ_POOL_SIZE = 4   # pool connections the FastAPI handlers may hold at once
+
+EPOCH_BACKFILL_BATCH = 5000   # rows per published_at_epoch back-fill step (one coalesced write)
+
+
+def _tsquery_expr(query: str) -> str:
+    """
+    Turn free user text into a safe to_tsquery() expression: only word
+    characters survive, terms are ANDed, and a trailing ``*`` on a term
+    becomes a ``:*`` prefix match (same semantics as the SQLite FTS5 path).
+    """
+    terms = []
+    for tok in query.split():
+        prefix = tok.endswith("*")
+        words  = re.findall(r"\w+", tok)
+        if not words:
+            continue
+        if prefix:
+            words[-1] += ":*"
+        terms.extend(words)
+    return " & ".join(terms)
+
+
+class _WriteOp:
+    __slots__ = ("sql", "params", "many", "fn", "future", "enqueued_at")
+
+    def __init__(self, future: asyncio.Future, *, sql: Optional[str] = None,
+                 params: Any = (), many: bool = False,
+                 fn: Optional[Callable[[Any], Awaitable[Any]]] = None) -> None:
+        self.sql         = sql
+        self.params      = params
+        self.many        = many
+        self.fn          = fn
+        self.future      = future
+        self.enqueued_at = time.monotonic()
+
+
+class WriteCoalescer:
+    """
+    Group-commit service: queued mutations share one transaction per
+    ``max_delay_ms`` / ``max_ops``.  Each mutation runs inside its own
+    SAVEPOINT so a failing one is rolled back alone (PostgreSQL would
+    otherwise abort the whole group); futures resolve after COMMIT.
+    """
+
+    def __init__(
+        self,
+        acquire: Callable[[], Any],
+        *,
+        max_ops: int = WRITE_COALESCE_MAX_OPS,
+        max_delay_ms: float = WRITE_COALESCE_MAX_DELAY_MS,
+    ) -> None:
+        self._acquire     = acquire
+        self.max_ops      = max(1, int(max_ops))
+        self.max_delay_ms = max(0.0, float(max_delay_ms))
+        self._queue: deque[_WriteOp] = deque()
+        self._wake  = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+        self._flushing: Optional[asyncio.Task] = None   # group being applied right now
+        self._stopping = False
+        self._commits     = 0
+        self._ops         = 0
+        self._op_errors   = 0
+        self._commit_errs = 0
+        self._max_batch   = 0
+        self._wait_ms_sum = 0.0
+        self._recent: deque[tuple[int, float]] = deque(maxlen=512)
+
+    def start(self) -> None:
+        if self._task is None or self._task.done():
+            self._task = asyncio.get_event_loop().create_task(self._run())
+
+    async def stop(self) -> None:
+        """
+        Stop the background task, then flush whatever is still queued.  A group
+        being applied when stop() is called is finished (committed or rolled
+        back, its callers resolved) before the rest of the queue is drained.
+        """
+        task, self._task = self._task, None
+        if task is not None:
+            self._stopping = True
+            self._wake.set()
+            try:
+                await asyncio.gather(task, return_exceptions=True)
+            finally:
+                self._stopping = False
+        if self._flushing is not None:
+            await asyncio.gather(self._flushing, return_exceptions=True)
+        while self._queue:
+            await self._flush()
+
+    async def execute(self, sql: str, params: Any = (), *, many: bool = False) -> int:
+        """Queue one statement (``$n`` placeholders); returns its row count."""
+        return await self._submit(sql=sql, params=params, many=many)
+
+    async def run(self, fn: Callable[[asyncpg.Connection], Awaitable[Any]]) -> Any:
+        """Queue ``await fn(conn)``; returns its result once committed."""
+        return await self._submit(fn=fn)
+
+    async def _submit(self, **op: Any) -> Any:
+        if self._task is None:
+            self.start()
+        fut = asyncio.get_event_loop().create_future()
+        self._queue.append(_WriteOp(fut, **op))
+        if len(self._queue) == 1 or len(self._queue) >= self.max_ops:
+            self._wake.set()
+        return await fut
+
+    async def _run(self) -> None:
+        while not self._stopping:
+            await self._wake.wait()
+            self._wake.clear()
+            if self._stopping:
+                break                  # stop() drains the queue itself
+            if not self._queue:
+                continue
+            delay = self.max_delay_ms / 1000 - (time.monotonic() - self._queue[0].enqueued_at)
+            if delay > 0 and len(self._queue) < self.max_ops:
+                try:
+                    await asyncio.wait_for(self._wake.wait(), timeout=delay)
+                except asyncio.TimeoutError:
+                    pass
+                self._wake.clear()
+            # Shielded: cancelling this task must not abandon a group whose ops
+            # are already off the queue — stop() awaits _flushing instead.
+            self._flushing = asyncio.ensure_future(self._flush())
+            try:
+                await asyncio.shield(self._flushing)
+            except Exception as exc:
+                logger.error(f"WriteCoalescer flush error: {exc}", exc_info=True)
+            finally:
+                if self._flushing.done():
+                    self._flushing = None
+            if self._queue:
+                self._wake.set()
+
+    async def _flush(self) -> None:
+        batch = [self._queue.popleft() for _ in range(min(len(self._queue), self.max_ops))]
+        if not batch:
+            return
+        t0 = time.monotonic()
+        outcomes: list[tuple[Any, Optional[BaseException]]] = []
+        try:
+            async with self._acquire() as conn:
+                async with conn.transaction():
+                    for op in batch:
+                        self._wait_ms_sum += (t0 - op.enqueued_at) * 1000
+                        try:
+                            async with conn.transaction():   # SAVEPOINT
+                                if op.fn is not None:
+                                    res = await op.fn(conn)
+                                elif op.many:
+                                    await conn.executemany(op.sql, op.params)
+                                    res = -1
+                                else:
+                                    res = _status_rowcount(await conn.execute(op.sql, *op.params))
+                            outcomes.append((res, None))
+                        except Exception as exc:
+                            self._op_errors += 1
+                            outcomes.append((None, exc))
+        except Exception as exc:
+            self._commit_errs += 1
+            outcomes = [(None, exc)] * len(batch)
+        commit_ms = (time.monotonic() - t0) * 1000
+        self._commits  += 1
+        self._ops      += len(batch)
+        self._max_batch = max(self._max_batch, len(batch))
+        self._recent.append((len(batch), commit_ms))
+        for op, (res, exc) in zip(batch, outcomes):
+            if op.future.done():
+                continue
+            if exc is not None:
+                op.future.set_exception(exc)
+            else:
+                op.future.set_result(res)
+
+    def to_dict(self) -> dict:
+        sizes = sorted(b for b, _ in self._recent)
+        lats  = sorted(ms for _, ms in self._recent)
+
+        def _pct(vals: list, p: float) -> float:
+            return round(vals[min(len(vals) - 1, int(len(vals) * p))], 2) if vals else 0.0
+
+        return {
+            "max_ops":          self.max_ops,
+            "max_delay_ms":     self.max_delay_ms,
+            "queued":           len(self._queue),
+            "commits":          self._commits,
+            "ops":              self._ops,
+            "op_errors":        self._op_errors,
+            "commit_errors":    self._commit_errs,
+            "avg_batch":        round(self._ops / self._commits, 2) if self._commits else 0.0,
+            "max_batch":        self._max_batch,
+            "batch_p50":        _pct(sizes, 0.50),
+            "batch_p95":        _pct(sizes, 0.95),
+            "commit_ms_p50":    _pct(lats, 0.50),
+            "commit_ms_p95":    _pct(lats, 0.95),
+            "commit_ms_max":    round(lats[-1], 2) if lats else 0.0,
+            "avg_queue_wait_ms": round(self._wait_ms_sum / self._ops, 2) if self._ops else 0.0,
+        }
+
+
 class NewsDatabase:
     """Singleton async CRUD layer backed by asyncpg (PostgreSQL)."""
 
@@ -92,6 +311,11 @@ class NewsDatabase:
     def __init__(self, dsn: str) -> None:
         self._dsn  = dsn
         self._pool: Optional[asyncpg.Pool] = None
+        self._writer = WriteCoalescer(self._acquire)
+        self._api_pool_size = API_READ_POOL_SIZE
+        self._api_sem       = asyncio.Semaphore(API_READ_POOL_SIZE)
+        self._epoch_backfilled = False
+        self._epoch_task: Optional[asyncio.Task] = None
         self._cached_stats: QueueStats = {
             "enriched": 0, "enrich_pending": 0, "enrich_failed": 0,
             "translated": 0, "translate_skipped": 0, "translate_pending": 0,
@@ -123,6 +347,11 @@ class NewsDatabase:
         )
         async with self._pool.acquire() as conn:
             await self._migrate(conn)
+        self._writer.start()
+        if not self._epoch_backfilled:
+            self._epoch_task = asyncio.get_event_loop().create_task(
+                self._backfill_published_epoch()
+            )
         logger.info(f"✅ NewsDatabase (pg) connected: {self._dsn.split('@')[-1]}")
 
     async def _migrate(self, conn: asyncpg.Connection) -> None:
@@ -179,6 +408,15 @@ class NewsDatabase:
             )
         """)
 
+        await conn.execute("""
+            CREATE TABLE IF NOT EXISTS gm_feed_validators (
+                id_source     TEXT PRIMARY KEY,
+                etag          TEXT,
+                last_modified TEXT,
+                updated_at_ms BIGINT
+            )
+        """)
+
         await conn.execute("""
             CREATE TABLE IF NOT EXISTS languages (
                 language_code              TEXT PRIMARY KEY,
@@ -191,7 +429,173 @@ class NewsDatabase:
             )
         """)
 
+        await conn.execute(
+            "ALTER TABLE gm_articles ADD COLUMN IF NOT EXISTS translated_at_ms BIGINT"
+        )
+
+        # Per-source aggregates for /api/sources, maintained by a trigger
+        existed = await conn.fetchval("SELECT to_regclass('gm_source_stats') IS NOT NULL")
+        await conn.execute("""
+            CREATE TABLE IF NOT EXISTS gm_source_stats (
+                id_source          TEXT PRIMARY KEY,
+                article_count      BIGINT NOT NULL DEFAULT 0,
+                enriched_count     BIGINT NOT NULL DEFAULT 0,
+                translated_count   BIGINT NOT NULL DEFAULT 0,
+                last_inserted_ms   BIGINT,
+                last_published_gmt TEXT
+            )
+        """)
+        await conn.execute("""
+            CREATE OR REPLACE FUNCTION gm_source_stats_trg() RETURNS trigger AS $$
+            BEGIN
+                IF TG_OP = 'INSERT' THEN
+                    IF NEW.id_source IS NULL THEN
+                        RETURN NULL;
+                    END IF;
+                    INSERT INTO gm_source_stats AS st (
+                        id_source, article_count, enriched_count, translated_count,
+                        last_inserted_ms, last_published_gmt
+                    )
+                    VALUES (
+                        NEW.id_source, 1,
+                        (NEW.is_enriched = 1)::int, (NEW.is_translated = 1)::int,
+                        NEW.inserted_at_ms, NEW.published_at_gmt
+                    )
+                    ON CONFLICT (id_source) DO UPDATE SET
+                        article_count      = st.article_count + 1,
+                        enriched_count     = st.enriched_count   + EXCLUDED.enriched_count,
+                        translated_count   = st.translated_count + EXCLUDED.translated_count,
+                        last_inserted_ms   = GREATEST(st.last_inserted_ms, EXCLUDED.last_inserted_ms),
+                        last_published_gmt = GREATEST(st.last_published_gmt, EXCLUDED.last_published_gmt);
+                ELSIF TG_OP = 'UPDATE' THEN
+                    UPDATE gm_source_stats SET
+                        enriched_count   = enriched_count
+                            + (NEW.is_enriched = 1)::int - (OLD.is_enriched = 1)::int,
+                        translated_count = translated_count
+                            + (NEW.is_translated = 1)::int - (OLD.is_translated = 1)::int
+                    WHERE id_source = NEW.id_source;
+                ELSIF TG_OP = 'DELETE' THEN
+                    UPDATE gm_source_stats SET
+                        article_count    = article_count - 1,
+                        enriched_count   = enriched_count   - (OLD.is_enriched = 1)::int,
+                        translated_count = translated_count - (OLD.is_translated = 1)::int
+                    WHERE id_source = OLD.id_source;
+                END IF;
+                RETURN NULL;
+            END;
+            $$ LANGUAGE plpgsql
+        """)
+        await conn.execute("DROP TRIGGER IF EXISTS trg_source_stats_insert ON gm_articles")
+        await conn.execute("""
+            CREATE TRIGGER trg_source_stats_insert
+            AFTER INSERT OR DELETE ON gm_articles
+            FOR EACH ROW EXECUTE FUNCTION gm_source_stats_trg()
+        """)
+        await conn.execute("DROP TRIGGER IF EXISTS trg_source_stats_update ON gm_articles")
+        await conn.execute("""
+            CREATE TRIGGER trg_source_stats_update
+            AFTER UPDATE OF is_enriched, is_translated ON gm_articles
+            FOR EACH ROW
+            WHEN ((OLD.is_enriched = 1) IS DISTINCT FROM (NEW.is_enriched = 1)
+               OR (OLD.is_translated = 1) IS DISTINCT FROM (NEW.is_translated = 1))
+            EXECUTE FUNCTION gm_source_stats_trg()
+        """)
+        if not existed:
+            await conn.execute("""
+                INSERT INTO gm_source_stats (
+                    id_source, article_count, enriched_count, translated_count,
+                    last_inserted_ms, last_published_gmt
+                )
+                SELECT id_source, COUNT(*),
+                       COUNT(*) FILTER (WHERE is_enriched = 1),
+                       COUNT(*) FILTER (WHERE is_translated = 1),
+                       MAX(inserted_at_ms), MAX(published_at_gmt)
+                FROM gm_articles
+                WHERE id_source IS NOT NULL
+                GROUP BY id_source
+                ON CONFLICT (id_source) DO NOTHING
+            """)
+
+        # Full-text search: weighted tsvector over original + translated text.
+        # A STORED generated column is recomputed by every INSERT / UPDATE, so
+        # the RSS, enrichment and translation writers keep it current for free.
+        await conn.execute("""
+            ALTER TABLE gm_articles ADD COLUMN IF NOT EXISTS search_tsv tsvector
+            GENERATED ALWAYS AS (
+                setweight(to_tsvector('simple',
+                    coalesce(title, '') || ' ' || coalesce(translated_title, '')), 'A') ||
+                setweight(to_tsvector('simple',
+                    coalesce(description, '') || ' ' || coalesce(translated_description, '')), 'B') ||
+                setweight(to_tsvector('simple',
+                    coalesce(content, '') || ' ' || coalesce(translated_content, '')), 'D')
+            ) STORED
+        """)
+        await conn.execute("""
+            CREATE INDEX IF NOT EXISTS idx_articles_search_tsv
+            ON gm_articles USING GIN (search_tsv)
+        """)
+
+        # Integer published_at_epoch for sargable time filters.  A BEFORE
+        # trigger derives it from published_at_gmt on every INSERT / UPDATE,
+        # so no writer has to know about it; older rows are back-filled by
+        # _backfill_published_epoch(), resuming from gm_migrations.
+        await conn.execute(
+            "ALTER TABLE gm_articles ADD COLUMN IF NOT EXISTS published_at_epoch BIGINT"
+        )
+        await conn.execute("""
+            CREATE OR REPLACE FUNCTION gm_gmt_epoch(gmt TEXT) RETURNS BIGINT AS $$
+            BEGIN
+                IF gmt IS NULL OR gmt = '' THEN
+                    RETURN NULL;
+                END IF;
+                RETURN extract(epoch FROM gmt::timestamptz)::bigint;
+            EXCEPTION WHEN others THEN
+                RETURN NULL;
+            END;
+            $$ LANGUAGE plpgsql STABLE
+        """)
+        await conn.execute("""
+            CREATE OR REPLACE FUNCTION gm_published_epoch_trg() RETURNS trigger AS $$
+            BEGIN
+                NEW.published_at_epoch := gm_gmt_epoch(NEW.published_at_gmt);
+                RETURN NEW;
+            END;
+            $$ LANGUAGE plpgsql
+        """)
+        await conn.execute("DROP TRIGGER IF EXISTS trg_articles_epoch ON gm_articles")
+        await conn.execute("""
+            CREATE TRIGGER trg_articles_epoch
+            BEFORE INSERT OR UPDATE OF published_at_gmt ON gm_articles
+            FOR EACH ROW EXECUTE FUNCTION gm_published_epoch_trg()
+        """)
+        await conn.execute("""
+            CREATE TABLE IF NOT EXISTS gm_migrations (
+                name     TEXT PRIMARY KEY,
+                position TEXT,
+                done     INTEGER NOT NULL DEFAULT 0
+            )
+        """)
+        await conn.execute(
+            "INSERT INTO gm_migrations (name) VALUES ('published_at_epoch') "
+            "ON CONFLICT (name) DO NOTHING"
+        )
+        self._epoch_backfilled = bool(await conn.fetchval(
+            "SELECT done FROM gm_migrations WHERE name = 'published_at_epoch'"
+        ))
+
         # Indexes (idempotent)
+        await conn.execute("""
+            CREATE INDEX IF NOT EXISTS idx_articles_published_epoch
+            ON gm_articles(published_at_epoch DESC)
+        """)
+        await conn.execute("""
+            CREATE INDEX IF NOT EXISTS idx_articles_source_epoch
+            ON gm_articles(id_source, published_at_epoch DESC)
+        """)
+        await conn.execute("""
+            CREATE INDEX IF NOT EXISTS idx_articles_inserted_keyset
+            ON gm_articles(inserted_at_ms, id_article)
+        """)
         await conn.execute("""
             CREATE INDEX IF NOT EXISTS idx_articles_enrich_try
             ON gm_articles(is_enriched, enrich_try)
@@ -242,6 +646,69 @@ class NewsDatabase:
 
         logger.info("✅ Migration: schema ensured")
 
+    async def _backfill_published_epoch(self) -> None:
+        """
+        Fill published_at_epoch for rows written before the column existed,
+        EPOCH_BACKFILL_BATCH rows per coalesced write in id_article order.
+        The keyset position is saved in gm_migrations in the same
+        transaction, so a restart resumes where the last one stopped.
+        """
+        try:
+            async with self._acquire() as conn:
+                pos = await conn.fetchval(
+                    "SELECT position FROM gm_migrations WHERE name = 'published_at_epoch'"
+                )
+            logger.info("🕒 published_at_epoch back-fill: resuming"
+                        + (f" after {pos!r}" if pos else ""))
+            filled = 0
+
+            async def _step(conn: asyncpg.Connection, after: str) -> tuple[Optional[str], int]:
+                row = await conn.fetchrow(
+                    """
+                    WITH batch AS (
+                        SELECT id_article FROM gm_articles
+                        WHERE id_article > $1
+                        ORDER BY id_article
+                        LIMIT $2
+                    ), upd AS (
+                        UPDATE gm_articles a
+                        SET published_at_epoch = gm_gmt_epoch(a.published_at_gmt)
+                        FROM batch b
+                        WHERE a.id_article = b.id_article
+                          AND a.published_at_epoch IS NULL
+                          AND a.published_at_gmt IS NOT NULL
+                        RETURNING 1
+                    )
+                    SELECT (SELECT MAX(id_article) FROM batch) AS last,
+                           (SELECT COUNT(*) FROM upd)          AS n
+                    """,
+                    after, EPOCH_BACKFILL_BATCH,
+                )
+                if row["last"] is not None:
+                    await conn.execute(
+                        "UPDATE gm_migrations SET position = $1 WHERE name = 'published_at_epoch'",
+                        row["last"],
+                    )
+                return row["last"], row["n"]
+
+            after = pos or ""
+            while True:
+                last, n = await self._writer.run(lambda c, a=after: _step(c, a))
+                filled += n
+                if last is None:
+                    break
+                after = last
+                await asyncio.sleep(0.05)          # let hot-path writes through
+            await self._writer.execute(
+                "UPDATE gm_migrations SET done = 1 WHERE name = 'published_at_epoch'"
+            )
+            self._epoch_backfilled = True
+            logger.info(f"✅ published_at_epoch back-fill complete ({filled} rows)")
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.warning(f"⚠️  published_at_epoch back-fill stopped: {e} (resumes on restart)")
+
     async def open_ro_conn(self) -> asyncpg.Connection:
         """
         Acquire a connection from the pool for a worker.
@@ -254,12 +721,42 @@ class NewsDatabase:
         return await self._pool.acquire()
 
     async def close(self) -> None:
+        if self._epoch_task is not None:
+            self._epoch_task.cancel()
+            self._epoch_task = None
         if self._pool:
+            await self._writer.stop()
             await self._pool.close()
             self._pool = None
             NewsDatabase._instance = None
             logger.info("✅ NewsDatabase (pg) connection pool closed")
 
+    def configure_write_coalescer(
+        self, max_ops: Optional[int] = None, max_delay_ms: Optional[float] = None
+    ) -> None:
+        if max_ops is not None:
+            self._writer.max_ops = max(1, int(max_ops))
+        if max_delay_ms is not None:
+            self._writer.max_delay_ms = max(0.0, float(max_delay_ms))
+
+    def write_stats(self) -> dict:
+        return self._writer.to_dict()
+
+    def configure_api_read_pool(self, size: int) -> None:
+        self._api_pool_size = max(1, int(size))
+        self._api_sem       = asyncio.Semaphore(self._api_pool_size)
+
+    @contextlib.asynccontextmanager
+    async def _api_conn(self):
+        """Pool connection for API handlers, capped so readers cannot starve collectors."""
+        async with self._api_sem:
+            async with self._acquire() as conn:
+                yield conn
+
+    def api_pool_stats(self) -> dict:
+        in_use = self._api_pool_size - self._api_sem._value
+        return {"size": self._api_pool_size, "open": in_use, "idle": 0}
+
     # ── Internal context manager helper ──────────────────────────────────────
 
     def _acquire(self):
@@ -303,20 +800,18 @@ class NewsDatabase:
         return result == "INSERT 0 1"
 
     async def update_source_timezone(self, source_id: str, timezone: str) -> None:
-        async with self._acquire() as conn:
-            await conn.execute(
-                "UPDATE gm_sources SET timezone=$1 WHERE id_source=$2",
-                timezone, source_id,
-            )
+        await self._writer.execute(
+            "UPDATE gm_sources SET timezone=$1 WHERE id_source=$2",
+            (timezone, source_id),
+        )
 
     async def update_source_timezone_and_enable(
         self, source_id: str, timezone: str
     ) -> None:
-        async with self._acquire() as conn:
-            await conn.execute(
-                "UPDATE gm_sources SET timezone=$1, use_timezone=1 WHERE id_source=$2",
-                timezone, source_id,
-            )
+        await self._writer.execute(
+            "UPDATE gm_sources SET timezone=$1, use_timezone=1 WHERE id_source=$2",
+            (timezone, source_id),
+        )
 
     async def get_source_block_status(self, source_id: str) -> tuple[int, int]:
         async with self._acquire() as conn:
@@ -336,8 +831,8 @@ class NewsDatabase:
         Increment blocked_count; auto-set fetch_blocked=1 when count reaches 3.
         Uses a single atomic UPDATE … RETURNING to avoid a read-then-write race.
         """
-        async with self._acquire() as conn:
-            row = await conn.fetchrow(
+        async def _apply(conn: asyncpg.Connection):
+            return await conn.fetchrow(
                 """
                 UPDATE gm_sources
                 SET blocked_count = blocked_count + 1,
@@ -347,6 +842,8 @@ class NewsDatabase:
                 """,
                 source_id,
             )
+
+        row = await self._writer.run(_apply)
         if row is None:
             return
         new_count  = row["blocked_count"]
@@ -379,19 +876,63 @@ class NewsDatabase:
         return [_row_to_dict(r) for r in rows]
 
     async def unblock_source(self, source_id: str) -> int:
+        async def _apply(conn: asyncpg.Connection) -> int:
+            await conn.execute(
+                "UPDATE gm_sources SET fetch_blocked=0, blocked_count=0 "
+                "WHERE id_source=$1",
+                source_id,
+            )
+            return _status_rowcount(await conn.execute(
+                "UPDATE gm_articles SET is_enriched=0 "
+                "WHERE id_source=$1 AND is_enriched != 1",
+                source_id,
+            ))
+
+        return await self._writer.run(_apply)
+
+    async def load_feed_validators(self) -> dict[str, dict]:
         async with self._acquire() as conn:
-            async with conn.transaction():
-                await conn.execute(
-                    "UPDATE gm_sources SET fetch_blocked=0, blocked_count=0 "
-                    "WHERE id_source=$1",
-                    source_id,
-                )
-                result = await conn.execute(
-                    "UPDATE gm_articles SET is_enriched=0 "
-                    "WHERE id_source=$1 AND is_enriched != 1",
-                    source_id,
-                )
-        return int(result.split()[-1])
+            rows = await conn.fetch(
+                "SELECT id_source, etag, last_modified FROM gm_feed_validators"
+            )
+        return {
+            r["id_source"]: {"etag": r["etag"], "last_modified": r["last_modified"]}
+            for r in rows
+        }
+
+    async def save_feed_validator(
+        self, source_id: str, etag: Optional[str], last_modified: Optional[str]
+    ) -> None:
+        if not etag and not last_modified:
+            await self._writer.execute(
+                "DELETE FROM gm_feed_validators WHERE id_source=$1", (source_id,)
+            )
+            return
+        await self._writer.execute(
+            """
+            INSERT INTO gm_feed_validators (id_source, etag, last_modified, updated_at_ms)
+            VALUES ($1, $2, $3, $4)
+            ON CONFLICT(id_source) DO UPDATE SET
+                etag          = EXCLUDED.etag,
+                last_modified = EXCLUDED.last_modified,
+                updated_at_ms = EXCLUDED.updated_at_ms
+            """,
+            (source_id, etag, last_modified, int(time.time() * 1000)),
+        )
+
+    async def fetch_source_publish_rates(self, window_days: int = 7) -> dict[str, float]:
+        window_ms = window_days * 86_400_000
+        since_ms  = int(time.time() * 1000) - window_ms
+        async with self._acquire() as conn:
+            rows = await conn.fetch(
+                """
+                SELECT id_source, COUNT(*) AS n FROM gm_articles
+                WHERE inserted_at_ms > $1 AND id_source LIKE 'rss-%'
+                GROUP BY id_source
+                """,
+                since_ms,
+            )
+        return {r["id_source"]: r["n"] / (window_ms / 1000) for r in rows}
 
     # ═══════════════════════════════════════════════════════════════════════════
     # ARTICLES
@@ -412,26 +953,53 @@ class NewsDatabase:
     async def insert_articles_batch(self, articles: list[dict]) -> int:
         """
         INSERT … ON CONFLICT DO NOTHING for a list of articles.
-        Uses a single COPY-style executemany for efficiency.
         Returns the number of rows actually inserted.
+        Thin wrapper around insert_articles_bulk() for callers that only need a count.
+        """
+        return len(await self.insert_articles_bulk(articles))
+
+    async def insert_articles_bulk(self, articles: list[dict]) -> list[str]:
+        """
+        Bulk-insert *articles* and return the ``title_hash`` of every row
+        actually inserted.
+
+        Rows are streamed with COPY (``copy_records_to_table``) into a
+        transaction-scoped staging table, then moved with a single
+        ``INSERT … SELECT … ON CONFLICT DO NOTHING RETURNING title_hash``.
+        The conflict target is left open so both the id_article primary key
+        and the unique title_hash index skip duplicates instead of aborting
+        the batch.  All dicts must share the key set of ``articles[0]``.
         """
         if not articles:
-            return 0
-        cols         = list(articles[0].keys())
-        col_list     = ", ".join(cols)
-        placeholders = ", ".join(f"${i+1}" for i in range(len(cols)))
-        sql          = (
-            f"INSERT INTO gm_articles ({col_list}) VALUES ({placeholders}) "
-            f"ON CONFLICT(id_article) DO NOTHING"
-        )
-        inserted = 0
-        async with self._acquire() as conn:
-            async with conn.transaction():
-                for article in articles:
-                    result = await conn.execute(sql, *[article[c] for c in cols])
-                    if result == "INSERT 0 1":
-                        inserted += 1
-        return inserted
+            return []
+        cols     = list(articles[0].keys())
+        col_list = ", ".join(cols)
+        # Staging columns keep the exact dict-key spelling (COPY quotes its
+        # column names) while types come from gm_articles itself.
+        stg_cols = ", ".join(f'"{c}"' for c in cols)
+        stg_defs = ", ".join(f'{c} AS "{c}"' for c in cols)
+
+        async def _apply(conn: asyncpg.Connection) -> list[str]:
+            await conn.execute(
+                f"CREATE TEMP TABLE _stg_articles ON COMMIT DROP AS "
+                f"SELECT {stg_defs} FROM gm_articles WITH NO DATA"
+            )
+            await conn.copy_records_to_table(
+                "_stg_articles",
+                records=[tuple(a[c] for c in cols) for a in articles],
+                columns=cols,
+            )
+            rows = await conn.fetch(
+                f"INSERT INTO gm_articles ({col_list}) "
+                f"SELECT {stg_cols} FROM _stg_articles "
+                f"ON CONFLICT DO NOTHING "
+                f"RETURNING title_hash"
+            )
+            # Dropped now, not at COMMIT: another batch may share this transaction
+            await conn.execute("DROP TABLE _stg_articles")
+            return [r["title_hash"] for r in rows]
+
+        return await self._writer.run(_apply)
 
     async def find_by_title_hash(self, title_hash: str) -> Optional[dict]:
         async with self._acquire() as conn:
@@ -498,7 +1066,7 @@ class NewsDatabase:
                   AND a.enrich_try <= 2
                   AND a.url IS NOT NULL AND a.url != ''
                   AND (s.fetch_blocked IS NULL OR s.fetch_blocked != 1)
-                ORDER BY a.published_at_gmt DESC
+                ORDER BY a.published_at_epoch DESC NULLS LAST
                 LIMIT $2
                 """,
                 enrich_try, limit,
@@ -507,17 +1075,15 @@ class NewsDatabase:
 
     async def mark_enrich_attempt_failed(self, article_id: str, current_try: int) -> None:
         if current_try >= 2:
-            async with self._acquire() as conn:
-                await conn.execute(
-                    "UPDATE gm_articles SET is_enriched = -1 WHERE id_article = $1",
-                    article_id,
-                )
+            await self._writer.execute(
+                "UPDATE gm_articles SET is_enriched = -1 WHERE id_article = $1",
+                (article_id,),
+            )
         else:
-            async with self._acquire() as conn:
-                await conn.execute(
-                    "UPDATE gm_articles SET enrich_try = enrich_try + 1 WHERE id_article = $1",
-                    article_id,
-                )
+            await self._writer.execute(
+                "UPDATE gm_articles SET enrich_try = enrich_try + 1 WHERE id_article = $1",
+                (article_id,),
+            )
 
     async def save_enriched_article(
         self,
@@ -529,29 +1095,27 @@ class NewsDatabase:
         url_to_image: Optional[str],
         is_enriched:  int,
     ) -> None:
-        async with self._acquire() as conn:
-            await conn.execute(
-                """
-                UPDATE gm_articles
-                SET author        = COALESCE($1, author),
-                    description   = COALESCE($2, description),
-                    content       = $3,
-                    is_enriched   = $4,
-                    "urlToImage"  = COALESCE($5, "urlToImage"),
-                    is_translated = CASE WHEN $4 = 1 AND is_translated != 1 THEN 0
-                                         ELSE is_translated END
-                WHERE id_article = $6
-                """,
-                author, description, content, is_enriched, url_to_image, article_id,
-            )
+        await self._writer.execute(
+            """
+            UPDATE gm_articles
+            SET author        = COALESCE($1, author),
+                description   = COALESCE($2, description),
+                content       = $3,
+                is_enriched   = $4,
+                "urlToImage"  = COALESCE($5, "urlToImage"),
+                is_translated = CASE WHEN $4 = 1 AND is_translated != 1 THEN 0
+                                     ELSE is_translated END
+            WHERE id_article = $6
+            """,
+            (author, description, content, is_enriched, url_to_image, article_id),
+        )
 
     async def save_enrichment_failure(self, article_id: str, has_content: bool) -> None:
         val = 1 if has_content else -1
-        async with self._acquire() as conn:
-            await conn.execute(
-                "UPDATE gm_articles SET is_enriched=$1 WHERE id_article=$2",
-                val, article_id,
-            )
+        await self._writer.execute(
+            "UPDATE gm_articles SET is_enriched=$1 WHERE id_article=$2",
+            (val, article_id),
+        )
 
     async def bulk_close_blocked_source_articles(self) -> None:
         async with self._acquire() as conn:
@@ -611,7 +1175,7 @@ class NewsDatabase:
             )
         return int(result.split()[-1])
 
-    async def save_translation(self, article_id: str, values: TranslationValues) -> None:
+    async def save_translation(self, article_id: str, values: TranslationValues) -> Optional[int]:
         _ALLOWED = frozenset({
             "is_translated", "translated_title",
             "translated_description", "translated_content",
@@ -619,15 +1183,17 @@ class NewsDatabase:
         params = {k: v for k, v in values.items() if k in _ALLOWED}
         if "is_translated" not in params:
             raise ValueError("save_translation requires 'is_translated'")
+        if params.get("is_translated") == 1:
+            params["translated_at_ms"] = int(time.time() * 1000)
         # Build: SET col=$1, col2=$2, … WHERE id_article=$N
         keys   = [k for k in params]
         sets   = ", ".join(f"{k}=${i+1}" for i, k in enumerate(keys))
         vals   = [params[k] for k in keys] + [article_id]
-        async with self._acquire() as conn:
-            await conn.execute(
-                f"UPDATE gm_articles SET {sets} WHERE id_article=${len(vals)}",
-                *vals,
-            )
+        await self._writer.execute(
+            f"UPDATE gm_articles SET {sets} WHERE id_article=${len(vals)}",
+            tuple(vals),
+        )
+        return params.get("translated_at_ms")
 
     async def fetch_articles_missing_gmt(
         self, source_id: str
@@ -648,12 +1214,11 @@ class NewsDatabase:
     async def update_gmt_batch(self, updates: list[GmtUpdate]) -> None:
         if not updates:
             return
-        async with self._acquire() as conn:
-            async with conn.transaction():
-                await conn.executemany(
-                    "UPDATE gm_articles SET published_at_gmt=$1 WHERE id_article=$2",
-                    [(u["gmt_timestamp"], u["article_id"]) for u in updates],
-                )
+        await self._writer.execute(
+            "UPDATE gm_articles SET published_at_gmt=$1 WHERE id_article=$2",
+            [(u["gmt_timestamp"], u["article_id"]) for u in updates],
+            many=True,
+        )
 
     # ═══════════════════════════════════════════════════════════════════════════
     # BLOCKED DOMAINS
@@ -673,10 +1238,10 @@ class NewsDatabase:
         Upsert blocked-domain counter.
         Returns (new_count, newly_became_blocked).
         Atomic INSERT … ON CONFLICT DO UPDATE … RETURNING replaces the
-        aiosqlite _write_lock + separate SELECT.
+        aiosqlite read-then-update block.
         """
-        async with self._acquire() as conn:
-            row = await conn.fetchrow(
+        async def _apply(conn: asyncpg.Connection):
+            return await conn.fetchrow(
                 """
                 INSERT INTO gm_blocked_domains (domain, blocked_count, is_blocked, last_error, updated_at)
                 VALUES ($1, 1, 0, $2, now())
@@ -692,6 +1257,8 @@ class NewsDatabase:
                 """,
                 domain, str(error_code),
             )
+
+        row = await self._writer.run(_apply)
         count      = row["blocked_count"] if row else 1
         is_blocked = bool(row["is_blocked"]) if row else False
         return count, is_blocked
@@ -709,6 +1276,225 @@ class NewsDatabase:
             )
         return int(result.split()[-1])
 
+    # ═══════════════════════════════════════════════════════════════════════════
+    # API READS
+    # ═══════════════════════════════════════════════════════════════════════════
+
+    async def ping(self) -> bool:
+        async with self._api_conn() as conn:
+            await conn.fetchval("SELECT 1")
+        return True
+
+    async def get_latest_published_gmt(self) -> "str | None":
+        async with self._api_conn() as conn:
+            if self._epoch_backfilled:
+                return await conn.fetchval(
+                    "SELECT published_at_gmt FROM gm_articles "
+                    "WHERE published_at_epoch <= $1 "
+                    "ORDER BY published_at_epoch DESC LIMIT 1",
+                    int(time.time()),
+                )
+            return await conn.fetchval(
+                "SELECT MAX(published_at_gmt) FROM gm_articles "
+                "WHERE published_at_gmt IS NOT NULL AND published_at_gmt != '' "
+                "AND published_at_gmt <= to_char(now() AT TIME ZONE 'UTC', "
+                "'YYYY-MM-DD\"T\"HH24:MI:SS+00:00')"
+            )
+
+    async def fetch_articles_since(
+        self,
+        since_ms: int,
+        until_ms: int,
+        limit: int,
+        source_ids: Optional[list[str]] = None,
+    ) -> list[dict]:
+        sql = """
+            SELECT id_article, id_source, author, title, description, url,
+                   "urlToImage", "publishedAt",
+                   published_at_gmt, inserted_at_ms,
+                   translated_title, translated_description, translated_content,
+                   is_translated
+            FROM gm_articles
+            WHERE inserted_at_ms > $1 AND inserted_at_ms <= $2
+              AND (published_at_epoch IS NULL OR published_at_epoch <= $3)
+        """
+        args: list = [since_ms, until_ms, int(time.time())]
+        if source_ids:
+            args.append(source_ids)
+            sql += f" AND id_source = ANY(${len(args)}::text[])"
+        args.append(limit)
+        sql += f" ORDER BY inserted_at_ms DESC LIMIT ${len(args)}"
+        async with self._api_conn() as conn:
+            rows = await conn.fetch(sql, *args)
+        return [_row_to_dict(r) for r in rows]
+
+    @staticmethod
+    def _articles_after_sql(
+        after_ms: int, after_id: Any, until_ms: int, source_ids: Optional[list[str]]
+    ) -> tuple[str, list]:
+        sql = """
+            SELECT id_article, id_source, author, title, description, url,
+                   "urlToImage", "publishedAt",
+                   published_at_gmt, inserted_at_ms,
+                   translated_title, translated_description, translated_content,
+                   is_translated
+            FROM gm_articles
+        """
+        if after_id is None:
+            args: list = [after_ms]
+            sql += " WHERE inserted_at_ms > $1"
+        else:
+            args = [after_ms, after_id]
+            sql += " WHERE (inserted_at_ms, id_article) > ($1, $2)"
+        args.extend((until_ms, int(time.time())))
+        sql += (f" AND inserted_at_ms <= ${len(args) - 1}"
+                f" AND (published_at_epoch IS NULL OR published_at_epoch <= ${len(args)})")
+        if source_ids:
+            args.append(source_ids)
+            sql += f" AND id_source = ANY(${len(args)}::text[])"
+        sql += " ORDER BY inserted_at_ms ASC, id_article ASC"
+        return sql, args
+
+    async def fetch_articles_after(
+        self,
+        after_ms: int,
+        after_id: Any,
+        until_ms: int,
+        limit: int,
+        source_ids: Optional[list[str]] = None,
+    ) -> list[dict]:
+        sql, args = self._articles_after_sql(after_ms, after_id, until_ms, source_ids)
+        args.append(limit)
+        sql += f" LIMIT ${len(args)}"
+        async with self._api_conn() as conn:
+            rows = await conn.fetch(sql, *args)
+        return [_row_to_dict(r) for r in rows]
+
+    async def iter_articles_after(
+        self,
+        after_ms: int,
+        after_id: Any,
+        until_ms: int,
+        chunk: int,
+        source_ids: Optional[list[str]] = None,
+    ) -> AsyncIterator[list[dict]]:
+        """Server-side cursor (inside one read transaction), *chunk* rows at a time."""
+        sql, args = self._articles_after_sql(after_ms, after_id, until_ms, source_ids)
+        async with self._acquire() as conn:
+            async with conn.transaction(readonly=True):
+                cur = await conn.cursor(sql, *args)
+                while True:
+                    rows = await cur.fetch(chunk)
+                    if not rows:
+                        break
+                    yield [_row_to_dict(r) for r in rows]
+
+    async def fetch_translation_updates(
+        self, since_ms: int, limit: int, after_id: Any = None
+    ) -> list[dict]:
+        if after_id is None:
+            where, args = "translated_at_ms > $1", [since_ms]
+        else:
+            where, args = "(translated_at_ms, id_article) > ($1, $2)", [since_ms, after_id]
+        args.append(limit)
+        async with self._api_conn() as conn:
+            rows = await conn.fetch(
+                f"""
+                SELECT id_article, translated_title, translated_description,
+                       translated_content, translated_at_ms
+                FROM gm_articles
+                WHERE {where} AND is_translated = 1
+                ORDER BY translated_at_ms ASC, id_article ASC
+                LIMIT ${len(args)}
+                """,
+                *args,
+            )
+        return [_row_to_dict(r) for r in rows]
+
+    async def fetch_latest_inserted(self) -> tuple[int, int]:
+        async with self._api_conn() as conn:
+            row = await conn.fetchrow(
+                "SELECT MAX(inserted_at_ms) AS latest, COUNT(*) AS total "
+                "FROM gm_articles WHERE inserted_at_ms IS NOT NULL"
+            )
+        return ((row["latest"] or 0), (row["total"] or 0)) if row else (0, 0)
+
+    async def fetch_sources_with_counts(self) -> list[dict]:
+        async with self._api_conn() as conn:
+            rows = await conn.fetch(
+                """
+                SELECT s.id_source, s.name, s.category, s.language,
+                       st.article_count, st.enriched_count, st.translated_count,
+                       st.last_inserted_ms, st.last_published_gmt
+                FROM gm_source_stats st
+                JOIN gm_sources s ON s.id_source = st.id_source
+                WHERE st.article_count > 0
+                ORDER BY s.name
+                """
+            )
+        return [_row_to_dict(r) for r in rows]
+
+    @property
+    def search_available(self) -> bool:
+        return True
+
+    async def search_articles(
+        self,
+        query: str,
+        *,
+        limit: int,
+        offset: int = 0,
+        source_ids: Optional[list[str]] = None,
+        languages: Optional[list[str]] = None,
+        since_ms: Optional[int] = None,
+        until_ms: Optional[int] = None,
+    ) -> list[dict]:
+        tsq = _tsquery_expr(query)
+        if not tsq:
+            return []
+        where = [
+            "a.search_tsv @@ q.q",
+            "(a.published_at_epoch IS NULL OR a.published_at_epoch <= $2)",
+        ]
+        args: list = [tsq, int(time.time())]
+        if source_ids:
+            args.append(source_ids)
+            where.append(f"a.id_source = ANY(${len(args)}::text[])")
+        if languages:
+            args.append(languages)
+            where.append(f"a.detected_language = ANY(${len(args)}::text[])")
+        if since_ms is not None:
+            args.append(since_ms)
+            where.append(f"a.inserted_at_ms >= ${len(args)}")
+        if until_ms is not None:
+            args.append(until_ms)
+            where.append(f"a.inserted_at_ms <= ${len(args)}")
+        args.extend((limit, offset))
+        # Rank every match, but build headlines only for the returned page
+        sql = f"""
+            WITH q AS (SELECT to_tsquery('simple', $1) AS q),
+            hits AS (
+                SELECT a.id_article, a.id_source, a.author, a.title, a.description, a.url,
+                       a."urlToImage", a."publishedAt", a.published_at_gmt, a.inserted_at_ms,
+                       a.detected_language, a.translated_title, a.translated_description,
+                       a.is_translated,
+                       ts_rank_cd(a.search_tsv, q.q) AS score
+                FROM gm_articles a, q
+                WHERE {' AND '.join(where)}
+                ORDER BY score DESC
+                LIMIT ${len(args) - 1} OFFSET ${len(args)}
+            )
+            SELECT hits.*,
+                   ts_headline('simple',
+                       coalesce(hits.title, '') || ' ' || coalesce(hits.description, ''),
+                       q.q, 'StartSel=<b>, StopSel=</b>, MaxWords=16, MinWords=8') AS snippet
+            FROM hits, q
+            ORDER BY hits.score DESC
+        """
+        async with self._api_conn() as conn:
+            rows = await conn.fetch(sql, *args)
+        return [_row_to_dict(r) for r in rows]
+
     # ═══════════════════════════════════════════════════════════════════════════
     # QUEUE STATS
     # ═══════════════════════════════════════════════════════════════════════════
@@ -1,18 +1,24 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
 """
-NLLB-200 GPU worker process.
+NLLB-200 inference worker process.
 
 This module is kept intentionally thin so that Python's ``spawn`` start
 method does not need to import the heavy ``translatev1`` module inside the
-child process.  Only ``torch`` and ``transformers`` are imported here, and
-only after the worker function is actually called.
+child process.  The inference libraries (``torch`` / ``transformers``, or
+``ctranslate2`` / ``onnxruntime`` for the CPU runtimes) are imported only
+when the worker loads its runtime.
 
-Spawned by ``translatev1._NLLBProcessTranslator._ensure_started()``.
+Spawned by ``translatev1._NLLBProcessTranslator._ensure_started()`` — via
+``pool()`` which, for ``NLLB_POOL_SIZE > 1``, loads the model once and forks
+the workers so they share its weights copy-on-write.
 """
 
 import multiprocessing
+import os
+import re
 import signal
+import time
 
 # ---------------------------------------------------------------------------
 # Language-code maps
@@ -87,12 +93,221 @@ NLLB_MODEL_ID  = "facebook/nllb-200-distilled-600M"
 import os as _os
 NLLB_BATCH_SIZE: int = int(_os.environ.get("NLLB_BATCH_SIZE", 16))
 NLLB_NUM_BEAMS:  int = int(_os.environ.get("NLLB_NUM_BEAMS",  4))   # 1=greedy (fast), 4=beam (slower, marginally better)
+# Padded source tokens per model.generate() call (batch rows × longest row).
+# Batches are formed by this budget, not by a fixed row count, so a batch of
+# short titles holds many rows while long content segments go a few at a time.
+NLLB_TOKEN_BUDGET:   int = int(_os.environ.get("NLLB_TOKEN_BUDGET",   4096))
+# Long fields are split into sentence groups of at most this many source
+# tokens, translated separately and re-joined — nothing is truncated.
+NLLB_SEGMENT_TOKENS: int = int(_os.environ.get("NLLB_SEGMENT_TOKENS", 200))
+
+# Inference runtime — all share the request/response protocol:
+#   torch        fp32 PyTorch (CUDA when available)
+#   torch-int8   PyTorch with int8 dynamic quantisation of Linear layers (CPU)
+#   ctranslate2  CTranslate2 model converted with ct2-transformers-converter
+#   onnx         ONNX Runtime via optimum (exported on first load if no dir)
+NLLB_RUNTIME:   str = _os.environ.get("NLLB_RUNTIME", "torch")
+NLLB_THREADS:   int = int(_os.environ.get("NLLB_THREADS", 0))      # intra-op CPU threads; 0 = library default
+NLLB_MODEL_DIR: str = _os.environ.get("NLLB_MODEL_DIR", "")        # converted / exported model for ctranslate2 / onnx
+RUNTIMES = ("torch", "torch-int8", "ctranslate2", "onnx")
+# Worker processes sharing one request queue.  CPU torch runtimes load the
+# weights once and fork, so N workers cost ~1× model RAM; other runtimes
+# (and CUDA, which cannot fork) load one copy per worker / stay at 1.
+NLLB_POOL_SIZE: int = int(_os.environ.get("NLLB_POOL_SIZE", 1))
 
 # Sentinel returned when NLLB cannot map this language (source or target not in lang_map).
 # Callers must distinguish this from None (transient inference error).
 NOLANG = "<<NLLB_NOLANG>>"
 
 
+# ---------------------------------------------------------------------------
+# Inference runtimes
+# ---------------------------------------------------------------------------
+
+class _HFRuntime:
+    """transformers-style model: ``model.generate()`` over tokenizer tensors."""
+
+    name = "torch"
+    fork_safe = False   # weights may be inherited by fork()ed workers
+
+    def __init__(self) -> None:
+        self.model = self.tokenizer = None
+        self.device = "cpu"
+
+    def set_threads(self, threads: int) -> None:
+        """Re-apply the intra-op thread count (used in forked workers)."""
+        return None
+
+    def generate(
+        self, texts: list[str], src_nllb: str, tgt_nllb: str,
+        max_new_tokens: int, num_beams: int,
+    ) -> list[str]:
+        import torch
+        self.tokenizer.src_lang = src_nllb
+        inputs = self.tokenizer(
+            texts, return_tensors="pt",
+            padding=True, truncation=True, max_length=512,
+        ).to(self.device)
+        with torch.inference_mode():
+            output_ids = self.model.generate(
+                **inputs,
+                forced_bos_token_id=self.tokenizer.convert_tokens_to_ids(tgt_nllb),
+                max_new_tokens=max_new_tokens,
+                max_length=None,
+                num_beams=num_beams,
+            )
+        return self.tokenizer.batch_decode(output_ids, skip_special_tokens=True)
+
+
+class _TorchRuntime(_HFRuntime):
+    """PyTorch fp32, or int8 dynamic quantisation of every nn.Linear (CPU only)."""
+
+    def __init__(self, model_id: str, threads: int, quantize: bool) -> None:
+        super().__init__()
+        import torch
+        from transformers import AutoModelForSeq2SeqLM, AutoTokenizer
+        if threads:
+            torch.set_num_threads(threads)
+        self.name   = "torch-int8" if quantize else "torch"
+        self.device = "cuda:0" if torch.cuda.is_available() and not quantize else "cpu"
+        self.tokenizer = AutoTokenizer.from_pretrained(model_id)
+        model = AutoModelForSeq2SeqLM.from_pretrained(model_id)
+        if quantize:
+            from torch.ao.quantization import quantize_dynamic
+            model = quantize_dynamic(model, {torch.nn.Linear}, dtype=torch.qint8)
+        self.model = model.to(self.device)
+        self.model.eval()
+        self.fork_safe = self.device == "cpu"
+
+    def set_threads(self, threads: int) -> None:
+        import torch
+        if threads:
+            torch.set_num_threads(threads)
+
+
+class _ONNXRuntime(_HFRuntime):
+    """ONNX Runtime (CPU) through optimum; exports *model_id* when no dir is given."""
+
+    name = "onnx"
+
+    def __init__(self, model_id: str, threads: int, model_dir: str) -> None:
+        super().__init__()
+        import onnxruntime
+        from optimum.onnxruntime import ORTModelForSeq2SeqLM
+        from transformers import AutoTokenizer
+        opts = onnxruntime.SessionOptions()
+        if threads:
+            opts.intra_op_num_threads = threads
+        self.tokenizer = AutoTokenizer.from_pretrained(model_id)
+        self.model = ORTModelForSeq2SeqLM.from_pretrained(
+            model_dir or model_id, export=not model_dir, session_options=opts,
+        )
+
+
+class _CT2Runtime:
+    """CTranslate2 translator (int8 / int8_float16 as converted)."""
+
+    name = "ctranslate2"
+    fork_safe = False
+
+    def __init__(self, model_id: str, threads: int, model_dir: str) -> None:
+        import ctranslate2
+        from transformers import AutoTokenizer
+        if not model_dir:
+            raise ValueError(
+                "NLLB_MODEL_DIR must point to a CTranslate2 model, e.g. "
+                f"ct2-transformers-converter --model {model_id} --quantization int8 --output_dir …"
+            )
+        self.device = "cuda" if ctranslate2.get_cuda_device_count() > 0 else "cpu"
+        self.tokenizer  = AutoTokenizer.from_pretrained(model_id)
+        self.translator = ctranslate2.Translator(
+            model_dir, device=self.device, intra_threads=threads or 0,
+        )
+
+    def set_threads(self, threads: int) -> None:
+        return None
+
+    def generate(
+        self, texts: list[str], src_nllb: str, tgt_nllb: str,
+        max_new_tokens: int, num_beams: int,
+    ) -> list[str]:
+        tok = self.tokenizer
+        tok.src_lang = src_nllb
+        source = [
+            tok.convert_ids_to_tokens(tok.encode(t, truncation=True, max_length=512))
+            for t in texts
+        ]
+        results = self.translator.translate_batch(
+            source,
+            target_prefix=[[tgt_nllb]] * len(texts),
+            beam_size=num_beams,
+            max_decoding_length=max_new_tokens,
+        )
+        return [
+            tok.decode(tok.convert_tokens_to_ids(r.hypotheses[0][1:]), skip_special_tokens=True)
+            for r in results
+        ]
+
+
+def load_runtime(runtime: str, model_id: str, *, threads: int = 0, model_dir: str = ""):
+    """Instantiate one of ``RUNTIMES``; heavy imports happen only here."""
+    if runtime == "torch":
+        return _TorchRuntime(model_id, threads, quantize=False)
+    if runtime == "torch-int8":
+        return _TorchRuntime(model_id, threads, quantize=True)
+    if runtime == "ctranslate2":
+        return _CT2Runtime(model_id, threads, model_dir)
+    if runtime == "onnx":
+        return _ONNXRuntime(model_id, threads, model_dir)
+    raise ValueError(f"Unknown NLLB runtime {runtime!r} (expected one of {RUNTIMES})")
+
+
+# ---------------------------------------------------------------------------
+# Sentence segmentation
+# ---------------------------------------------------------------------------
+
+# Sentence end: Latin / CJK / Arabic / Devanagari terminators followed by
+# whitespace, or a line break.  Good enough for news prose; abbreviations that
+# split too early only cost a slightly shorter segment.
+_SENT_END_RE = re.compile(r'(?<=[.!?…。！？؟।])\s+|(?<=[。！？])|\n+')
+
+
+# Rough UTF-8 bytes per SentencePiece token — lets the parent estimate the
+# segment count of a request without loading the tokenizer.
+_BYTES_PER_TOKEN = 4
+
+
+def estimate_segments(text: str, segment_tokens: int = 0) -> int:
+    """Approximate number of segments the worker will split *text* into."""
+    per_segment = max(1, (segment_tokens or NLLB_SEGMENT_TOKENS) * _BYTES_PER_TOKEN)
+    return max(1, -(-len(text.encode('utf-8')) // per_segment))
+
+
+def split_sentences(text: str) -> list[str]:
+    """Split *text* into sentences (empty pieces dropped)."""
+    return [s.strip() for s in _SENT_END_RE.split(text) if s and s.strip()]
+
+
+def plan_batches(lengths: list[int], token_budget: int) -> list[list[int]]:
+    """
+    Group item indices into generate() batches: items are sorted by token
+    length and a batch grows while ``rows × longest`` stays within
+    *token_budget*, so padding waste stays small and batch size adapts.
+    """
+    order = sorted(range(len(lengths)), key=lengths.__getitem__)
+    batches: list[list[int]] = []
+    cur: list[int] = []
+    for i in order:
+        # ascending order → the newcomer is the longest row of the batch
+        if cur and (len(cur) + 1) * lengths[i] > token_budget:
+            batches.append(cur)
+            cur = []
+        cur.append(i)
+    if cur:
+        batches.append(cur)
+    return batches
+
+
 # ---------------------------------------------------------------------------
 # Worker entry-point
 # ---------------------------------------------------------------------------
@@ -105,71 +320,174 @@ def worker(
     target_map: dict,
     batch_size: int = 8,
     num_beams: int = 4,
+    token_budget: int = NLLB_TOKEN_BUDGET,
+    segment_tokens: int = NLLB_SEGMENT_TOKENS,
+    runtime: str = NLLB_RUNTIME,
+    threads: int = NLLB_THREADS,
+    model_dir: str = NLLB_MODEL_DIR,
+    worker_id: int = 0,
+    preloaded=None,
 ) -> None:
     """
-    GPU worker process.  Loads the NLLB model once, then processes translation
-    requests indefinitely until a ``None`` sentinel is received.
+    Inference worker process.  Loads the NLLB model once with the selected
+    *runtime* (see ``RUNTIMES``), then processes translation requests
+    indefinitely until a ``None`` sentinel is received.
 
     Requests are batched: after the first item arrives the worker drains the
-    queue (non-blocking) up to ``batch_size`` items, groups them by
-    (src_lang, tgt_lang) pair, and runs a single ``model.generate()`` per
-    group so the GPU is saturated rather than processing one item at a time.
+    queue (non-blocking) up to ``batch_size`` requests and groups them by
+    (src_lang, tgt_lang) pair.  Within a group every text is split into
+    sentence segments of at most ``segment_tokens`` tokens; all segments are
+    sorted by length and packed into ``model.generate()`` calls of at most
+    ``token_budget`` padded tokens, then re-joined per request.
+
+    *preloaded* is a runtime inherited from ``pool()`` through fork(); the
+    worker then only re-applies *threads* instead of loading the model.
 
     Protocol
     --------
     request:  ``(req_id: str, text: str, src_code: str, tgt_code: str)``
             | ``None``   ← shutdown sentinel
-    response: ``(req_id: str, translated_str_or_None)``
+    response: ``(req_id: str, translated_str_or_None, meta: dict)``
+              where ``meta = {"worker", "pid", "ms", "tokens"}`` feeds the
+              per-worker throughput in ``/api/translate``.
+    claim:    ``(None, None, {"event": "claim", "worker", "req_ids"})`` —
+              sent before a batch is run, so the parent can fail those
+              requests at once if this worker dies mid-batch.
     """
     import queue as _queue
     import time as _time
 
     signal.signal(signal.SIGINT, signal.SIG_IGN)   # parent handles SIGINT
 
-    model = tokenizer = device = None
+    pid = os.getpid()
+    rt = tokenizer = None
     ready = False
 
+    tag = f"[nllb-worker{worker_id}]" if worker_id else "[nllb-worker]"
+
     def _load() -> bool:
-        nonlocal model, tokenizer, device, ready
+        nonlocal rt, tokenizer, ready
+        if preloaded is not None:
+            rt = preloaded
+            rt.set_threads(threads)
+            tokenizer = rt.tokenizer
+            print(f"{tag} Ready (forked, shared weights, threads={threads or 'default'})", flush=True)
+            ready = True
+            return True
         try:
-            import torch
-            from transformers import AutoModelForSeq2SeqLM, AutoTokenizer
-            device = "cuda:0" if torch.cuda.is_available() else "cpu"
-            print(f"[nllb-worker] Loading {model_id} on {device} (batch_size={batch_size}) …", flush=True)
-            tokenizer = AutoTokenizer.from_pretrained(model_id)
-            model = AutoModelForSeq2SeqLM.from_pretrained(model_id).to(device)
-            model.eval()
-            print(f"[nllb-worker] Ready on {device}", flush=True)
+            print(
+                f"{tag} Loading {model_id} with runtime={runtime} "
+                f"threads={threads or 'default'} (batch_size={batch_size}) …",
+                flush=True,
+            )
+            rt = load_runtime(runtime, model_id, threads=threads, model_dir=model_dir)
+            tokenizer = rt.tokenizer
+            print(f"{tag} Ready on {rt.device} ({rt.name})", flush=True)
             ready = True
             return True
         except Exception as e:
-            print(f"[nllb-worker] Load failed: {e}", flush=True)
+            print(f"{tag} Load failed: {e}", flush=True)
             return False
 
-    def _translate_group(texts: list[str], src_nllb: str, tgt_nllb: str) -> list[str | None]:
-        """Run batched inference for a group sharing the same lang pair."""
-        import torch
+    def _translate_batch(
+        texts: list[str], src_nllb: str, tgt_nllb: str, longest: int
+    ) -> list[str | None]:
+        """Run one generate() over length-sorted segments of one lang pair."""
         try:
-            tokenizer.src_lang = src_nllb
-            forced_bos = tokenizer.convert_tokens_to_ids(tgt_nllb)
-            inputs = tokenizer(
-                texts, return_tensors="pt",
-                padding=True, truncation=True, max_length=512,
-            ).to(device)
-            with torch.no_grad():
-                output_ids = model.generate(
-                    **inputs,
-                    forced_bos_token_id=forced_bos,
-                    max_new_tokens=256,
-                    max_length=None,
-                    num_beams=num_beams,
-                )
-            decoded = tokenizer.batch_decode(output_ids, skip_special_tokens=True)
+            decoded = rt.generate(
+                texts, src_nllb, tgt_nllb,
+                # Room for target-side expansion (e.g. CJK → Latin)
+                max_new_tokens=min(512, 2 * longest + 16),
+                num_beams=num_beams,
+            )
             return [s.strip() or None for s in decoded]
         except Exception as e:
-            print(f"[nllb-worker] Inference error: {str(e)[:200]}", flush=True)
+            print(f"{tag} Inference error: {str(e)[:200]}", flush=True)
             return [None] * len(texts)
 
+    def _segment(text: str) -> list[tuple[str, int]]:
+        """Split *text* into (segment, n_tokens) pairs of ≤ segment_tokens each."""
+        sents = split_sentences(text) or [text]
+        lens  = [len(ids) for ids in tokenizer(sents, add_special_tokens=False)["input_ids"]]
+        segs: list[tuple[str, int]] = []
+        cur: list[str] = []
+        cur_len = 0
+        for sent, n in zip(sents, lens):
+            if n > segment_tokens:
+                # Overlong "sentence" (no punctuation): pack whole words up to
+                # segment_tokens, and cut a word that alone is longer on token
+                # ids — CJK / Thai text without spaces is a single "word", and
+                # anything over the budget would be truncated at max_length.
+                if cur:
+                    segs.append((" ".join(cur), cur_len))
+                    cur, cur_len = [], 0
+                words = sent.split()
+                for word, ids in zip(words, tokenizer(words, add_special_tokens=False)["input_ids"]):
+                    if len(ids) > segment_tokens:
+                        if cur:
+                            segs.append((" ".join(cur), cur_len))
+                            cur, cur_len = [], 0
+                        for k in range(0, len(ids), segment_tokens):
+                            part = ids[k:k + segment_tokens]
+                            segs.append((tokenizer.decode(part, skip_special_tokens=True).strip(), len(part)))
+                        continue
+                    if cur and cur_len + len(ids) > segment_tokens:
+                        segs.append((" ".join(cur), cur_len))
+                        cur, cur_len = [], 0
+                    cur.append(word)
+                    cur_len += len(ids)
+                if cur:
+                    segs.append((" ".join(cur), cur_len))
+                    cur, cur_len = [], 0
+                continue
+            if cur and cur_len + n > segment_tokens:
+                segs.append((" ".join(cur), cur_len))
+                cur, cur_len = [], 0
+            cur.append(sent)
+            cur_len += n
+        if cur:
+            segs.append((" ".join(cur), cur_len))
+        return segs
+
+    def _translate_group(
+        texts: list[str], src_nllb: str, tgt_nllb: str
+    ) -> tuple[list[str | None], list[int]]:
+        """
+        Segment, length-bucket, translate and reassemble one lang-pair group.
+        Returns the per-request results and source token counts.
+        """
+        n_tokens = [0] * len(texts)
+        try:
+            tokenizer.src_lang = src_nllb
+            seg_owner: list[int] = []
+            seg_text:  list[str] = []
+            seg_len:   list[int] = []
+            for owner, text in enumerate(texts):
+                for seg, n in _segment(text):
+                    seg_owner.append(owner)
+                    seg_text.append(seg)
+                    seg_len.append(n + 2)   # + lang tag and </s>
+                    n_tokens[owner] += n + 2
+        except Exception as e:
+            print(f"{tag} Segmentation error: {str(e)[:200]}", flush=True)
+            return [None] * len(texts), n_tokens
+
+        seg_out: list[str | None] = [None] * len(seg_text)
+        for batch in plan_batches(seg_len, token_budget):
+            longest = max(seg_len[i] for i in batch)
+            out = _translate_batch([seg_text[i] for i in batch], src_nllb, tgt_nllb, longest)
+            for i, r in zip(batch, out):
+                seg_out[i] = r
+
+        parts: list[list[str | None]] = [[] for _ in texts]
+        for owner, r in zip(seg_owner, seg_out):
+            parts[owner].append(r)
+        # A request succeeds only if every one of its segments did
+        return [
+            " ".join(p) if p and all(x is not None for x in p) else None  # type: ignore[arg-type]
+            for p in parts
+        ], n_tokens
+
     _load()
 
     shutdown = False
@@ -206,18 +524,22 @@ def worker(
 
         if not items:
             break
+        resp_q.put((None, None, {
+            "event": "claim", "worker": worker_id, "req_ids": [it[0] for it in items],
+        }))
 
         # ── group by (src_nllb, tgt_nllb) ────────────────────────────────────
         # items that can't be mapped are sent back as None immediately
         groups: dict[tuple[str, str], list[tuple[int, str, str]]] = {}
         results: dict[str, str | None] = {}
+        costs:   dict[str, tuple[float, int]] = {}   # req_id → (ms share, tokens)
 
         for req_id, text, src_code, tgt_code in items:
             src_nllb = lang_map.get((src_code or "").lower())
             tgt_nllb = target_map.get(tgt_code) or lang_map.get(tgt_code)
             if not ready or not text or not text.strip() or not src_nllb or not tgt_nllb:
                 if not src_nllb or not tgt_nllb:
-                    print(f"[nllb-worker] Unknown lang: src={src_code!r} tgt={tgt_code!r}", flush=True)
+                    print(f"{tag} Unknown lang: src={src_code!r} tgt={tgt_code!r}", flush=True)
                     results[req_id] = NOLANG  # permanent — caller should route to other backend
                 else:
                     results[req_id] = None
@@ -231,18 +553,182 @@ def worker(
             texts    = [g[1] for g in group_items]
             src_code = group_items[0][2]
             print(
-                f"[nllb-worker] batch {len(texts)} × {src_code}→{tgt_nllb.split('_')[0]} "
+                f"{tag} batch {len(texts)} × {src_code}→{tgt_nllb.split('_')[0]} "
                 f"| {texts[0][:80]!r}{'…' if len(texts)>1 else ''}",
                 flush=True,
             )
-            translated = _translate_group(texts, src_nllb, tgt_nllb)
-            for req_id, result in zip(req_ids, translated):
+            t0 = _time.monotonic()
+            translated, n_tokens = _translate_group(texts, src_nllb, tgt_nllb)
+            ms_each = (_time.monotonic() - t0) * 1000 / len(texts)
+            for req_id, result, n in zip(req_ids, translated, n_tokens):
                 results[req_id] = result
+                costs[req_id]   = (ms_each, n)
                 if result:
-                    print(f"[nllb-worker] ← {result[:80]!r}", flush=True)
+                    print(f"{tag} ← {result[:80]!r}", flush=True)
 
         # ── dispatch responses in original order ──────────────────────────────
         for req_id, _, _, _ in items:
-            resp_q.put((req_id, results.get(req_id)))
+            ms, n = costs.get(req_id, (0.0, 0))
+            resp_q.put((req_id, results.get(req_id), {
+                "worker": worker_id, "pid": pid, "ms": round(ms, 1), "tokens": n,
+            }))
+
+    print(f"{tag} Exiting.", flush=True)
+
+
+# ---------------------------------------------------------------------------
+# Worker pool entry-point
+# ---------------------------------------------------------------------------
+
+def _die_with_parent() -> None:
+    """Linux: have the kernel SIGTERM this process when its parent exits."""
+    try:
+        import ctypes
+        ctypes.CDLL("libc.so.6", use_errno=True).prctl(1, signal.SIGTERM)  # PR_SET_PDEATHSIG
+    except Exception:
+        pass
+
+
+def _status_set(status, slot: int, value: int) -> None:
+    if status is not None:
+        status[slot] = value
 
-    print("[nllb-worker] Exiting.", flush=True)
+
+def pool(
+    req_q: "multiprocessing.Queue[tuple | None]",
+    resp_q: "multiprocessing.Queue[tuple]",
+    model_id: str,
+    lang_map: dict,
+    target_map: dict,
+    batch_size: int = 8,
+    num_beams: int = 4,
+    token_budget: int = NLLB_TOKEN_BUDGET,
+    segment_tokens: int = NLLB_SEGMENT_TOKENS,
+    runtime: str = NLLB_RUNTIME,
+    threads: int = NLLB_THREADS,
+    model_dir: str = NLLB_MODEL_DIR,
+    pool_size: int = NLLB_POOL_SIZE,
+    status=None,
+) -> None:
+    """
+    Run *pool_size* workers on the shared *req_q* (spawned as one process).
+
+    Every worker pulls its next batch from the same queue, so an idle worker
+    always takes the oldest waiting request — no per-worker routing.  For
+    CPU torch runtimes the model is loaded here once and the workers are
+    fork()ed afterwards: the weight tensors live in pages that nobody writes
+    to, so they stay shared copy-on-write.  ``threads`` (or cpu_count) is
+    split evenly between the workers.
+
+    With more than one worker this process only supervises: it never runs
+    inference (so re-forking stays safe) and respawns a worker that dies
+    abnormally (OOM kill, segfault).  A worker that exits cleanly got its
+    ``None`` sentinel — the caller sends one per worker — and from then on
+    nothing is respawned.
+
+    *status* is a shared integer array the parent reads for liveness:
+    ``[workers, pid_0, deaths_0, pid_1, deaths_1, …]`` (pid 0 = not running).
+    """
+    worker_args = (
+        req_q, resp_q, model_id, lang_map, target_map, batch_size, num_beams,
+        token_budget, segment_tokens, runtime,
+    )
+    if pool_size <= 1:
+        _status_set(status, 0, 1)
+        _status_set(status, 1, os.getpid())
+        worker(*worker_args, threads, model_dir)
+        return
+
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    _die_with_parent()
+    per_worker = max(1, (threads or os.cpu_count() or 1) // pool_size)
+    preloaded = None
+    try:
+        print(f"[nllb-pool] Loading {model_id} ({runtime}) once for {pool_size} workers …", flush=True)
+        rt = load_runtime(runtime, model_id, threads=per_worker, model_dir=model_dir)
+        if rt.fork_safe:
+            preloaded = rt
+        elif rt.device != "cpu":
+            print(f"[nllb-pool] {rt.device} cannot be forked — running a single worker", flush=True)
+            _status_set(status, 0, 1)
+            _status_set(status, 1, os.getpid())
+            worker(*worker_args, threads, model_dir, 0, rt)
+            return
+        else:
+            print(f"[nllb-pool] {rt.name} is not fork-safe — each worker loads its own copy", flush=True)
+            del rt
+    except Exception as e:
+        print(f"[nllb-pool] Load failed: {e}", flush=True)
+
+    if preloaded is not None:
+        import gc
+        gc.freeze()   # keep refcount / GC writes off the inherited object pages
+
+    def _spawn(wid: int) -> int:
+        pid = os.fork()
+        if pid == 0:
+            code = 0
+            try:
+                _die_with_parent()
+                worker(*worker_args, per_worker, model_dir, wid, preloaded)
+            except BaseException:
+                code = 1
+            finally:
+                os._exit(code)
+        _status_set(status, 1 + 2 * wid, pid)
+        return pid
+
+    _status_set(status, 0, pool_size)
+    children: dict[int, tuple[int, float]] = {}     # pid → (worker id, spawned at)
+    for wid in range(pool_size):
+        children[_spawn(wid)] = (wid, time.monotonic())
+    print(
+        f"[nllb-pool] {pool_size} workers × {per_worker} threads "
+        f"({'shared weights' if preloaded is not None else 'separate loads'})",
+        flush=True,
+    )
+
+    stopping = False
+    deadline = None
+    while children:
+        try:
+            if deadline is None:
+                pid, wstatus = os.waitpid(-1, 0)
+            else:
+                pid, wstatus = os.waitpid(-1, os.WNOHANG)
+                if pid == 0:
+                    if time.monotonic() > deadline:
+                        break
+                    time.sleep(0.1)
+                    continue
+        except ChildProcessError:
+            break
+        if pid not in children:
+            continue
+        wid, started = children.pop(pid)
+        _status_set(status, 1 + 2 * wid, 0)
+        clean = os.WIFEXITED(wstatus) and os.WEXITSTATUS(wstatus) == 0
+        if clean:
+            # Got its sentinel — shutting down; give the others time to drain theirs
+            stopping = True
+            deadline = deadline or time.monotonic() + 15
+            continue
+        if status is not None:
+            status[2 + 2 * wid] += 1
+        how = (f"signal {os.WTERMSIG(wstatus)}" if os.WIFSIGNALED(wstatus)
+               else f"exit code {os.WEXITSTATUS(wstatus)}")
+        if stopping:
+            print(f"[nllb-pool] Worker {wid} (pid {pid}) died during shutdown ({how})", flush=True)
+            continue
+        print(f"[nllb-pool] Worker {wid} (pid {pid}) died ({how}) — respawning", flush=True)
+        if time.monotonic() - started < 10:
+            time.sleep(5)        # crash loop (e.g. OOM on load) — do not spin
+        children[_spawn(wid)] = (wid, time.monotonic())
+
+    for pid in children:
+        try:
+            os.kill(pid, signal.SIGTERM)
+            os.waitpid(pid, 0)
+        except (ProcessLookupError, ChildProcessError):
+            pass
+    print("[nllb-pool] Exiting.", flush=True)
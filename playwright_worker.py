@@ -4,29 +4,107 @@
 Headless-browser fetcher worker — Playwright / Chromium.
 
 Used for JS-rendered pages and sites that block plain HTTP clients.
-Images and fonts are disabled via Chromium launch flags (no page.route()
-handlers) to avoid asyncio CancelledError cascades when navigation times out.
+Images are disabled via Chromium launch flags.  Other unwanted traffic —
+fonts, media, ad / tracker domains, third-party iframes — is blocked at the
+CDP network layer (``_NetFilter``: ``Network.setBlockedURLs`` plus a
+``Fetch`` interception limited to the blocked resource types).  There are
+no ``page.route()`` handlers, which used to cause asyncio CancelledError
+cascades when navigation timed out; every CDP reply is best-effort.
+
+Each worker process keeps **one long-lived Chromium** (async Playwright API)
+and drives up to ``PLAYWRIGHT_PAGES_PER_WORKER`` pages concurrently.  Pages
+live in recycled browser contexts (``PLAYWRIGHT_CONTEXT_REUSE`` fetches
+each); the browser itself is relaunched after
+``PLAYWRIGHT_MAX_PAGES_PER_BROWSER`` navigations or when its process tree
+grows past ``PLAYWRIGHT_MAX_BROWSER_MB``.
 
 Spawned by ``article_fetcher._PlaywrightFetcher._make_process()``.
 
 Protocol
 --------
-request:  ``(req_id: str, url: str, timeout: int)``
+request:  ``(req_id: str, url: str, timeout: int[, options: dict])``
         | ``None``   ← shutdown sentinel
 response: ``(req_id: str, result: dict)``
 
 result keys: html, success, error_code, error_type
+  + retry_after  raw ``Retry-After`` header on HTTP 429 / 503
+  + net  ``{blocked, blocked_by_type, bytes_loaded, bytes_saved_est}``
+  + fields, has_content, html_len  when ``options['extract']`` is set
+    (html is then None unless ``options['raw_html']`` — see article_extract)
 """
 
+import asyncio
 import multiprocessing
+import os
 import re as _re
 import signal
+import threading
 
 ERROR_PERMANENT = 'permanent'
 ERROR_TEMPORARY = 'temporary'
 
 _PERMANENT_HTTP_CODES = frozenset({401, 402, 403, 404, 406, 410, 451})
 
+# Concurrency / recycling — overridable after import (see wxAsyncNewsGather)
+PLAYWRIGHT_PROCESSES:             int = int(os.environ.get('PLAYWRIGHT_PROCESSES',             2))
+PLAYWRIGHT_PAGES_PER_WORKER:      int = int(os.environ.get('PLAYWRIGHT_PAGES_PER_WORKER',      4))
+PLAYWRIGHT_MAX_PAGES_PER_BROWSER: int = int(os.environ.get('PLAYWRIGHT_MAX_PAGES_PER_BROWSER', 300))
+PLAYWRIGHT_MAX_BROWSER_MB:        int = int(os.environ.get('PLAYWRIGHT_MAX_BROWSER_MB',        1500))
+PLAYWRIGHT_CONTEXT_REUSE:         int = int(os.environ.get('PLAYWRIGHT_CONTEXT_REUSE',         25))
+
+_USER_AGENT = (
+    'Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 '
+    '(KHTML, like Gecko) Chrome/124.0.0.0 Safari/537.36'
+)
+_LAUNCH_ARGS = [
+    '--blink-settings=imagesEnabled=false',
+    '--disable-images',
+    '--no-sandbox',
+    '--disable-dev-shm-usage',
+]
+# Memory is sampled every this many navigations (scanning /proc is not free)
+_MEM_CHECK_EVERY = 20
+
+# Resource filtering — resource types as Chromium's CDP names them
+# (image, media, font, stylesheet, script, xhr, fetch, websocket, …)
+PLAYWRIGHT_BLOCK_TYPES:    str  = os.environ.get('PLAYWRIGHT_BLOCK_TYPES', 'image,media,font,texttrack,manifest')
+PLAYWRIGHT_BLOCK_DOMAINS:  str  = os.environ.get('PLAYWRIGHT_BLOCK_DOMAINS', '')      # extra domains, comma-separated
+PLAYWRIGHT_BLOCK_FRAMES:   bool = os.environ.get('PLAYWRIGHT_BLOCK_FRAMES', 'true').lower() in ('1', 'true', 'yes')
+# JSON file of per-domain overrides, e.g.
+#   {"example.com": {"allow_types": ["font"], "block_domains": ["cdn.x.com"],
+#                    "third_party_frames": true},
+#    "spa-site.com": {"enabled": false}}
+PLAYWRIGHT_BLOCK_RULES_FILE: str = os.environ.get('PLAYWRIGHT_BLOCK_RULES_FILE', '')
+
+# Ad / tracker / social-widget hosts (suffix match)
+_DEFAULT_BLOCK_DOMAINS = (
+    'doubleclick.net', 'googlesyndication.com', 'googleadservices.com',
+    'google-analytics.com', 'googletagmanager.com', 'googletagservices.com',
+    'adservice.google.com', 'amazon-adsystem.com', 'adnxs.com', 'criteo.com',
+    'criteo.net', 'rubiconproject.com', 'pubmatic.com', 'casalemedia.com',
+    'openx.net', 'taboola.com', 'outbrain.com', 'teads.tv', 'moatads.com',
+    'scorecardresearch.com', 'quantserve.com', 'chartbeat.com', 'chartbeat.net',
+    'hotjar.com', 'newrelic.com', 'nr-data.net', 'facebook.net',
+    'platform.twitter.com', 'ads-twitter.com', 'mc.yandex.ru', 'yandex.ru/ads',
+    'cdn.onesignal.com', 'onesignal.com', 'pushwoosh.com', 'sharethrough.com',
+    'smartadserver.com', 'adform.net', 'bidswitch.net', 'media.net',
+)
+
+# Rough transfer size of one blocked request per type (HTTP Archive medians)
+# — blocked requests are never sent, so bytes saved can only be estimated.
+_EST_BYTES = {
+    'Image': 30_000, 'Media': 300_000, 'Font': 30_000, 'Stylesheet': 15_000,
+    'Script': 25_000, 'Document': 40_000, 'TextTrack': 5_000, 'Manifest': 2_000,
+    'XHR': 5_000, 'Fetch': 5_000,
+}
+
+_CDP_TYPES = {
+    t.lower(): t for t in (
+        'Document', 'Stylesheet', 'Image', 'Media', 'Font', 'Script', 'TextTrack',
+        'XHR', 'Fetch', 'Prefetch', 'EventSource', 'WebSocket', 'Manifest', 'Ping', 'Other',
+    )
+}
+
 
 def _classify(status: int) -> str:
     return ERROR_PERMANENT if status in _PERMANENT_HTTP_CODES else ERROR_TEMPORARY
@@ -40,71 +118,400 @@ def _count_paragraphs(html: str) -> int:
     )
 
 
-def _fetch(url: str, timeout_s: int, options: dict | None = None) -> dict:
-    """Fetch *url* using a fresh headless Chromium instance."""
+def _host(url: str) -> str:
+    m = _re.match(r'[a-z][a-z0-9+.-]*://([^/:?#]+)', url or '', _re.I)
+    return m.group(1).lower() if m else ''
+
+
+def _site(host: str) -> str:
+    """Registrable-domain approximation: last two labels, three for ``co.uk``-style."""
+    parts = host.split('.')
+    if len(parts) >= 3 and len(parts[-1]) == 2 and parts[-2] in ('co', 'com', 'org', 'net', 'gov', 'ac', 'edu'):
+        return '.'.join(parts[-3:])
+    return '.'.join(parts[-2:])
+
+
+def blocking_config() -> dict:
+    """Current filter settings, passed to spawned workers (module overrides included)."""
+    return {
+        'types':      PLAYWRIGHT_BLOCK_TYPES,
+        'domains':    PLAYWRIGHT_BLOCK_DOMAINS,
+        'frames':     PLAYWRIGHT_BLOCK_FRAMES,
+        'rules_file': PLAYWRIGHT_BLOCK_RULES_FILE,
+    }
+
+
+def _split(csv: str) -> list[str]:
+    return [x.strip() for x in (csv or '').split(',') if x.strip()]
+
+
+class _BlockRules:
+    """Resolved filter settings for one page's domain."""
+
+    __slots__ = ('enabled', 'types', 'domains', 'frames')
+
+    def __init__(self, enabled: bool, types: frozenset, domains: tuple, frames: bool) -> None:
+        self.enabled = enabled
+        self.types   = types      # CDP resource-type names
+        self.domains = domains
+        self.frames  = frames
+
+
+class _BlockPolicy:
+    """Global defaults plus per-domain overrides (suffix match on the page host)."""
+
+    def __init__(self, config: dict | None) -> None:
+        cfg = config or {}
+        self.types   = frozenset(
+            _CDP_TYPES[t.lower()] for t in _split(cfg.get('types', PLAYWRIGHT_BLOCK_TYPES))
+            if t.lower() in _CDP_TYPES and t.lower() != 'document'
+        )
+        self.domains = tuple(_DEFAULT_BLOCK_DOMAINS) + tuple(_split(cfg.get('domains', PLAYWRIGHT_BLOCK_DOMAINS)))
+        self.frames  = bool(cfg.get('frames', PLAYWRIGHT_BLOCK_FRAMES))
+        self.overrides: dict[str, dict] = {}
+        path = cfg.get('rules_file', PLAYWRIGHT_BLOCK_RULES_FILE)
+        if path:
+            try:
+                import json
+                with open(path, encoding='utf-8') as f:
+                    self.overrides = {k.lower(): v for k, v in json.load(f).items()}
+                print(f"[playwright-worker] {len(self.overrides)} per-domain block rules from {path}", flush=True)
+            except Exception as e:
+                print(f"[playwright-worker] Block rules not loaded ({path}): {e}", flush=True)
+
+    def for_url(self, url: str) -> _BlockRules:
+        host = _host(url)
+        rule: dict = {}
+        for dom, r in self.overrides.items():
+            if host == dom or host.endswith('.' + dom):
+                rule = r
+                break
+        if rule.get('enabled') is False:
+            return _BlockRules(False, frozenset(), (), False)
+        types = set(self.types)
+        types |= {_CDP_TYPES[t.lower()] for t in rule.get('block_types', []) if t.lower() in _CDP_TYPES}
+        types -= {_CDP_TYPES[t.lower()] for t in rule.get('allow_types', []) if t.lower() in _CDP_TYPES}
+        types.discard('Document')
+        allow   = set(rule.get('allow_domains', []))
+        domains = tuple(d for d in self.domains + tuple(rule.get('block_domains', [])) if d not in allow)
+        frames  = bool(rule.get('third_party_frames', self.frames))
+        return _BlockRules(True, frozenset(types), domains, frames)
+
+
+class _NetFilter:
+    """
+    CDP-level resource filter for one page.
+
+    Blocked domains go to ``Network.setBlockedURLs`` (handled inside
+    Chromium, no round-trip).  Blocked resource types — and sub-frame
+    documents when third-party frames are blocked — are intercepted with
+    ``Fetch.enable`` patterns, so only those requests pause; the main
+    document and all other traffic are never intercepted.  Every reply is
+    fire-and-forget: a page that timed out or closed just drops them.
+    """
+
+    def __init__(self, cdp, main_frame: str) -> None:
+        self._cdp        = cdp
+        self._main_frame = main_frame
+        self._rules: _BlockRules | None = None
+        self._site       = ''
+        self._blocked: dict[str, int] = {}
+        self._bytes      = 0
+        self._tasks: set = set()
+        cdp.on('Fetch.requestPaused',   self._on_paused)
+        cdp.on('Network.loadingFinished', self._on_finished)
+        cdp.on('Network.loadingFailed',   self._on_failed)
+
+    @classmethod
+    async def attach(cls, context, page) -> "_NetFilter | None":
+        try:
+            cdp   = await context.new_cdp_session(page)
+            tree  = await cdp.send('Page.getFrameTree')
+            await cdp.send('Network.enable')
+            return cls(cdp, tree['frameTree']['frame']['id'])
+        except Exception as e:
+            print(f"[playwright-worker] CDP filter unavailable: {str(e)[:120]}", flush=True)
+            return None
+
+    async def arm(self, url: str, policy: _BlockPolicy) -> None:
+        """Apply the rules for *url* and reset the per-fetch counters."""
+        rules = policy.for_url(url)
+        self._rules   = rules
+        self._site    = _site(_host(url))
+        self._blocked = {}
+        self._bytes   = 0
+        patterns = []
+        if rules.enabled:
+            patterns = [{'resourceType': t, 'requestStage': 'Request'} for t in sorted(rules.types)]
+            if rules.frames:
+                patterns.append({'resourceType': 'Document', 'requestStage': 'Request'})
+        try:
+            await self._cdp.send('Network.setBlockedURLs', {'urls': [
+                p for d in rules.domains for p in (f'*://{d}/*', f'*://*.{d}/*')
+            ]})
+            if patterns:
+                await self._cdp.send('Fetch.enable', {'patterns': patterns})
+            else:
+                await self._cdp.send('Fetch.disable')
+        except Exception as e:
+            print(f"[playwright-worker] CDP filter arm failed: {str(e)[:120]}", flush=True)
+
+    def report(self) -> dict:
+        n = sum(self._blocked.values())
+        return {
+            'blocked':         n,
+            'blocked_by_type': dict(self._blocked),
+            'bytes_loaded':    self._bytes,
+            'bytes_saved_est': sum(_EST_BYTES.get(t, 5_000) * c for t, c in self._blocked.items()),
+        }
+
+    # ── CDP events ────────────────────────────────────────────────────────────
+
+    def _count(self, rtype: str) -> None:
+        self._blocked[rtype] = self._blocked.get(rtype, 0) + 1
+
+    def _on_paused(self, ev: dict) -> None:
+        rtype = ev.get('resourceType', 'Other')
+        block = True
+        if rtype == 'Document':
+            # Only sub-frames reach here as documents worth judging
+            block = (
+                ev.get('frameId') != self._main_frame
+                and _site(_host(ev.get('request', {}).get('url', ''))) != self._site
+            )
+        if block:
+            self._count(rtype)
+            self._reply('Fetch.failRequest', {'requestId': ev['requestId'], 'errorReason': 'BlockedByClient'})
+        else:
+            self._reply('Fetch.continueRequest', {'requestId': ev['requestId']})
+
+    def _on_finished(self, ev: dict) -> None:
+        self._bytes += int(ev.get('encodedDataLength') or 0)
+
+    def _on_failed(self, ev: dict) -> None:
+        if ev.get('blockedReason') == 'inspector':     # Network.setBlockedURLs hit
+            self._count(ev.get('type', 'Other'))
+
+    def _reply(self, method: str, params: dict) -> None:
+        async def _send() -> None:
+            try:
+                await self._cdp.send(method, params)
+            except (Exception, asyncio.CancelledError):
+                pass     # page navigated away / closed — nothing to answer
+        task = asyncio.get_running_loop().create_task(_send())
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+
+def _tree_rss_mb(root_pid: int) -> float | None:
+    """RSS (MB) of every descendant of *root_pid* — the Playwright driver and
+    Chromium processes.  Linux /proc only; None elsewhere."""
+    try:
+        children: dict[int, list[int]] = {}
+        rss_pages: dict[int, int] = {}
+        for entry in os.listdir('/proc'):
+            if not entry.isdigit():
+                continue
+            try:
+                with open(f'/proc/{entry}/stat') as f:
+                    stat = f.read()
+                with open(f'/proc/{entry}/statm') as f:
+                    rss_pages[int(entry)] = int(f.read().split()[1])
+            except OSError:
+                continue
+            ppid = int(stat.rsplit(')', 1)[1].split()[1])
+            children.setdefault(ppid, []).append(int(entry))
+    except OSError:
+        return None
+    total, stack = 0, list(children.get(root_pid, []))
+    while stack:
+        pid = stack.pop()
+        total += rss_pages.get(pid, 0)
+        stack.extend(children.get(pid, []))
+    return total * os.sysconf('SC_PAGE_SIZE') / (1024 * 1024)
+
+
+class _Slot:
+    """A browser context with one page, reused for several fetches."""
+
+    __slots__ = ('context', 'page', 'nojs', 'uses', 'filter')
+
+    def __init__(self, context, page, nojs: bool, net_filter: "_NetFilter | None" = None) -> None:
+        self.context = context
+        self.page    = page
+        self.nojs    = nojs
+        self.uses    = 0
+        self.filter  = net_filter
+
+    async def close(self) -> None:
+        try:
+            await self.context.close()
+        except Exception:
+            pass
+
+
+class _Browser:
+    """
+    One long-lived Chromium with a pool of recycled contexts.
+
+    ``acquire()`` hands out an idle slot (or opens a new context); slots go
+    back to the pool after a clean fetch and are closed after an error or
+    ``context_reuse`` fetches.  When the browser is due for a restart
+    (page count or memory), new acquires wait, in-flight fetches finish,
+    and the last ``release()`` closes the browser; the next ``acquire()``
+    relaunches it.
+    """
+
+    def __init__(self, pw, *, max_pages: int, max_mb: int, context_reuse: int) -> None:
+        self._pw            = pw
+        self._max_pages     = max_pages
+        self._max_mb        = max_mb
+        self._context_reuse = max(1, context_reuse)
+        self._browser       = None
+        self._idle: list[_Slot] = []
+        self._cond      = asyncio.Condition()
+        self._in_use    = 0
+        self._served    = 0
+        self._draining  = False
+        self.launches   = 0
+
+    async def _launch(self) -> None:
+        self._browser = await self._pw.chromium.launch(headless=True, args=_LAUNCH_ARGS)
+        self._served  = 0
+        self.launches += 1
+        print(f"[playwright-worker] Browser launched (#{self.launches})", flush=True)
+
+    async def _close_browser(self) -> None:
+        idle, self._idle = self._idle, []
+        for slot in idle:
+            await slot.close()
+        if self._browser is not None:
+            try:
+                await self._browser.close()
+            except Exception:
+                pass
+        self._browser = None
+
+    def _restart_due(self) -> str | None:
+        if self._max_pages and self._served >= self._max_pages:
+            return f"{self._served} pages"
+        if self._max_mb and self._served % _MEM_CHECK_EVERY == 0:
+            mb = _tree_rss_mb(os.getpid())
+            if mb is not None and mb > self._max_mb:
+                return f"{mb:.0f} MB"
+        return None
+
+    async def acquire(self, nojs: bool) -> _Slot:
+        async with self._cond:
+            while self._draining:
+                await self._cond.wait()
+            if self._browser is None or not self._browser.is_connected():
+                if self._browser is not None:
+                    print("[playwright-worker] Browser disconnected — relaunching", flush=True)
+                    self._idle.clear()
+                await self._launch()
+            self._in_use += 1
+            browser = self._browser
+        for i, slot in enumerate(self._idle):
+            if slot.nojs == nojs:
+                return self._idle.pop(i)
+        try:
+            context = await browser.new_context(
+                user_agent=_USER_AGENT,
+                locale='pt-BR',
+                java_script_enabled=not nojs,
+                extra_http_headers={'Referer': 'https://www.google.com/'},
+            )
+            page = await context.new_page()
+            return _Slot(context, page, nojs, await _NetFilter.attach(context, page))
+        except BaseException:
+            await self._done()
+            raise
+
+    async def release(self, slot: _Slot, healthy: bool) -> None:
+        slot.uses += 1
+        if healthy and not self._draining and slot.uses < self._context_reuse:
+            try:
+                # Stop the previous page's timers / sockets before parking it
+                await slot.page.goto('about:blank', timeout=5000)
+                self._idle.append(slot)
+            except Exception:
+                await slot.close()
+        else:
+            await slot.close()
+        await self._done()
+
+    async def _done(self) -> None:
+        async with self._cond:
+            self._in_use -= 1
+            self._served += 1
+            if not self._draining:
+                reason = self._restart_due()
+                if reason:
+                    print(f"[playwright-worker] Recycling browser ({reason})", flush=True)
+                    self._draining = True
+            if self._draining and self._in_use == 0:
+                await self._close_browser()
+                self._draining = False
+                self._cond.notify_all()
+
+    async def close(self) -> None:
+        async with self._cond:
+            await self._close_browser()
+
+
+async def _fetch(
+    browser: _Browser,
+    policy: _BlockPolicy,
+    url: str,
+    timeout_s: int,
+    options: dict | None = None,
+) -> dict:
+    """Fetch *url* in a pooled page of the worker's persistent Chromium."""
     out = {'html': None, 'success': False, 'error_code': None, 'error_type': None}
     opts = options or {}
     nojs = opts.get('nojs', False)
+    slot    = None
+    healthy = False
     try:
-        from playwright.sync_api import sync_playwright
-
-        with sync_playwright() as pw:
-            browser = pw.chromium.launch(
-                headless=True,
-                args=[
-                    '--blink-settings=imagesEnabled=false',
-                    '--disable-images',
-                    '--no-sandbox',
-                ],
-            )
-            try:
-                context = browser.new_context(
-                    user_agent=(
-                        'Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 '
-                        '(KHTML, like Gecko) Chrome/124.0.0.0 Safari/537.36'
-                    ),
-                    locale='pt-BR',
-                    java_script_enabled=not nojs,
-                    extra_http_headers={'Referer': 'https://www.google.com/'},
-                )
-                page = context.new_page()
-                response = page.goto(
-                    url,
-                    wait_until='domcontentloaded',
-                    timeout=timeout_s * 1000,
-                )
-                status = response.status if response else None
-                if status and status >= 400:
-                    out['error_code'] = status
-                    out['error_type'] = _classify(status)
-                    print(f"[playwright-worker] HTTP {status} {url[:80]}", flush=True)
-                else:
-                    if nojs:
-                        # No JS → SSR content is final, capture immediately
-                        out['html']    = page.content()
-                        out['success'] = True
-                        print(f"[playwright-worker] OK (nojs) {url[:80]}", flush=True)
-                    else:
-                        # Capture fast (SSR content, before paywall JS fires)
-                        html_fast = page.content()
-                        # Capture slow (after JS executes — needed for SPA/lazy content)
-                        page.wait_for_timeout(1500)
-                        html_slow = page.content()
-                        # Use whichever version has more substantive paragraphs.
-                        # If paywall JS fires and hides content, html_fast wins.
-                        # If content is lazy-loaded, html_slow wins.
-                        fast_p = _count_paragraphs(html_fast)
-                        slow_p = _count_paragraphs(html_slow)
-                        out['html']    = html_fast if fast_p > slow_p else html_slow
-                        out['success'] = True
-                        print(f"[playwright-worker] OK (fast={fast_p}/slow={slow_p}) {url[:80]}", flush=True)
-            finally:
-                browser.close()
+        slot = await browser.acquire(nojs)
+        page = slot.page
+        if slot.filter is not None:
+            await slot.filter.arm(url, policy)
+        response = await page.goto(
+            url,
+            wait_until='domcontentloaded',
+            timeout=timeout_s * 1000,
+        )
+        status = response.status if response else None
+        if status and status >= 400:
+            out['error_code'] = status
+            out['error_type'] = _classify(status)
+            if status in (429, 503):
+                out['retry_after'] = response.headers.get('retry-after')
+            print(f"[playwright-worker] HTTP {status} {url[:80]}", flush=True)
+        else:
+            if nojs:
+                # No JS → SSR content is final, capture immediately
+                out['html']    = await page.content()
+                out['success'] = True
+                print(f"[playwright-worker] OK (nojs) {url[:80]}", flush=True)
+            else:
+                # Capture fast (SSR content, before paywall JS fires)
+                html_fast = await page.content()
+                # Capture slow (after JS executes — needed for SPA/lazy content)
+                await page.wait_for_timeout(1500)
+                html_slow = await page.content()
+                # Use whichever version has more substantive paragraphs.
+                # If paywall JS fires and hides content, html_fast wins.
+                # If content is lazy-loaded, html_slow wins.
+                fast_p = _count_paragraphs(html_fast)
+                slow_p = _count_paragraphs(html_slow)
+                out['html']    = html_fast if fast_p > slow_p else html_slow
+                out['success'] = True
+                print(f"[playwright-worker] OK (fast={fast_p}/slow={slow_p}) {url[:80]}", flush=True)
+        healthy = True
 
-    except ImportError as e:
-        out['error_code'] = 'UNAVAILABLE'
-        out['error_type'] = ERROR_TEMPORARY
-        print(f"[playwright-worker] playwright not installed: {e}", flush=True)
     except Exception as e:
         name = type(e).__name__
         msg  = str(e)
@@ -118,19 +525,101 @@ def _fetch(url: str, timeout_s: int, options: dict | None = None) -> dict:
             out['error_code'] = 'BROWSER_ERROR'
             out['error_type'] = ERROR_TEMPORARY
         print(f"[playwright-worker] {name} ({out['error_code']}) {url[:80]}: {msg[:120]}", flush=True)
+    finally:
+        if slot is not None and slot.filter is not None:
+            out['net'] = net = slot.filter.report()
+            if net['blocked']:
+                print(
+                    f"[playwright-worker] blocked {net['blocked']} "
+                    f"(~{net['bytes_saved_est'] // 1024} KB saved, {net['bytes_loaded'] // 1024} KB loaded) "
+                    f"{url[:80]}",
+                    flush=True,
+                )
+        if slot is not None:
+            # A timed-out / failed page may still be navigating — discard its context
+            await browser.release(slot, healthy)
 
     return out
 
 
+async def _serve(
+    req_q: "multiprocessing.Queue",
+    resp_q: "multiprocessing.Queue",
+    pages: int,
+    max_pages: int,
+    max_mb: int,
+    context_reuse: int,
+    blocking: dict | None,
+) -> None:
+    """Run up to *pages* fetches concurrently against one persistent browser."""
+    from playwright.async_api import async_playwright
+
+    loop  = asyncio.get_running_loop()
+    inbox: asyncio.Queue = asyncio.Queue()
+    # The reader only takes a request off the shared queue when a page slot
+    # is free, so idle sibling processes get the rest.
+    free  = threading.Semaphore(pages)
+
+    def _reader() -> None:
+        while True:
+            free.acquire()
+            try:
+                item = req_q.get()
+            except (EOFError, OSError):
+                item = None
+            loop.call_soon_threadsafe(inbox.put_nowait, item)
+            if item is None:
+                return
+
+    async def _handle(item: tuple) -> None:
+        req_id, url, timeout_s = item[0], item[1], item[2]
+        options = item[3] if len(item) > 3 else {}
+        try:
+            result = await _fetch(browser, policy, url, timeout_s, options)
+            if options.get('extract'):
+                # Parse here so only the extracted fields cross the queue
+                from article_extract import apply_worker_options
+                result = await asyncio.to_thread(apply_worker_options, result, url, options)
+        except Exception as e:
+            print(f"[playwright-worker] {type(e).__name__} handling {url[:80]}: {str(e)[:120]}", flush=True)
+            result = {'html': None, 'success': False,
+                      'error_code': 'BROWSER_ERROR', 'error_type': ERROR_TEMPORARY}
+        try:
+            resp_q.put((req_id, result))
+        finally:
+            free.release()
+
+    async with async_playwright() as pw:
+        browser = _Browser(pw, max_pages=max_pages, max_mb=max_mb, context_reuse=context_reuse)
+        policy  = _BlockPolicy(blocking)
+        threading.Thread(target=_reader, daemon=True, name='playwright-reader').start()
+        print(f"[playwright-worker] Ready ({pages} concurrent pages)", flush=True)
+        tasks: set[asyncio.Task] = set()
+        while True:
+            item = await inbox.get()
+            if item is None:
+                break
+            task = asyncio.create_task(_handle(item))
+            tasks.add(task)
+            task.add_done_callback(tasks.discard)
+        if tasks:
+            await asyncio.gather(*tasks, return_exceptions=True)
+        await browser.close()
+
+
 def worker(
     req_q: "multiprocessing.Queue",
     resp_q: "multiprocessing.Queue",
+    pages: int = PLAYWRIGHT_PAGES_PER_WORKER,
+    max_pages: int = PLAYWRIGHT_MAX_PAGES_PER_BROWSER,
+    max_mb: int = PLAYWRIGHT_MAX_BROWSER_MB,
+    context_reuse: int = PLAYWRIGHT_CONTEXT_REUSE,
+    blocking: dict | None = None,
 ) -> None:
     signal.signal(signal.SIGINT, signal.SIG_IGN)
 
     try:
-        from playwright.sync_api import sync_playwright  # noqa: F401
-        print("[playwright-worker] Ready", flush=True)
+        from playwright.async_api import async_playwright  # noqa: F401
     except ImportError as e:
         print(f"[playwright-worker] playwright not installed: {e}", flush=True)
         while True:
@@ -147,14 +636,5 @@ def worker(
             }))
         return
 
-    while True:
-        try:
-            item = req_q.get()
-        except (EOFError, OSError):
-            break
-        if item is None:
-            break
-        req_id, url, timeout_s = item[0], item[1], item[2]
-        options = item[3] if len(item) > 3 else {}
-        result = _fetch(url, timeout_s, options)
-        resp_q.put((req_id, result))
+    asyncio.run(_serve(req_q, resp_q, max(1, pages), max_pages, max_mb, context_reuse, blocking))
+    print("[playwright-worker] Exiting.", flush=True)
@@ -6,17 +6,32 @@ HTTP fetcher worker — plain ``requests`` library.
 Spawned by ``article_fetcher._RequestsFetcher._make_process()``.
 Kept intentionally thin: all heavy imports happen inside ``worker()``.
 
+One ``requests.Session`` per process holds a keep-alive pool per host
+(HTTP/1.1 — HTTP/2 comes from the cffi tier) shared by
+``REQUESTS_INFLIGHT_PER_WORKER`` fetch threads.  The session's cookie jar
+refuses all cookies, so articles do not share state; cookies set during a
+redirect chain still apply to that chain (requests keeps them per request).
+Host addresses resolved by the parent's shared DNS cache arrive as
+``options['dns']`` and are pinned (``dns_cache.pinned_hosts``), so most
+fetches skip the blocking libc lookup.
+
 Protocol
 --------
-request:  ``(req_id: str, url: str, timeout: int)``
+request:  ``(req_id: str, url: str, timeout: int[, options: dict])``
         | ``None``   ← shutdown sentinel
 response: ``(req_id: str, result: dict)``
 
 result keys: html, success, error_code, error_type
+  + retry_after  raw ``Retry-After`` header on HTTP 429 / 503
+  + fields, has_content, html_len  when ``options['extract']`` is set
+    (html is then None unless ``options['raw_html']`` — see article_extract)
 """
 
 import multiprocessing
+import os
 import signal
+import threading
+from concurrent.futures import ThreadPoolExecutor
 
 # Error-type constants (mirrored from article_fetcher to keep this module standalone)
 ERROR_PERMANENT = 'permanent'
@@ -24,6 +39,9 @@ ERROR_TEMPORARY = 'temporary'
 
 _PERMANENT_HTTP_CODES = frozenset({401, 402, 403, 404, 406, 410, 451})
 
+# Concurrent requests per worker process — overridable after import
+REQUESTS_INFLIGHT_PER_WORKER: int = int(os.environ.get('REQUESTS_INFLIGHT_PER_WORKER', 10))
+
 
 def _classify(status: int) -> str:
     return ERROR_PERMANENT if status in _PERMANENT_HTTP_CODES else ERROR_TEMPORARY
@@ -82,11 +100,23 @@ def _headers_for(url: str) -> dict:
     return _DEFAULT_HEADERS.copy()
 
 
-def _fetch(url: str, timeout: int) -> dict:
+def _make_session(inflight: int):
+    """Session with a per-host keep-alive pool sized for *inflight* threads."""
+    import requests
+    from http.cookiejar import DefaultCookiePolicy
+    from requests.adapters import HTTPAdapter
+    session = requests.Session()
+    session.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+    adapter = HTTPAdapter(pool_connections=256, pool_maxsize=inflight, pool_block=False)
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    return session
+
+
+def _fetch(session, url: str, timeout: int) -> dict:
     out = {'html': None, 'success': False, 'error_code': None, 'error_type': None}
     try:
-        import requests
-        resp = requests.get(url, headers=_headers_for(url), timeout=timeout)
+        resp = session.get(url, headers=_headers_for(url), timeout=timeout)
         resp.raise_for_status()
         out['html']    = _decode(resp)
         out['success'] = True
@@ -98,6 +128,8 @@ def _fetch(url: str, timeout: int) -> dict:
             code = getattr(resp, 'status_code', None)
             out['error_code'] = code
             out['error_type'] = _classify(code) if isinstance(code, int) else ERROR_TEMPORARY
+            if code in (429, 503):
+                out['retry_after'] = resp.headers.get('Retry-After')
         elif isinstance(e, _req.Timeout):
             out['error_code'] = 'TIMEOUT'
             out['error_type'] = ERROR_TEMPORARY
@@ -117,17 +149,45 @@ def _fetch(url: str, timeout: int) -> dict:
 def worker(
     req_q: "multiprocessing.Queue",
     resp_q: "multiprocessing.Queue",
+    inflight: int = REQUESTS_INFLIGHT_PER_WORKER,
 ) -> None:
     signal.signal(signal.SIGINT, signal.SIG_IGN)
-    print("[requests-worker] Ready", flush=True)
-
-    while True:
-        try:
-            item = req_q.get()
-        except (EOFError, OSError):
-            break
-        if item is None:
-            break
+    inflight = max(1, inflight)
+    session  = _make_session(inflight)
+    from dns_cache import pinned_hosts
+    pinned_hosts.install()
+    # Only take a request off the shared queue when a thread is free, so
+    # idle sibling processes get the rest.
+    free     = threading.Semaphore(inflight)
+    print(f"[requests-worker] Ready ({inflight} in flight, pooled session)", flush=True)
+
+    def _handle(item: tuple) -> None:
         req_id, url, timeout = item[0], item[1], item[2]
-        result = _fetch(url, timeout)
-        resp_q.put((req_id, result))
+        options = item[3] if len(item) > 3 else {}
+        try:
+            pinned_hosts.pin(options.get('dns'))
+            result = _fetch(session, url, timeout)
+            if options.get('extract'):
+                # Parse here so only the extracted fields cross the queue
+                from article_extract import apply_worker_options
+                result = apply_worker_options(result, url, options)
+        except Exception as e:
+            print(f"[requests-worker] {type(e).__name__} handling {url[:80]}: {str(e)[:120]}", flush=True)
+            result = {'html': None, 'success': False,
+                      'error_code': 'ERROR', 'error_type': ERROR_TEMPORARY}
+        try:
+            resp_q.put((req_id, result))
+        finally:
+            free.release()
+
+    with ThreadPoolExecutor(max_workers=inflight, thread_name_prefix='requests-fetch') as pool:
+        while True:
+            free.acquire()
+            try:
+                item = req_q.get()
+            except (EOFError, OSError):
+                break
+            if item is None:
+                break
+            pool.submit(_handle, item)
+    session.close()
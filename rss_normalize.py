@@ -0,0 +1,446 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+rss_normalize.py — CPU-bound normalisation of RSS entries (Stage 2).
+
+Moved out of wxAsyncNewsGather.py so that the Stage-2 preparer can run in a
+``ProcessPoolExecutor`` (via ``exec_worker.ExecWorkerPool``): a spawned
+child only imports this light module, never the collector itself with its
+config, logging handlers and DB engine.
+
+Process-boundary contract
+-------------------------
+feedparser entries are reduced to plain dicts with ``entry_to_dict()`` in
+the parent; ``prepare_entries_timed()`` takes those dicts plus plain
+scalars and returns plain dicts, so everything pickles cheaply.
+"""
+
+import logging
+import re
+import time
+from datetime import datetime, timezone, timedelta
+from typing import Any, Optional
+
+import pytz
+from dateutil import parser as dateutil_parser
+
+from html_utils import (
+    extract_and_remove_first_image,
+    fix_encoding_if_needed,
+    sanitize_html_content,
+)
+
+# Language detection
+try:
+    from langdetect import detect, detect_langs, LangDetectException  # type: ignore
+    LANGDETECT_AVAILABLE = True
+except ImportError:
+    LANGDETECT_AVAILABLE = False
+    detect = None  # type: ignore
+    detect_langs = None  # type: ignore
+    LangDetectException = Exception  # type: ignore
+    logging.warning("⚠️  langdetect not available - language detection disabled. Install with: pip install langdetect")
+
+# Languages that are unlikely to appear in news feeds but that langdetect
+# commonly produces as false positives for short English/Latin-script text.
+_LANGDETECT_LOW_PRIOR_LANGS = frozenset({
+    'cy',   # Welsh — frequent false positive for English headlines
+    'mt',   # Maltese
+    'la',   # Latin
+    'af',   # Afrikaans (often confused with English/Dutch)
+    'so',   # Somali false-positive on some English patterns
+})
+# Minimum probability required to trust a low-prior language detection.
+# Below this threshold the runner-up language (if any) is used instead.
+_LOW_PRIOR_MIN_PROB = 0.90
+
+
+# ---------------------------------------------------------------------------
+# Field normalisation helpers
+# ---------------------------------------------------------------------------
+
+def as_text(value: Any) -> str:
+    """Return a safe string for loosely-typed feed/API fields with encoding fix."""
+    if value is None:
+        return ""
+    if isinstance(value, str):
+        # Fix encoding issues before returning
+        return fix_encoding_if_needed(value)
+    if isinstance(value, list):
+        return " ".join(as_text(item) for item in value if item is not None)
+    result = str(value)
+    return fix_encoding_if_needed(result)
+
+
+def detect_article_language(
+    title: Optional[str],
+    description: Optional[str] = None,
+    content: Optional[str] = None,
+) -> tuple[Optional[str], float]:
+    """
+    Detect language of article using langdetect
+    
+    Args:
+        title: Article title
+        description: Article description (optional)
+        content: Article content (optional)
+    
+    Returns:
+        tuple: (language_code, confidence) or (None, 0.0) if detection fails
+    """
+    if not LANGDETECT_AVAILABLE:
+        return None, 0.0
+    
+    # Assertion for type checker - at this point, detect and LangDetectException are available
+    assert detect is not None, "detect should be available when LANGDETECT_AVAILABLE is True"
+    assert detect_langs is not None, "detect_langs should be available when LANGDETECT_AVAILABLE is True"
+
+    # Build detection text (prefer longer text for better accuracy)
+    detection_text = ""
+
+    if content and len(content.strip()) > 100:
+        detection_text = content[:500]  # Use first 500 chars of content
+    elif description and len(description.strip()) > 50:
+        detection_text = description[:300]  # Use description
+    elif title:
+        detection_text = title  # Fallback to title
+    else:
+        return None, 0.0
+
+    # Clean HTML tags if present
+    detection_text = re.sub(r'<[^>]+>', '', detection_text).strip()
+
+    if len(detection_text) < 10:
+        return None, 0.0
+
+    try:
+        probs = detect_langs(detection_text)  # list of Language(lang, prob), sorted desc
+        if not probs:
+            return None, 0.0
+        top = probs[0]
+        lang_code, confidence = top.lang, top.prob
+
+        # langdetect frequently mis-classifies short English/Latin-script news
+        # headlines as Welsh (cy) and a few other rare languages.  If the top
+        # result is one of those low-prior languages and its probability is
+        # below the threshold, fall back to the next candidate (if any) so we
+        # don't waste translation resources on a phantom Welsh article.
+        if lang_code in _LANGDETECT_LOW_PRIOR_LANGS and confidence < _LOW_PRIOR_MIN_PROB:
+            if len(probs) > 1:
+                lang_code, confidence = probs[1].lang, probs[1].prob
+            else:
+                return None, 0.0
+
+        return lang_code, round(confidence, 4)
+    except (LangDetectException, Exception):
+        # Detection failed (text too short, unknown language, etc.)
+        return None, 0.0
+
+
+def normalize_timestamp_to_utc(
+    timestamp_str: str,
+    source_timezone: Optional[str] = None,
+    use_source_timezone: bool = False,
+) -> tuple[Optional[str], Optional[str]]:
+    """
+    Normalize a timestamp string to UTC (GMT+0).
+    
+    SMART TIMEZONE CORRECTION LOGIC:
+    1. Parse article timestamp with its timezone (if present)
+    2. If use_source_timezone=True and source_timezone is provided:
+       a. Convert timestamp to UTC using article's timezone (or UTC if none)
+       b. Compare with current UTC time
+       c. If timestamp is >30 minutes in the future → Apply source_timezone correction
+       d. Otherwise → Use article's timezone (it's correct)
+    3. If article has no timezone → Use source_timezone (if available)
+    4. Return None if no timezone info available
+    
+    This prevents overcorrection of sources that sometimes report correct timezones,
+    while still fixing sources that consistently lie about their timezone.
+    
+    Args:
+        timestamp_str: Timestamp string with timezone info (ISO, RFC 2822, etc.)
+        source_timezone: Optional timezone offset string (e.g., 'UTC+05:30')
+        use_source_timezone: If True, apply source_timezone only when timestamp is in future
+    
+    Returns:
+        Tuple: (utc_timestamp_str, detected_timezone_str)
+        - utc_timestamp_str: ISO format UTC timestamp, or None if no timezone available
+        - detected_timezone_str: Detected timezone offset (e.g., 'UTC+05:30') or None
+    """
+    if not timestamp_str or timestamp_str.strip() == '':
+        return datetime.now(timezone.utc).replace(microsecond=0).isoformat(), None
+    
+    # Mapping of common timezone abbreviations to UTC offsets (in seconds)
+    # This prevents UnknownTimezoneWarning from dateutil
+    tzinfos = {
+        'EDT': -4 * 3600,    # Eastern Daylight Time (UTC-4)
+        'EST': -5 * 3600,    # Eastern Standard Time (UTC-5)
+        'CDT': -5 * 3600,    # Central Daylight Time (UTC-5)
+        'CST': -6 * 3600,    # Central Standard Time (UTC-6)
+        'MDT': -6 * 3600,    # Mountain Daylight Time (UTC-6)
+        'MST': -7 * 3600,    # Mountain Standard Time (UTC-7)
+        'PDT': -7 * 3600,    # Pacific Daylight Time (UTC-7)
+        'PST': -8 * 3600,    # Pacific Standard Time (UTC-8)
+        'AKDT': -8 * 3600,   # Alaska Daylight Time (UTC-8)
+        'AKST': -9 * 3600,   # Alaska Standard Time (UTC-9)
+        'HST': -10 * 3600,   # Hawaii Standard Time (UTC-10)
+        'BST': 1 * 3600,     # British Summer Time (UTC+1)
+        'CEST': 2 * 3600,    # Central European Summer Time (UTC+2)
+        'CET': 1 * 3600,     # Central European Time (UTC+1)
+        'EEST': 3 * 3600,    # Eastern European Summer Time (UTC+3)
+        'EET': 2 * 3600,     # Eastern European Time (UTC+2)
+        'IST': 5.5 * 3600,   # Indian Standard Time (UTC+5:30)
+        'JST': 9 * 3600,     # Japan Standard Time (UTC+9)
+        'KST': 9 * 3600,     # Korea Standard Time (UTC+9)
+        'AEST': 10 * 3600,   # Australian Eastern Standard Time (UTC+10)
+        'AEDT': 11 * 3600,   # Australian Eastern Daylight Time (UTC+11)
+        'AWST': 8 * 3600,    # Australian Western Standard Time (UTC+8)
+        'NZST': 12 * 3600,   # New Zealand Standard Time (UTC+12)
+        'NZDT': 13 * 3600,   # New Zealand Daylight Time (UTC+13)
+    }
+    
+    # Pre-process: Fix truncated timezone offsets (3 digits instead of 4)
+    # Some RSS feeds send +000, +010, +053 instead of +0000, +0100, +0530
+    # Example: "Sun, 01 Mar 2026 22:44:21 +000" → "Sun, 01 Mar 2026 22:44:21 +0000"
+    import re
+    truncated_tz_pattern = r'([+-])(\d)(\d)(\d)(?!\d)'  # Match +NNN or -NNN (3 digits, not followed by another digit)
+    match = re.search(truncated_tz_pattern, timestamp_str)
+    if match:
+        # Expand truncated timezone: +010 → +0100, +053 → +0530
+        sign = match.group(1)
+        digit1 = match.group(2)
+        digit2 = match.group(3)
+        digit3 = match.group(4)
+        
+        # Reconstruct as HHMM format
+        expanded_tz = f"{sign}{digit1}{digit2}{digit3}0"
+        timestamp_str = timestamp_str[:match.start()] + expanded_tz + timestamp_str[match.end():]
+
+    # Pre-process: Replace IANA timezone names (e.g. "Europe/Dublin") with their
+    # UTC offset so dateutil can parse them.  Some RSS feeds (e.g. breakingnews.ie)
+    # embed the full zone name instead of a numeric offset.
+    iana_tz_pattern = re.compile(r'([A-Za-z]+/[A-Za-z_]+)')
+    iana_match = iana_tz_pattern.search(timestamp_str)
+    if iana_match:
+        try:
+            tz_obj = pytz.timezone(iana_match.group(1))
+            # Use the current UTC offset for this zone (accounts for DST)
+            now_offset = datetime.now(tz_obj).utcoffset()
+            total_secs = int(now_offset.total_seconds())
+            h, rem = divmod(abs(total_secs), 3600)
+            m = rem // 60
+            offset_str = f"{'+' if total_secs >= 0 else '-'}{h:02d}{m:02d}"
+            timestamp_str = timestamp_str[:iana_match.start()] + offset_str + timestamp_str[iana_match.end():]
+        except Exception:
+            # Unknown IANA zone — strip it so dateutil at least parses the date
+            timestamp_str = timestamp_str[:iana_match.start()].rstrip()
+
+    try:
+        # Parse the timestamp with dateutil (handles most formats and extracts timezone)
+        parsed_dt = dateutil_parser.parse(timestamp_str, tzinfos=tzinfos)
+        detected_tz = None
+        
+        # SMART TIMEZONE CORRECTION LOGIC (changed behavior)
+        # If use_source_timezone=True, we have a confirmed source timezone,
+        # but we should only apply it if the article timestamp is in the future.
+        # This prevents overcorrection of sources that sometimes report correct timezones.
+        if use_source_timezone and source_timezone:
+            from dateutil.tz import tzoffset
+            import re
+            
+            # First, try to convert with article's timezone (if present)
+            test_dt = parsed_dt
+            if parsed_dt.tzinfo is None:
+                # No timezone in article - try UTC first
+                test_dt = parsed_dt.replace(tzinfo=timezone.utc)
+            
+            # Convert to UTC for comparison
+            test_utc = test_dt.astimezone(timezone.utc)
+            now_utc = datetime.now(timezone.utc)
+            
+            # Check if timestamp is in the future (more than 30 minutes ahead)
+            time_diff_minutes = (test_utc - now_utc).total_seconds() / 60
+            
+            if time_diff_minutes > 30:
+                # Timestamp is in the future - article timezone is WRONG
+                # The feed incorrectly added source timezone offset to the timestamp
+                # We need to UNDO that addition by subtracting the offset
+                tz_match = re.search(r'([+-])?(\d{2}):(\d{2})', source_timezone)
+                if tz_match:
+                    # Parse source timezone offset
+                    # CRITICAL: For UTC-03:00, we want to SUBTRACT 3h (so sign should be +1)
+                    # For UTC+05:00, we want to ADD 5h (so sign should be -1, subtract negative = add)
+                    sign = 1 if tz_match.group(1) == '-' else -1  # INVERTED on purpose!
+                    hours = int(tz_match.group(2))
+                    minutes = int(tz_match.group(3))
+                    total_seconds = sign * (hours * 3600 + minutes * 60)
+                    
+                    # Log correction for debugging
+                    logging.debug(f"TIMEZONE-CORRECTION: Article timestamp is {time_diff_minutes:.1f}min in future, subtracting {total_seconds/3600:.1f}h to correct")
+                    
+                    # CRITICAL FIX: Subtract the offset from timestamp
+                    # Example: Feed reports "04:43:09 +0000" but it's Argentina (UTC-03:00)
+                    # The feed ADDED 3h incorrectly, so we SUBTRACT 3h: 04:43 - 3h = 01:43 UTC ✓
+                    # Strip any existing timezone and treat as naive
+                    parsed_dt = parsed_dt.replace(tzinfo=None)
+                    
+                    # Subtract the source timezone offset
+                    corrected_dt = parsed_dt - timedelta(seconds=total_seconds)
+                    
+                    # Now mark as UTC
+                    utc_dt = corrected_dt.replace(tzinfo=timezone.utc)
+                    detected_tz = source_timezone
+                    
+                    return utc_dt.replace(microsecond=0).isoformat(), detected_tz
+            
+            # If we reach here: timestamp is NOT in the future
+            # Continue with normal processing (use article timezone)
+        
+        # PRIORITY 1: Check if article timestamp has timezone info
+        if parsed_dt.tzinfo is not None:
+            # Article has timezone - USE IT (only if use_source_timezone is False)
+            # Extract detected timezone as UTC offset string
+            offset = parsed_dt.utcoffset()
+            if offset is not None:  # Changed from 'if offset:' to handle UTC+00:00 correctly
+                total_seconds = int(offset.total_seconds())
+                hours, remainder = divmod(abs(total_seconds), 3600)
+                minutes = remainder // 60
+                sign = '+' if total_seconds >= 0 else '-'
+                detected_tz = f"UTC{sign}{hours:02d}:{minutes:02d}"
+        else:
+            # No timezone in article timestamp
+            # PRIORITY 2: Check if timestamp text claims to be GMT/UTC
+            if 'GMT' in timestamp_str.upper() or 'UTC' in timestamp_str.upper():
+                # Timestamp claims to be GMT/UTC, treat as such
+                parsed_dt = parsed_dt.replace(tzinfo=timezone.utc)
+                detected_tz = 'UTC+00:00'
+            # PRIORITY 3: Use source timezone if permitted
+            elif use_source_timezone and source_timezone:
+                # Source timezone can be used (confirmed source)
+                from dateutil.tz import tzoffset
+                import re
+                
+                # Parse timezone offset from string like 'UTC+05:30'
+                tz_match = re.search(r'([+-])?(\d{2}):(\d{2})', source_timezone)
+                if tz_match:
+                    sign = -1 if tz_match.group(1) == '-' else 1
+                    hours = int(tz_match.group(2))
+                    minutes = int(tz_match.group(3))
+                    total_seconds = sign * (hours * 3600 + minutes * 60)
+                    tz_offset = tzoffset('', total_seconds)
+                    parsed_dt = parsed_dt.replace(tzinfo=tz_offset)
+                    detected_tz = source_timezone
+                else:
+                    # Invalid source timezone format
+                    return None, None
+            else:
+                # PRIORITY 4: No timezone available - CANNOT CONVERT
+                return None, None
+        
+        # Convert to UTC
+        utc_dt = parsed_dt.astimezone(timezone.utc)
+        
+        # Return ISO format without microseconds for consistency, plus detected timezone
+        return utc_dt.replace(microsecond=0).isoformat(), detected_tz
+        
+    except Exception as e:
+        # If parsing fails, return current UTC time
+        logging.debug(f"Failed to parse timestamp '{timestamp_str}': {e}")
+        return datetime.now(timezone.utc).replace(microsecond=0).isoformat(), None
+
+
+# ---------------------------------------------------------------------------
+# Stage-2 entry preparation (runs in a worker process)
+# ---------------------------------------------------------------------------
+
+# feedparser keys read by prepare_entries(); everything else stays behind.
+_ENTRY_KEYS = ('title', 'link', 'summary', 'description', 'author', 'published', 'updated')
+
+
+def entry_to_dict(entry) -> dict:
+    """
+    Reduce a feedparser entry to a plain, cheaply picklable dict holding only
+    the fields Stage 2 reads.  Values are kept raw — ``as_text`` and the
+    encoding fix run in the worker.
+    """
+    out = {k: entry.get(k) for k in _ENTRY_KEYS if entry.get(k) is not None}
+    src = entry.get('source') or {}
+    if src:
+        out['source'] = {'href': src.get('href', ''), 'title': src.get('title', '')}
+    return out
+
+
+def prepare_entries(
+    entries: list[dict],
+    src_tz: Optional[str],
+    use_source_tz: bool,
+    src_lang: str,
+) -> list[dict]:
+    """
+    Normalise feed entries: title/url validation, timestamp → UTC, HTML
+    sanitising, first-image extraction and language detection.
+
+    Entries without a title or link are skipped.
+    """
+    prepared = []
+    for entry in entries:
+        # Title is mandatory — skip entry immediately if absent
+        title = ' '.join(as_text(entry.get('title', '')).split())
+        if not title:
+            continue
+        url = as_text(entry.get('link', ''))
+        if not url:
+            continue
+        description = as_text(entry.get('summary', entry.get('description', '')))
+        author      = as_text(entry.get('author', ''))
+        published   = as_text(entry.get('published', entry.get('updated', '')))
+        published_gmt, detected_tz = normalize_timestamp_to_utc(
+            published, src_tz, use_source_timezone=use_source_tz
+        )
+        clean_description = sanitize_html_content(description) if description else ''
+        extracted_image_url, clean_description = (
+            extract_and_remove_first_image(clean_description)
+            if clean_description else (None, clean_description)
+        )
+        if src_lang:
+            detected_lang, lang_confidence = src_lang, 1.0
+        else:
+            detected_lang, lang_confidence = detect_article_language(
+                title, clean_description
+            )
+        # entry.source has the real publisher URL/name for aggregator
+        # feeds like Google News (entry.link is always a proxy URL)
+        _src = entry.get('source', {})
+        source_href  = as_text(_src.get('href', ''))
+        source_title = as_text(_src.get('title', ''))
+        prepared.append({
+            'title':             title,
+            'url':               url,
+            'author':            author,
+            'published':         published,
+            'published_gmt':     published_gmt,
+            'detected_tz':       detected_tz,
+            'clean_description': clean_description,
+            'image_url':         extracted_image_url or '',
+            'detected_lang':     detected_lang,
+            'lang_confidence':   lang_confidence,
+            'source_href':       source_href,
+            'source_title':      source_title,
+        })
+    return prepared
+
+
+def prepare_entries_timed(
+    entries: list[dict],
+    src_tz: Optional[str],
+    use_source_tz: bool,
+    src_lang: str,
+) -> tuple[list[dict], float]:
+    """
+    ``prepare_entries`` plus the CPU seconds it consumed in the calling
+    process/thread — the executor entry point used by Stage 2.
+    """
+    t0 = time.thread_time()
+    prepared = prepare_entries(entries, src_tz, use_source_tz, src_lang)
+    return prepared, time.thread_time() - t0
@@ -0,0 +1,244 @@
+"""
+rss_stream.py — Incremental RSS / Atom parsing over a byte stream (Stage 1).
+
+``feedparser.parse`` needs the whole body in memory and builds every entry
+before Stage 2 sees any of them.  For large feeds that are mostly unchanged
+between polls, ``StreamingFeedParser`` is fed the response chunk by chunk
+(``aiohttp`` ``iter_chunked``, each chunk on an executor thread), turns each finished ``<item>`` / ``<entry>``
+into a feedparser-shaped dict and frees its element straight away.
+
+Early stop
+----------
+Feeds list entries newest first.  With an ``is_known(title)`` predicate
+(title hashes already seen for this source), parsing stops after
+``stop_after`` *consecutive* known entries; ``done`` turns true and the
+caller stops reading the body.  A single known entry is not enough — some
+feeds float updated or pinned items to the top.
+
+Output shape
+------------
+``StreamedFeed`` mimics the two attributes Stage 2 reads from a
+feedparser result: ``entries`` (dicts with ``title``, ``link``,
+``summary``, ``author``, ``published``, ``updated``, ``source``) and
+``feed`` (``{'language': …}``).  Titles come out as feedparser gives them
+— one level of XML entity decoding, escaped markup left as text, raw child
+elements serialised back to markup — so ``title_hash`` values match rows
+written by the feedparser path.  (feedparser also drops unsafe elements
+such as ``<script>`` from raw markup; that case is not reproduced.)
+
+lxml's pull parser (``recover=True``) is used when available; the stdlib
+``XMLPullParser`` otherwise.  lxml recovers what it can from broken XML;
+with the stdlib parser a syntax error raises ``ValueError`` (a body that
+merely ends early keeps the entries read so far) — the caller falls back to
+feedparser, which copes with far worse input.
+"""
+
+from __future__ import annotations
+
+import html
+from typing import Callable, Optional
+
+try:
+    from lxml import etree as _etree
+    _HAS_LXML = True
+except ImportError:
+    import xml.etree.ElementTree as _etree      # type: ignore[no-redef]
+    _HAS_LXML = False
+
+_ENTRY_TAGS = frozenset({'item', 'entry'})
+_VOID_TAGS  = frozenset({'br', 'hr', 'img', 'wbr'})      # serialised as <br />
+
+# local tag name → feedparser entry key (first one found wins)
+_TEXT_FIELDS = {
+    'title':       'title',
+    'description': 'summary',
+    'summary':     'summary',
+    'encoded':     'content',        # content:encoded
+    'content':     'content',        # Atom <content>
+    'pubDate':     'published',
+    'published':   'published',
+    'issued':      'published',
+    'updated':     'updated',
+    'modified':    'updated',
+    'date':        'updated',        # dc:date
+    'creator':     'author',         # dc:creator
+    'author':      'author',
+}
+
+
+def _local(tag) -> str:
+    if not isinstance(tag, str):
+        return ''                    # lxml comments / processing instructions
+    return tag.rsplit('}', 1)[-1]
+
+
+def _text(elem) -> str:
+    return ''.join(elem.itertext()).strip()
+
+
+def _markup(elem) -> str:
+    """Inner XML of *elem*: text escaped, child elements re-serialised."""
+    parts = [html.escape(elem.text or '', quote=False)]
+    for child in elem:
+        name = _local(child.tag)
+        if name:
+            attrs = ''.join(
+                f' {_local(k)}="{html.escape(v)}"' for k, v in child.attrib.items()
+            )
+            if name in _VOID_TAGS:
+                parts.append(f'<{name}{attrs} />')
+            else:
+                parts.append(f'<{name}{attrs}>{_markup(child)}</{name}>')
+        parts.append(html.escape(child.tail or '', quote=False))
+    return ''.join(parts)
+
+
+def _title(elem) -> str:
+    """Title text as feedparser returns it, whitespace-collapsed as in Stage 2."""
+    if len(elem):
+        if elem.get('type') == 'xhtml' and len(elem) == 1:
+            elem = elem[0]                  # Atom xhtml: drop the <div> wrapper
+        value = _markup(elem)
+    else:
+        value = elem.text or ''
+    return ' '.join(value.split())
+
+
+class StreamedFeed:
+    """The subset of a feedparser result that Stage 2 reads."""
+
+    __slots__ = ('entries', 'feed', 'truncated', 'bytes_read')
+
+    def __init__(self) -> None:
+        self.entries: list[dict] = []
+        self.feed: dict = {}
+        self.truncated  = False          # stopped early on known entries
+        self.bytes_read = 0
+
+
+class StreamingFeedParser:
+    """Push bytes with ``feed()``; finished entries land in ``result.entries``."""
+
+    def __init__(
+        self,
+        is_known: Optional[Callable[[str], bool]] = None,
+        stop_after: int = 5,
+    ) -> None:
+        if _HAS_LXML:
+            self._parser = _etree.XMLPullParser(
+                events=('start', 'end'), recover=True, resolve_entities=False,
+            )
+        else:
+            self._parser = _etree.XMLPullParser(events=('start', 'end'))
+        self._is_known   = is_known
+        self._stop_after = max(1, stop_after)
+        self._streak     = 0
+        self._depth      = 0             # > 0 while inside an entry
+        self.result      = StreamedFeed()
+        self.done        = False
+
+    # ── input ─────────────────────────────────────────────────────────────────
+
+    def feed(self, chunk: bytes) -> None:
+        if self.done:
+            return
+        self.result.bytes_read += len(chunk)
+        try:
+            self._parser.feed(chunk)
+        except _etree.ParseError as e:
+            raise ValueError(f"feed XML error: {e}") from e
+        self._drain()
+
+    def close(self) -> StreamedFeed:
+        if not self.done:
+            try:
+                self._parser.close()
+            except _etree.ParseError as e:
+                if not self.result.entries:
+                    raise ValueError(f"feed XML error: {e}") from e
+            self._drain()
+        return self.result
+
+    # ── events ────────────────────────────────────────────────────────────────
+
+    def _drain(self) -> None:
+        for event, elem in self._parser.read_events():
+            name = _local(elem.tag)
+            if event == 'start':
+                if name in _ENTRY_TAGS:
+                    self._depth += 1
+                continue
+            if name in _ENTRY_TAGS and self._depth:
+                self._depth -= 1
+                if self._depth == 0:
+                    self._entry_done(elem)
+                    if self.done:
+                        return
+            elif not self._depth:
+                if name == 'language' and 'language' not in self.result.feed:
+                    self.result.feed['language'] = _text(elem)
+                elif name in ('feed', 'rss', 'RDF'):
+                    lang = elem.get('{http://www.w3.org/XML/1998/namespace}lang')
+                    if lang and 'language' not in self.result.feed:
+                        self.result.feed['language'] = lang
+
+    def _entry_done(self, elem) -> None:
+        entry = self._to_entry(elem)
+        # Free the element (and, with lxml, its already-processed siblings)
+        elem.clear()
+        if _HAS_LXML:
+            parent = elem.getparent()
+            while parent is not None and elem.getprevious() is not None:
+                del parent[0]
+        if not entry.get('title'):
+            return
+        self.result.entries.append(entry)
+        if self._is_known is not None and self._is_known(entry['title']):
+            self._streak += 1
+            if self._streak >= self._stop_after:
+                self.result.truncated = True
+                self.done = True
+        else:
+            self._streak = 0
+
+    @staticmethod
+    def _to_entry(elem) -> dict:
+        entry: dict = {}
+        for child in elem:
+            name = _local(child.tag)
+            if name == 'link':
+                href = child.get('href')
+                if href is not None:                    # Atom
+                    if child.get('rel', 'alternate') == 'alternate' and 'link' not in entry:
+                        entry['link'] = href.strip()
+                elif 'link' not in entry:
+                    entry['link'] = _text(child)
+                continue
+            if name == 'guid' and 'link' not in entry and child.get('isPermaLink') != 'false':
+                guid = _text(child)
+                if guid.startswith(('http://', 'https://')):
+                    entry['_guid_link'] = guid
+                continue
+            if name == 'source':
+                entry['source'] = {
+                    'href': child.get('url') or child.get('href') or '',
+                    'title': _text(child),
+                }
+                continue
+            if name == 'author' and len(child):        # Atom <author><name>
+                for sub in child:
+                    if _local(sub.tag) == 'name':
+                        entry.setdefault('author', _text(sub))
+                continue
+            key = _TEXT_FIELDS.get(name)
+            if key == 'title':
+                entry.setdefault('title', _title(child))
+            elif key and key not in entry:
+                entry[key] = _text(child)
+        guid_link = entry.pop('_guid_link', None)
+        if 'link' not in entry and guid_link:
+            entry['link'] = guid_link
+        if 'summary' not in entry and 'content' in entry:
+            entry['summary'] = entry['content']
+        entry.pop('content', None)
+        return entry
@@ -0,0 +1,192 @@
+#!/usr/bin/env python3
+"""
+Benchmark the NLLB inference runtimes on a fixed sample corpus.
+
+For every runtime given on the command line this script:
+1. Loads the model through nllb_worker.load_runtime() (same code as the worker)
+2. Runs one warm-up batch, then translates the corpus with the worker's
+   length-bucketed token-budget batching
+3. Reports load time, wall time, source / output tokens per second and
+   chrF against the reference translations
+
+Usage:
+    python scripts/bench_nllb.py --runtimes torch,torch-int8 --threads 8
+    python scripts/bench_nllb.py --runtimes ctranslate2 --model-dir /models/nllb-ct2-int8
+    python scripts/bench_nllb.py --corpus my_corpus.tsv --json results.json
+
+A custom corpus is a TSV file: ``src_code<TAB>source text<TAB>reference``
+(reference may be empty; chrF is then computed against the first runtime).
+"""
+
+import sys
+import os
+import argparse
+import json
+import time
+from collections import Counter
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import nllb_worker
+
+
+# (src_code, source, English reference) — short headlines and longer ledes
+SAMPLE_CORPUS = [
+    ("es", "El banco central mantuvo los tipos de interés sin cambios por tercera reunión consecutiva.",
+     "The central bank kept interest rates unchanged for the third consecutive meeting."),
+    ("es", "Miles de personas salieron a las calles de Madrid para protestar contra el aumento del precio de la vivienda. Los organizadores pidieron al gobierno que limite los alquileres.",
+     "Thousands of people took to the streets of Madrid to protest against rising housing prices. The organisers asked the government to cap rents."),
+    ("fr", "Le gouvernement a présenté un projet de loi pour réduire les émissions de carbone.",
+     "The government presented a bill to reduce carbon emissions."),
+    ("fr", "Les agriculteurs ont bloqué plusieurs autoroutes ce matin. Ils dénoncent la baisse de leurs revenus et la concurrence des importations.",
+     "Farmers blocked several motorways this morning. They denounce the fall in their income and competition from imports."),
+    ("de", "Die Inflation in Deutschland ist im März überraschend gesunken.",
+     "Inflation in Germany fell unexpectedly in March."),
+    ("de", "Der Bundestag hat nach einer langen Debatte das neue Heizungsgesetz verabschiedet. Die Opposition kündigte an, vor das Verfassungsgericht zu ziehen.",
+     "After a long debate, the Bundestag passed the new heating law. The opposition announced that it would go to the Constitutional Court."),
+    ("it", "Il presidente ha parlato della crisi economica durante la conferenza stampa.",
+     "The president spoke about the economic crisis during the press conference."),
+    ("ru", "Президент подписал указ о повышении пенсий с первого января.",
+     "The president signed a decree raising pensions from January 1."),
+    ("zh", "中国央行宣布下调存款准备金率，以支持经济增长。",
+     "China's central bank announced a cut in the reserve requirement ratio to support economic growth."),
+    ("ja", "東京株式市場で日経平均株価が史上最高値を更新した。",
+     "The Nikkei stock average hit a record high on the Tokyo stock market."),
+    ("ar", "أعلنت وزارة الصحة عن حملة تطعيم جديدة تستهدف الأطفال في المدارس.",
+     "The Ministry of Health announced a new vaccination campaign targeting children in schools."),
+    ("tr", "Merkez Bankası politika faizini yüzde 50'de sabit tuttu.",
+     "The Central Bank kept its policy rate unchanged at 50 percent."),
+]
+
+
+def chrf(hypothesis: str, reference: str, max_n: int = 6, beta: float = 2.0) -> float:
+    """Character n-gram F-score (chrF, Popović 2015) in 0..100."""
+    hyp = hypothesis.replace(" ", "")
+    ref = reference.replace(" ", "")
+    precisions, recalls = [], []
+    for n in range(1, max_n + 1):
+        h = Counter(hyp[i:i + n] for i in range(len(hyp) - n + 1))
+        r = Counter(ref[i:i + n] for i in range(len(ref) - n + 1))
+        if not h or not r:
+            continue
+        match = sum((h & r).values())
+        precisions.append(match / sum(h.values()))
+        recalls.append(match / sum(r.values()))
+    if not precisions:
+        return 0.0
+    p = sum(precisions) / len(precisions)
+    r = sum(recalls) / len(recalls)
+    if p + r == 0:
+        return 0.0
+    return 100 * (1 + beta ** 2) * p * r / (beta ** 2 * p + r)
+
+
+def load_corpus(path: str | None) -> list[tuple[str, str, str]]:
+    if not path:
+        return SAMPLE_CORPUS
+    rows = []
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            parts = line.rstrip("\n").split("\t")
+            if len(parts) >= 2 and parts[1].strip():
+                rows.append((parts[0], parts[1], parts[2] if len(parts) > 2 else ""))
+    return rows
+
+
+def run_one(runtime: str, corpus, args) -> dict:
+    """Load *runtime*, translate *corpus*, return timings and outputs."""
+    t0 = time.perf_counter()
+    rt = nllb_worker.load_runtime(
+        runtime, args.model_id, threads=args.threads, model_dir=args.model_dir,
+    )
+    load_s = time.perf_counter() - t0
+    tok = rt.tokenizer
+    tgt_nllb = nllb_worker.NLLB_TARGET_MAP.get(args.tgt) or nllb_worker.NLLB_LANG_MAP[args.tgt]
+
+    # warm-up (first call pays one-off allocation / graph costs)
+    rt.generate([corpus[0][1]], nllb_worker.NLLB_LANG_MAP[corpus[0][0]], tgt_nllb, 64, args.beams)
+
+    outputs = [""] * len(corpus)
+    src_tokens = out_tokens = 0
+    t0 = time.perf_counter()
+    by_lang: dict[str, list[int]] = {}
+    for i, (src, _, _) in enumerate(corpus):
+        by_lang.setdefault(src, []).append(i)
+    for src, idxs in by_lang.items():
+        src_nllb = nllb_worker.NLLB_LANG_MAP[src]
+        tok.src_lang = src_nllb
+        lens = [len(tok(corpus[i][1])["input_ids"]) for i in idxs]
+        src_tokens += sum(lens)
+        for batch in nllb_worker.plan_batches(lens, args.token_budget):
+            longest = max(lens[b] for b in batch)
+            texts = [corpus[idxs[b]][1] for b in batch]
+            decoded = rt.generate(texts, src_nllb, tgt_nllb, min(512, 2 * longest + 16), args.beams)
+            for b, out in zip(batch, decoded):
+                outputs[idxs[b]] = out.strip()
+                out_tokens += len(tok(out, add_special_tokens=False)["input_ids"])
+    wall_s = time.perf_counter() - t0
+    return {
+        "runtime":        runtime,
+        "device":         rt.device,
+        "load_s":         round(load_s, 2),
+        "wall_s":         round(wall_s, 3),
+        "src_tok_per_s":  round(src_tokens / wall_s, 1) if wall_s else 0.0,
+        "out_tok_per_s":  round(out_tokens / wall_s, 1) if wall_s else 0.0,
+        "outputs":        outputs,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark NLLB inference runtimes")
+    parser.add_argument("--runtimes", default="torch,torch-int8",
+                        help=f"Comma-separated subset of {','.join(nllb_worker.RUNTIMES)}")
+    parser.add_argument("--model-id", default=nllb_worker.NLLB_MODEL_ID)
+    parser.add_argument("--model-dir", default=nllb_worker.NLLB_MODEL_DIR,
+                        help="Converted model dir (ctranslate2 / onnx)")
+    parser.add_argument("--threads", type=int, default=nllb_worker.NLLB_THREADS)
+    parser.add_argument("--beams", type=int, default=nllb_worker.NLLB_NUM_BEAMS)
+    parser.add_argument("--token-budget", type=int, default=nllb_worker.NLLB_TOKEN_BUDGET)
+    parser.add_argument("--tgt", default="en", help="Target language code")
+    parser.add_argument("--corpus", help="TSV corpus (src_code, text, reference)")
+    parser.add_argument("--json", help="Write full results (incl. outputs) to this file")
+    args = parser.parse_args()
+
+    corpus = load_corpus(args.corpus)
+    results = []
+    for runtime in [r.strip() for r in args.runtimes.split(",") if r.strip()]:
+        print(f"⏳ {runtime} …", flush=True)
+        try:
+            results.append(run_one(runtime, corpus, args))
+        except Exception as e:
+            print(f"❌ {runtime}: {e}")
+
+    if not results:
+        return 1
+
+    # Quality: chrF vs references, or vs the first runtime when none given
+    baseline = results[0]["outputs"]
+    for res in results:
+        scores = [
+            chrf(out, ref or base)
+            for out, (_, _, ref), base in zip(res["outputs"], corpus, baseline)
+        ]
+        res["chrf"] = round(sum(scores) / len(scores), 1)
+
+    print()
+    print(f"{'runtime':<13} {'device':<7} {'load s':>7} {'wall s':>8} "
+          f"{'src tok/s':>10} {'out tok/s':>10} {'chrF':>6}")
+    print("-" * 66)
+    for res in results:
+        print(f"{res['runtime']:<13} {res['device']:<7} {res['load_s']:>7} {res['wall_s']:>8} "
+              f"{res['src_tok_per_s']:>10} {res['out_tok_per_s']:>10} {res['chrf']:>6}")
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(results, f, ensure_ascii=False, indent=2)
+        print(f"\n✅ Results written to {args.json}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,391 @@
+#!/usr/bin/env python3
+"""
+Move article bodies (content / translated_content) out of gm_articles into
+gm_article_bodies, and benchmark the hot gm_articles queries before / after.
+
+Bodies are most of gm_articles' bytes, so every scan that never shows them
+(queue stats, the enrichment queue, API pages, the reader's source load)
+still drags them through the page cache.  After the move gm_articles rows
+are small and bodies are read only for the rows actually returned.
+
+Steps (stop wxAsyncNewsGather first — the script writes directly):
+1. Creates gm_article_bodies (in --bodies-db when given, ATTACHed as
+   ``bodies``) and drops the FTS / body triggers; the service recreates
+   them on its next start
+2. Copies bodies in rowid batches, then clears the inline columns; progress
+   is checkpointed in gm_migrations, so an interrupted run resumes
+3. Optionally VACUUMs to give the freed pages back
+4. Rebuilds gm_articles_fts from the split layout
+
+Then set ARTICLE_BODY_STORE=table (and ARTICLE_BODIES_DB when used) in .env
+so writers keep new bodies out of gm_articles.  ``--restore`` moves the
+bodies back inline (set ARTICLE_BODY_STORE=inline before restarting).
+
+Usage:
+    python scripts/split_article_bodies.py --bench-only              # measure only
+    cp predator_news.db /tmp/copy.db
+    python scripts/split_article_bodies.py --db /tmp/copy.db --bench --vacuum
+    python scripts/split_article_bodies.py --bodies-db article_bodies.db --vacuum
+    python scripts/split_article_bodies.py --restore
+"""
+
+import sys
+import os
+import argparse
+import json
+import sqlite3
+import statistics
+import time
+
+from decouple import config
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import body_codec
+from news_db import (
+    _BODY_COLUMNS, _FTS_TRIGGERS, _SEARCH_COLUMNS, FTS_REBUILD_BATCH,
+    _fts_decode_rows, _fts_values,
+)
+
+MIGRATION = "split_article_bodies"
+
+
+def get_db_path():
+    """Database path from DB_PATH (relative paths are relative to the repo root)"""
+    db_path = str(config('DB_PATH', default='predator_news.db'))
+    if not os.path.isabs(db_path):
+        repo_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        db_path = os.path.join(repo_dir, db_path)
+    return db_path
+
+
+def open_db(db_path, bodies_path):
+    """(connection, body codec) — the codec carries the service's zstd dictionaries."""
+    conn = sqlite3.connect(db_path, timeout=60.0)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.execute("PRAGMA busy_timeout=60000")
+    if bodies_path:
+        conn.execute("ATTACH DATABASE ? AS bodies", (bodies_path,))
+        conn.execute("PRAGMA bodies.journal_mode=WAL")
+    # zstd-compressed bodies (BODY_CODEC=zstd) are decoded with the service's dictionaries;
+    # gm_body_text() is only used by --restore to write them back as plain text
+    codec = body_codec.BodyCodec()
+    schema = "bodies" if bodies_path else "main"
+    if conn.execute(
+        f"SELECT 1 FROM {schema}.sqlite_master WHERE type='table' AND name='gm_body_dicts'"
+    ).fetchone():
+        codec.load_dicts(conn.execute(
+            f"SELECT dict_id, data FROM {schema}.gm_body_dicts ORDER BY created_ms"
+        ).fetchall())
+    conn.create_function("gm_body_text", 1, codec.decode, deterministic=True)
+    return conn, codec
+
+
+def file_size(path):
+    return sum(os.path.getsize(p) for p in (path, path + "-wal") if os.path.exists(p))
+
+
+# ── benchmark ─────────────────────────────────────────────────────────────────
+
+def hot_queries(conn):
+    """(name, sql, params) of the gm_articles queries the service and reader run most."""
+    now = int(time.time())
+    row = conn.execute(
+        "SELECT title_hash FROM gm_articles WHERE title_hash IS NOT NULL "
+        "ORDER BY rowid DESC LIMIT 1"
+    ).fetchone()
+    title_hash = row[0] if row else ""
+    row = conn.execute(
+        "SELECT id_source FROM gm_articles GROUP BY id_source ORDER BY COUNT(*) DESC LIMIT 1"
+    ).fetchone()
+    source_id = row[0] if row else ""
+    row = conn.execute("SELECT MAX(inserted_at_ms) FROM gm_articles").fetchone()
+    since_ms = (row[0] or 0) - 24 * 3600 * 1000
+    return [
+        ("queue_stats",
+         "SELECT is_enriched, is_translated, COUNT(*) FROM gm_articles "
+         "GROUP BY is_enriched, is_translated", ()),
+        ("pending_enrichment",
+         """SELECT a.id_article, a.id_source, a.url, a.author, a.description,
+                   a.urlToImage, a.enrich_try, s.name
+            FROM gm_articles a LEFT JOIN gm_sources s ON s.id_source = a.id_source
+            WHERE a.is_enriched = 0 AND a.enrich_try = 0
+              AND a.url IS NOT NULL AND a.url != ''
+              AND (s.fetch_blocked IS NULL OR s.fetch_blocked != 1)
+            ORDER BY a.published_at_epoch DESC LIMIT 50""", ()),
+        ("title_hash_lookup",
+         "SELECT author, description, urlToImage FROM gm_articles "
+         "WHERE title_hash = ? AND is_enriched = 1 LIMIT 1", (title_hash,)),
+        ("api_page_24h",
+         """SELECT id_article, id_source, author, title, description, url,
+                   urlToImage, publishedAt, published_at_gmt, inserted_at_ms,
+                   translated_title, translated_description, is_translated
+            FROM gm_articles
+            WHERE inserted_at_ms > ?
+              AND (published_at_epoch IS NULL OR published_at_epoch <= ?)
+            ORDER BY inserted_at_ms DESC LIMIT 500""", (since_ms, now)),
+        ("reader_source_load",
+         """SELECT * FROM gm_articles
+            WHERE id_source = ?
+              AND (published_at_epoch IS NULL OR published_at_epoch <= ?)
+            ORDER BY published_at_epoch DESC LIMIT 50""", (source_id, now)),
+        ("table_scan",
+         "SELECT COUNT(*) FROM gm_articles WHERE author IS NULL", ()),
+    ]
+
+
+def bench(conn, db_path, bodies_path, label, repeat):
+    """Time each hot query *repeat* times; first run reported separately (colder cache)."""
+    page_size  = conn.execute("PRAGMA page_size").fetchone()[0]
+    page_count = conn.execute("PRAGMA page_count").fetchone()[0]
+    result = {
+        "label": label,
+        "articles": conn.execute("SELECT COUNT(*) FROM gm_articles").fetchone()[0],
+        "main_db_mb": round(file_size(db_path) / 1e6, 1),
+        "main_pages": page_count,
+        "page_size": page_size,
+        "queries": {},
+    }
+    if bodies_path:
+        result["bodies_db_mb"] = round(file_size(bodies_path) / 1e6, 1)
+    for name, sql, params in hot_queries(conn):
+        times = []
+        for _ in range(repeat):
+            t0 = time.perf_counter()
+            rows = conn.execute(sql, params).fetchall()
+            times.append((time.perf_counter() - t0) * 1000)
+        result["queries"][name] = {
+            "first_ms":  round(times[0], 2),
+            "median_ms": round(statistics.median(times[1:] or times), 2),
+            "rows":      len(rows),
+        }
+    print(f"\n📊 {label}: {result['articles']:,} articles, "
+          f"main DB {result['main_db_mb']} MB ({page_count:,} pages)"
+          + (f", bodies DB {result['bodies_db_mb']} MB" if bodies_path else ""))
+    for name, q in result["queries"].items():
+        print(f"   {name:<20} first {q['first_ms']:>9.2f} ms   "
+              f"median {q['median_ms']:>9.2f} ms   rows {q['rows']}")
+    return result
+
+
+def print_comparison(before, after):
+    print("\n📈 before → after (median ms)")
+    for name, b in before["queries"].items():
+        a = after["queries"].get(name)
+        if not a:
+            continue
+        speedup = b["median_ms"] / a["median_ms"] if a["median_ms"] else float("inf")
+        print(f"   {name:<20} {b['median_ms']:>9.2f} → {a['median_ms']:>9.2f}   ×{speedup:.1f}")
+    print(f"   {'main DB (MB)':<20} {before['main_db_mb']:>9} → {after['main_db_mb']:>9}")
+
+
+# ── migration ─────────────────────────────────────────────────────────────────
+
+def prepare(conn, bodies_tbl):
+    if bodies_tbl.startswith("bodies.") and conn.execute(
+        "SELECT 1 FROM main.sqlite_master WHERE type='table' AND name='gm_article_bodies'"
+    ).fetchone():
+        # The service's triggers name the table unqualified — a main copy would shadow it
+        if conn.execute("SELECT 1 FROM main.gm_article_bodies LIMIT 1").fetchone():
+            sys.exit("❌ Bodies are in the main DB — run with --restore (without --bodies-db) first")
+        conn.execute("DROP TABLE main.gm_article_bodies")
+    conn.execute(
+        f"""
+        CREATE TABLE IF NOT EXISTS {bodies_tbl} (
+            id_article         TEXT PRIMARY KEY,
+            content            TEXT,
+            translated_content TEXT
+        )
+        """
+    )
+    conn.execute(
+        """
+        CREATE TABLE IF NOT EXISTS gm_migrations (
+            name     TEXT PRIMARY KEY,
+            position TEXT,
+            done     INTEGER NOT NULL DEFAULT 0
+        )
+        """
+    )
+    # Per-row FTS maintenance would dominate the run; the index is rebuilt
+    # once at the end and the service recreates its triggers on start.
+    for name in (*_FTS_TRIGGERS, "trg_articles_body_delete"):
+        conn.execute(f"DROP TRIGGER IF EXISTS main.{name}")
+    conn.commit()
+
+
+def move_bodies(conn, bodies_tbl, batch, restore):
+    """Walk gm_articles by rowid (descending) moving bodies; resumable via gm_migrations."""
+    name = MIGRATION + ("_restore" if restore else "")
+    conn.execute("INSERT OR IGNORE INTO gm_migrations (name) VALUES (?)", (name,))
+    # A new run in either direction invalidates the other direction's checkpoint
+    conn.execute(
+        "DELETE FROM gm_migrations WHERE name = ?",
+        (MIGRATION if restore else MIGRATION + "_restore",),
+    )
+    conn.commit()
+    position, done = conn.execute(
+        "SELECT position, done FROM gm_migrations WHERE name = ?", (name,)
+    ).fetchone()
+    if done:
+        conn.execute("UPDATE gm_migrations SET position = NULL, done = 0 WHERE name = ?", (name,))
+        position = None
+    upper = int(position) if position is not None else (
+        conn.execute("SELECT COALESCE(MAX(rowid), 0) + 1 FROM gm_articles").fetchone()[0]
+    )
+    cols = ", ".join(_BODY_COLUMNS)
+    moved = 0
+    t0 = time.time()
+    while upper > 1:
+        lower = max(1, upper - batch)
+        if not restore:
+            cur = conn.execute(
+                f"""
+                INSERT INTO {bodies_tbl} (id_article, {cols})
+                SELECT id_article, NULLIF(content, ''), NULLIF(translated_content, '')
+                FROM gm_articles
+                WHERE rowid >= ? AND rowid < ?
+                  AND (content != '' OR translated_content != '')
+                ON CONFLICT(id_article) DO UPDATE SET
+                    content            = COALESCE(excluded.content, content),
+                    translated_content = COALESCE(excluded.translated_content, translated_content)
+                """,
+                (lower, upper),
+            )
+            moved += cur.rowcount
+            conn.execute(
+                """
+                UPDATE gm_articles SET content = NULL, translated_content = NULL
+                WHERE rowid >= ? AND rowid < ?
+                  AND (content IS NOT NULL OR translated_content IS NOT NULL)
+                """,
+                (lower, upper),
+            )
+        else:
+            cur = conn.execute(
+                f"""
+                UPDATE gm_articles SET
+                    content = COALESCE(
+                        (SELECT gm_body_text(b.content) FROM {bodies_tbl} b
+                         WHERE b.id_article = gm_articles.id_article), content),
+                    translated_content = COALESCE(
+                        (SELECT gm_body_text(b.translated_content) FROM {bodies_tbl} b
+                         WHERE b.id_article = gm_articles.id_article), translated_content)
+                WHERE rowid >= ? AND rowid < ?
+                  AND id_article IN (SELECT id_article FROM {bodies_tbl})
+                """,
+                (lower, upper),
+            )
+            moved += cur.rowcount
+            conn.execute(
+                f"""
+                DELETE FROM {bodies_tbl} WHERE id_article IN (
+                    SELECT id_article FROM gm_articles WHERE rowid >= ? AND rowid < ?
+                )
+                """,
+                (lower, upper),
+            )
+        conn.execute(
+            "UPDATE gm_migrations SET position = ? WHERE name = ?", (str(lower), name)
+        )
+        conn.commit()
+        upper = lower
+        print(f"\r   {'restored' if restore else 'moved'} {moved:,} bodies "
+              f"(rowid < {upper:,}, {time.time() - t0:.0f}s)", end="", flush=True)
+    conn.execute("UPDATE gm_migrations SET done = 1 WHERE name = ?", (name,))
+    conn.commit()
+    print()
+    return moved
+
+
+def rebuild_fts(conn, codec, bodies_tbl):
+    """Refill gm_articles_fts with plain text, as NewsDatabase.rebuild_search_index() does."""
+    if not conn.execute(
+        "SELECT 1 FROM sqlite_master WHERE type='table' AND name='gm_articles_fts'"
+    ).fetchone():
+        return
+    cols = [c for c, _ in _SEARCH_COLUMNS]
+    select = (
+        f"SELECT a.rowid, {_fts_values('a', 'b')} FROM gm_articles a "
+        f"LEFT JOIN {bodies_tbl} b ON b.id_article = a.id_article "
+        f"WHERE a.rowid > ? ORDER BY a.rowid LIMIT ?"
+    )
+    insert = (
+        f"INSERT INTO gm_articles_fts (rowid, {', '.join(cols)}) "
+        f"VALUES ({', '.join('?' * (len(cols) + 1))})"
+    )
+    print("🔎 Rebuilding gm_articles_fts…")
+    conn.execute("DELETE FROM gm_articles_fts")
+    last = 0
+    while True:
+        rows = conn.execute(select, (last, FTS_REBUILD_BATCH)).fetchall()
+        if not rows:
+            break
+        conn.executemany(insert, _fts_decode_rows(rows, codec.decode))
+        last = rows[-1][0]
+    conn.commit()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Split article bodies out of gm_articles")
+    parser.add_argument("--db", default=get_db_path(), help="SQLite database (default: DB_PATH)")
+    parser.add_argument("--bodies-db", default=str(config('ARTICLE_BODIES_DB', default='')),
+                        help="Separate bodies file, relative to the DB directory (default: ARTICLE_BODIES_DB)")
+    parser.add_argument("--batch", type=int, default=2000, help="rowids per transaction")
+    parser.add_argument("--bench", action="store_true", help="Benchmark hot queries before and after")
+    parser.add_argument("--bench-only", action="store_true", help="Benchmark only, change nothing")
+    parser.add_argument("--repeat", type=int, default=5, help="Runs per benchmark query")
+    parser.add_argument("--vacuum", action="store_true", help="VACUUM after moving (reclaims the freed pages)")
+    parser.add_argument("--restore", action="store_true", help="Move bodies back into gm_articles")
+    parser.add_argument("--json", help="Write benchmark results to this file")
+    args = parser.parse_args()
+
+    db_path = args.db
+    bodies_path = ""
+    if args.bodies_db:
+        bodies_path = (args.bodies_db if os.path.isabs(args.bodies_db)
+                       else os.path.join(os.path.dirname(os.path.abspath(db_path)), args.bodies_db))
+    bodies_tbl = "bodies.gm_article_bodies" if bodies_path else "main.gm_article_bodies"
+    print(f"📊 Database: {db_path}" + (f"\n📦 Bodies:   {bodies_path}" if bodies_path else ""))
+
+    conn, codec = open_db(db_path, bodies_path)
+    results = []
+    try:
+        if args.bench or args.bench_only:
+            results.append(bench(conn, db_path, bodies_path, "before", args.repeat))
+        if args.bench_only:
+            return
+
+        prepare(conn, bodies_tbl)
+        t0 = time.time()
+        moved = move_bodies(conn, bodies_tbl, max(1, args.batch), args.restore)
+        print(f"✅ {'Restored' if args.restore else 'Moved'} {moved:,} bodies in {time.time() - t0:.1f}s")
+
+        if args.vacuum:
+            print("🧹 VACUUM…")
+            conn.execute("VACUUM")
+            if bodies_path:
+                conn.execute("VACUUM bodies")
+        rebuild_fts(conn, codec, bodies_tbl)
+        conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+        if bodies_path:
+            conn.execute("PRAGMA bodies.wal_checkpoint(TRUNCATE)")
+
+        if args.bench:
+            results.append(bench(conn, db_path, bodies_path, "after", args.repeat))
+            print_comparison(results[0], results[1])
+        layout = "inline" if args.restore else "table"
+        print(f"\nNext: set ARTICLE_BODY_STORE={layout}"
+              + (f" and ARTICLE_BODIES_DB={args.bodies_db}" if bodies_path and not args.restore else "")
+              + " in .env, then restart the collector.")
+    finally:
+        if args.json and results:
+            with open(args.json, "w") as f:
+                json.dump(results, f, indent=2)
+        conn.close()
+
+
+if __name__ == "__main__":
+    main()
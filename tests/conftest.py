@@ -0,0 +1,37 @@
+"""Shared pytest fixtures for the unit tests (no network)."""
+
+import sqlite3
+
+import pytest
+
+# The gm_* tables wxAsyncNewsGather creates before NewsDatabase migrates them
+NEWS_SCHEMA = """
+CREATE TABLE gm_sources (
+    id_source TEXT PRIMARY KEY, name TEXT, description TEXT, url TEXT,
+    category TEXT, language TEXT, country TEXT,
+    fetch_blocked INTEGER DEFAULT 0, blocked_count INTEGER DEFAULT 0
+);
+CREATE TABLE gm_articles (
+    id_article TEXT PRIMARY KEY, id_source TEXT, author TEXT, title TEXT,
+    description TEXT, url TEXT, urlToImage TEXT, publishedAt TEXT,
+    content TEXT, published_at_gmt TEXT, inserted_at_ms INTEGER,
+    detected_language TEXT, language_confidence REAL,
+    is_enriched INTEGER NOT NULL DEFAULT 0, is_translated INTEGER NOT NULL DEFAULT 0,
+    translated_title TEXT, translated_description TEXT, translated_content TEXT,
+    translated_at_ms INTEGER, title_hash TEXT
+);
+CREATE TABLE languages (
+    language_code TEXT PRIMARY KEY, language_name TEXT,
+    translate INTEGER NOT NULL DEFAULT 0, translate_to TEXT, translator_code TEXT,
+    translate_backend TEXT, translate_without_enrichment INTEGER NOT NULL DEFAULT 0
+);
+"""
+
+
+@pytest.fixture
+def news_db_path(tmp_path):
+    """Path of a fresh SQLite file with the base news schema."""
+    path = str(tmp_path / "news.db")
+    with sqlite3.connect(path) as conn:
+        conn.executescript(NEWS_SCHEMA)
+    return path
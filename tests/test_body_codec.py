@@ -0,0 +1,82 @@
+"""Unit tests for body_codec (no network, no DB)."""
+
+import random
+
+import pytest
+
+import body_codec
+from body_codec import BodyCodec, VERSION_ZSTD
+
+pytest.importorskip("zstandard")
+
+WORDS = ("market government election climate football science health court "
+         "minister company report police city school energy price").split()
+
+
+def bodies(n=400, seed=7):
+    rnd = random.Random(seed)
+    return [
+        "Reuters — " + " ".join(rnd.choice(WORDS) for _ in range(rnd.randint(40, 120)))
+        + ". Subscribe to our newsletter. All rights reserved."
+        for _ in range(n)
+    ]
+
+
+@pytest.fixture(scope="module")
+def trained():
+    return body_codec.train_dictionary(bodies(), size=8192)
+
+
+def _codec(*dicts, enabled=True):
+    codec = BodyCodec()
+    codec.load_dicts(dicts)
+    codec.enabled = enabled
+    return codec
+
+
+def test_round_trip_with_dictionary(trained):
+    codec = _codec(trained)
+    for text in bodies(20, seed=1) + ["ünïcødé — “quotes” " * 10]:
+        stored = codec.encode(text)
+        assert isinstance(stored, bytes) and stored[0] == VERSION_ZSTD
+        assert len(stored) < len(text.encode("utf-8"))
+        assert codec.decode(stored) == text
+
+
+def test_plain_text_passes_through(trained):
+    off = _codec(trained, enabled=False)
+    text = bodies(1)[0]
+    assert off.encode(text) is text                   # codec off: stored as TEXT
+    assert _codec(trained).encode("short") == "short"  # under BODY_MIN_BYTES
+    for value in (text, None, ""):
+        assert BodyCodec().decode(value) == value
+    assert BodyCodec().encode(None) is None
+
+
+def test_other_codec_with_same_dictionary_decodes(trained):
+    stored = _codec(trained).encode(bodies(1)[0])
+    reader = _codec(trained, enabled=False)            # e.g. the reader or the split script
+    assert reader.decode(stored) == bodies(1)[0]
+    assert reader.decode(bytearray(stored)) == bodies(1)[0]
+
+
+def test_unknown_dictionary(trained):
+    stored = _codec(trained).encode(bodies(1)[0])
+    with pytest.raises(RuntimeError, match="not loaded"):
+        BodyCodec().decode(stored)
+    assert BodyCodec().safe_decode(stored) is None
+
+
+def test_unknown_format_version():
+    with pytest.raises(ValueError, match="version"):
+        BodyCodec().decode(bytes((99,)) + b"payload")
+    assert BodyCodec().safe_decode(bytes((99,))) is None
+
+
+def test_newest_dictionary_is_active(trained):
+    older = body_codec.train_dictionary(bodies(seed=3), size=8192)
+    codec = _codec(older, trained)
+    assert codec.active_dict == trained[0]
+    stored = codec.encode(bodies(1)[0])
+    assert codec.decode(stored) == bodies(1)[0]
+    assert _codec(older, enabled=False).safe_decode(stored) is None
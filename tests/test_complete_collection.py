@@ -75,6 +75,7 @@ async def test_complete_collection():
     # Wait a bit for RSS discovery tasks to complete
     print("\n⏳ Waiting for RSS discovery tasks to complete...")
     await asyncio.sleep(5)
+    await news_gather.http.close()   # started lazily by the collectors
     
     print("\n" + "="*80)
     print("📊 Final Database Statistics:")
@@ -0,0 +1,176 @@
+"""Unit tests for dns_cache (stubbed resolvers, no network)."""
+
+import asyncio
+import socket
+
+import pytest
+
+import dns_cache
+from dns_cache import DNSCache, NXDomainError, PinnedHosts
+
+
+class _Clock:
+    """Stand-in for the ``time`` module with a hand-driven clock."""
+
+    def __init__(self, now: float = 1000.0) -> None:
+        self.now = now
+
+    def monotonic(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    c = _Clock()
+    monkeypatch.setattr(dns_cache, "time", c)
+    monkeypatch.setattr(dns_cache, "DNS_USE_AIODNS", False)
+    return c
+
+
+def _stub(cache, answers):
+    """Replace the getaddrinfo query; *answers* maps host → (addrs, ttl) or an exception."""
+    calls = []
+
+    async def query(host):
+        calls.append(host)
+        answer = answers[host]
+        if isinstance(answer, BaseException):
+            raise answer
+        return answer
+
+    cache._query_getaddrinfo = query
+    return calls
+
+
+def test_nxdomain_is_cached_for_negative_ttl(clock):
+    cache = DNSCache()
+    calls = _stub(cache, {"gone.example": NXDomainError("gone.example")})
+
+    async def lookups():
+        return [await cache.lookup("gone.example"), await cache.lookup("GONE.example.")]
+
+    assert asyncio.run(lookups()) == [None, None]
+    assert calls == ["gone.example"]
+    assert cache.is_nxdomain("gone.example")
+    with pytest.raises(NXDomainError):
+        asyncio.run(cache.resolve("gone.example", 443))
+
+    clock.now += dns_cache.DNS_NEGATIVE_TTL + 1
+    assert not cache.is_nxdomain("gone.example")
+    asyncio.run(cache.lookup("gone.example"))
+    assert calls == ["gone.example"] * 2
+    assert cache.to_dict()["negative"] == 4
+
+
+def test_transient_error_is_not_cached(clock):
+    cache = DNSCache()
+    answers = {"flaky.example": OSError("SERVFAIL")}
+    calls = _stub(cache, answers)
+    with pytest.raises(OSError):
+        asyncio.run(cache.lookup("flaky.example"))
+    assert cache.peek("flaky.example") == (None, 0.0)
+
+    answers["flaky.example"] = (["192.0.2.1"], 120)
+    assert asyncio.run(cache.lookup("flaky.example")) == ["192.0.2.1"]
+    assert calls == ["flaky.example"] * 2
+    assert cache.to_dict()["failures"] == 1
+
+
+@pytest.mark.parametrize("ttl,kept", [(5, "min"), (600, 600), (10**6, "max")])
+def test_ttl_is_clamped(clock, ttl, kept):
+    kept = {"min": dns_cache.DNS_CACHE_MIN_TTL, "max": dns_cache.DNS_CACHE_MAX_TTL}.get(kept, kept)
+    cache = DNSCache()
+    calls = _stub(cache, {"a.example": (["192.0.2.7"], ttl)})
+    asyncio.run(cache.lookup("a.example"))
+    assert cache.peek("a.example") == (["192.0.2.7"], kept)
+
+    clock.now += kept - 1
+    asyncio.run(cache.lookup("a.example"))
+    assert len(calls) == 1
+    clock.now += 2
+    asyncio.run(cache.lookup("a.example"))
+    assert len(calls) == 2
+
+
+def test_concurrent_lookups_share_one_query(clock):
+    cache = DNSCache()
+    release = asyncio.Event()
+    calls = []
+
+    async def query(host):
+        calls.append(host)
+        await release.wait()
+        return ["192.0.2.9", "2001:db8::9"], 300
+
+    cache._query_getaddrinfo = query
+
+    async def main():
+        waiters = [asyncio.ensure_future(cache.lookup("b.example")) for _ in range(5)]
+        await asyncio.sleep(0)
+        release.set()
+        results = await asyncio.gather(*waiters)
+        v4 = await cache.resolve("b.example", 80, socket.AF_INET)
+        return results, v4
+
+    results, v4 = asyncio.run(main())
+    assert calls == ["b.example"]
+    assert results == [["192.0.2.9", "2001:db8::9"]] * 5
+    assert [r["host"] for r in v4] == ["192.0.2.9"]
+    assert cache.to_dict()["misses"] == 1 and cache.to_dict()["inflight"] == 0
+
+
+def test_getaddrinfo_maps_eai_noname_to_nxdomain(monkeypatch):
+    monkeypatch.setattr(dns_cache, "DNS_USE_AIODNS", False)
+    cache = DNSCache()
+
+    async def main():
+        loop = asyncio.get_running_loop()
+
+        async def fake_getaddrinfo(host, port, type=0):
+            if host == "nope.example":
+                raise socket.gaierror(socket.EAI_NONAME, "Name or service not known")
+            if host == "slow.example":
+                raise socket.gaierror(socket.EAI_AGAIN, "Temporary failure")
+            return [(socket.AF_INET, socket.SOCK_STREAM, 6, "", ("192.0.2.3", 0))] * 2
+
+        loop.getaddrinfo = fake_getaddrinfo
+        found = await cache.lookup("ok.example")
+        missing = await cache.lookup("nope.example")
+        with pytest.raises(OSError):
+            await cache.lookup("slow.example")
+        return found, missing
+
+    assert asyncio.run(main()) == (["192.0.2.3"], None)
+    assert cache.is_nxdomain("nope.example")
+    assert cache.peek("slow.example") == (None, 0.0)
+
+
+def test_pinned_hosts_filter_by_family_and_expire(clock):
+    libc = []
+    pins = PinnedHosts()
+    pins._orig = lambda *args: libc.append(args) or ["libc"]
+    pins.pin({"host": "c.example", "addrs": ["192.0.2.5", "2001:db8::5"], "ttl": 30})
+
+    both = pins._getaddrinfo("c.example", 443)
+    assert [(fam, sa) for fam, _, _, _, sa in both] == [
+        (socket.AF_INET, ("192.0.2.5", 443)),
+        (socket.AF_INET6, ("2001:db8::5", 443, 0, 0)),
+    ]
+    v6 = pins._getaddrinfo(b"C.example.", "80", socket.AF_INET6)
+    assert [sa for *_, sa in v6] == [("2001:db8::5", 80, 0, 0)]
+    assert libc == []
+
+    assert pins._getaddrinfo("c.example", "https") == ["libc"]     # service name
+    assert pins._getaddrinfo("other.example", 80) == ["libc"]
+    clock.now += 31
+    assert pins._getaddrinfo("c.example", 443) == ["libc"]
+    assert len(libc) == 3
+
+
+def test_pinned_hosts_family_without_address_falls_through(clock):
+    pins = PinnedHosts()
+    pins._orig = lambda *args: ["libc"]
+    pins.pin({"host": "d.example", "addrs": ["192.0.2.6"], "ttl": 30})
+    assert pins._getaddrinfo("d.example", 443, socket.AF_INET6) == ["libc"]
+    pins.pin({"host": "e.example", "addrs": []})                     # nothing to pin
+    assert pins._getaddrinfo("e.example", 443) == ["libc"]
@@ -0,0 +1,174 @@
+"""Unit tests for domain_dispatcher (no network)."""
+
+import asyncio
+from email.utils import formatdate
+
+import pytest
+
+import domain_dispatcher
+from domain_dispatcher import DomainDispatcher, host_of, parse_retry_after
+
+
+class _Clock:
+    """Stand-in for the ``time`` module with a hand-driven clock."""
+
+    def __init__(self, now: float = 1000.0) -> None:
+        self.now = now
+
+    def monotonic(self) -> float:
+        return self.now
+
+    def time(self) -> float:
+        return 1_700_000_000.0 + self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    c = _Clock()
+    monkeypatch.setattr(domain_dispatcher, "time", c)
+    return c
+
+
+def _drain(q: asyncio.Queue) -> list:
+    out = []
+    while not q.empty():
+        out.append(q.get_nowait())
+    return out
+
+
+async def _settle() -> None:
+    for _ in range(5):
+        await asyncio.sleep(0)
+
+
+# ── helpers ───────────────────────────────────────────────────────────────────
+
+def test_host_of_strips_www():
+    assert host_of("https://www.example.com/a") == "example.com"
+    assert host_of("http://news.example.com:8080/x") == "news.example.com"
+    assert host_of("not a url") == ""
+
+
+def test_parse_retry_after(clock):
+    assert parse_retry_after("120") == 120
+    assert parse_retry_after(None) is None
+    assert parse_retry_after("garbage") is None
+    date = formatdate(clock.time() + 60, usegmt=True)
+    assert parse_retry_after(date) == pytest.approx(60, abs=1)
+
+
+# ── token bucket / cool-down (hand-driven clock) ──────────────────────────────
+
+def test_token_bucket_allows_burst_then_rate(clock):
+    d = DomainDispatcher(per_host=10, rate=2.0, burst=3.0)
+    d.add("cffi", "a.com", 1)
+    h = d._hosts["a.com"]
+    for _ in range(3):
+        assert d._wait_for(h, clock.now) == 0.0
+        h.tokens -= 1.0
+    assert d._wait_for(h, clock.now) == pytest.approx(0.5)
+    clock.now += 0.5
+    assert d._wait_for(h, clock.now) == 0.0
+    clock.now += 100
+    d._wait_for(h, clock.now)
+    assert h.tokens == 3.0                       # refill is capped at burst
+
+
+def test_per_host_cap_blocks_until_done(clock):
+    d = DomainDispatcher(per_host=2, rate=100, burst=10)
+    d.add("cffi", "a.com", 1)
+    h = d._hosts["a.com"]
+    h.in_flight = 2
+    assert d._wait_for(h, clock.now) is None
+    d.done("a.com")
+    assert d._wait_for(h, clock.now) == 0.0
+
+
+def test_cooldown_honours_retry_after(clock):
+    d = DomainDispatcher(per_host=5, rate=100, burst=10)
+    d.add("cffi", "a.com", 1)
+    h = d._hosts["a.com"]
+    h.in_flight = 1
+    d.done("a.com", throttled=True, retry_after="45")
+    assert d._wait_for(h, clock.now) == pytest.approx(45)
+    assert d.throttled == 1
+    clock.now += 45
+    assert d._wait_for(h, clock.now) == 0.0
+
+
+def test_cooldown_default_is_exponential_and_capped(clock):
+    d = DomainDispatcher(per_host=5, rate=100, burst=10,
+                         default_cooldown=30, max_cooldown=100)
+    d.add("cffi", "a.com", 1)
+    h = d._hosts["a.com"]
+    waits = []
+    for _ in range(3):
+        d.done("a.com", throttled=True)
+        waits.append(h.cool_until - clock.now)
+        clock.now = h.cool_until
+    assert waits == [30, 60, 100]
+    d.done("a.com")                              # success resets the strikes
+    assert h.strikes == 0
+
+
+# ── run(): real event loop ────────────────────────────────────────────────────
+
+def test_run_caps_in_flight_per_host():
+    async def main():
+        d = DomainDispatcher(per_host=2, rate=1000, burst=100)
+        out = {"cffi": asyncio.Queue()}
+        for i in range(5):
+            d.add("cffi", "a.com", i)
+        task = asyncio.ensure_future(d.run(out))
+        await _settle()
+        first = _drain(out["cffi"])
+        pending = d.pending("cffi")
+        d.done("a.com")
+        await _settle()
+        second = _drain(out["cffi"])
+        task.cancel()
+        return first, pending, second
+
+    first, pending, second = asyncio.run(main())
+    assert first == [0, 1] and pending == 3
+    assert second == [2]
+
+
+def test_run_round_robins_hosts_and_lanes():
+    async def main():
+        d = DomainDispatcher(per_host=10, rate=1000, burst=100)
+        out = {"cffi": asyncio.Queue(), "playwright": asyncio.Queue()}
+        for i in range(3):
+            d.add("cffi", "a.com", f"a{i}")
+        d.add("cffi", "b.com", "b0")
+        d.add("playwright", "c.com", "c0")
+        task = asyncio.ensure_future(d.run(out))
+        await _settle()
+        task.cancel()
+        return _drain(out["cffi"]), _drain(out["playwright"]), d.dispatched
+
+    cffi, playwright, dispatched = asyncio.run(main())
+    assert cffi == ["a0", "b0", "a1", "a2"]
+    assert playwright == ["c0"]
+    assert dispatched == 5
+
+
+def test_run_holds_cooling_host_but_serves_others():
+    async def main():
+        d = DomainDispatcher(per_host=10, rate=1000, burst=100)
+        out = {"cffi": asyncio.Queue()}
+        d.add("cffi", "slow.com", "s0")
+        task = asyncio.ensure_future(d.run(out))
+        await _settle()
+        first = _drain(out["cffi"])
+        d.done("slow.com", throttled=True, retry_after="60")
+        d.add("cffi", "slow.com", "s1")
+        d.add("cffi", "fast.com", "f0")
+        await _settle()
+        second = _drain(out["cffi"])
+        task.cancel()
+        return first, second, d.pending("cffi")
+
+    first, second, pending = asyncio.run(main())
+    assert first == ["s0"]
+    assert second == ["f0"] and pending == 1
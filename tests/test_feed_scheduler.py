@@ -0,0 +1,119 @@
+"""Unit tests for feed_scheduler (no network, no DB)."""
+
+from email.utils import formatdate
+
+import pytest
+
+from feed_scheduler import FeedScheduler, cache_lifetime, retry_after_seconds
+
+T0 = 1_700_000_000.0
+SRC = {"id": "src-1", "name": "Feed", "url": "https://example.com/rss"}
+
+
+def _scheduler(**kw):
+    kw.setdefault("jitter", 0.0)
+    sched = FeedScheduler(default_interval=900, min_interval=120, max_interval=6 * 3600, **kw)
+    sched.sync([SRC], now=T0)
+    return sched
+
+
+def _poll(sched, now, outcome="ok", new=0, headers=None):
+    assert sched.pop_due(10, now=now) == [SRC]
+    sched.record_new_articles(SRC["id"], new)
+    return sched.record_poll(SRC["id"], outcome, headers, now=now)
+
+
+# ── header helpers ────────────────────────────────────────────────────────────
+
+def test_cache_lifetime_max_age_wins_over_expires():
+    headers = {"Cache-Control": "public, max-age=600",
+               "Expires": formatdate(T0 + 60, usegmt=True)}
+    assert cache_lifetime(headers, now=T0) == 600
+
+
+def test_cache_lifetime_expires_and_no_store():
+    assert cache_lifetime({"Expires": formatdate(T0 + 300, usegmt=True)}, now=T0) == pytest.approx(300)
+    assert cache_lifetime({"Cache-Control": "no-store"}, now=T0) == 0.0
+    assert cache_lifetime({}, now=T0) is None
+
+
+def test_retry_after_seconds_and_date():
+    assert retry_after_seconds({"Retry-After": "120"}, now=T0) == 120
+    assert retry_after_seconds({"Retry-After": formatdate(T0 + 90, usegmt=True)},
+                               now=T0) == pytest.approx(90)
+    assert retry_after_seconds({"Retry-After": "soon"}, now=T0) is None
+
+
+# ── scheduling ────────────────────────────────────────────────────────────────
+
+def test_new_feed_due_immediately_then_default_interval():
+    sched = _scheduler()
+    assert sched.seconds_until_next(now=T0) == 0
+    assert _poll(sched, T0) == 900
+    assert sched.pop_due(10, now=T0 + 899) == []
+    assert sched.pop_due(10, now=T0 + 900) == [SRC]
+
+
+def test_interval_follows_publish_rate():
+    sched = _scheduler()
+    sched.seed_rates({SRC["id"]: 1 / 600})
+    assert _poll(sched, T0) == pytest.approx(600)
+
+
+def test_first_quiet_poll_does_not_jump_to_max_interval():
+    sched = _scheduler()
+    _poll(sched, T0)
+    interval = _poll(sched, T0 + 900)            # zero new articles, no history
+    assert 900 < interval <= 1800
+    state = sched._feeds[SRC["id"]]
+    assert state.rate > 0
+
+
+def test_quiet_feed_backs_off_at_most_max_growth_per_poll():
+    sched = _scheduler()
+    now, prev = T0, _poll(sched, T0)
+    for _ in range(12):
+        now += prev
+        interval = _poll(sched, now)
+        assert interval <= prev * 2 + 1e-6
+        prev = interval
+    assert prev == 6 * 3600
+
+
+def test_busy_feed_shortens_interval_down_to_min():
+    sched = _scheduler()
+    now, prev = T0, _poll(sched, T0)
+    for _ in range(10):
+        now += prev
+        prev = _poll(sched, now, new=50)
+    assert prev == 120
+
+
+def test_cache_headers_set_interval_floor():
+    sched = _scheduler()
+    sched.seed_rates({SRC["id"]: 1 / 200})
+    assert _poll(sched, T0, headers={"Cache-Control": "max-age=1800"}) == 1800
+
+
+def test_retry_after_sets_floor_on_error():
+    sched = _scheduler()
+    assert _poll(sched, T0, outcome="error", headers={"Retry-After": "7200"}) == 7200 * 2
+
+
+def test_error_backoff_doubles_and_resets():
+    sched = _scheduler()
+    now = T0
+    intervals = []
+    for _ in range(3):
+        intervals.append(_poll(sched, now, outcome="error"))
+        now += intervals[-1]
+    assert intervals == [1800, 3600, 7200]
+    assert _poll(sched, now, outcome="ok", new=1) < 7200
+    assert sched._feeds[SRC["id"]].errors == 0
+
+
+def test_sync_drops_vanished_feeds():
+    sched = _scheduler()
+    assert sched.sync([], now=T0) == (0, 1)
+    assert sched.pop_due(10, now=T0) == []
+    assert sched.record_poll(SRC["id"], "ok", now=T0) is None
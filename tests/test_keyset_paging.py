@@ -0,0 +1,156 @@
+"""Unit tests for the /api/articles keyset paging (temporary SQLite file, no network)."""
+
+import asyncio
+import sqlite3
+
+import pytest
+
+import news_db
+from news_db import NewsDatabase, decode_article_cursor, encode_article_cursor
+
+UNTIL = 4000
+
+# (id_article, inserted_at_ms, id_source) — ids are BLOBs, as url_encode() makes them
+ROWS = [
+    (b"c", 1000, "s1"), (b"a", 1000, "s1"), (b"b", 1000, "s2"),
+    (b"e", 2000, "s2"), (b"d", 2000, "s1"),
+    (b"f", 3000, "s1"),
+    (b"g", 5000, "s1"),                       # after UNTIL
+]
+ORDER = [b"a", b"b", b"c", b"d", b"e", b"f"]  # (inserted_at_ms, id_article) up to UNTIL
+
+
+def _article(id_article, ms, source):
+    name = id_article.decode()
+    return {
+        "id_article": id_article, "id_source": source, "author": "", "title": f"T {name}",
+        "description": "", "url": f"https://example.com/{name}", "urlToImage": "",
+        "publishedAt": "", "published_at_gmt": "2025-01-01T00:00:00+00:00",
+        "content": f"body {name}", "translated_content": f"corpo {name}",
+        "inserted_at_ms": ms, "title_hash": f"h-{name}",
+    }
+
+
+@pytest.fixture(params=["inline", "table"])
+def layout(request, monkeypatch):
+    monkeypatch.setattr(news_db, "ARTICLE_BODY_STORE", request.param)
+    monkeypatch.setattr(news_db, "ARTICLE_BODIES_DB", "")
+    return request.param
+
+
+def _with_db(path, fn):
+    async def main():
+        db = await NewsDatabase.open(path)
+        try:
+            await db.insert_articles_bulk([_article(*r) for r in ROWS])
+            return await fn(db)
+        finally:
+            await db.close()
+            NewsDatabase._instance = None
+
+    return asyncio.run(main())
+
+
+async def _walk(db, limit, source_ids=None):
+    """Follow next_cursor the way GET /api/articles?order=asc does."""
+    pages, cursor = [], encode_article_cursor(0, None)
+    while True:
+        after_ms, after_id = decode_article_cursor(cursor)
+        rows = await db.fetch_articles_after(after_ms, after_id, UNTIL, limit + 1, source_ids)
+        has_more, rows = len(rows) > limit, rows[:limit]
+        pages.append(([r["id_article"] for r in rows], has_more))
+        if not has_more:
+            return pages
+        cursor = encode_article_cursor(rows[-1]["inserted_at_ms"], rows[-1]["id_article"])
+
+
+# ── cursor ────────────────────────────────────────────────────────────────────
+
+@pytest.mark.parametrize("article_id", [b"\x00\xffblob", "text-id ✓", None])
+def test_cursor_round_trip(article_id):
+    cursor = encode_article_cursor(1234, article_id)
+    assert decode_article_cursor(cursor) == (1234, article_id)
+
+
+@pytest.mark.parametrize("cursor", ["", "x.n", "12", "12.q", "12.b!!", "12.s_w"])
+def test_malformed_cursor_raises_value_error(cursor):
+    with pytest.raises(ValueError):
+        decode_article_cursor(cursor)
+
+
+# ── paging ────────────────────────────────────────────────────────────────────
+
+@pytest.mark.parametrize("limit", [1, 2, 4, 10])
+def test_pages_cover_ties_exactly_once(news_db_path, layout, limit):
+    pages = _with_db(news_db_path, lambda db: _walk(db, limit))
+    ids = [i for page, _ in pages for i in page]
+    assert ids == ORDER
+    assert [more for _, more in pages] == [True] * (len(pages) - 1) + [False]
+    assert all(len(page) == limit for page, _ in pages[:-1])
+
+
+def test_cursor_inside_a_tie_resumes_after_it(news_db_path, layout):
+    async def fn(db):
+        rows = await db.fetch_articles_after(1000, b"a", UNTIL, 10)
+        plain = await db.fetch_articles_after(1000, None, UNTIL, 10)
+        return [r["id_article"] for r in rows], [r["id_article"] for r in plain]
+
+    after_a, after_ms = _with_db(news_db_path, fn)
+    assert after_a == [b"b", b"c", b"d", b"e", b"f"]
+    assert after_ms == [b"d", b"e", b"f"]             # no id: strictly after the millisecond
+
+
+def test_source_filter(news_db_path, layout):
+    pages = _with_db(news_db_path, lambda db: _walk(db, 2, ["s2"]))
+    assert pages == [([b"b", b"e"], False)]
+
+
+def test_rows_carry_bodies(news_db_path, layout):
+    async def fn(db):
+        return await db.fetch_articles_after(0, None, UNTIL, 1)
+
+    (row,) = _with_db(news_db_path, fn)
+    assert row["translated_content"] == "corpo a"
+    with sqlite3.connect(news_db_path) as conn:
+        inline = conn.execute(
+            "SELECT translated_content FROM gm_articles WHERE id_article = ?", (b"a",)
+        ).fetchone()[0]
+    assert inline == ("corpo a" if layout == "inline" else None)
+
+
+def test_iter_articles_after_matches_pages(news_db_path, layout):
+    async def fn(db):
+        chunks = [
+            [r["id_article"] for r in chunk]
+            async for chunk in db.iter_articles_after(1000, b"a", UNTIL, 2)
+        ]
+        filtered = [
+            r["id_article"]
+            async for chunk in db.iter_articles_after(0, None, UNTIL, 2, ["s1"])
+            for r in chunk
+        ]
+        return chunks, filtered
+
+    chunks, filtered = _with_db(news_db_path, fn)
+    assert chunks == [[b"b", b"c"], [b"d", b"e"], [b"f"]]
+    assert filtered == [b"a", b"c", b"d", b"f"]
+
+
+def test_translation_updates_walk_ties(news_db_path, layout):
+    async def fn(db):
+        # Five translations, three of them in the same millisecond
+        with sqlite3.connect(news_db_path) as conn:
+            conn.executemany(
+                "UPDATE gm_articles SET is_translated = 1, translated_at_ms = ? WHERE id_article = ?",
+                [(7000, b"c"), (7000, b"a"), (7000, b"b"), (8000, b"d"), (6000, b"e")],
+            )
+        pages, after_ms, after_id = [], 0, None
+        while True:
+            rows = await db.fetch_translation_updates(after_ms, 2, after_id)
+            pages.append([r["id_article"] for r in rows])
+            if len(rows) < 2:
+                return pages
+            after_ms, after_id = rows[-1]["translated_at_ms"], rows[-1]["id_article"]
+
+    pages = _with_db(news_db_path, fn)
+    assert pages == [[b"e", b"a"], [b"b", b"c"], [b"d"]]
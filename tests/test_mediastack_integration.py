@@ -29,6 +29,7 @@ async def test_mediastack_integration():
     # Test MediaStack collection directly
     print("\n🌍 Testing MediaStack collection...")
     await news_gather.collect_mediastack()
+    await news_gather.http.close()   # started lazily by the collector
     
     print("\n" + "="*80)
     print("✅ Test complete!")
@@ -0,0 +1,115 @@
+"""Unit tests for the published_at_epoch column, triggers and back-fill (temporary SQLite file, no network)."""
+
+import asyncio
+import calendar
+import sqlite3
+import time
+
+import pytest
+
+import news_db
+from news_db import NewsDatabase
+
+ROWS = 25   # rowids 1..25, written before the column existed
+
+
+def _gmt(i):
+    return f"2025-01-{i:02d}T12:00:00+00:00"
+
+
+def _epoch(gmt):
+    return calendar.timegm(time.strptime(gmt[:19], "%Y-%m-%dT%H:%M:%S"))
+
+
+@pytest.fixture
+def old_db(news_db_path, monkeypatch):
+    monkeypatch.setattr(news_db, "EPOCH_BACKFILL_BATCH", 10)
+    with sqlite3.connect(news_db_path) as conn:
+        conn.executemany(
+            "INSERT INTO gm_articles (id_article, title, published_at_gmt, inserted_at_ms, title_hash) "
+            "VALUES (?, 't', ?, 1000, ?)",
+            [(f"a{i}", _gmt(i), f"h{i}") for i in range(1, ROWS + 1)],
+        )
+    return news_db_path
+
+
+def _open_and(path, fn):
+    async def main():
+        db = await NewsDatabase.open(path)
+        try:
+            return await fn(db)
+        finally:
+            await db.close()
+            NewsDatabase._instance = None
+
+    return asyncio.run(main())
+
+
+def _state(path):
+    with sqlite3.connect(path) as conn:
+        filled = [r[0] for r in conn.execute(
+            "SELECT rowid FROM gm_articles WHERE published_at_epoch IS NOT NULL ORDER BY rowid"
+        )]
+        position, done = conn.execute(
+            "SELECT position, done FROM gm_migrations WHERE name = 'published_at_epoch'"
+        ).fetchone()
+    return filled, position, done
+
+
+def test_backfill_resumes_from_stored_position(old_db):
+    def position():
+        with sqlite3.connect(old_db) as conn:
+            return conn.execute(
+                "SELECT position FROM gm_migrations WHERE name = 'published_at_epoch'"
+            ).fetchone()[0]
+
+    async def first_batch_only(db):
+        while position() is None:            # steps are 50 ms apart
+            await asyncio.sleep(0.001)
+
+    _open_and(old_db, first_batch_only)      # close() cancels the back-fill
+    filled, pos, done = _state(old_db)
+    assert (filled, pos, done) == (list(range(16, ROWS + 1)), "16", 0)
+
+    # Undo one row above the checkpoint: a restart that began again from the
+    # top would fill it, one that resumes from position leaves it alone
+    with sqlite3.connect(old_db) as conn:
+        conn.execute("UPDATE gm_articles SET published_at_epoch = NULL WHERE rowid = 20")
+
+    _open_and(old_db, lambda db: db._epoch_task)
+    filled, pos, done = _state(old_db)
+    assert filled == [r for r in range(1, ROWS + 1) if r != 20]
+    assert (pos, done) == ("1", 1)
+    with sqlite3.connect(old_db) as conn:
+        values = dict(conn.execute("SELECT rowid, published_at_epoch FROM gm_articles"))
+    assert values[1] == _epoch(_gmt(1)) and values[ROWS] == _epoch(_gmt(ROWS))
+
+    async def scheduled(db):
+        return db._epoch_task
+
+    assert _open_and(old_db, scheduled) is None   # finished: not scheduled again
+
+
+def test_triggers_fill_epoch_for_other_writers(news_db_path):
+    _open_and(news_db_path, lambda db: db.ping())
+    with sqlite3.connect(news_db_path) as conn:
+        conn.execute("INSERT INTO gm_articles (id_article, title, published_at_gmt, title_hash) "
+                     "VALUES ('x', 't', ?, 'hx')", (_gmt(3),))
+        conn.execute("INSERT INTO gm_articles (id_article, title, title_hash) "
+                     "VALUES ('y', 't', 'hy')")
+        inserted = dict(conn.execute("SELECT id_article, published_at_epoch FROM gm_articles"))
+
+        conn.execute("UPDATE gm_articles SET published_at_gmt = ? WHERE id_article = 'x'", (_gmt(7),))
+        conn.execute("UPDATE gm_articles SET published_at_gmt = ? WHERE id_article = 'y'", (_gmt(9),))
+        updated = dict(conn.execute("SELECT id_article, published_at_epoch FROM gm_articles"))
+
+        # A writer that sets both keeps its own value
+        conn.execute("UPDATE gm_articles SET published_at_gmt = ?, published_at_epoch = 42 "
+                     "WHERE id_article = 'x'", (_gmt(11),))
+        explicit = conn.execute(
+            "SELECT published_at_epoch FROM gm_articles WHERE id_article = 'x'"
+        ).fetchone()[0]
+
+    assert inserted == {"x": _epoch(_gmt(3)), "y": None}
+    assert updated == {"x": _epoch(_gmt(7)), "y": _epoch(_gmt(9))}
+    assert explicit == 42
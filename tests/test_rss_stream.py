@@ -0,0 +1,166 @@
+"""Unit tests for rss_stream.StreamingFeedParser (no network)."""
+
+import pytest
+
+import rss_stream
+from rss_stream import StreamingFeedParser
+
+RSS = """<?xml version="1.0" encoding="utf-8"?>
+<rss version="2.0" xmlns:dc="http://purl.org/dc/elements/1.1/"
+     xmlns:content="http://purl.org/rss/1.0/modules/content/">
+<channel>
+  <title>Example</title>
+  <language>pt-BR</language>
+  {items}
+</channel>
+</rss>"""
+
+ITEM = """<item>
+    <title>{title}</title>
+    <link>https://example.com/{n}</link>
+    <description>Summary {n}</description>
+    <pubDate>Mon, 06 Jan 2025 10:0{n}:00 GMT</pubDate>
+    <dc:creator>Autor {n}</dc:creator>
+  </item>"""
+
+ATOM = """<?xml version="1.0" encoding="utf-8"?>
+<feed xmlns="http://www.w3.org/2005/Atom" xml:lang="fr">
+  <title>Atom</title>
+  <entry>
+    <title type="html">&lt;b&gt;Caf&#233; &amp;amp; cr&#232;me&lt;/b&gt;</title>
+    <link rel="self" href="https://example.com/self"/>
+    <link rel="alternate" href="https://example.com/a1"/>
+    <author><name>Jeanne</name></author>
+    <content type="html">&lt;p&gt;Body&lt;/p&gt;</content>
+    <updated>2025-01-06T10:00:00Z</updated>
+  </entry>
+</feed>"""
+
+
+def _rss(titles):
+    items = "\n  ".join(ITEM.format(title=t, n=i) for i, t in enumerate(titles))
+    return RSS.format(items=items).encode("utf-8")
+
+
+def _parse(data, size=None, **kw):
+    parser = StreamingFeedParser(**kw)
+    size = size or len(data)
+    for i in range(0, len(data), size):
+        parser.feed(data[i:i + size])
+        if parser.done:
+            break
+    return parser.close()
+
+
+# ── output shape ──────────────────────────────────────────────────────────────
+
+def test_rss_entries_and_language():
+    feed = _parse(_rss(["Primeira  notícia", "Segunda &amp; última"]))
+    assert feed.feed == {"language": "pt-BR"}
+    assert [e["title"] for e in feed.entries] == ["Primeira notícia", "Segunda & última"]
+    first = feed.entries[0]
+    assert first["link"] == "https://example.com/0"
+    assert first["summary"] == "Summary 0"
+    assert first["published"] == "Mon, 06 Jan 2025 10:00:00 GMT"
+    assert first["author"] == "Autor 0"
+    assert not feed.truncated
+
+
+def test_atom_title_link_and_author():
+    feed = _parse(ATOM.encode("utf-8"))
+    assert feed.feed == {"language": "fr"}
+    (entry,) = feed.entries
+    assert entry["title"] == "<b>Café &amp; crème</b>"   # one level of decoding
+    assert entry["link"] == "https://example.com/a1"  # rel="alternate", not "self"
+    assert entry["author"] == "Jeanne"
+    assert entry["summary"] == "<p>Body</p>"
+    assert entry["updated"] == "2025-01-06T10:00:00Z"
+
+
+def test_guid_permalink_used_when_link_missing():
+    data = _rss(["x"]).replace(
+        b"<link>https://example.com/0</link>",
+        b"<guid>https://example.com/guid</guid>",
+    )
+    assert _parse(data).entries[0]["link"] == "https://example.com/guid"
+
+
+# Raw title XML → title as feedparser returns it (whitespace collapsed as in Stage 2)
+TITLES = [
+    ("Um &amp; dois", "Um & dois"),
+    ("Tom &amp;amp; Jerry", "Tom &amp; Jerry"),
+    ("A &lt;b&gt;bold&lt;/b&gt; one", "A <b>bold</b> one"),
+    ("a &lt; b", "a < b"),
+    ("<![CDATA[C <i>d</i> &amp; e]]>", "C <i>d</i> &amp; e"),
+    ("Três <b>quatro</b>", "Três <b>quatro</b>"),
+    ("T <i>a &amp; b</i> <br/> z", "T <i>a &amp; b</i> <br /> z"),
+    ('T <a href="http://e/">link</a>', 'T <a href="http://e/">link</a>'),
+    (" spaced\n  out ", "spaced out"),
+]
+
+
+@pytest.mark.parametrize("raw,expected", TITLES)
+def test_title_matches_feedparser_output(raw, expected):
+    assert _parse(_rss([raw])).entries[0]["title"] == expected
+
+
+def test_atom_xhtml_title_drops_div_wrapper():
+    data = ATOM.replace(
+        '<title type="html">&lt;b&gt;Caf&#233; &amp;amp; cr&#232;me&lt;/b&gt;</title>',
+        '<title type="xhtml"><div xmlns="http://www.w3.org/1999/xhtml">A <b>b</b></div></title>',
+    ).encode("utf-8")
+    assert _parse(data).entries[0]["title"] == "A <b>b</b>"
+
+
+def test_titles_and_links_match_feedparser():
+    feedparser = pytest.importorskip("feedparser")
+    for data in (_rss([raw for raw, _ in TITLES]), ATOM.encode("utf-8")):
+        ours = _parse(data).entries
+        theirs = feedparser.parse(data).entries
+        assert [(e["title"], e["link"]) for e in ours] == \
+               [(" ".join(e.title.split()), e.link) for e in theirs]
+
+
+# ── chunking ──────────────────────────────────────────────────────────────────
+
+@pytest.mark.parametrize("size", [1, 7, 64])
+def test_chunk_boundaries_do_not_change_result(size):
+    data = _rss(["Ação — “aspas”", "Ünïcödé &amp; entities", "Plain"])
+    whole = _parse(data).entries
+    assert _parse(data, size=size).entries == whole
+    assert len(whole) == 3
+
+
+def test_bytes_read_counts_fed_bytes():
+    data = _rss(["a", "b"])
+    assert _parse(data, size=10).bytes_read == len(data)
+
+
+def test_body_ending_early_keeps_finished_entries():
+    data = b"<rss><channel><item><title>one</title><link>http://x/1</link></item><item><tit"
+    assert [e["title"] for e in _parse(data).entries] == ["one"]
+
+
+@pytest.mark.skipif(rss_stream._HAS_LXML, reason="lxml recovers instead of raising")
+def test_broken_xml_raises_value_error():
+    with pytest.raises(ValueError):
+        _parse(b"<rss><channel><item><title>x</title></chan")
+
+
+# ── early stop ────────────────────────────────────────────────────────────────
+
+def test_stops_after_consecutive_known_entries():
+    titles = ["new 1", "new 2", "old 1", "old 2", "old 3", "old 4"]
+    data = _rss(titles)
+    known = {"old 1", "old 2", "old 3", "old 4"}
+    feed = _parse(data, size=32, is_known=known.__contains__, stop_after=2)
+    assert [e["title"] for e in feed.entries] == ["new 1", "new 2", "old 1", "old 2"]
+    assert feed.truncated
+    assert feed.bytes_read < len(data)
+
+
+def test_isolated_known_entry_does_not_stop():
+    titles = ["pinned", "new 1", "old 1", "new 2"]
+    feed = _parse(_rss(titles), is_known={"pinned", "old 1"}.__contains__, stop_after=2)
+    assert [e["title"] for e in feed.entries] == titles
+    assert not feed.truncated
@@ -0,0 +1,179 @@
+"""Unit tests for the gm_articles_fts search index (temporary SQLite file, no network)."""
+
+import asyncio
+import random
+import sqlite3
+
+import pytest
+
+import body_codec
+import news_db
+from news_db import NewsDatabase
+
+
+@pytest.fixture(params=["inline", "table", "table+file"])
+def layout(request, monkeypatch):
+    store, _, file = request.param.partition("+")
+    monkeypatch.setattr(news_db, "ARTICLE_BODY_STORE", store)
+    monkeypatch.setattr(news_db, "ARTICLE_BODIES_DB", "bodies.db" if file else "")
+    return request.param
+
+
+def _article(name, content="", **kw):
+    return {
+        "id_article": name.encode(), "id_source": "s1", "author": "",
+        "title": f"{name} headline", "description": f"{name} summary", "url": f"https://e.com/{name}",
+        "urlToImage": "", "publishedAt": "", "published_at_gmt": "2025-01-01T00:00:00+00:00",
+        "content": content, "inserted_at_ms": 1000, "title_hash": f"h-{name}", **kw,
+    }
+
+
+def _with_db(path, fn):
+    async def main():
+        db = await NewsDatabase.open(path)
+        try:
+            return await fn(db)
+        finally:
+            await db.close()
+
+    return asyncio.run(main())
+
+
+async def _hits(db, query):
+    ids = (r["id_article"] for r in await db.search_articles(query, limit=10))
+    return sorted(i.decode() if isinstance(i, bytes) else i for i in ids)
+
+
+def _integrity(path):
+    """FTS5 integrity-check, including the comparison against the stored content."""
+    with sqlite3.connect(path) as conn:
+        conn.execute(
+            "INSERT INTO gm_articles_fts (gm_articles_fts, rank) VALUES ('integrity-check', 1)"
+        )
+
+
+def test_bodies_are_indexed_and_survive_rebuild(news_db_path, layout):
+    async def fn(db):
+        await db.insert_articles_bulk([
+            _article("alpha", "zebra crossing"), _article("beta", ""),
+        ])
+        await db.save_enriched_article(
+            b"beta", author=None, description=None, content="giraffe neck",
+            url_to_image=None, is_enriched=1,
+        )
+        await db.save_translation(b"alpha", {
+            "is_translated": 1, "translated_title": "alfa manchete",
+            "translated_content": "faixa de pedestres",
+        })
+        found = [await _hits(db, q) for q in ("zebra", "giraffe", "pedestres", "manchete")]
+        await db.rebuild_search_index()
+        rebuilt = [await _hits(db, q) for q in ("zebra", "giraffe", "pedestres", "manchete")]
+        return found, rebuilt
+
+    found, rebuilt = _with_db(news_db_path, fn)
+    assert found == [["alpha"], ["beta"], ["alpha"], ["alpha"]]
+    assert rebuilt == found
+    _integrity(news_db_path)
+    with sqlite3.connect(news_db_path) as conn:     # FTS5's own 'rebuild' command
+        conn.execute("INSERT INTO gm_articles_fts (gm_articles_fts) VALUES ('rebuild')")
+    assert _with_db(news_db_path, lambda db: _hits(db, "giraffe")) == ["beta"]
+
+
+def test_body_update_replaces_indexed_text(news_db_path, layout):
+    async def fn(db):
+        await db.insert_articles_bulk([_article("alpha", "first draft")])
+        await db.save_enriched_article(
+            b"alpha", author=None, description=None, content="final copy",
+            url_to_image=None, is_enriched=1,
+        )
+        return await _hits(db, "draft"), await _hits(db, "final")
+
+    assert _with_db(news_db_path, fn) == ([], ["alpha"])
+    _integrity(news_db_path)
+
+
+def test_other_writers_keep_index_in_step(news_db_path, layout):
+    _with_db(news_db_path, lambda db: db.insert_articles_bulk([_article("alpha", "zebra")]))
+    # Another process: plain sqlite3, no service functions or TEMP triggers
+    with sqlite3.connect(news_db_path) as conn:
+        conn.execute(
+            "INSERT INTO gm_articles (id_article, title, description, content, inserted_at_ms) "
+            "VALUES ('gamma', 'okapi sighting', '', 'forest', 1000)"
+        )
+        conn.execute("UPDATE gm_articles SET title = 'tapir sighting' WHERE id_article = ?",
+                     (b"alpha",))
+    _integrity(news_db_path)
+
+    async def fn(db):
+        return [await _hits(db, q) for q in ("okapi", "forest", "tapir", "zebra", "headline")]
+
+    assert _with_db(news_db_path, fn) == [["gamma"], ["gamma"], ["alpha"], ["alpha"], []]
+    with sqlite3.connect(news_db_path) as conn:
+        conn.execute("DELETE FROM gm_articles WHERE id_article = 'gamma'")
+        left = conn.execute("SELECT COUNT(*) FROM gm_articles_fts").fetchone()[0]
+    assert left == 1
+
+
+def test_external_content_index_is_replaced(news_db_path, monkeypatch):
+    monkeypatch.setattr(news_db, "ARTICLE_BODY_STORE", "table")
+    monkeypatch.setattr(news_db, "ARTICLE_BODIES_DB", "")
+    cols = ", ".join(c for c, _ in news_db._SEARCH_COLUMNS)
+    with sqlite3.connect(news_db_path) as conn:
+        conn.execute(
+            f"CREATE VIRTUAL TABLE gm_articles_fts USING fts5({cols}, "
+            f"content='gm_articles', content_rowid='rowid')"
+        )
+        conn.execute("CREATE TABLE gm_article_bodies "
+                     "(id_article TEXT PRIMARY KEY, content TEXT, translated_content TEXT)")
+        conn.execute("INSERT INTO gm_articles (id_article, title, inserted_at_ms) "
+                     "VALUES ('old', 'legacy row', 1)")
+        conn.execute("INSERT INTO gm_article_bodies VALUES ('old', 'wombat burrow', NULL)")
+
+    assert _with_db(news_db_path, lambda db: _hits(db, "wombat")) == ["old"]
+    with sqlite3.connect(news_db_path) as conn:
+        sql = conn.execute(
+            "SELECT sql FROM sqlite_master WHERE name = 'gm_articles_fts'"
+        ).fetchone()[0]
+    assert "content=" not in sql
+    _integrity(news_db_path)
+
+
+def test_compressed_bodies_are_indexed_as_text(news_db_path, tmp_path, monkeypatch):
+    pytest.importorskip("zstandard")
+    monkeypatch.setattr(news_db, "ARTICLE_BODY_STORE", "table")
+    monkeypatch.setattr(news_db, "ARTICLE_BODIES_DB", "bodies.db")
+    monkeypatch.setattr(body_codec, "BODY_CODEC", "zstd")
+    rnd = random.Random(5)
+    words = "market election climate football science court energy price".split()
+    text = lambda: " ".join(rnd.choice(words) for _ in range(80))
+    dict_id, data = body_codec.train_dictionary([text() for _ in range(300)], size=8192)
+    with sqlite3.connect(str(tmp_path / "bodies.db")) as conn:
+        conn.execute("CREATE TABLE gm_body_dicts (dict_id INTEGER PRIMARY KEY, "
+                     "created_ms INTEGER NOT NULL, samples INTEGER NOT NULL, data BLOB NOT NULL)")
+        conn.execute("INSERT INTO gm_body_dicts VALUES (?, 0, 300, ?)", (dict_id, data))
+
+    async def fn(db):
+        await db.insert_articles_bulk([
+            _article("alpha", text() + " aardvark"), _article("beta", text()),
+        ])
+        await db.save_translation(b"beta", {"is_translated": 1,
+                                            "translated_content": text() + " tamanduá"})
+        found = [await _hits(db, q) for q in ("aardvark", "tamandua")]
+        await db.rebuild_search_index()
+        return found, [await _hits(db, q) for q in ("aardvark", "tamandua")]
+
+    found, rebuilt = _with_db(news_db_path, fn)
+    assert found == rebuilt == [["alpha"], ["beta"]]
+    with sqlite3.connect(str(tmp_path / "bodies.db")) as conn:
+        kinds = {r[0] for r in conn.execute(
+            "SELECT typeof(content) FROM gm_article_bodies UNION "
+            "SELECT typeof(translated_content) FROM gm_article_bodies WHERE translated_content IS NOT NULL"
+        )}
+    assert kinds == {"blob"}
+    # Any plain connection can search and check the index — no SQL function needed
+    with sqlite3.connect(news_db_path) as conn:
+        hits = conn.execute(
+            "SELECT rowid FROM gm_articles_fts WHERE gm_articles_fts MATCH 'aardvark'"
+        ).fetchall()
+    assert len(hits) == 1
+    _integrity(news_db_path)
@@ -0,0 +1,134 @@
+"""Unit tests for the trigger-maintained gm_source_stats counters (temporary SQLite file, no network)."""
+
+import asyncio
+import sqlite3
+
+import pytest
+
+import news_db
+from news_db import NewsDatabase
+
+EXPECTED = """
+    SELECT id_source, COUNT(*), SUM(is_enriched = 1), SUM(is_translated = 1),
+           MAX(inserted_at_ms), MAX(published_at_gmt)
+    FROM gm_articles
+    WHERE id_source IS NOT NULL
+    GROUP BY id_source
+"""
+
+
+@pytest.fixture(params=["inline", "table"])
+def layout(request, monkeypatch):
+    monkeypatch.setattr(news_db, "ARTICLE_BODY_STORE", request.param)
+    monkeypatch.setattr(news_db, "ARTICLE_BODIES_DB", "")
+    return request.param
+
+
+def _article(name, source, ms, **kw):
+    return {
+        "id_article": name.encode(), "id_source": source, "author": "",
+        "title": f"{name} headline", "description": "", "url": f"https://e.com/{name}",
+        "urlToImage": "", "publishedAt": "", "published_at_gmt": f"2025-01-0{ms // 1000}T00:00:00+00:00",
+        "content": f"{name} body", "inserted_at_ms": ms, "title_hash": f"h-{name}", **kw,
+    }
+
+
+def _with_db(path, fn):
+    async def main():
+        db = await NewsDatabase.open(path)
+        try:
+            return await fn(db)
+        finally:
+            await db.close()
+            NewsDatabase._instance = None
+
+    return asyncio.run(main())
+
+
+def _stats(path):
+    with sqlite3.connect(path) as conn:
+        kept = conn.execute(
+            "SELECT id_source, article_count, enriched_count, translated_count, "
+            "last_inserted_ms, last_published_gmt "
+            "FROM gm_source_stats WHERE article_count > 0 ORDER BY id_source"
+        ).fetchall()
+        expected = sorted(conn.execute(EXPECTED).fetchall())
+    return kept, expected
+
+
+def test_counters_follow_every_writer(news_db_path, layout):
+    async def fn(db):
+        await db.insert_articles_bulk([
+            _article("a1", "s1", 1000), _article("a2", "s1", 2000),
+            _article("b1", "s2", 3000), _article("b2", "s2", 4000),
+            _article("n1", None, 5000),
+        ])
+        for name in ("a1", "a2", "b1"):
+            await db.save_enriched_article(
+                name.encode(), author=None, description=None, content=f"{name} full",
+                url_to_image=None, is_enriched=1,
+            )
+        await db.save_enrichment_failure(b"a2", has_content=False)      # un-enrich: 1 → -1
+        await db.mark_enrich_attempt_failed(b"b1", current_try=2)       # 1 → -1
+        await db.save_enriched_article(                                 # -1 → 1
+            b"b1", author=None, description=None, content="b1 again",
+            url_to_image=None, is_enriched=1,
+        )
+        await db.save_translation(b"a1", {"is_translated": 1, "translated_title": "t"})
+        await db.save_translation(b"b2", {"is_translated": 1, "translated_title": "t"})
+        await db.save_translation(b"b2", {"is_translated": 1, "translated_title": "t2"})
+
+    _with_db(news_db_path, fn)
+    kept, expected = _stats(news_db_path)
+    assert kept == expected
+    assert [r[:4] for r in kept] == [("s1", 2, 1, 1), ("s2", 2, 1, 1)]
+
+    # Another process: plain sqlite3, same triggers
+    with sqlite3.connect(news_db_path) as conn:
+        conn.execute("UPDATE gm_articles SET is_enriched = 1 WHERE id_article = ?", (b"b2",))
+        conn.execute("UPDATE gm_articles SET is_translated = 0 WHERE id_article = ?", (b"a1",))
+        conn.execute("DELETE FROM gm_articles WHERE id_article = ?", (b"b1",))
+        conn.execute("INSERT INTO gm_articles (id_article, id_source, title, is_enriched, "
+                     "is_translated, inserted_at_ms, title_hash) "
+                     "VALUES ('c1', 's3', 'c', 1, 1, 6000, 'h-c1')")
+    kept, expected = _stats(news_db_path)
+    assert [r[:4] for r in kept] == [r[:4] for r in expected] == [
+        ("s1", 2, 1, 0), ("s2", 1, 1, 1), ("s3", 1, 1, 1),
+    ]
+
+    with sqlite3.connect(news_db_path) as conn:
+        conn.execute("DELETE FROM gm_articles WHERE id_source = 's1'")
+        left = conn.execute(
+            "SELECT article_count, enriched_count, translated_count "
+            "FROM gm_source_stats WHERE id_source = 's1'"
+        ).fetchone()
+    assert left == (0, 0, 0)
+
+
+def test_backfill_of_existing_rows(news_db_path):
+    rows = [
+        ("a1", "s1", 1, 1, 1000, "2025-01-01T00:00:00+00:00"),
+        ("a2", "s1", -1, 0, 3000, "2025-01-03T00:00:00+00:00"),
+        ("a3", "s1", 0, -1, 2000, "2025-01-05T00:00:00+00:00"),
+        ("b1", "s2", 1, 0, 4000, None),
+        ("n1", None, 1, 1, 5000, None),
+    ]
+    with sqlite3.connect(news_db_path) as conn:
+        conn.executemany(
+            "INSERT INTO gm_articles (id_article, id_source, title, is_enriched, is_translated, "
+            "inserted_at_ms, published_at_gmt, title_hash) VALUES (?, ?, 't', ?, ?, ?, ?, ?)",
+            [r + (f"h-{r[0]}",) for r in rows],
+        )
+
+    _with_db(news_db_path, lambda db: db.ping())
+    kept, expected = _stats(news_db_path)
+    assert kept == expected == [
+        ("s1", 3, 1, 1, 3000, "2025-01-05T00:00:00+00:00"),
+        ("s2", 1, 1, 0, 4000, None),
+    ]
+
+    # A second start must not back-fill again on top of the trigger counts
+    _with_db(news_db_path, lambda db: db.insert_articles_bulk([_article("a4", "s1", 6000)]))
+    kept, expected = _stats(news_db_path)
+    assert kept == expected
+    assert kept[0][:2] == ("s1", 4)
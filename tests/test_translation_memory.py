@@ -0,0 +1,83 @@
+"""Unit tests for translation_memory.TranslationMemory (temporary SQLite file, no network)."""
+
+import asyncio
+
+from translation_memory import TranslationMemory
+
+
+def _tm(tmp_path, lru_size=100):
+    return TranslationMemory(db_path=str(tmp_path / "tm.db"), lru_size=lru_size)
+
+
+def test_lru_hit_and_miss(tmp_path):
+    async def main():
+        tm = _tm(tmp_path)
+        await tm.store_many([("Olá mundo", "Hello world")], "pt", "en", "google", 40)
+        hits = await tm.lookup_many(["Olá   mundo", "Outra coisa"], "pt", "en", "google")
+        other_pair = await tm.lookup_many(["Olá mundo"], "pt", "es", "google")
+        return hits, other_pair, tm.to_dict()
+
+    hits, other_pair, stats = asyncio.run(main())
+    assert hits == ["Hello world", None]       # whitespace-normalised key
+    assert other_pair == [None]                # target language is part of the key
+    assert stats["hits_lru"] == 1 and stats["hits_db"] == 0 and stats["misses"] == 2
+    assert stats["saved_ms"] == 40
+
+
+def test_lru_evicts_oldest_and_falls_back_to_sqlite(tmp_path):
+    async def main():
+        tm = _tm(tmp_path, lru_size=2)
+        for i in range(3):
+            await tm.store_many([(f"texto {i}", f"text {i}")], "pt", "en", "nllb", 0)
+        assert tm.to_dict()["lru_size"] == 2
+        first = await tm.lookup_many(["texto 0"], "pt", "en", "nllb")
+        return first, tm.to_dict()
+
+    first, stats = asyncio.run(main())
+    assert first == ["text 0"]
+    assert stats["hits_db"] == 1 and stats["hits_lru"] == 0
+
+
+def test_entries_survive_restart(tmp_path):
+    async def store():
+        await _tm(tmp_path).store_many([("Bonjour", "Hello")], "fr", "en", "google", 10)
+
+    async def lookup():
+        tm = _tm(tmp_path)
+        found = await tm.lookup_many(["Bonjour", "Bonsoir"], "fr", "en", "google")
+        again = await tm.lookup_many(["Bonjour"], "fr", "en", "google")
+        return found, again, tm.to_dict()
+
+    asyncio.run(store())
+    found, again, stats = asyncio.run(lookup())
+    assert found == ["Hello", None] and again == ["Hello"]
+    assert stats["hits_db"] == 1 and stats["hits_lru"] == 1 and stats["misses"] == 1
+
+
+def test_backend_is_part_of_the_key_unless_unpinned(tmp_path):
+    async def main():
+        tm = _tm(tmp_path)
+        await tm.store_many([("Hola", "Hello")], "es", "en", "google", 0)
+        await tm.store_many([("Adiós", "Goodbye")], "es", "en", "nllb", 0)
+        pinned = await tm.lookup_many(["Hola", "Adiós"], "es", "en", "nllb")
+        either = await tm.lookup_many(["Hola", "Adiós", "Gracias"], "es", "en", None)
+        cold = _tm(tmp_path)                    # unpinned lookup served from SQLite
+        from_db = await cold.lookup_many(["Hola", "Adiós"], "es", "en", None)
+        return pinned, either, from_db, cold.to_dict()
+
+    pinned, either, from_db, cold = asyncio.run(main())
+    assert pinned == [None, "Goodbye"]
+    assert either == ["Hello", "Goodbye", None]
+    assert from_db == ["Hello", "Goodbye"]
+    assert cold["hits_db"] == 2 and cold["misses"] == 0
+
+
+def test_disabled_memory_never_hits(tmp_path):
+    async def main():
+        tm = _tm(tmp_path)
+        tm.configure(enabled=False, db_path=tm.db_path, lru_size=10)
+        await tm.store_many([("Ciao", "Hi")], "it", "en", "google", 0)
+        return await tm.lookup_many(["Ciao"], "it", "en", "google")
+
+    assert asyncio.run(main()) == [None]
+    assert not (tmp_path / "tm.db").exists()
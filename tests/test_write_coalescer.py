@@ -0,0 +1,206 @@
+"""Unit tests for news_db.WriteCoalescer (temporary SQLite file, no network)."""
+
+import asyncio
+import sqlite3
+
+import aiosqlite
+
+from news_db import WriteCoalescer
+
+
+def _run(coro):
+    return asyncio.run(coro)
+
+
+async def _open(path):
+    conn = await aiosqlite.connect(str(path))
+    await conn.execute("CREATE TABLE t (k TEXT PRIMARY KEY, v INTEGER)")
+    await conn.commit()
+    return conn
+
+
+def _rows(path):
+    with sqlite3.connect(str(path)) as conn:
+        return dict(conn.execute("SELECT k, v FROM t").fetchall())
+
+
+def test_group_commit_single_transaction(tmp_path):
+    async def main():
+        conn = await _open(tmp_path / "db.sqlite")
+        writer = WriteCoalescer(lambda: conn, max_ops=100, max_delay_ms=50)
+        counts = await asyncio.gather(*(
+            writer.execute("INSERT INTO t VALUES (?, ?)", (f"k{i}", i)) for i in range(20)
+        ))
+        stats = writer.to_dict()
+        await writer.stop()
+        await conn.close()
+        return counts, stats
+
+    counts, stats = _run(main())
+    assert counts == [1] * 20
+    assert stats["commits"] == 1 and stats["max_batch"] == 20
+    assert len(_rows(tmp_path / "db.sqlite")) == 20
+
+
+def test_max_ops_splits_groups(tmp_path):
+    async def main():
+        conn = await _open(tmp_path / "db.sqlite")
+        writer = WriteCoalescer(lambda: conn, max_ops=5, max_delay_ms=1000)
+        await asyncio.gather(*(
+            writer.execute("INSERT INTO t VALUES (?, ?)", (f"k{i}", i)) for i in range(12)
+        ))
+        stats = writer.to_dict()
+        await writer.stop()
+        await conn.close()
+        return stats
+
+    stats = _run(main())
+    assert stats["commits"] == 3 and stats["max_batch"] == 5
+
+
+def test_run_returns_result_and_executemany_rowcount(tmp_path):
+    async def main():
+        conn = await _open(tmp_path / "db.sqlite")
+        writer = WriteCoalescer(lambda: conn)
+        many = await writer.execute(
+            "INSERT INTO t VALUES (?, ?)", [("a", 1), ("b", 2)], many=True
+        )
+
+        async def _bump(c):
+            await c.execute("UPDATE t SET v = v + 10 WHERE k = 'a'")
+            async with c.execute("SELECT v FROM t WHERE k = 'a'") as cur:
+                return (await cur.fetchone())[0]
+
+        value = await writer.run(_bump)
+        await writer.stop()
+        await conn.close()
+        return many, value
+
+    assert _run(main()) == (2, 11)
+    assert _rows(tmp_path / "db.sqlite") == {"a": 11, "b": 2}
+
+
+def test_failed_op_is_rolled_back_alone(tmp_path):
+    async def main():
+        conn = await _open(tmp_path / "db.sqlite")
+        writer = WriteCoalescer(lambda: conn, max_delay_ms=50)
+
+        async def _half_then_fail(c):
+            await c.execute("INSERT INTO t VALUES ('half', 1)")
+            raise RuntimeError("boom")
+
+        results = await asyncio.gather(
+            writer.execute("INSERT INTO t VALUES ('before', 1)"),
+            writer.run(_half_then_fail),
+            writer.execute("INSERT INTO t VALUES ('before', 2)"),   # PK conflict
+            writer.execute("INSERT INTO t VALUES ('after', 3)"),
+            return_exceptions=True,
+        )
+        stats = writer.to_dict()
+        await writer.stop()
+        await conn.close()
+        return results, stats
+
+    results, stats = _run(main())
+    assert results[0] == 1 and results[3] == 1
+    assert isinstance(results[1], RuntimeError)
+    assert isinstance(results[2], sqlite3.IntegrityError)
+    assert stats["commits"] == 1 and stats["op_errors"] == 2
+    assert _rows(tmp_path / "db.sqlite") == {"before": 1, "after": 3}
+
+
+def test_stop_drains_queue(tmp_path):
+    async def main():
+        conn = await _open(tmp_path / "db.sqlite")
+        writer = WriteCoalescer(lambda: conn, max_delay_ms=10_000)
+        pending = [
+            asyncio.ensure_future(writer.execute("INSERT INTO t VALUES (?, ?)", (f"k{i}", i)))
+            for i in range(5)
+        ]
+        await asyncio.sleep(0.05)           # flusher is waiting out the group window
+        await writer.stop()
+        results = await asyncio.wait_for(asyncio.gather(*pending), timeout=5)
+        await conn.close()
+        return results
+
+    assert _run(main()) == [1] * 5
+    assert len(_rows(tmp_path / "db.sqlite")) == 5
+
+
+def test_stop_during_flush_resolves_in_flight_group(tmp_path):
+    async def main():
+        conn = await _open(tmp_path / "db.sqlite")
+        writer = WriteCoalescer(lambda: conn, max_delay_ms=0)
+        entered = asyncio.Event()
+
+        async def _slow(c):
+            entered.set()
+            await asyncio.sleep(0.2)
+            await c.execute("INSERT INTO t VALUES ('slow', 1)")
+            return "done"
+
+        slow = asyncio.ensure_future(writer.run(_slow))
+        await entered.wait()                # group is being applied
+        queued = asyncio.ensure_future(writer.execute("INSERT INTO t VALUES ('queued', 2)"))
+        await asyncio.sleep(0)
+        await writer.stop()
+        results = await asyncio.wait_for(asyncio.gather(slow, queued), timeout=5)
+        in_tx = conn.in_transaction
+        await conn.close()
+        return results, in_tx
+
+    results, in_tx = _run(main())
+    assert results == ["done", 1]
+    assert not in_tx
+    assert _rows(tmp_path / "db.sqlite") == {"slow": 1, "queued": 2}
+
+
+def test_cancelled_flusher_still_finishes_group(tmp_path):
+    async def main():
+        conn = await _open(tmp_path / "db.sqlite")
+        writer = WriteCoalescer(lambda: conn, max_delay_ms=0)
+        entered = asyncio.Event()
+
+        async def _slow(c):
+            entered.set()
+            await asyncio.sleep(0.1)
+            await c.execute("INSERT INTO t VALUES ('slow', 1)")
+            return "done"
+
+        slow = asyncio.ensure_future(writer.run(_slow))
+        await entered.wait()
+        writer._task.cancel()               # e.g. loop shutdown cancelling all tasks
+        result = await asyncio.wait_for(slow, timeout=5)
+        await writer.stop()
+        await conn.close()
+        return result
+
+    assert _run(main()) == "done"
+    assert _rows(tmp_path / "db.sqlite") == {"slow": 1}
+
+
+def test_failed_commit_fails_whole_group(tmp_path):
+    async def main():
+        conn = await _open(tmp_path / "db.sqlite")
+        writer = WriteCoalescer(lambda: conn, max_delay_ms=20)
+
+        async def _broken(c):
+            # A statement error that aborts the transaction makes the
+            # savepoint rollback impossible — the group must fail as a whole
+            await c.execute("ROLLBACK")
+            raise RuntimeError("transaction lost")
+
+        results = await asyncio.gather(
+            writer.execute("INSERT INTO t VALUES ('a', 1)"),
+            writer.run(_broken),
+            return_exceptions=True,
+        )
+        stats = writer.to_dict()
+        await writer.stop()
+        await conn.close()
+        return results, stats
+
+    results, stats = _run(main())
+    assert all(isinstance(r, Exception) for r in results)
+    assert stats["commit_errors"] == 1
+    assert _rows(tmp_path / "db.sqlite") == {}
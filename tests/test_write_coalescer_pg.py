@@ -0,0 +1,151 @@
+"""Unit tests for news_db_pg.WriteCoalescer (mocked asyncpg connection, no server)."""
+
+import asyncio
+import contextlib
+
+import pytest
+
+pytest.importorskip("asyncpg")
+
+from news_db_pg import WriteCoalescer
+
+
+class _Tx:
+    """asyncpg-style transaction: the outermost one commits, nested ones are savepoints."""
+
+    def __init__(self, conn):
+        self.conn = conn
+
+    async def __aenter__(self):
+        self.conn.pending.append([])
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        writes = self.conn.pending.pop()
+        if exc_type is not None:          # includes CancelledError: rolled back
+            return False
+        if self.conn.pending:
+            self.conn.pending[-1].extend(writes)
+        else:
+            self.conn.committed.extend(writes)
+            self.conn.commits += 1
+        return False
+
+
+class _Conn:
+    def __init__(self):
+        self.pending: list[list] = []
+        self.committed: list = []
+        self.commits = 0
+
+    def transaction(self):
+        return _Tx(self)
+
+    async def execute(self, sql, *params):
+        if "fail" in sql:
+            raise RuntimeError("statement failed")
+        self.pending[-1].append((sql, params))
+        return "INSERT 0 1"
+
+    async def executemany(self, sql, rows):
+        self.pending[-1].extend((sql, tuple(r)) for r in rows)
+
+
+def _writer(conn, **kw):
+    @contextlib.asynccontextmanager
+    async def acquire():
+        yield conn
+
+    return WriteCoalescer(acquire, **kw)
+
+
+def test_group_commit_single_transaction():
+    async def main():
+        conn = _Conn()
+        writer = _writer(conn, max_ops=100, max_delay_ms=50)
+        counts = await asyncio.gather(*(
+            writer.execute("INSERT INTO t VALUES ($1)", (i,)) for i in range(10)
+        ))
+        await writer.stop()
+        return counts, conn
+
+    counts, conn = asyncio.run(main())
+    assert counts == [1] * 10
+    assert conn.commits == 1 and len(conn.committed) == 10
+
+
+def test_failed_op_is_rolled_back_alone():
+    async def main():
+        conn = _Conn()
+        writer = _writer(conn, max_delay_ms=50)
+
+        async def _half_then_fail(c):
+            await c.execute("INSERT INTO t VALUES ($1)", "half")
+            raise RuntimeError("boom")
+
+        results = await asyncio.gather(
+            writer.execute("INSERT INTO t VALUES ($1)", ("a",)),
+            writer.run(_half_then_fail),
+            writer.execute("fail"),
+            writer.execute("INSERT INTO t VALUES ($1)", ("b",)),
+            return_exceptions=True,
+        )
+        stats = writer.to_dict()
+        await writer.stop()
+        return results, stats, conn
+
+    results, stats, conn = asyncio.run(main())
+    assert results[0] == 1 and results[3] == 1
+    assert all(isinstance(r, RuntimeError) for r in results[1:3])
+    assert stats["commits"] == 1 and stats["op_errors"] == 2
+    assert [p for _, p in conn.committed] == [("a",), ("b",)]
+
+
+def test_stop_during_flush_resolves_in_flight_group():
+    async def main():
+        conn = _Conn()
+        writer = _writer(conn, max_delay_ms=0)
+        entered = asyncio.Event()
+
+        async def _slow(c):
+            entered.set()
+            await asyncio.sleep(0.2)
+            await c.execute("INSERT INTO t VALUES ($1)", "slow")
+            return "done"
+
+        slow = asyncio.ensure_future(writer.run(_slow))
+        await entered.wait()                # group is being applied
+        queued = asyncio.ensure_future(writer.execute("INSERT INTO t VALUES ($1)", ("queued",)))
+        await asyncio.sleep(0)
+        await writer.stop()
+        results = await asyncio.wait_for(asyncio.gather(slow, queued), timeout=5)
+        return results, conn
+
+    results, conn = asyncio.run(main())
+    assert results == ["done", 1]
+    assert not conn.pending
+    assert [p for _, p in conn.committed] == [("slow",), ("queued",)]
+
+
+def test_cancelled_flusher_still_finishes_group():
+    async def main():
+        conn = _Conn()
+        writer = _writer(conn, max_delay_ms=0)
+        entered = asyncio.Event()
+
+        async def _slow(c):
+            entered.set()
+            await asyncio.sleep(0.1)
+            await c.execute("INSERT INTO t VALUES ($1)", "slow")
+            return "done"
+
+        slow = asyncio.ensure_future(writer.run(_slow))
+        await entered.wait()
+        writer._task.cancel()               # e.g. loop shutdown cancelling all tasks
+        result = await asyncio.wait_for(slow, timeout=5)
+        await writer.stop()
+        return result, conn
+
+    result, conn = asyncio.run(main())
+    assert result == "done"
+    assert conn.commits == 1 and [p for _, p in conn.committed] == [("slow",)]
@@ -6,9 +6,14 @@ Text processing utilities shared across translation modules.
 
 import re
 
-# Maximum characters sent per NLLB request (tokenizer truncates at 512 tokens anyway).
+# Maximum characters google_translate.py sends per request (legacy one-shot helper).
 MAX_TRANSLATE_CHARS = 4500
 
+# Maximum characters sent per NLLB request.  nllb_worker splits longer text
+# into sentence segments, so this only bounds the inference time per field;
+# the request timeout grows with the segment count (NLLB_TIMEOUT_PER_SEGMENT).
+NLLB_MAX_CHARS = 20000
+
 # Safe limit per Google Translate request (free API cap is 5000 chars).
 GOOGLE_MAX_CHARS = 4900
 
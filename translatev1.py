@@ -21,8 +21,9 @@ import uuid
 
 import google_worker
 import nllb_worker
+from translation_memory import memory as _tm
 from lang_rules import AUTO_FALLBACK_TARGET, _load_language_rules, get_language_rules
-from text_utils import GOOGLE_MAX_CHARS, MAX_TRANSLATE_CHARS, _strip_html
+from text_utils import GOOGLE_MAX_CHARS, NLLB_MAX_CHARS, _strip_html
 
 logger = logging.getLogger(__name__)
 
@@ -44,18 +45,29 @@ class _ProcessTranslator:
     (start / shutdown), and the calling interface (translate_sync /
     translate_async) are provided here so both backends are identical.
 
+    ``pool_size`` workers share one request queue (same as ``_ProcessFetcher``):
+    whichever worker is idle takes the next request.
+
     Protocol
     --------
     request:  ``(req_id: str, text: str, src_code: str, tgt_code: str)``
-            | ``None``  ← shutdown sentinel
-    response: ``(req_id: str, translated_str_or_None)``
+            | ``None``  ← shutdown sentinel (one per worker)
+    response: ``(req_id: str, translated_str_or_None[, meta: dict])``
+              — optional ``meta`` (``worker``, ``pid``, ``ms``, ``tokens``)
+              feeds ``pool_stats()``.
+    claim:    ``(None, None, {"event": "claim", "worker", "req_ids"})`` —
+              the requests a worker is running; failed at once (``None``)
+              when ``_check_pool()`` finds that worker dead.
     """
 
     _PROCESS_NAME = "translator"
     _PUMP_NAME    = "translator-pump"
 
-    def __init__(self) -> None:
-        self._process: multiprocessing.Process | None = None
+    def __init__(self, pool_size: int = 1) -> None:
+        self._pool_size = pool_size
+        self._processes: list[multiprocessing.Process] = []
+        self._worker_stats: dict[int, dict] = {}
+        self._claims: dict[int, set[str]] = {}       # worker id → req_ids in flight
         self._req_q:   "multiprocessing.Queue[tuple | None]" | None = None
         self._resp_q:  "multiprocessing.Queue[tuple]" | None = None
         self._async_pending: dict[str, "asyncio.Future[str | None]"] = {}
@@ -74,6 +86,10 @@ class _ProcessTranslator:
     ) -> multiprocessing.Process:
         raise NotImplementedError
 
+    def _make_processes(self, ctx, req_q, resp_q) -> list[multiprocessing.Process]:
+        """One process per pool slot; override when a process hosts several workers."""
+        return [self._make_process(ctx, req_q, resp_q) for _ in range(self._pool_size)]
+
     # ── lifecycle ─────────────────────────────────────────────────────────────
 
     def start(self) -> None:
@@ -89,8 +105,9 @@ class _ProcessTranslator:
             ctx = multiprocessing.get_context("spawn")
             self._req_q  = ctx.Queue()
             self._resp_q = ctx.Queue()
-            self._process = self._make_process(ctx, self._req_q, self._resp_q)
-            self._process.start()
+            self._processes = self._make_processes(ctx, self._req_q, self._resp_q)
+            for p in self._processes:
+                p.start()
             try:
                 self._loop = asyncio.get_event_loop()
             except RuntimeError:
@@ -114,14 +131,17 @@ class _ProcessTranslator:
             logger     = logging.getLogger(__name__),
             warn_after = 60.0,
         )
+        next_check = _time.monotonic() + 1.0
         while not self._shutdown.is_set():
+            if _time.monotonic() >= next_check:
+                self._check_pool()
+                next_check = _time.monotonic() + 1.0
             try:
                 item = self._resp_q.get(timeout=0.5)
             except Exception:
                 with self._lock:
                     n_pending = len(self._async_pending) + len(self._sync_pending)
-                alive    = self._process.is_alive()  if self._process else None
-                exitcode = self._process.exitcode    if self._process else None
+                alive, exitcode = self._process_state()
                 probe.check(
                     pending           = n_pending,
                     subprocess_alive  = alive,
@@ -129,17 +149,53 @@ class _ProcessTranslator:
                 )
                 continue
             probe.reset()
-            req_id, result = item
+            req_id, result = item[0], item[1]
+            meta = item[2] if len(item) > 2 else None
+            if req_id is None:
+                if meta and meta.get("event") == "claim":
+                    with self._lock:
+                        self._claims[meta.get("worker", 0)] = set(meta.get("req_ids") or ())
+                continue
+            if meta:
+                self._record_worker(meta, result)
+                with self._lock:
+                    self._claims.get(meta.get("worker", 0), set()).discard(req_id)
+            self._resolve(req_id, result)
+
+    def _resolve(self, req_id: str, result) -> None:
+        """Hand *result* to whoever waits for *req_id* (no-op if nobody does)."""
+        with self._lock:
+            fut       = self._async_pending.pop(req_id, None)
+            sync_slot = self._sync_pending.get(req_id)
+        if fut is not None and self._loop is not None:
+            self._loop.call_soon_threadsafe(
+                lambda f=fut, r=result: f.set_result(r) if not f.done() else None
+            )
+        elif sync_slot is not None:
+            sync_slot[1] = result
+            sync_slot[0].set()
+
+    def _fail_claims(self, worker_id: int, reason: str) -> None:
+        """Fail the requests *worker_id* was running (None → retried later)."""
+        with self._lock:
+            req_ids = self._claims.pop(worker_id, set())
+            req_ids &= set(self._async_pending) | set(self._sync_pending)
+        if req_ids:
+            logging.getLogger(__name__).warning(
+                "%s worker %d %s — failing %d in-flight request(s)",
+                self.__class__.__name__, worker_id, reason, len(req_ids),
+            )
+        for req_id in req_ids:
+            self._resolve(req_id, None)
+
+    def _check_pool(self) -> None:
+        """Pump thread, about once a second: fail requests held by dead workers."""
+        alive, exitcode = _ProcessTranslator._process_state(self)
+        if alive is False:
             with self._lock:
-                fut       = self._async_pending.pop(req_id, None)
-                sync_slot = self._sync_pending.get(req_id)
-            if fut is not None and self._loop is not None:
-                self._loop.call_soon_threadsafe(
-                    lambda f=fut, r=result: f.set_result(r) if not f.done() else None
-                )
-            elif sync_slot is not None:
-                sync_slot[1] = result
-                sync_slot[0].set()
+                workers = list(self._claims)
+            for wid in workers:
+                self._fail_claims(wid, f"process exited (exitcode={exitcode})")
 
     def shutdown(self) -> None:
         """Gracefully stop the worker process and resolve all pending calls."""
@@ -148,14 +204,16 @@ class _ProcessTranslator:
         self._shutdown.set()
         if self._req_q is not None:
             try:
-                self._req_q.put_nowait(None)   # sentinel → triggers worker exit loop
+                # One sentinel per worker → each exits its loop
+                for _ in range(self._pool_size):
+                    self._req_q.put_nowait(None)
             except Exception:
                 pass
-        if self._process is not None:
-            self._process.join(timeout=10)
-            if self._process.is_alive():
-                self._process.terminate()
-                self._process.join(timeout=3)
+        for p in self._processes:
+            p.join(timeout=10)
+            if p.is_alive():
+                p.terminate()
+                p.join(timeout=3)
         if self._pump_thread is not None:
             self._pump_thread.join(timeout=3)
         with self._lock:
@@ -168,6 +226,67 @@ class _ProcessTranslator:
             self._async_pending.clear()
             self._sync_pending.clear()
 
+    # ── pool telemetry ────────────────────────────────────────────────────────
+
+    def _process_state(self) -> tuple[bool | None, int | None]:
+        """(all processes alive, first non-None exit code) for diagnostics."""
+        if not self._processes:
+            return None, None
+        alive    = all(p.is_alive() for p in self._processes)
+        exitcode = next((p.exitcode for p in self._processes if p.exitcode is not None), None)
+        return alive, exitcode
+
+    def _record_worker(self, meta: dict, result) -> None:
+        """Pump thread: fold one response's ``meta`` into the per-worker counters."""
+        wid = meta.get("worker", 0)
+        now = _time.monotonic()
+        with self._lock:
+            w = self._worker_stats.get(wid)
+            if w is None:
+                w = self._worker_stats[wid] = {
+                    "pid": meta.get("pid"), "requests": 0, "failed": 0,
+                    "busy_ms": 0.0, "tokens": 0, "first": now, "last": now,
+                }
+            w["pid"]       = meta.get("pid", w["pid"])
+            w["requests"] += 1
+            w["failed"]   += result is None
+            w["busy_ms"]  += meta.get("ms", 0.0)
+            w["tokens"]   += meta.get("tokens", 0)
+            w["last"]      = now
+
+    def pool_stats(self) -> dict:
+        """Per-worker throughput for ``/api/translate``."""
+        now = _time.monotonic()
+        with self._lock:
+            workers = []
+            for wid, w in sorted(self._worker_stats.items()):
+                busy_s = w["busy_ms"] / 1000
+                span_s = max(now - w["first"], 1.0)
+                workers.append({
+                    "worker":       wid,
+                    "pid":          w["pid"],
+                    "requests":     w["requests"],
+                    "failed":       w["failed"],
+                    "tokens":       w["tokens"],
+                    "tokens_per_s": round(w["tokens"] / busy_s, 1) if busy_s else 0.0,
+                    "req_per_min":  round(w["requests"] * 60 / span_s, 1),
+                    "utilisation":  round(min(busy_s / span_s, 1.0), 3),
+                    "idle_s":       round(now - w["last"], 1),
+                })
+        alive, _ = self._process_state()
+        return {
+            "pool_size": self._pool_size,
+            "alive":     alive,
+            "queued":    self._queue_depth(),
+            "workers":   workers,
+        }
+
+    def _queue_depth(self) -> int | None:
+        try:
+            return self._req_q.qsize() if self._req_q is not None else 0
+        except NotImplementedError:    # macOS
+            return None
+
     # ── translation interface ─────────────────────────────────────────────────
 
     def translate_sync(
@@ -197,6 +316,16 @@ class _ProcessTranslator:
     # the pending entry is removed, and None is returned so the article is
     # queued for a later retry rather than blocking the worker indefinitely.
     ASYNC_TIMEOUT: float = 120.0
+    # Extra seconds per segment past the first for backends that split long
+    # text (NLLB); 0 keeps the timeout flat.
+    TIMEOUT_PER_SEGMENT: float = 0.0
+
+    def _segments(self, text: str) -> int:
+        return 1
+
+    def timeout_for(self, text: str) -> float:
+        """Seconds one request for *text* may take before it is given up."""
+        return self.ASYNC_TIMEOUT + self.TIMEOUT_PER_SEGMENT * (self._segments(text) - 1)
 
     async def translate_async(
         self, text: str, src_code: str, tgt_code: str
@@ -229,19 +358,19 @@ class _ProcessTranslator:
             self._async_pending[req_id] = fut
         assert self._req_q is not None
         self._req_q.put((req_id, text, src_code, tgt_code))
+        timeout = self.timeout_for(text)
         try:
-            return await asyncio.wait_for(fut, timeout=self.ASYNC_TIMEOUT)
+            return await asyncio.wait_for(fut, timeout=timeout)
         except asyncio.TimeoutError:
             import logging as _logging
-            alive    = self._process.is_alive()  if self._process else None
-            exitcode = self._process.exitcode    if self._process else None
+            alive, exitcode = self._process_state()
             with self._lock:
                 n_pending = len(self._async_pending)
                 self._async_pending.pop(req_id, None)
             _logging.getLogger(__name__).warning(
                 "%s translate_async timed out after %.0fs "
                 "(req_id=%s, subprocess_alive=%s, exitcode=%s, pending=%d)",
-                self.__class__.__name__, self.ASYNC_TIMEOUT, req_id,
+                self.__class__.__name__, timeout, req_id,
                 alive, exitcode, n_pending,
             )
             return None
@@ -267,14 +396,72 @@ class _GoogleProcessTranslator(_ProcessTranslator):
 
 
 class _NLLBProcessTranslator(_ProcessTranslator):
-    """NLLB-200 GPU inference backend running as a subprocess."""
+    """
+    NLLB-200 inference backend (runtime per NLLB_RUNTIME).
+
+    One spawned process runs ``nllb_worker.pool()``, which hosts
+    ``NLLB_POOL_SIZE`` workers (forked after loading the weights once), so
+    the pool size is read from ``nllb_worker`` at start-up.  The forked
+    workers are not our children: their pids, death counts and the actual
+    worker count come back through a shared ``_pool_status`` array, which
+    ``_check_pool()`` watches so a dead worker's requests fail at once.
+    """
 
     _PROCESS_NAME = "nllb-gpu"
     _PUMP_NAME    = "nllb-pump"
+    TIMEOUT_PER_SEGMENT = 30.0
+
+    def __init__(self, pool_size: int = 1) -> None:
+        super().__init__(pool_size)
+        self._pool_status = None              # [workers, pid_0, deaths_0, …] (nllb_worker.pool)
+        self._seen_deaths: list[int] = []
+
+    def _segments(self, text: str) -> int:
+        return nllb_worker.estimate_segments(text)
+
+    def _make_processes(self, ctx, req_q, resp_q):
+        self._pool_size = max(1, nllb_worker.NLLB_POOL_SIZE)
+        self._pool_status = ctx.Array('l', 1 + 2 * self._pool_size)
+        self._seen_deaths = [0] * self._pool_size
+        return [self._make_process(ctx, req_q, resp_q)]
+
+    def _workers(self) -> list[tuple[int, int, int]]:
+        """``(worker id, pid or 0, deaths)`` as reported by the pool process."""
+        st = self._pool_status
+        if st is None:
+            return []
+        n = min(st[0], len(self._seen_deaths))
+        return [(w, st[1 + 2 * w], st[2 + 2 * w]) for w in range(n)]
+
+    def _check_pool(self) -> None:
+        super()._check_pool()
+        st = self._pool_status
+        if st is not None and 0 < st[0] < self._pool_size:
+            self._pool_size = st[0]           # e.g. CUDA cannot fork → one worker
+        for wid, _, deaths in self._workers():
+            if deaths != self._seen_deaths[wid]:
+                self._seen_deaths[wid] = deaths
+                self._fail_claims(wid, "died")
+
+    def _process_state(self) -> tuple[bool | None, int | None]:
+        alive, exitcode = super()._process_state()
+        workers = self._workers()
+        if alive and workers:
+            alive = all(pid for _, pid, _ in workers)
+        return alive, exitcode
+
+    def pool_stats(self) -> dict:
+        stats = super().pool_stats()
+        workers = {wid: (pid, deaths) for wid, pid, deaths in self._workers()}
+        for w in stats["workers"]:
+            if w["worker"] in workers:
+                w["alive"] = bool(workers[w["worker"]][0])
+        stats["restarts"] = sum(deaths for _, deaths in workers.values())
+        return stats
 
     def _make_process(self, ctx, req_q, resp_q):
         return ctx.Process(
-            target=nllb_worker.worker,
+            target=nllb_worker.pool,
             args=(
                 req_q, resp_q,
                 nllb_worker.NLLB_MODEL_ID,
@@ -282,6 +469,13 @@ class _NLLBProcessTranslator(_ProcessTranslator):
                 dict(nllb_worker.NLLB_TARGET_MAP),
                 nllb_worker.NLLB_BATCH_SIZE,
                 nllb_worker.NLLB_NUM_BEAMS,
+                nllb_worker.NLLB_TOKEN_BUDGET,
+                nllb_worker.NLLB_SEGMENT_TOKENS,
+                nllb_worker.NLLB_RUNTIME,
+                nllb_worker.NLLB_THREADS,
+                nllb_worker.NLLB_MODEL_DIR,
+                self._pool_size,
+                self._pool_status,
             ),
             daemon=True,
             name=self._PROCESS_NAME,
@@ -376,7 +570,11 @@ stats = _TranslationStats()
 
 def get_stats() -> dict:
     """Return a snapshot of translation backend telemetry."""
-    return stats.snapshot()
+    return {
+        **stats.snapshot(),
+        "memory":    _tm.to_dict(),
+        "nllb_pool": _nllb.pool_stats(),
+    }
 
 
 def _backend_for(language_code: str | None) -> str | None:
@@ -483,9 +681,9 @@ def _translate_via_nllb_sync(
     any_translated = False
     perm_fail = False
     for field_idx, original in non_empty:
-        text = original[:MAX_TRANSLATE_CHARS]  # NLLB context limited to ~512 tokens
+        text = original[:NLLB_MAX_CHARS]  # worker splits long text into sentence segments
         logger.debug("[nllb-sync]   → src=%s tgt=%s text=%r", src, target, text[:120])
-        translated = _nllb.translate_sync(text, src, target)
+        translated = _nllb.translate_sync(text, src, target, timeout=_nllb.timeout_for(text))
         if translated == nllb_worker.NOLANG:
             logger.info("[nllb-sync] Language permanently unsupported by NLLB")
             perm_fail = True
@@ -616,10 +814,16 @@ async def translate_article_fields_async(
     description: str,
     content: str,
     source_language_code: str | None,
+    info: dict | None = None,
 ) -> tuple[tuple[str, bool], tuple[str, bool], tuple[str, bool], str | None]:
     """
     Fully async version of translate_article_fields.
 
+    Fields already in the translation memory (see translation_memory.py)
+    are served from it; only the rest go to a backend.  When *info* is
+    given, ``info['backend_called']`` tells the caller whether Google /
+    NLLB was contacted at all (so rate-limit delays can be skipped).
+
     Returns a 4-tuple:
         (t_title, ok_t), (t_desc, ok_d), (t_cont, ok_c), backend_recommendation
 
@@ -654,6 +858,24 @@ async def translate_article_fields_async(
     src     = source_language_code or 'auto'
     logger.debug("[translate-async] backend=%s lang=%s→%s", backend, source_language_code, target)
 
+    # ── translation memory ───────────────────────────────────────────────────
+    # Entries are stored under the backend that produced them; unless the
+    # language pins a backend, either one's translation is good enough.
+    cached = await _tm.lookup_many(
+        [orig for _, orig in non_empty], src, target, None if _was_rr else backend
+    )
+    from_memory = {fi: t for (fi, _), t in zip(non_empty, cached) if t is not None}
+    if from_memory:
+        non_empty = [(fi, orig) for fi, orig in non_empty if fi not in from_memory]
+        logger.debug("[translate-async] %d field(s) from translation memory", len(from_memory))
+    if info is not None:
+        info['backend_called'] = bool(non_empty)
+    if not non_empty:
+        res_mem = [(f, False) for f in fields]
+        for fi, t in from_memory.items():
+            res_mem[fi] = (t, True)
+        return res_mem[0], res_mem[1], res_mem[2], None
+
     # ── routing telemetry ────────────────────────────────────────────────────
     if _was_rr:
         if backend == 'google': stats.inc(rr_google=1)
@@ -698,7 +920,7 @@ async def translate_article_fields_async(
 
     async def _via_nllb() -> list[tuple[str, bool]] | None:
         """Returns results list, None (transient), or _PERM_FAIL (permanent lang failure)."""
-        nllb_non_empty = [(fi, orig[:MAX_TRANSLATE_CHARS]) for fi, orig in non_empty]
+        nllb_non_empty = [(fi, orig[:NLLB_MAX_CHARS]) for fi, orig in non_empty]
         for _, original in nllb_non_empty:
             logger.debug("[nllb-async]  → src=%s tgt=%s text=%r", src, target, original[:120])
         tasks = [_nllb.translate_async(original, src, target) for _, original in nllb_non_empty]
@@ -722,6 +944,8 @@ async def translate_article_fields_async(
 
     backend_recommendation: str | None = None
     results = None
+    produced_by: str | None = None   # backend whose output ended up in results
+    _t_call = _time.perf_counter()
 
     if backend == 'google':
         _t0 = _time.perf_counter()
@@ -736,6 +960,7 @@ async def translate_article_fields_async(
             results = None if (n_result is None or n_result is _PERM_FAIL) else n_result
             if results is not None:
                 backend_recommendation = 'nllb'
+                produced_by = 'nllb'
                 stats.inc(nllb_ok=1, total_ok=1)
             elif n_result is _PERM_FAIL:
                 stats.inc(nllb_perm_fail=1, total_failed=1)
@@ -752,9 +977,11 @@ async def translate_article_fields_async(
                 if n_result is _PERM_FAIL: stats.inc(nllb_perm_fail=1, total_failed=1)
                 else:                      stats.inc(nllb_transient=1,  total_failed=1)
             else:
+                produced_by = 'nllb'
                 stats.inc(nllb_ok=1, total_ok=1)
         else:
             results = g_result
+            produced_by = 'google'
             stats.inc(google_ok=1, total_ok=1)
     else:  # 'nllb'
         _t0 = _time.perf_counter()
@@ -769,6 +996,7 @@ async def translate_article_fields_async(
             results = None if (g_result is None or g_result is _PERM_FAIL) else g_result
             if results is not None:
                 backend_recommendation = 'google'
+                produced_by = 'google'
                 stats.inc(google_ok=1, total_ok=1)
             elif g_result is _PERM_FAIL:
                 stats.inc(google_perm_fail=1, total_failed=1)
@@ -785,11 +1013,23 @@ async def translate_article_fields_async(
                 if g_result is _PERM_FAIL: stats.inc(google_perm_fail=1, total_failed=1)
                 else:                      stats.inc(google_transient=1,  total_failed=1)
             else:
+                produced_by = 'google'
                 stats.inc(google_ok=1, total_ok=1)
         else:
             results = n_result
+            produced_by = 'nllb'
             stats.inc(nllb_ok=1, total_ok=1)
 
+    if results is not None and produced_by is not None:
+        fresh = [(orig, results[fi][0]) for fi, orig in non_empty if results[fi][1]]
+        if fresh:
+            cost_ms = int((_time.perf_counter() - _t_call) * 1000) // len(non_empty)
+            await _tm.store_many(fresh, src, target, produced_by, cost_ms)
+    if from_memory:
+        if results is None:
+            results = [(f, False) for f in fields]
+        for fi, t_mem in from_memory.items():
+            results[fi] = (t_mem, True)
     if results is None:
         return (title, False), (description, False), (content, False), None
     t = tuple(results)
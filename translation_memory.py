@@ -0,0 +1,237 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Translation memory — persistent cache of translated text.
+
+Syndicated wire copy shows up across dozens of feeds with an identical
+title / description, so the same text would otherwise be sent to Google or
+NLLB again and again.  Entries are keyed by
+
+    sha1(backend, source language, target language, normalised text)
+
+and live in two tiers.  A lookup may name one backend, or none when the
+caller did not pin one (round-robin languages): then an entry
+written by any backend in ``TM_BACKENDS`` is a hit, so the text is not
+translated — and cached — once per backend.  The tiers:
+
+  * an in-memory LRU (``TM_LRU_SIZE`` entries) consulted on the event loop;
+  * a small SQLite side database (``TM_DB_PATH``) that survives restarts.
+
+All SQLite access happens on one dedicated thread, so lookups that miss the
+LRU and the write-behind of new entries never block the event loop and never
+touch the main news database's writer.
+"""
+
+import asyncio
+import hashlib
+import logging
+import sqlite3
+import threading
+import time as _time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+logger = logging.getLogger(__name__)
+
+TM_ENABLED  = True
+TM_DB_PATH  = "translation_memory.db"
+TM_LRU_SIZE = 20_000
+
+TM_BACKENDS = ("nllb", "google")   # tried in this order by lookup_many(backend=None)
+
+
+def normalise(text: str) -> str:
+    """Canonical form used for the cache key (whitespace-collapsed)."""
+    return " ".join(text.split())
+
+
+def make_key(text: str, src: str | None, tgt: str, backend: str) -> str:
+    raw = "\x1f".join((backend, src or "auto", tgt, normalise(text)))
+    return hashlib.sha1(raw.encode("utf-8")).hexdigest()
+
+
+class TranslationMemory:
+    """LRU front + SQLite back store; all public coroutines are loop-safe."""
+
+    def __init__(self, db_path: str = TM_DB_PATH, lru_size: int = TM_LRU_SIZE) -> None:
+        self.enabled  = TM_ENABLED
+        self.db_path  = db_path
+        self.lru_size = lru_size
+        self._lru: "OrderedDict[str, tuple[str, int]]" = OrderedDict()   # key → (text, cost_ms)
+        self._lock     = threading.Lock()
+        self._executor: ThreadPoolExecutor | None = None
+        self._con:      sqlite3.Connection | None = None
+        self._disabled = False
+        # counters
+        self.hits_lru = 0
+        self.hits_db  = 0
+        self.misses   = 0
+        self.stores   = 0
+        self.saved_ms = 0
+
+    # ── SQLite side (runs only on the tm thread) ──────────────────────────────
+
+    def _db(self) -> sqlite3.Connection:
+        if self._con is None:
+            con = sqlite3.connect(self.db_path, check_same_thread=False)
+            con.execute("PRAGMA journal_mode=WAL")
+            con.execute("PRAGMA synchronous=NORMAL")
+            con.execute(
+                """
+                CREATE TABLE IF NOT EXISTS translation_memory (
+                    key           TEXT PRIMARY KEY,
+                    backend       TEXT NOT NULL,
+                    src           TEXT,
+                    tgt           TEXT NOT NULL,
+                    translated    TEXT NOT NULL,
+                    cost_ms       INTEGER NOT NULL DEFAULT 0,
+                    hits          INTEGER NOT NULL DEFAULT 0,
+                    created_at_ms INTEGER NOT NULL
+                )
+                """
+            )
+            con.commit()
+            self._con = con
+        return self._con
+
+    def _db_get_many(self, keys: list[str]) -> dict[str, tuple[str, int]]:
+        con = self._db()
+        rows = con.execute(
+            f"SELECT key, translated, cost_ms FROM translation_memory "
+            f"WHERE key IN ({', '.join('?' * len(keys))})",
+            keys,
+        ).fetchall()
+        if rows:
+            con.executemany(
+                "UPDATE translation_memory SET hits = hits + 1 WHERE key = ?",
+                [(r[0],) for r in rows],
+            )
+            con.commit()
+        return {r[0]: (r[1], r[2]) for r in rows}
+
+    def _db_put_many(self, entries: list[tuple]) -> None:
+        con = self._db()
+        con.executemany(
+            "INSERT OR REPLACE INTO translation_memory "
+            "(key, backend, src, tgt, translated, cost_ms, hits, created_at_ms) "
+            "VALUES (?, ?, ?, ?, ?, ?, 0, ?)",
+            entries,
+        )
+        con.commit()
+
+    async def _run(self, fn, *args):
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="tm-sqlite")
+        return await asyncio.get_running_loop().run_in_executor(self._executor, fn, *args)
+
+    # ── LRU ───────────────────────────────────────────────────────────────────
+
+    def _lru_get(self, key: str) -> tuple[str, int] | None:
+        with self._lock:
+            hit = self._lru.get(key)
+            if hit is not None:
+                self._lru.move_to_end(key)
+            return hit
+
+    def _lru_put(self, key: str, value: tuple[str, int]) -> None:
+        with self._lock:
+            self._lru[key] = value
+            self._lru.move_to_end(key)
+            while len(self._lru) > self.lru_size:
+                self._lru.popitem(last=False)
+
+    # ── public API ────────────────────────────────────────────────────────────
+
+    def configure(self, *, enabled: bool, db_path: str, lru_size: int) -> None:
+        """Apply .env settings; call before the first lookup."""
+        self.enabled  = enabled
+        self.db_path  = db_path
+        self.lru_size = max(0, int(lru_size))
+
+    async def lookup_many(
+        self, texts: list[str], src: str | None, tgt: str, backend: str | None
+    ) -> list[str | None]:
+        """
+        Cached translation per text (None where missing), in input order.
+        *backend* None accepts an entry from any backend in ``TM_BACKENDS``.
+        """
+        if not self.enabled or self._disabled or not texts:
+            return [None] * len(texts)
+        backends = (backend,) if backend else TM_BACKENDS
+        keys = [[make_key(t, src, tgt, b) for b in backends] for t in texts]
+        found: list[tuple[str, int] | None] = []
+        for ks in keys:
+            hit = None
+            for k in ks:
+                hit = self._lru_get(k)
+                if hit is not None:
+                    break
+            found.append(hit)
+        missing = [i for i, hit in enumerate(found) if hit is None]
+        self.hits_lru += len(texts) - len(missing)
+        if missing:
+            try:
+                from_db = await self._run(self._db_get_many, [k for i in missing for k in keys[i]])
+            except Exception as e:
+                logger.warning(f"⚠️  Translation memory disabled ({e})")
+                self._disabled = True
+                from_db = {}
+            for i in missing:
+                for k in keys[i]:
+                    hit = from_db.get(k)
+                    if hit is not None:
+                        self._lru_put(k, hit)
+                        found[i] = hit
+                        self.hits_db += 1
+                        break
+                else:
+                    self.misses += 1
+        out: list[str | None] = []
+        for hit in found:
+            if hit is not None:
+                self.saved_ms += hit[1]
+                out.append(hit[0])
+            else:
+                out.append(None)
+        return out
+
+    async def store_many(
+        self,
+        pairs: list[tuple[str, str]],
+        src: str | None,
+        tgt: str,
+        backend: str,
+        cost_ms: int,
+    ) -> None:
+        """Remember ``(original, translated)`` pairs; *cost_ms* is per entry."""
+        if not self.enabled or self._disabled or not pairs:
+            return
+        now = int(_time.time() * 1000)
+        entries = []
+        for original, translated in pairs:
+            key = make_key(original, src, tgt, backend)
+            self._lru_put(key, (translated, cost_ms))
+            entries.append((key, backend, src, tgt, translated, cost_ms, now))
+        self.stores += len(entries)
+        try:
+            await self._run(self._db_put_many, entries)
+        except Exception as e:
+            logger.warning(f"⚠️  Translation memory write failed: {e}")
+
+    def to_dict(self) -> dict:
+        lookups = self.hits_lru + self.hits_db + self.misses
+        return {
+            "enabled":      self.enabled and not self._disabled,
+            "lru_size":     len(self._lru),
+            "lru_capacity": self.lru_size,
+            "hits_lru":     self.hits_lru,
+            "hits_db":      self.hits_db,
+            "misses":       self.misses,
+            "hit_rate":     round((self.hits_lru + self.hits_db) / lookups, 3) if lookups else 0.0,
+            "stores":       self.stores,
+            "saved_ms":     self.saved_ms,
+        }
+
+
+# Module-level singleton used by translatev1
+memory = TranslationMemory()
@@ -60,20 +60,57 @@ from html_utils import (
 # Async parallel enrichment worker
 from enrichment_worker import EnrichmentWorker, _BLOCKED_THRESHOLD
 
+# RSS Stage-2 normalisation — module-level so it can run in a process pool
+from rss_normalize import (
+    as_text,
+    detect_article_language,
+    entry_to_dict,
+    normalize_timestamp_to_utc,
+    prepare_entries_timed,
+)
+
+# Generic CPU/thread/async dispatcher (Stage-2 process pool)
+from exec_worker import ExecWorkerPool, Task, TaskKind
+
 # Centralised async CRUD layer — backend selected by DB_BACKEND in .env
 from db_factory import get_db_class, get_db_dsn, get_db_backend
 
 # Generic multi-producer/multi-consumer pipeline infrastructure
 from pipeline import PipelineQueue, PipelineStage, PipelineSupervisor
 
+# Per-feed adaptive polling (next-due min-heap) for the RSS Stage-1 driver
+from feed_scheduler import FeedScheduler
+
+# Incremental RSS/Atom parsing with early stop for large feeds (Stage 1)
+from rss_stream import StreamingFeedParser
+
 # Async event-loop span profiler — circular ring buffer maxlen=1000
 from loop_watchdog import watchdog as _watchdog
 
+# In-process fan-out of committed rows to GET /api/stream subscribers
+from broadcast_bus import bus as _push_bus, EVENT_ARTICLES, EVENT_TRANSLATIONS
+
+# Per-host politeness between the enrichment feeder and the tier queues
+from domain_dispatcher import DomainDispatcher, host_of as _host_of
+
+# Shared TTL-respecting DNS cache behind every aiohttp session
+import dns_cache
+from dns_cache import resolver as _dns
+
+# Service-scoped aiohttp session + connector shared by all collectors
+import http_pool
+from http_pool import HttpPool
+
+# SQLite backend module + article-body codec (settings are assigned in __init__)
+import news_db
+import body_codec
+from news_db import encode_article_cursor, decode_article_cursor
+
 # FastAPI server (optional - enabled via API_SERVER_ENABLED)
 try:
-    from fastapi import FastAPI, Query, HTTPException
+    from fastapi import FastAPI, Query, HTTPException, Request
     from fastapi.middleware.cors import CORSMiddleware
-    from fastapi.responses import JSONResponse
+    from fastapi.responses import JSONResponse, Response, StreamingResponse
     from sqlalchemy import func
     import uvicorn
     _FASTAPI_AVAILABLE = True
@@ -81,36 +118,15 @@ except ImportError:
     FastAPI = None  # type: ignore[assignment,misc]
     Query = None  # type: ignore[assignment,misc]
     HTTPException = None  # type: ignore[assignment,misc]
+    Request = None  # type: ignore[assignment,misc]
+    Response = None  # type: ignore[assignment,misc]
+    StreamingResponse = None  # type: ignore[assignment,misc]
     CORSMiddleware = None  # type: ignore[assignment,misc]
     JSONResponse = None  # type: ignore[assignment,misc]
     uvicorn = None  # type: ignore[assignment]
     _FASTAPI_AVAILABLE = False
     logging.warning("⚠️  fastapi/uvicorn not available - API server disabled. Install with: pip install fastapi uvicorn")
 
-# Language detection
-try:
-    from langdetect import detect, detect_langs, LangDetectException  # type: ignore
-    LANGDETECT_AVAILABLE = True
-except ImportError:
-    LANGDETECT_AVAILABLE = False
-    detect = None  # type: ignore
-    detect_langs = None  # type: ignore
-    LangDetectException = Exception  # type: ignore
-    logging.warning("⚠️  langdetect not available - language detection disabled. Install with: pip install langdetect")
-
-# Languages that are unlikely to appear in news feeds but that langdetect
-# commonly produces as false positives for short English/Latin-script text.
-_LANGDETECT_LOW_PRIOR_LANGS = frozenset({
-    'cy',   # Welsh — frequent false positive for English headlines
-    'mt',   # Maltese
-    'la',   # Latin
-    'af',   # Afrikaans (often confused with English/Dutch)
-    'so',   # Somali false-positive on some English patterns
-})
-# Minimum probability required to trust a low-prior language detection.
-# Below this threshold the runner-up language (if any) is used instead.
-_LOW_PRIOR_MIN_PROB = 0.90
-
 # NewsAPI Configuration
 API_KEY1 = str(config('NEWS_API_KEY_1', cast=str))
 API_KEY2 = str(config('NEWS_API_KEY_2', cast=str))
@@ -128,7 +144,21 @@ RSS_S1_MAX_CONCURRENT  = int(config('RSS_S1_MAX_CONCURRENT',  default=20))   # S
 RSS_S2_INITIAL_WORKERS = int(config('RSS_S2_INITIAL_WORKERS', default=2))    # Stage 2: initial CPU workers
 RSS_S2_MAX_WORKERS     = int(config('RSS_S2_MAX_WORKERS',     default=16))   # Stage 2: max CPU workers (supervisor ceiling)
 RSS_S3_DEDUP_WORKERS   = int(config('RSS_S3_DEDUP_WORKERS',   default=4))    # Stage 3: dedup workers (WAL allows parallel reads)
+RSS_S2_PROCESS_WORKERS = int(config('RSS_S2_PROCESS_WORKERS', default=min(8, os.cpu_count() or 2)))  # Stage 2: normaliser processes (0 = default thread pool)
 RSS_S4_MAX_WORKERS     = int(config('RSS_S4_MAX_WORKERS',     default=1))    # Stage 4: DB write (keep 1 — serialised INSERTs)
+# Adaptive per-feed polling: each feed's interval follows its publish rate,
+# cache headers and error history, clamped to [MIN, MAX].  RSS_CYCLE_INTERVAL
+# is the default for feeds with no history and the stats/reload window.
+RSS_POLL_MIN_INTERVAL  = int(config('RSS_POLL_MIN_INTERVAL',  default=120))     # seconds
+RSS_POLL_MAX_INTERVAL  = int(config('RSS_POLL_MAX_INTERVAL',  default=21600))   # seconds (6 h)
+RSS_POLL_HISTORY_DAYS  = int(config('RSS_POLL_HISTORY_DAYS',  default=7))       # DB history used to seed rates
+# Streaming parse (rss_stream) for large feeds: incremental XML over the
+# response stream, stopping after N consecutive already-stored entries.
+RSS_STREAM_ENABLED     = config('RSS_STREAM_ENABLED', default=True, cast=bool)
+RSS_STREAM_MIN_BYTES   = int(config('RSS_STREAM_MIN_BYTES',   default=262144))  # Content-Length at/above this streams (unknown length always does)
+RSS_STREAM_STOP_AFTER  = int(config('RSS_STREAM_STOP_AFTER',  default=5))       # consecutive known entries before stopping
+RSS_STREAM_KNOWN_MAX   = int(config('RSS_STREAM_KNOWN_MAX',   default=500))     # title hashes remembered per streamed feed
+RSS_STREAM_CHUNK       = 64 * 1024
 # Backwards-compat aliases
 RSS_MAX_CONCURRENT  = RSS_S1_MAX_CONCURRENT
 RSS_INITIAL_WORKERS = RSS_S2_INITIAL_WORKERS
@@ -166,8 +196,41 @@ PLAYWRIGHT_TIMEOUT     = int(config('PLAYWRIGHT_TIMEOUT',     default=30))
 PLAYWRIGHT_BATCH_SIZE  = int(config('PLAYWRIGHT_BATCH_SIZE',  default=12))
 ENRICH_CFFI_MAX_WORKERS       = int(config('ENRICH_CFFI_MAX_WORKERS',       default=40))
 ENRICH_REQUESTS_MAX_WORKERS   = int(config('ENRICH_REQUESTS_MAX_WORKERS',   default=20))
-ENRICH_PLAYWRIGHT_MAX_WORKERS = int(config('ENRICH_PLAYWRIGHT_MAX_WORKERS', default=6))
+ENRICH_PLAYWRIGHT_MAX_WORKERS = int(config('ENRICH_PLAYWRIGHT_MAX_WORKERS', default=8))   # ≈ PLAYWRIGHT_PROCESSES × PAGES_PER_WORKER
 HTTP_POOL_SIZE             = int(config('HTTP_POOL_SIZE',             default=10))
+# Per-host politeness across all enrichment tiers (domain_dispatcher)
+ENRICH_HOST_CONCURRENCY   = int(config('ENRICH_HOST_CONCURRENCY',     default=2))     # queued + in-flight articles per host
+ENRICH_HOST_RATE          = float(config('ENRICH_HOST_RATE',          default=1.0))   # token-bucket refill, requests/s per host
+ENRICH_HOST_BURST         = float(config('ENRICH_HOST_BURST',         default=3.0))   # token-bucket size per host
+ENRICH_HOST_COOLDOWN      = float(config('ENRICH_HOST_COOLDOWN',      default=30.0))  # 429/503 without Retry-After (doubles per strike)
+ENRICH_HOST_MAX_COOLDOWN  = float(config('ENRICH_HOST_MAX_COOLDOWN',  default=600.0)) # cap on any cool-down incl. Retry-After
+ENRICH_THROTTLE_RETRIES   = int(config('ENRICH_THROTTLE_RETRIES',     default=3))     # same-tier retries of a 429/503 before advancing
+ENRICH_DISPATCH_MAX_PENDING = int(config('ENRICH_DISPATCH_MAX_PENDING', default=2000)) # per tier, held back by politeness
+# Shared aiohttp client (http_pool) — one keep-alive pool for every collector
+HTTP_POOL_LIMIT    = int(config('HTTP_POOL_LIMIT',     default=100))    # open connections, all hosts
+HTTP_POOL_PER_HOST = int(config('HTTP_POOL_PER_HOST',  default=6))      # open connections per host
+HTTP_KEEPALIVE_S   = float(config('HTTP_KEEPALIVE_S',  default=60))     # idle keep-alive before close
+# Shared DNS cache (dns_cache) — aiohttp sessions + host hints for the fetch workers
+DNS_CACHE_SIZE     = int(config('DNS_CACHE_SIZE',      default=50000))
+DNS_CACHE_MIN_TTL  = float(config('DNS_CACHE_MIN_TTL', default=60))     # floor on record TTLs
+DNS_CACHE_MAX_TTL  = float(config('DNS_CACHE_MAX_TTL', default=3600))   # ceiling on record TTLs
+DNS_DEFAULT_TTL    = float(config('DNS_DEFAULT_TTL',   default=300))    # getaddrinfo fallback (no TTL)
+DNS_NEGATIVE_TTL   = float(config('DNS_NEGATIVE_TTL',  default=900))    # NXDOMAIN
+DNS_USE_AIODNS     = config('DNS_USE_AIODNS', default=True, cast=bool)  # c-ares when installed
+CFFI_DNS_CACHE_TTL = int(config('CFFI_DNS_CACHE_TTL',  default=300))    # libcurl's own cache in cffi workers
+# In-flight requests per fetch process (pooled keep-alive session each; 4 cffi / 2 requests processes)
+CFFI_INFLIGHT_PER_WORKER     = int(config('CFFI_INFLIGHT_PER_WORKER',     default=10))
+REQUESTS_INFLIGHT_PER_WORKER = int(config('REQUESTS_INFLIGHT_PER_WORKER', default=10))
+# Playwright: persistent Chromium per process, several concurrent pages each
+PLAYWRIGHT_PROCESSES             = int(config('PLAYWRIGHT_PROCESSES',             default=2))
+PLAYWRIGHT_PAGES_PER_WORKER      = int(config('PLAYWRIGHT_PAGES_PER_WORKER',      default=4))
+PLAYWRIGHT_MAX_PAGES_PER_BROWSER = int(config('PLAYWRIGHT_MAX_PAGES_PER_BROWSER', default=300))   # relaunch Chromium after N pages
+PLAYWRIGHT_MAX_BROWSER_MB        = int(config('PLAYWRIGHT_MAX_BROWSER_MB',        default=1500))  # … or when its process tree exceeds this RSS
+PLAYWRIGHT_CONTEXT_REUSE         = int(config('PLAYWRIGHT_CONTEXT_REUSE',         default=25))    # fetches per browser context before recycling
+PLAYWRIGHT_BLOCK_TYPES           = str(config('PLAYWRIGHT_BLOCK_TYPES',           default='image,media,font,texttrack,manifest'))  # CDP resource types to block
+PLAYWRIGHT_BLOCK_DOMAINS         = str(config('PLAYWRIGHT_BLOCK_DOMAINS',         default=''))    # extra ad/tracker domains (built-in list always applies)
+PLAYWRIGHT_BLOCK_FRAMES          = config('PLAYWRIGHT_BLOCK_FRAMES',              default=True, cast=bool)  # block third-party iframes
+PLAYWRIGHT_BLOCK_RULES_FILE      = str(config('PLAYWRIGHT_BLOCK_RULES_FILE',      default=''))    # JSON per-domain overrides
 # Backwards-compat aliases
 CFFI_CONCURRENCY       = ENRICH_CFFI_MAX_WORKERS
 REQUESTS_CONCURRENCY   = ENRICH_REQUESTS_MAX_WORKERS
@@ -178,14 +241,39 @@ API_SERVER_ENABLED = config('API_SERVER_ENABLED', default=True, cast=bool)
 API_PORT = int(config('NEWS_API_PORT', default=8765))
 API_HOST = str(config('NEWS_API_HOST', default='0.0.0.0'))
 API_MAX_ARTICLES = 200
+API_READ_POOL_SIZE = int(config('API_READ_POOL_SIZE', default=4))   # read-only DB connections for API handlers
+API_SOURCES_CACHE_TTL = float(config('API_SOURCES_CACHE_TTL', default=30.0))   # seconds /api/sources is served from memory
+API_SEARCH_MAX_LIMIT = int(config('API_SEARCH_MAX_LIMIT', default=100))     # max rows per /api/search page
+API_SEARCH_MAX_OFFSET = int(config('API_SEARCH_MAX_OFFSET', default=2000))  # deepest /api/search page offset
+API_STREAM_HEARTBEAT = float(config('API_STREAM_HEARTBEAT', default=15.0))     # seconds between SSE keep-alive comments
+API_STREAM_BACKFILL  = int(config('API_STREAM_BACKFILL',  default=500))         # rows per back-fill event replayed from the DB on (re)connect
+API_NDJSON_CHUNK     = int(config('API_NDJSON_CHUNK',     default=500))         # rows per server-side cursor fetch in /api/articles/ndjson
+# Row shape pushed on the 'articles' stream — identical to GET /api/articles
+_PUSH_ARTICLE_FIELDS = (
+    'id_article', 'id_source', 'author', 'title', 'description', 'url',
+    'urlToImage', 'publishedAt', 'published_at_gmt', 'inserted_at_ms',
+    'translated_title', 'translated_description', 'translated_content',
+    'is_translated',
+)
 
 # Backfill Configuration — enriches existing articles that have no content yet
 BACKFILL_ENABLED = config('BACKFILL_ENABLED', default=True, cast=bool)
 BACKFILL_BATCH_SIZE = int(config('BACKFILL_BATCH_SIZE', default=50))   # articles per batch
 BACKFILL_DELAY = float(config('BACKFILL_DELAY', default=1.0))           # seconds between articles
 BACKFILL_CYCLE_INTERVAL = int(config('BACKFILL_CYCLE_INTERVAL', default=10))  # seconds between cycles
-ENRICH_WRITE_BATCH   = int(config('ENRICH_WRITE_BATCH',   default=10))   # articles per DB commit in enrich-write stage
-ENRICH_WRITE_WORKERS = int(config('ENRICH_WRITE_WORKERS', default=1))    # parallel write workers (pipeline aiosqlite awaits)
+ENRICH_WRITE_WORKERS = int(config('ENRICH_WRITE_WORKERS', default=16))   # concurrent writes in flight → group-commit size
+
+# DB group commit (news_db.WriteCoalescer) — every writer stage shares one commit stream
+DB_WRITE_COALESCE_MAX_OPS      = int(config('DB_WRITE_COALESCE_MAX_OPS',        default=256))    # commit once this many writes are queued…
+DB_WRITE_COALESCE_MAX_DELAY_MS = float(config('DB_WRITE_COALESCE_MAX_DELAY_MS', default=25.0))   # …or after the oldest waited this long
+
+# Article bodies (SQLite) — content / translated_content in gm_article_bodies instead of gm_articles
+ARTICLE_BODY_STORE = str(config('ARTICLE_BODY_STORE', default='inline'))   # inline | table (run scripts/split_article_bodies.py first)
+ARTICLE_BODIES_DB  = str(config('ARTICLE_BODIES_DB',  default=''))         # separate file ATTACHed as 'bodies' ('' = main DB)
+BODY_CODEC         = str(config('BODY_CODEC',         default='plain'))    # plain | zstd (needs ARTICLE_BODY_STORE=table + zstandard)
+BODY_ZSTD_LEVEL    = int(config('BODY_ZSTD_LEVEL',    default=9))          # zstd level for new / recompressed bodies
+BODY_DICT_SIZE     = int(config('BODY_DICT_SIZE',     default=112640))     # trained dictionary size (bytes)
+BODY_DICT_SAMPLES  = int(config('BODY_DICT_SAMPLES',  default=5000))       # recent bodies the dictionary is trained on
 
 # ── Translation Pipeline ──────────────────────────────────────────────────────
 # Stage T1  Google Translate    thread     Google subprocess
@@ -195,9 +283,20 @@ TRANSLATE_BATCH_SIZE     = int(config('TRANSLATE_BATCH_SIZE',     default=100))
 TRANSLATE_MAX_WORKERS    = int(config('TRANSLATE_MAX_WORKERS',    default=4))     # concurrent translations
 TRANSLATE_DELAY          = float(config('TRANSLATE_DELAY',        default=2.0))   # seconds between articles
 TRANSLATE_CYCLE_INTERVAL = int(config('TRANSLATE_CYCLE_INTERVAL', default=60))    # seconds between cycles
-NLLB_BATCH_SIZE          = int(config('NLLB_BATCH_SIZE',          default=16))    # GPU batch size (16=safe for 6 GB; 32 if VRAM allows)
+TRANSLATE_WRITE_WORKERS  = int(config('TRANSLATE_WRITE_WORKERS',  default=8))     # concurrent save_translation() writes
+NLLB_BATCH_SIZE          = int(config('NLLB_BATCH_SIZE',          default=16))    # requests the NLLB worker collects per cycle
+NLLB_TOKEN_BUDGET        = int(config('NLLB_TOKEN_BUDGET',        default=4096))  # padded tokens per generate() call (4096 ≈ old 16×256)
+NLLB_SEGMENT_TOKENS      = int(config('NLLB_SEGMENT_TOKENS',      default=200))   # long fields are split into sentence groups of this size
+NLLB_RUNTIME             = str(config('NLLB_RUNTIME',             default='torch'))  # torch | torch-int8 | ctranslate2 | onnx
+NLLB_THREADS             = int(config('NLLB_THREADS',             default=0))     # CPU intra-op threads (0 = library default)
+NLLB_MODEL_DIR           = str(config('NLLB_MODEL_DIR',           default=''))    # converted model dir for ctranslate2 / onnx
+NLLB_POOL_SIZE           = int(config('NLLB_POOL_SIZE',           default=1))     # NLLB workers on one queue (CPU torch: weights shared via fork)
 NLLB_NUM_BEAMS           = int(config('NLLB_NUM_BEAMS',           default=4))     # 1=greedy (fast), 4=beam (slower, marginally better)
 NLLB_ASYNC_TIMEOUT       = float(config('NLLB_ASYNC_TIMEOUT',     default=120.0)) # seconds before a pending request is cancelled
+NLLB_TIMEOUT_PER_SEGMENT = float(config('NLLB_TIMEOUT_PER_SEGMENT', default=30.0)) # extra seconds per segment past the first (long fields)
+TRANSLATION_MEMORY_ENABLED  = config('TRANSLATION_MEMORY_ENABLED',  default=True, cast=bool)          # reuse earlier translations of identical text
+TRANSLATION_MEMORY_DB       = str(config('TRANSLATION_MEMORY_DB',   default='translation_memory.db'))  # SQLite side file (survives restarts)
+TRANSLATION_MEMORY_LRU_SIZE = int(config('TRANSLATION_MEMORY_LRU_SIZE', default=20000))              # in-memory entries in front of it
 
 # Blocked-source probing — periodically re-tests blocked sources and unblocks survivors
 PROBE_ENABLED = config('PROBE_ENABLED', default=True, cast=bool)
@@ -239,19 +338,6 @@ def dbCredentials() -> str:
     return get_db_dsn()
 
 
-def as_text(value: Any) -> str:
-    """Return a safe string for loosely-typed feed/API fields with encoding fix."""
-    if value is None:
-        return ""
-    if isinstance(value, str):
-        # Fix encoding issues before returning
-        return fix_encoding_if_needed(value)
-    if isinstance(value, list):
-        return " ".join(as_text(item) for item in value if item is not None)
-    result = str(value)
-    return fix_encoding_if_needed(result)
-
-
 def _make_title_hash(title: str) -> str:
     """SHA-1 of lowercased, whitespace-normalised title — used for cross-feed dedup.
 
@@ -263,69 +349,22 @@ def _make_title_hash(title: str) -> str:
     return hashlib.sha1(norm.encode('utf-8', errors='ignore')).hexdigest()[:16]
 
 
-def detect_article_language(
-    title: Optional[str],
-    description: Optional[str] = None,
-    content: Optional[str] = None,
-) -> tuple[Optional[str], float]:
-    """
-    Detect language of article using langdetect
-    
-    Args:
-        title: Article title
-        description: Article description (optional)
-        content: Article content (optional)
-    
-    Returns:
-        tuple: (language_code, confidence) or (None, 0.0) if detection fails
-    """
-    if not LANGDETECT_AVAILABLE:
-        return None, 0.0
-    
-    # Assertion for type checker - at this point, detect and LangDetectException are available
-    assert detect is not None, "detect should be available when LANGDETECT_AVAILABLE is True"
-    assert detect_langs is not None, "detect_langs should be available when LANGDETECT_AVAILABLE is True"
-
-    # Build detection text (prefer longer text for better accuracy)
-    detection_text = ""
-
-    if content and len(content.strip()) > 100:
-        detection_text = content[:500]  # Use first 500 chars of content
-    elif description and len(description.strip()) > 50:
-        detection_text = description[:300]  # Use description
-    elif title:
-        detection_text = title  # Fallback to title
-    else:
-        return None, 0.0
-
-    # Clean HTML tags if present
-    detection_text = re.sub(r'<[^>]+>', '', detection_text).strip()
-
-    if len(detection_text) < 10:
-        return None, 0.0
+def _parse_feed_timed(content):
+    """feedparser.parse plus the CPU seconds it took on the executor thread."""
+    t0 = time.thread_time()
+    feed = feedparser.parse(content)
+    return feed, time.thread_time() - t0
 
-    try:
-        probs = detect_langs(detection_text)  # list of Language(lang, prob), sorted desc
-        if not probs:
-            return None, 0.0
-        top = probs[0]
-        lang_code, confidence = top.lang, top.prob
-
-        # langdetect frequently mis-classifies short English/Latin-script news
-        # headlines as Welsh (cy) and a few other rare languages.  If the top
-        # result is one of those low-prior languages and its probability is
-        # below the threshold, fall back to the next candidate (if any) so we
-        # don't waste translation resources on a phantom Welsh article.
-        if lang_code in _LANGDETECT_LOW_PRIOR_LANGS and confidence < _LOW_PRIOR_MIN_PROB:
-            if len(probs) > 1:
-                lang_code, confidence = probs[1].lang, probs[1].prob
-            else:
-                return None, 0.0
 
-        return lang_code, round(confidence, 4)
-    except (LangDetectException, Exception):
-        # Detection failed (text too short, unknown language, etc.)
-        return None, 0.0
+def _stream_feed_timed(stream, chunk):
+    """Push *chunk* into a StreamingFeedParser (None closes it) on an executor
+    thread; returns the CPU seconds it took there."""
+    t0 = time.thread_time()
+    if chunk is None:
+        stream.close()
+    else:
+        stream.feed(chunk)
+    return time.thread_time() - t0
 
 
 # Country code to timezone mapping (most common timezone for each country)
@@ -351,219 +390,6 @@ COUNTRY_TIMEZONES = {
 }
 
 
-def normalize_timestamp_to_utc(
-    timestamp_str: str,
-    source_timezone: Optional[str] = None,
-    use_source_timezone: bool = False,
-) -> tuple[Optional[str], Optional[str]]:
-    """
-    Normalize a timestamp string to UTC (GMT+0).
-    
-    SMART TIMEZONE CORRECTION LOGIC:
-    1. Parse article timestamp with its timezone (if present)
-    2. If use_source_timezone=True and source_timezone is provided:
-       a. Convert timestamp to UTC using article's timezone (or UTC if none)
-       b. Compare with current UTC time
-       c. If timestamp is >30 minutes in the future → Apply source_timezone correction
-       d. Otherwise → Use article's timezone (it's correct)
-    3. If article has no timezone → Use source_timezone (if available)
-    4. Return None if no timezone info available
-    
-    This prevents overcorrection of sources that sometimes report correct timezones,
-    while still fixing sources that consistently lie about their timezone.
-    
-    Args:
-        timestamp_str: Timestamp string with timezone info (ISO, RFC 2822, etc.)
-        source_timezone: Optional timezone offset string (e.g., 'UTC+05:30')
-        use_source_timezone: If True, apply source_timezone only when timestamp is in future
-    
-    Returns:
-        Tuple: (utc_timestamp_str, detected_timezone_str)
-        - utc_timestamp_str: ISO format UTC timestamp, or None if no timezone available
-        - detected_timezone_str: Detected timezone offset (e.g., 'UTC+05:30') or None
-    """
-    if not timestamp_str or timestamp_str.strip() == '':
-        return datetime.now(timezone.utc).replace(microsecond=0).isoformat(), None
-    
-    # Mapping of common timezone abbreviations to UTC offsets (in seconds)
-    # This prevents UnknownTimezoneWarning from dateutil
-    tzinfos = {
-        'EDT': -4 * 3600,    # Eastern Daylight Time (UTC-4)
-        'EST': -5 * 3600,    # Eastern Standard Time (UTC-5)
-        'CDT': -5 * 3600,    # Central Daylight Time (UTC-5)
-        'CST': -6 * 3600,    # Central Standard Time (UTC-6)
-        'MDT': -6 * 3600,    # Mountain Daylight Time (UTC-6)
-        'MST': -7 * 3600,    # Mountain Standard Time (UTC-7)
-        'PDT': -7 * 3600,    # Pacific Daylight Time (UTC-7)
-        'PST': -8 * 3600,    # Pacific Standard Time (UTC-8)
-        'AKDT': -8 * 3600,   # Alaska Daylight Time (UTC-8)
-        'AKST': -9 * 3600,   # Alaska Standard Time (UTC-9)
-        'HST': -10 * 3600,   # Hawaii Standard Time (UTC-10)
-        'BST': 1 * 3600,     # British Summer Time (UTC+1)
-        'CEST': 2 * 3600,    # Central European Summer Time (UTC+2)
-        'CET': 1 * 3600,     # Central European Time (UTC+1)
-        'EEST': 3 * 3600,    # Eastern European Summer Time (UTC+3)
-        'EET': 2 * 3600,     # Eastern European Time (UTC+2)
-        'IST': 5.5 * 3600,   # Indian Standard Time (UTC+5:30)
-        'JST': 9 * 3600,     # Japan Standard Time (UTC+9)
-        'KST': 9 * 3600,     # Korea Standard Time (UTC+9)
-        'AEST': 10 * 3600,   # Australian Eastern Standard Time (UTC+10)
-        'AEDT': 11 * 3600,   # Australian Eastern Daylight Time (UTC+11)
-        'AWST': 8 * 3600,    # Australian Western Standard Time (UTC+8)
-        'NZST': 12 * 3600,   # New Zealand Standard Time (UTC+12)
-        'NZDT': 13 * 3600,   # New Zealand Daylight Time (UTC+13)
-    }
-    
-    # Pre-process: Fix truncated timezone offsets (3 digits instead of 4)
-    # Some RSS feeds send +000, +010, +053 instead of +0000, +0100, +0530
-    # Example: "Sun, 01 Mar 2026 22:44:21 +000" → "Sun, 01 Mar 2026 22:44:21 +0000"
-    import re
-    truncated_tz_pattern = r'([+-])(\d)(\d)(\d)(?!\d)'  # Match +NNN or -NNN (3 digits, not followed by another digit)
-    match = re.search(truncated_tz_pattern, timestamp_str)
-    if match:
-        # Expand truncated timezone: +010 → +0100, +053 → +0530
-        sign = match.group(1)
-        digit1 = match.group(2)
-        digit2 = match.group(3)
-        digit3 = match.group(4)
-        
-        # Reconstruct as HHMM format
-        expanded_tz = f"{sign}{digit1}{digit2}{digit3}0"
-        timestamp_str = timestamp_str[:match.start()] + expanded_tz + timestamp_str[match.end():]
-
-    # Pre-process: Replace IANA timezone names (e.g. "Europe/Dublin") with their
-    # UTC offset so dateutil can parse them.  Some RSS feeds (e.g. breakingnews.ie)
-    # embed the full zone name instead of a numeric offset.
-    iana_tz_pattern = re.compile(r'([A-Za-z]+/[A-Za-z_]+)')
-    iana_match = iana_tz_pattern.search(timestamp_str)
-    if iana_match:
-        try:
-            tz_obj = pytz.timezone(iana_match.group(1))
-            # Use the current UTC offset for this zone (accounts for DST)
-            now_offset = datetime.now(tz_obj).utcoffset()
-            total_secs = int(now_offset.total_seconds())
-            h, rem = divmod(abs(total_secs), 3600)
-            m = rem // 60
-            offset_str = f"{'+' if total_secs >= 0 else '-'}{h:02d}{m:02d}"
-            timestamp_str = timestamp_str[:iana_match.start()] + offset_str + timestamp_str[iana_match.end():]
-        except Exception:
-            # Unknown IANA zone — strip it so dateutil at least parses the date
-            timestamp_str = timestamp_str[:iana_match.start()].rstrip()
-
-    try:
-        # Parse the timestamp with dateutil (handles most formats and extracts timezone)
-        parsed_dt = dateutil_parser.parse(timestamp_str, tzinfos=tzinfos)
-        detected_tz = None
-        
-        # SMART TIMEZONE CORRECTION LOGIC (changed behavior)
-        # If use_source_timezone=True, we have a confirmed source timezone,
-        # but we should only apply it if the article timestamp is in the future.
-        # This prevents overcorrection of sources that sometimes report correct timezones.
-        if use_source_timezone and source_timezone:
-            from dateutil.tz import tzoffset
-            import re
-            
-            # First, try to convert with article's timezone (if present)
-            test_dt = parsed_dt
-            if parsed_dt.tzinfo is None:
-                # No timezone in article - try UTC first
-                test_dt = parsed_dt.replace(tzinfo=timezone.utc)
-            
-            # Convert to UTC for comparison
-            test_utc = test_dt.astimezone(timezone.utc)
-            now_utc = datetime.now(timezone.utc)
-            
-            # Check if timestamp is in the future (more than 30 minutes ahead)
-            time_diff_minutes = (test_utc - now_utc).total_seconds() / 60
-            
-            if time_diff_minutes > 30:
-                # Timestamp is in the future - article timezone is WRONG
-                # The feed incorrectly added source timezone offset to the timestamp
-                # We need to UNDO that addition by subtracting the offset
-                tz_match = re.search(r'([+-])?(\d{2}):(\d{2})', source_timezone)
-                if tz_match:
-                    # Parse source timezone offset
-                    # CRITICAL: For UTC-03:00, we want to SUBTRACT 3h (so sign should be +1)
-                    # For UTC+05:00, we want to ADD 5h (so sign should be -1, subtract negative = add)
-                    sign = 1 if tz_match.group(1) == '-' else -1  # INVERTED on purpose!
-                    hours = int(tz_match.group(2))
-                    minutes = int(tz_match.group(3))
-                    total_seconds = sign * (hours * 3600 + minutes * 60)
-                    
-                    # Log correction for debugging
-                    logging.debug(f"TIMEZONE-CORRECTION: Article timestamp is {time_diff_minutes:.1f}min in future, subtracting {total_seconds/3600:.1f}h to correct")
-                    
-                    # CRITICAL FIX: Subtract the offset from timestamp
-                    # Example: Feed reports "04:43:09 +0000" but it's Argentina (UTC-03:00)
-                    # The feed ADDED 3h incorrectly, so we SUBTRACT 3h: 04:43 - 3h = 01:43 UTC ✓
-                    # Strip any existing timezone and treat as naive
-                    parsed_dt = parsed_dt.replace(tzinfo=None)
-                    
-                    # Subtract the source timezone offset
-                    corrected_dt = parsed_dt - timedelta(seconds=total_seconds)
-                    
-                    # Now mark as UTC
-                    utc_dt = corrected_dt.replace(tzinfo=timezone.utc)
-                    detected_tz = source_timezone
-                    
-                    return utc_dt.replace(microsecond=0).isoformat(), detected_tz
-            
-            # If we reach here: timestamp is NOT in the future
-            # Continue with normal processing (use article timezone)
-        
-        # PRIORITY 1: Check if article timestamp has timezone info
-        if parsed_dt.tzinfo is not None:
-            # Article has timezone - USE IT (only if use_source_timezone is False)
-            # Extract detected timezone as UTC offset string
-            offset = parsed_dt.utcoffset()
-            if offset is not None:  # Changed from 'if offset:' to handle UTC+00:00 correctly
-                total_seconds = int(offset.total_seconds())
-                hours, remainder = divmod(abs(total_seconds), 3600)
-                minutes = remainder // 60
-                sign = '+' if total_seconds >= 0 else '-'
-                detected_tz = f"UTC{sign}{hours:02d}:{minutes:02d}"
-        else:
-            # No timezone in article timestamp
-            # PRIORITY 2: Check if timestamp text claims to be GMT/UTC
-            if 'GMT' in timestamp_str.upper() or 'UTC' in timestamp_str.upper():
-                # Timestamp claims to be GMT/UTC, treat as such
-                parsed_dt = parsed_dt.replace(tzinfo=timezone.utc)
-                detected_tz = 'UTC+00:00'
-            # PRIORITY 3: Use source timezone if permitted
-            elif use_source_timezone and source_timezone:
-                # Source timezone can be used (confirmed source)
-                from dateutil.tz import tzoffset
-                import re
-                
-                # Parse timezone offset from string like 'UTC+05:30'
-                tz_match = re.search(r'([+-])?(\d{2}):(\d{2})', source_timezone)
-                if tz_match:
-                    sign = -1 if tz_match.group(1) == '-' else 1
-                    hours = int(tz_match.group(2))
-                    minutes = int(tz_match.group(3))
-                    total_seconds = sign * (hours * 3600 + minutes * 60)
-                    tz_offset = tzoffset('', total_seconds)
-                    parsed_dt = parsed_dt.replace(tzinfo=tz_offset)
-                    detected_tz = source_timezone
-                else:
-                    # Invalid source timezone format
-                    return None, None
-            else:
-                # PRIORITY 4: No timezone available - CANNOT CONVERT
-                return None, None
-        
-        # Convert to UTC
-        utc_dt = parsed_dt.astimezone(timezone.utc)
-        
-        # Return ISO format without microseconds for consistency, plus detected timezone
-        return utc_dt.replace(microsecond=0).isoformat(), detected_tz
-        
-    except Exception as e:
-        # If parsing fails, return current UTC time
-        logging.debug(f"Failed to parse timestamp '{timestamp_str}': {e}")
-        return datetime.now(timezone.utc).replace(microsecond=0).isoformat(), None
-
-
 def detect_timezone_from_articles(
     articles_timestamps: list[str],
     source_name: str = "Unknown",
@@ -687,6 +513,26 @@ class NewsGather():
         self.current_mediastack_key_index = 0
    
         self.logger.info("Initializing NewsGather...")
+
+        # Shared DNS cache settings (python-decouple does not populate os.environ)
+        dns_cache.DNS_CACHE_SIZE    = DNS_CACHE_SIZE
+        dns_cache.DNS_CACHE_MIN_TTL = DNS_CACHE_MIN_TTL
+        dns_cache.DNS_CACHE_MAX_TTL = DNS_CACHE_MAX_TTL
+        dns_cache.DNS_DEFAULT_TTL   = DNS_DEFAULT_TTL
+        dns_cache.DNS_NEGATIVE_TTL  = DNS_NEGATIVE_TTL
+        dns_cache.DNS_USE_AIODNS    = DNS_USE_AIODNS
+        http_pool.HTTP_POOL_LIMIT    = HTTP_POOL_LIMIT
+        http_pool.HTTP_POOL_PER_HOST = HTTP_POOL_PER_HOST
+        http_pool.HTTP_KEEPALIVE_S   = HTTP_KEEPALIVE_S
+        news_db.ARTICLE_BODY_STORE = ARTICLE_BODY_STORE
+        news_db.ARTICLE_BODIES_DB  = ARTICLE_BODIES_DB
+        body_codec.BODY_CODEC        = BODY_CODEC
+        body_codec.BODY_ZSTD_LEVEL   = BODY_ZSTD_LEVEL
+        body_codec.BODY_DICT_SIZE    = BODY_DICT_SIZE
+        body_codec.BODY_DICT_SAMPLES = BODY_DICT_SAMPLES
+        # Shared aiohttp session — started / closed by run_all_collectors
+        self.http = HttpPool()
+        self._discovering: set = set()     # publisher domains with a discovery task in flight
         self.logger.debug("Creating URL queue")
         self.url_queue = Queue()   
        
@@ -746,6 +592,7 @@ class NewsGather():
         self._enrich_stage_e1: Optional[PipelineStage] = None
         self._enrich_stage_e2: Optional[PipelineStage] = None
         self._enrich_stage_ew: Optional[PipelineStage] = None
+        self._enrich_dispatcher: Optional[DomainDispatcher] = None
 
         # Live pipeline objects for translation (set by backfill_translations)
         self._translate_q_t0:    Optional[PipelineQueue] = None
@@ -767,7 +614,14 @@ class NewsGather():
             'err_http':     0,       # HTTP status != 200
             'err_content':  0,       # bad content-type or parse failure
             'err_timeout':  0,       # fetch timeout fired
+            'err_dns':      0,       # feed host does not exist (NXDOMAIN)
+            'not_modified': 0,       # HTTP 304 — feed unchanged, Stages 2–4 skipped
+            'streamed':     0,       # large feeds parsed incrementally (rss_stream)
+            'stream_stopped': 0,     # … of which stopped early on known entries
             'articles_new': 0,       # new articles inserted this cycle
+            'cpu_s1_parse':     0.0, # CPU seconds spent in feedparser (Stage 1)
+            'cpu_s2_normalise': 0.0, # CPU seconds spent normalising entries (Stage 2)
+            'wall_s2_normalise': 0.0,  # wall seconds Stage 2 waited on normalisation
             'sleeping_until': None,  # time.time() when next cycle will start
         }
         # Live references to the current-cycle pipeline objects.
@@ -776,6 +630,29 @@ class NewsGather():
         self._rss_stage2:  Optional[PipelineStage] = None
         self._rss_q_s2s3:  Optional[PipelineQueue] = None
         self._rss_q_s3s4:  Optional[PipelineQueue] = None
+        # Conditional-GET validators per RSS source: {id_source: {'etag', 'last_modified'}}.
+        # Loaded in open_async_db(), updated by _rss_fetcher on every 200 response.
+        self._feed_validators: dict[str, dict] = {}
+        # Streaming Stage-1 parse: title hashes already stored per streamed feed
+        # (early-stop set) and feeds whose XML the streaming parser rejected.
+        self._feed_known_titles: dict[str, set] = {}
+        self._stream_fallback: set = set()
+        # Next-due heap for the continuous RSS Stage-1 driver
+        self._feed_scheduler = FeedScheduler(
+            default_interval=RSS_CYCLE_INTERVAL,
+            min_interval=RSS_POLL_MIN_INTERVAL,
+            max_interval=RSS_POLL_MAX_INTERVAL,
+        )
+        # Stage-2 normaliser processes (spawned lazily by collect_rss_feeds).
+        # 'spawn' keeps children free of the aiosqlite / pump threads.
+        self._rss_s2_pool: Optional[ExecWorkerPool] = (
+            ExecWorkerPool(
+                cpu_workers=RSS_S2_PROCESS_WORKERS,
+                thread_workers=1,
+                mp_context='spawn',
+            )
+            if RSS_S2_PROCESS_WORKERS > 0 else None
+        )
     
     async def open_async_db(self) -> None:
         """
@@ -784,6 +661,11 @@ class NewsGather():
         collector tasks are created.
         """
         self.db = await get_db_class().open(self.db_path)
+        self.db.configure_write_coalescer(
+            max_ops=DB_WRITE_COALESCE_MAX_OPS,
+            max_delay_ms=DB_WRITE_COALESCE_MAX_DELAY_MS,
+        )
+        self.db.configure_api_read_pool(API_READ_POOL_SIZE)
 
         # Load sources into memory
         source_rows = await self.db.load_sources()
@@ -816,6 +698,13 @@ class NewsGather():
         except Exception:
             pass  # Table may not exist yet on first run
 
+        try:
+            self._feed_validators = await self.db.load_feed_validators()
+            if self._feed_validators:
+                self.logger.info(f"🏷️  Loaded {len(self._feed_validators)} RSS feed validator(s)")
+        except Exception as e:
+            self.logger.debug(f"Could not load feed validators: {e}")
+
         # Load last known published timestamp for restart catch-up.
         # Collectors use this on their first cycle to fetch articles published
         # after this date, recovering any articles missed while the service was down.
@@ -953,14 +842,69 @@ class NewsGather():
                 pass
 
     async def _fetch_rss_content(self, session, rss_url, timeout_seconds):
+        status, content_type, content, _ = await self._fetch_rss_conditional(
+            session, rss_url, timeout_seconds
+        )
+        return status, content_type, content
+
+    @staticmethod
+    def _validators_from_headers(status: int, headers) -> Optional[dict]:
+        """ETag / Last-Modified of a 200 response, or None if it sent neither."""
+        if status != 200 or not headers:
+            return None
+        etag          = headers.get("ETag")
+        last_modified = headers.get("Last-Modified")
+        if not etag and not last_modified:
+            return None
+        return {'etag': etag, 'last_modified': last_modified}
+
+    async def _fetch_rss_conditional(self, session, rss_url, timeout_seconds, validators=None,
+                                     stream: Optional[StreamingFeedParser] = None):
+        """
+        GET *rss_url*, sending If-None-Match / If-Modified-Since when
+        *validators* (``{'etag': …, 'last_modified': …}``) are known.
+
+        Returns ``(status, content_type, content, headers)``; *headers* is a
+        case-insensitive copy of the response headers (empty when the curl
+        fallback was used).  A 304 comes back with empty content and is left to the caller.
+
+        With a *stream* parser, a 200 feed response of unknown length or at
+        least ``RSS_STREAM_MIN_BYTES`` is fed to it chunk by chunk, on an
+        executor thread, instead of being buffered; *content* is then None and the entries are in
+        ``stream.result``.  Reading stops as soon as the parser is done
+        (early stop).  Raises ``ValueError`` if the XML is unparsable.
+        """
+        headers = self._build_http_headers(rss_url)
+        if validators:
+            if validators.get('etag'):
+                headers['If-None-Match'] = validators['etag']
+            if validators.get('last_modified'):
+                headers['If-Modified-Since'] = validators['last_modified']
+
         timeout = aiohttp.ClientTimeout(total=timeout_seconds)
         async with session.get(
             rss_url,
             timeout=timeout,
-            headers=self._build_http_headers(rss_url),
+            headers=headers,
         ) as response:
             status = response.status
             content_type = response.headers.get("Content-Type", "")
+            resp_headers = response.headers.copy()   # CIMultiDict — case-insensitive
+            length = response.content_length
+            if (stream is not None and status == 200
+                    and (length is None or length >= RSS_STREAM_MIN_BYTES)
+                    and self._looks_like_feed_content_type(content_type)):
+                # Parse off the event loop, like feedparser below: a large
+                # feed is many chunks of pure-Python/XML work
+                _loop = asyncio.get_event_loop()
+                cpu_s = 0.0
+                async for chunk in response.content.iter_chunked(RSS_STREAM_CHUNK):
+                    cpu_s += await _loop.run_in_executor(None, _stream_feed_timed, stream, chunk)
+                    if stream.done:
+                        break
+                cpu_s += await _loop.run_in_executor(None, _stream_feed_timed, stream, None)
+                self._rss_cycle['cpu_s1_parse'] += cpu_s
+                return status, content_type, None, resp_headers
             # Get raw bytes - let feedparser handle encoding detection
             content = await response.read()
 
@@ -969,9 +913,10 @@ class NewsGather():
                 status, content_type, content = await asyncio.to_thread(
                     self._fetch_rss_with_curl, rss_url, timeout_seconds
                 )
+                resp_headers = {}
             except Exception as exc:
                 self.logger.debug(f"Curl fallback failed for {rss_url}: {exc}")
-        return status, content_type, content
+        return status, content_type, content, resp_headers
     
     def InitArticles(self, eng, meta, gm_sources, gm_articles):
         """
@@ -1506,6 +1451,8 @@ class NewsGather():
         if derived_id in self.sources:
             return
         try:
+            if await _dns.lookup(domain) is None:
+                return          # NXDOMAIN — nothing to probe
             rss_url = await self.discover_rss_feed(session, domain, domain)
             if not rss_url:
                 return
@@ -1648,233 +1595,237 @@ class NewsGather():
                         f"🔄 NewsAPI catch-up mode: fetching /everything from {_since_param} UTC"
                     )
                 
-                async with aiohttp.ClientSession() as session:
-                    for lang in languages:
-                        if self.shutdown_flag:
-                            break
+                session = self.http.session
+                for lang in languages:
+                    if self.shutdown_flag:
+                        break
                         
-                        # Rotate API key
-                        api_key = self.newsapi_keys[self.current_newsapi_key_index]
-                        self.current_newsapi_key_index = (self.current_newsapi_key_index + 1) % len(self.newsapi_keys)
+                    # Rotate API key
+                    api_key = self.newsapi_keys[self.current_newsapi_key_index]
+                    self.current_newsapi_key_index = (self.current_newsapi_key_index + 1) % len(self.newsapi_keys)
                         
-                        if _since_param:
-                            # Catch-up: /everything with date filter.
-                            # q='a OR e' is a broad query accepted by NewsAPI that
-                            # matches virtually every article in Latin-script languages.
-                            url = (
-                                f"https://newsapi.org/v2/everything"
-                                f"?q=a+OR+e&language={lang}&from={_since_param}"
-                                f"&sortBy=publishedAt&pageSize=100&apiKey={api_key}"
-                            )
-                        else:
-                            url = f"https://newsapi.org/v2/top-headlines?language={lang}&pageSize=100&apiKey={api_key}"
+                    if _since_param:
+                        # Catch-up: /everything with date filter.
+                        # q='a OR e' is a broad query accepted by NewsAPI that
+                        # matches virtually every article in Latin-script languages.
+                        url = (
+                            f"https://newsapi.org/v2/everything"
+                            f"?q=a+OR+e&language={lang}&from={_since_param}"
+                            f"&sortBy=publishedAt&pageSize=100&apiKey={api_key}"
+                        )
+                    else:
+                        url = f"https://newsapi.org/v2/top-headlines?language={lang}&pageSize=100&apiKey={api_key}"
                         
-                        self.logger.info(f"Fetching NewsAPI [{lang.upper()}] (key #{self.current_newsapi_key_index})...")
+                    self.logger.info(f"Fetching NewsAPI [{lang.upper()}] (key #{self.current_newsapi_key_index})...")
                         
-                        try:
-                            async with session.get(url, headers=self._build_http_headers(url)) as response:
-                                if response.status != 200:
-                                    self.logger.warning(f"HTTP {response.status} for NewsAPI {lang}")
-                                    continue
+                    try:
+                        async with session.get(
+                            url,
+                            headers=self._build_http_headers(url),
+                            timeout=aiohttp.ClientTimeout(total=30),
+                        ) as response:
+                            if response.status != 200:
+                                self.logger.warning(f"HTTP {response.status} for NewsAPI {lang}")
+                                continue
                                 
-                                response_text = await response.text()
-                                JSON_object = json.loads(response_text)
+                            response_text = await response.text()
+                            JSON_object = json.loads(response_text)
                                 
-                                if JSON_object.get('status') != 'ok':
-                                    self.logger.error(f"NewsAPI error [{lang}]: {JSON_object.get('message')}")
-                                    continue
+                            if JSON_object.get('status') != 'ok':
+                                self.logger.error(f"NewsAPI error [{lang}]: {JSON_object.get('message')}")
+                                continue
                                 
-                                articles = JSON_object.get("articles", [])
-                                self.logger.info(f"Processing {len(articles)} articles for {lang}")
+                            articles = JSON_object.get("articles", [])
+                            self.logger.info(f"Processing {len(articles)} articles for {lang}")
                                 
-                                # PHASE 1: Agrupar artigos por fonte e detectar problemas de fuso
-                                articles_by_source = {}
-                                for article in articles:
-                                    article_source = article.get('source', {})
-                                    article_source_id = article_source.get('id')
-                                    article_source_name = article_source.get('name', '')
-                                    source_id = article_source_name if article_source_id is None else article_source_id
+                            # PHASE 1: Agrupar artigos por fonte e detectar problemas de fuso
+                            articles_by_source = {}
+                            for article in articles:
+                                article_source = article.get('source', {})
+                                article_source_id = article_source.get('id')
+                                article_source_name = article_source.get('name', '')
+                                source_id = article_source_name if article_source_id is None else article_source_id
                                     
-                                    if source_id not in articles_by_source:
-                                        articles_by_source[source_id] = {
-                                            'name': article_source_name,
-                                            'articles': [],
-                                            'timestamps': []
-                                        }
+                                if source_id not in articles_by_source:
+                                    articles_by_source[source_id] = {
+                                        'name': article_source_name,
+                                        'articles': [],
+                                        'timestamps': []
+                                    }
                                     
-                                    articles_by_source[source_id]['articles'].append(article)
-                                    if article.get('publishedAt'):
-                                        articles_by_source[source_id]['timestamps'].append(article['publishedAt'])
+                                articles_by_source[source_id]['articles'].append(article)
+                                if article.get('publishedAt'):
+                                    articles_by_source[source_id]['timestamps'].append(article['publishedAt'])
                                 
-                                # Detectar fuso incorreto para cada fonte
-                                for source_id, source_info in articles_by_source.items():
-                                    if source_id in self.sources and self.sources[source_id].get('use_timezone', 0) == 0:
-                                        # Só detectar se não foi configurado manualmente
-                                        corrected_tz, should_enable = detect_timezone_from_articles(
-                                            source_info['timestamps'],
-                                            source_name=source_info['name'],
-                                            logger=self.logger
-                                        )
+                            # Detectar fuso incorreto para cada fonte
+                            for source_id, source_info in articles_by_source.items():
+                                if source_id in self.sources and self.sources[source_id].get('use_timezone', 0) == 0:
+                                    # Só detectar se não foi configurado manualmente
+                                    corrected_tz, should_enable = detect_timezone_from_articles(
+                                        source_info['timestamps'],
+                                        source_name=source_info['name'],
+                                        logger=self.logger
+                                    )
                                         
-                                        if corrected_tz and should_enable:
-                                            # Atualizar banco de dados
-                                            try:
-                                                async with aiosqlite.connect(self.db_path) as db:
-                                                    await db.execute(
-                                                        'UPDATE gm_sources SET timezone = ?, use_timezone = 1 WHERE id_source = ?',
-                                                        (corrected_tz, source_id)
-                                                    )
-                                                    await db.commit()
+                                    if corrected_tz and should_enable:
+                                        # Atualizar banco de dados
+                                        try:
+                                            async with aiosqlite.connect(self.db_path) as db:
+                                                await db.execute(
+                                                    'UPDATE gm_sources SET timezone = ?, use_timezone = 1 WHERE id_source = ?',
+                                                    (corrected_tz, source_id)
+                                                )
+                                                await db.commit()
                                                 
-                                                # Atualizar cache em memória
-                                                if source_id in self.sources:
-                                                    self.sources[source_id]['timezone'] = corrected_tz
-                                                    self.sources[source_id]['use_timezone'] = 1
+                                            # Atualizar cache em memória
+                                            if source_id in self.sources:
+                                                self.sources[source_id]['timezone'] = corrected_tz
+                                                self.sources[source_id]['use_timezone'] = 1
                                                 
-                                                self.logger.info(
-                                                    f"✅ [{source_info['name']}] Fuso corrigido para {corrected_tz}, use_timezone=1"
-                                                )
-                                            except Exception as e:
-                                                self.logger.error(f"Failed to update timezone for {source_info['name']}: {e}")
+                                            self.logger.info(
+                                                f"✅ [{source_info['name']}] Fuso corrigido para {corrected_tz}, use_timezone=1"
+                                            )
+                                        except Exception as e:
+                                            self.logger.error(f"Failed to update timezone for {source_info['name']}: {e}")
                                 
-                                # PHASE 2: Processar artigos com fuso já corrigido
-                                articles_inserted = 0
-                                articles_skipped = 0
-                                sources_added = 0
+                            # PHASE 2: Processar artigos com fuso já corrigido
+                            articles_inserted = 0
+                            articles_skipped = 0
+                            sources_added = 0
                                 
-                                for article in articles:
-                                    if self.shutdown_flag:
-                                        break
+                            for article in articles:
+                                if self.shutdown_flag:
+                                    break
                                     
-                                    await asyncio.sleep(0)  # cooperate with other tasks
+                                await asyncio.sleep(0)  # cooperate with other tasks
                                     
-                                    article_source = article['source']
-                                    article_source_id = article_source['id']
-                                    article_source_name = article_source['name']
-                                    source_id = article_source_name if article_source_id is None else article_source_id
-                                    source_name = article_source_name
-                                    article_author = article['author']
-                                    article_title = article['title']
+                                article_source = article['source']
+                                article_source_id = article_source['id']
+                                article_source_name = article_source['name']
+                                source_id = article_source_name if article_source_id is None else article_source_id
+                                source_name = article_source_name
+                                article_author = article['author']
+                                article_title = article['title']
                                     
-                                    # Clean title: normalize whitespace
-                                    if article_title:
-                                        article_title = ' '.join(article_title.split())
+                                # Clean title: normalize whitespace
+                                if article_title:
+                                    article_title = ' '.join(article_title.split())
                                     
-                                    article_description = article['description']
-                                    article_url = article['url']
-                                    article_urlToImage = article['urlToImage']
-                                    article_publishedAt = article['publishedAt']  # Keep original with timezone
-                                    article_content = article['content']
+                                article_description = article['description']
+                                article_url = article['url']
+                                article_urlToImage = article['urlToImage']
+                                article_publishedAt = article['publishedAt']  # Keep original with timezone
+                                article_content = article['content']
                                     
-                                    # Sanitize HTML in description and content
-                                    if article_description:
-                                        article_description = sanitize_html_content(article_description)
+                                # Sanitize HTML in description and content
+                                if article_description:
+                                    article_description = sanitize_html_content(article_description)
                                     
-                                    if article_content:
-                                        article_content = sanitize_html_content(article_content)
+                                if article_content:
+                                    article_content = sanitize_html_content(article_content)
                                     
-                                    # Extract first image from description if urlToImage is missing
-                                    # Also remove the image from HTML to avoid displaying twice
-                                    if not article_urlToImage and article_description:
-                                        article_urlToImage, article_description = extract_and_remove_first_image(article_description)
-                                        article_urlToImage = article_urlToImage or ''
+                                # Extract first image from description if urlToImage is missing
+                                # Also remove the image from HTML to avoid displaying twice
+                                if not article_urlToImage and article_description:
+                                    article_urlToImage, article_description = extract_and_remove_first_image(article_description)
+                                    article_urlToImage = article_urlToImage or ''
                                     
-                                    # Get source timezone if available
-                                    source_tz = self.sources.get(source_id, {}).get('timezone')
+                                # Get source timezone if available
+                                source_tz = self.sources.get(source_id, {}).get('timezone')
                                     
-                                    # Create normalized UTC version (article timezone has priority over source timezone)
-                                    # Use source timezone only if use_timezone flag is enabled
-                                    use_tz = self.sources.get(source_id, {}).get('use_timezone', 0)
-                                    article_publishedAt_gmt, detected_tz = normalize_timestamp_to_utc(article_publishedAt, source_tz, use_source_timezone=(use_tz == 1))
+                                # Create normalized UTC version (article timezone has priority over source timezone)
+                                # Use source timezone only if use_timezone flag is enabled
+                                use_tz = self.sources.get(source_id, {}).get('use_timezone', 0)
+                                article_publishedAt_gmt, detected_tz = normalize_timestamp_to_utc(article_publishedAt, source_tz, use_source_timezone=(use_tz == 1))
                                     
-                                    # Update source timezone if detected from article and different from configured
-                                    if detected_tz and source_tz != detected_tz:
-                                        self.loop.create_task(self.update_source_timezone(source_id, detected_tz))
+                                # Update source timezone if detected from article and different from configured
+                                if detected_tz and source_tz != detected_tz:
+                                    self.loop.create_task(self.update_source_timezone(source_id, detected_tz))
                                     
-                                    article_key = url_encode(article_title + article_url + article_publishedAt)
+                                article_key = url_encode(article_title + article_url + article_publishedAt)
                                     
-                                    # Try to extract source URL from article URL
-                                    if not article_url:
-                                        article_url = ''
-                                    try:
-                                        parsed_url = urlparse(article_url)
-                                        inferred_source_url = f"{parsed_url.scheme}://{parsed_url.netloc}"
-                                    except:
-                                        inferred_source_url = ''
+                                # Try to extract source URL from article URL
+                                if not article_url:
+                                    article_url = ''
+                                try:
+                                    parsed_url = urlparse(article_url)
+                                    inferred_source_url = f"{parsed_url.scheme}://{parsed_url.netloc}"
+                                except:
+                                    inferred_source_url = ''
                                     
-                                    # Add new source if not exists
-                                    if source_id not in self.sources:
-                                        self.logger.debug(f"New source detected: {source_name} (id: {source_id})")
-                                        source_url = inferred_source_url
-                                        source_description = ''
+                                # Add new source if not exists
+                                if source_id not in self.sources:
+                                    self.logger.debug(f"New source detected: {source_name} (id: {source_id})")
+                                    source_url = inferred_source_url
+                                    source_description = ''
                                         
-                                        new_source = {
-                                            'id_source': source_id,
-                                            'name': source_name,
-                                            'url': source_url,
-                                            'description': source_description,
-                                            'category': '',
-                                            'country': '',
-                                            'language': lang
-                                        }
-                                        
-                                        self.sources[source_id] = {**new_source, 'articles': {}}
-
-                                        try:
-                                            await self.db.insert_source_if_new(new_source)
-                                            sources_added += 1
-                                            self.logger.info(f"✅ Added source: {source_name}")
-                                            # Try to discover RSS feed
-                                            if source_url:
-                                                self.loop.create_task(
-                                                    self.register_rss_source(session, source_id, source_name, source_url)
-                                                )
-                                        except Exception as e:
-                                            self.logger.error(f"Failed to insert source {source_name}: {e}")
-                                    
-                                    # NewsAPI requests are per-language (the `lang` loop variable).
-                                    # Use it directly — no need for langdetect on a title-only article.
-                                    detected_lang, lang_confidence = lang, 1.0
-
-                                    # Insert article
-                                    new_article = {
-                                        'id_article': article_key,
+                                    new_source = {
                                         'id_source': source_id,
-                                        'author': article_author,
-                                        'title': article_title,
-                                        'description': article_description,
-                                        'url': article_url,
-                                        'urlToImage': article_urlToImage,
-                                        'publishedAt': article_publishedAt,  # Original with timezone
-                                        'published_at_gmt': article_publishedAt_gmt,  # Normalized UTC
-                                        'content': article_content,
-                                        'inserted_at_ms': int(time.time() * 1000),  # Insertion timestamp in ms
-                                        'detected_language': detected_lang,
-                                        'language_confidence': lang_confidence,
-                                        'is_enriched': 0,
+                                        'name': source_name,
+                                        'url': source_url,
+                                        'description': source_description,
+                                        'category': '',
+                                        'country': '',
+                                        'language': lang
                                     }
-
-                                    if await self.enrich_article_content(new_article, source_name, source_id):
-                                        new_article['is_enriched'] = 1
+                                        
+                                    self.sources[source_id] = {**new_source, 'articles': {}}
 
                                     try:
-                                        if await self.db.insert_article(new_article):
-                                            articles_inserted += 1
-                                            self.logger.debug(f"✅ [{source_name}] {article_title[:60]}...")
-                                        else:
-                                            articles_skipped += 1
-                                            self.logger.debug(f"⏭️  [{source_name}] Already exists: {article_title[:40]}...")
+                                        await self.db.insert_source_if_new(new_source)
+                                        sources_added += 1
+                                        self.logger.info(f"✅ Added source: {source_name}")
+                                        # Try to discover RSS feed
+                                        if source_url:
+                                            self.loop.create_task(
+                                                self.register_rss_source(session, source_id, source_name, source_url)
+                                            )
                                     except Exception as e:
-                                        self.logger.error(f"Failed to insert article '{article_title[:40]}...': {e}")
+                                        self.logger.error(f"Failed to insert source {source_name}: {e}")
+                                    
+                                # NewsAPI requests are per-language (the `lang` loop variable).
+                                # Use it directly — no need for langdetect on a title-only article.
+                                detected_lang, lang_confidence = lang, 1.0
+
+                                # Insert article
+                                new_article = {
+                                    'id_article': article_key,
+                                    'id_source': source_id,
+                                    'author': article_author,
+                                    'title': article_title,
+                                    'description': article_description,
+                                    'url': article_url,
+                                    'urlToImage': article_urlToImage,
+                                    'publishedAt': article_publishedAt,  # Original with timezone
+                                    'published_at_gmt': article_publishedAt_gmt,  # Normalized UTC
+                                    'content': article_content,
+                                    'inserted_at_ms': int(time.time() * 1000),  # Insertion timestamp in ms
+                                    'detected_language': detected_lang,
+                                    'language_confidence': lang_confidence,
+                                    'is_enriched': 0,
+                                }
+
+                                if await self.enrich_article_content(new_article, source_name, source_id):
+                                    new_article['is_enriched'] = 1
+
+                                try:
+                                    if await self.db.insert_article(new_article):
+                                        articles_inserted += 1
+                                        self.logger.debug(f"✅ [{source_name}] {article_title[:60]}...")
+                                    else:
+                                        articles_skipped += 1
+                                        self.logger.debug(f"⏭️  [{source_name}] Already exists: {article_title[:40]}...")
+                                except Exception as e:
+                                    self.logger.error(f"Failed to insert article '{article_title[:40]}...': {e}")
                                 
-                                self.logger.info(f"Summary NewsAPI {lang}: {articles_inserted} inserted, {articles_skipped} skipped, {sources_added} new sources")
+                            self.logger.info(f"Summary NewsAPI {lang}: {articles_inserted} inserted, {articles_skipped} skipped, {sources_added} new sources")
                         
-                        except aiohttp.ClientError as e:
-                            self.logger.error(f"Network error fetching NewsAPI {lang}: {e}")
-                        except json.JSONDecodeError as e:
-                            self.logger.error(f"JSON decode error for NewsAPI {lang}: {e}")
-                        except Exception as e:
-                            self.logger.error(f"Unexpected error processing NewsAPI {lang}: {e}", exc_info=True)
+                    except aiohttp.ClientError as e:
+                        self.logger.error(f"Network error fetching NewsAPI {lang}: {e}")
+                    except json.JSONDecodeError as e:
+                        self.logger.error(f"JSON decode error for NewsAPI {lang}: {e}")
+                    except Exception as e:
+                        self.logger.error(f"Unexpected error processing NewsAPI {lang}: {e}", exc_info=True)
                 
                 if not self.shutdown_flag:
                     self.logger.info(f"NewsAPI cycle {cycle_count} complete. Sleeping {NEWSAPI_CYCLE_INTERVAL}s...")
@@ -1887,174 +1838,228 @@ class NewsGather():
         finally:
             self.logger.info("🗞️  NewsAPI collector stopped")
     
+    async def _load_rss_schedule(self) -> int:
+        """
+        Sync the feed scheduler with gm_sources (skipping fetch_blocked).
+        Returns the number of scheduled RSS feeds.
+        """
+        raw_sources = await self.db.load_rss_sources(skip_blocked=True)
+        rss_sources = [
+            {
+                'id':       r['id_source'],
+                'name':     r['name'],
+                'url':      r['url'],
+                'language': r.get('language') or 'en',
+            }
+            for r in raw_sources
+        ]
+        added, removed = self._feed_scheduler.sync(rss_sources)
+        if added or removed:
+            self.logger.info(
+                f"📡 RSS schedule: {len(self._feed_scheduler)} feeds (+{added}, -{removed})"
+            )
+        return len(self._feed_scheduler)
+
     async def collect_rss_feeds(self):
         """
-        Collect articles from all RSS sources in database in a continuous loop.
+        Collect articles from all RSS sources in database, continuously.
 
-        Pipeline architecture (3 stages)
+        Pipeline architecture (4 stages)
         ─────────────────────────────────
-        Stage 1  _rss_fetcher (×RSS_MAX_CONCURRENT, semaphore-controlled)
+        Stage 1  _rss_fetcher (≤RSS_S1_MAX_CONCURRENT in flight)
+                 │  Driven by FeedScheduler: each feed is fetched when it is
+                 │  due, and its next-due time follows its own publish rate,
+                 │  cache headers and error history.
                  │  HTTP fetch + feedparser only; semaphore released before queue.put()
                  ▼
             PipelineQueue  q_s1_s2  [(source, feed), …]
                  │
         Stage 2  _rss_process_one  (×RSS_INITIAL_WORKERS → RSS_MAX_WORKERS, dynamic)
-                 │  timezone detection + CPU normalisation (executor) + bulk dedup read
-                 │  Multiple workers overlap their run_in_executor calls in parallel.
+                 │  timezone detection + CPU normalisation (executor)
                  ▼
             PipelineQueue  q_s2_s3  [(source_id, name, batch, tz_list), …]
                  │
-        Stage 3  _rss_write_batch  (×1, fixed — no write concurrency)
+        Stage 3  _rss_dedup  (×RSS_S3_DEDUP_WORKERS)
+                 │  bulk title-hash read on per-worker read-only connections
+                 ▼
+            PipelineQueue  q_s3_s4
+                 │
+        Stage 4  _rss_write_batch  (×1, fixed — no write concurrency)
                  │  INSERT OR IGNORE batches + timezone consistency back-fill
                  ▼
                  ∅
 
+        Stages 2–4 are long-lived; they only drain on shutdown.  Every
+        RSS_CYCLE_INTERVAL seconds the driver closes a stats window
+        (``_rss_cycle``), logs it, and reloads sources into the scheduler.
+
         PipelineSupervisor  monitors q_s1_s2 depth every 2 s and scales Stage 2
         up/down within [RSS_INITIAL_WORKERS, RSS_MAX_WORKERS].
         """
         self.logger.info("📡 RSS collector started")
         cycle_count = 0
 
-        try:
-            while not self.shutdown_flag:
-                cycle_count += 1
-                self.logger.info(f"📡 RSS Cycle {cycle_count} starting...")
-
-                # Get all RSS sources from database (skip fetch_blocked sources)
-                raw_sources = await self.db.load_rss_sources(skip_blocked=True)
-                rss_sources = [
-                    {
-                        'id':       r['id_source'],
-                        'name':     r['name'],
-                        'url':      r['url'],
-                        'language': r.get('language') or 'en',
-                    }
-                    for r in raw_sources
-                ]
-
-                if not rss_sources:
-                    self.logger.info("No RSS sources found in database")
-                    if not self.shutdown_flag:
-                        self.logger.info(f"RSS: No sources yet. Sleeping {RSS_CYCLE_INTERVAL}s...")
-                        await asyncio.sleep(RSS_CYCLE_INTERVAL)
-                    continue
-
-                self.logger.info(f"Found {len(rss_sources)} RSS sources to process")
-
-                # Reset per-cycle counters
-                self._rss_cycle.update({
-                    'cycle':        cycle_count,
-                    'started_at':   time.time(),
-                    'total':        len(rss_sources),
-                    'running':      0,
-                    'done':         0,
-                    'queued':       0,
-                    'processed':    0,
-                    'ok':           0,
-                    'err_http':     0,
-                    'err_content':  0,
-                    'err_timeout':  0,
-                    'articles_new': 0,
-                    'sleeping_until': None,
-                })
-
-                # ── Build pipeline ───────────────────────────────────────────────
-                q_s1_s2 = PipelineQueue('rss:s1→s2')   # (source, feed) tuples
-                q_s2_s3 = PipelineQueue('rss:s2→s3')   # (src_id, name, raw_batch, tzs)
-                q_s3_s4 = PipelineQueue('rss:s3→s4')   # (src_id, name, merged_batch, tzs)
-
-                stage2 = PipelineStage(
-                    'rss-processor',
-                    input_queue=q_s1_s2,
-                    output_queue=q_s2_s3,
-                    handler=self._rss_process_one,
-                    min_workers=RSS_S2_INITIAL_WORKERS,
-                    max_workers=RSS_S2_MAX_WORKERS,
-                )
-                stage3 = PipelineStage(
-                    'rss-dedup',
-                    input_queue=q_s2_s3,
-                    output_queue=q_s3_s4,
-                    handler=self._rss_dedup,
-                    min_workers=RSS_S3_DEDUP_WORKERS,
-                    max_workers=RSS_S3_DEDUP_WORKERS,
-                )
-                stage4 = PipelineStage(
-                    'rss-db-writer',
-                    input_queue=q_s3_s4,
-                    output_queue=None,
-                    handler=self._rss_write_batch,
-                    min_workers=RSS_S4_MAX_WORKERS,
-                    max_workers=RSS_S4_MAX_WORKERS,
-                )
-                supervisor = PipelineSupervisor(
-                    [stage2],
-                    check_interval=2.0,
-                    scale_up_threshold=8,
-                    scale_down_threshold=2,
-                )
+        # ── Build pipeline (once) ────────────────────────────────────────────
+        q_s1_s2 = PipelineQueue('rss:s1→s2')   # (source, feed) tuples
+        q_s2_s3 = PipelineQueue('rss:s2→s3')   # (src_id, name, raw_batch, tzs)
+        q_s3_s4 = PipelineQueue('rss:s3→s4')   # (src_id, name, merged_batch, tzs)
+
+        stage2 = PipelineStage(
+            'rss-processor',
+            input_queue=q_s1_s2,
+            output_queue=q_s2_s3,
+            handler=self._rss_process_one,
+            min_workers=RSS_S2_INITIAL_WORKERS,
+            max_workers=RSS_S2_MAX_WORKERS,
+        )
+        stage3 = PipelineStage(
+            'rss-dedup',
+            input_queue=q_s2_s3,
+            output_queue=q_s3_s4,
+            handler=self._rss_dedup,
+            min_workers=RSS_S3_DEDUP_WORKERS,
+            max_workers=RSS_S3_DEDUP_WORKERS,
+        )
+        stage4 = PipelineStage(
+            'rss-db-writer',
+            input_queue=q_s3_s4,
+            output_queue=None,
+            handler=self._rss_write_batch,
+            min_workers=RSS_S4_MAX_WORKERS,
+            max_workers=RSS_S4_MAX_WORKERS,
+        )
+        supervisor = PipelineSupervisor(
+            [stage2],
+            check_interval=2.0,
+            scale_up_threshold=8,
+            scale_down_threshold=2,
+        )
 
-                # Expose to /api/queues during this cycle
-                self._rss_stage2 = stage2
-                self._rss_q_s2s3 = q_s2_s3
-                self._rss_q_s3s4 = q_s3_s4
+        # Expose to /api/queues
+        self._rss_stage2 = stage2
+        self._rss_q_s2s3 = q_s2_s3
+        self._rss_q_s3s4 = q_s3_s4
 
-                await stage2.start(initial=RSS_S2_INITIAL_WORKERS)
-                await stage3.start(initial=RSS_S3_DEDUP_WORKERS)
-                await stage4.start(initial=RSS_S4_MAX_WORKERS)
-                supervisor.start()
+        if self._rss_s2_pool is not None:
+            self._rss_s2_pool.start()
+        await stage2.start(initial=RSS_S2_INITIAL_WORKERS)
+        await stage3.start(initial=RSS_S3_DEDUP_WORKERS)
+        await stage4.start(initial=RSS_S4_MAX_WORKERS)
+        supervisor.start()
 
-                # ── Stage 1: dispatch all fetchers ────────────────────────────────
-                semaphore = asyncio.Semaphore(RSS_S1_MAX_CONCURRENT)
-                async with aiohttp.ClientSession() as session:
-                    self.logger.info(
-                        f"📡 Dispatching {len(rss_sources)} RSS feeds "
-                        f"(S1={RSS_S1_MAX_CONCURRENT}, "
-                        f"S2={RSS_S2_INITIAL_WORKERS}→{RSS_S2_MAX_WORKERS}, "
-                        f"S3-dedup={RSS_S3_DEDUP_WORKERS}, "
-                        f"S4-write={RSS_S4_MAX_WORKERS})..."
-                    )
-                    tasks = [
-                        self._rss_fetcher(session, source, semaphore, q_s1_s2)
-                        for source in rss_sources
-                    ]
-                    await asyncio.gather(*tasks, return_exceptions=True)
-
-                # ── Drain: S1 done → S2 → S3 → S4 ───────────────────────────────
-                stage2.signal_upstream_done()
-                await stage2.wait_done()
-                supervisor.stop()
+        semaphore = asyncio.Semaphore(RSS_S1_MAX_CONCURRENT)
+        in_flight: set = set()
+        wake      = asyncio.Event()   # set whenever a Stage-1 slot frees up
 
-                stage3.signal_upstream_done()
-                await stage3.wait_done()
+        def _on_fetch_done(task: asyncio.Task) -> None:
+            in_flight.discard(task)
+            wake.set()
 
-                stage4.signal_upstream_done()
-                await stage4.wait_done()
+        try:
+            await self._load_rss_schedule()
+            try:
+                self._feed_scheduler.seed_rates(
+                    await self.db.fetch_source_publish_rates(RSS_POLL_HISTORY_DAYS)
+                )
+            except Exception as e:
+                self.logger.debug(f"Could not seed RSS publish rates: {e}")
+
+            session = self.http.session
+            self.logger.info(
+                f"📡 Continuous RSS polling of {len(self._feed_scheduler)} feeds "
+                f"(interval {RSS_POLL_MIN_INTERVAL}s–{RSS_POLL_MAX_INTERVAL}s, "
+                f"S1={RSS_S1_MAX_CONCURRENT}, "
+                f"S2={RSS_S2_INITIAL_WORKERS}→{RSS_S2_MAX_WORKERS} "
+            f"(procs={RSS_S2_PROCESS_WORKERS}), "
+                f"S3-dedup={RSS_S3_DEDUP_WORKERS}, "
+                f"S4-write={RSS_S4_MAX_WORKERS})..."
+            )
+            window_end = 0.0
+            while not self.shutdown_flag:
+                now = time.time()
 
-                # Clear live pipeline refs
-                self._rss_stage2 = None
-                self._rss_q_s2s3 = None
-                self._rss_q_s3s4 = None
+                # ── Stats window roll-over + source reload ───────────────
+                if now >= window_end:
+                    if cycle_count:
+                        rc = self._rss_cycle
+                        self.logger.info(
+                            f"📡 RSS window {cycle_count} — "
+                            f"polled={rc['done']} ok={rc['ok']} new_articles={rc['articles_new']} "
+                            f"http_err={rc['err_http']} content_err={rc['err_content']} "
+                            f"timeout={rc['err_timeout']} dns={rc['err_dns']} "
+                            f"not_modified={rc['not_modified']} "
+                            f"| {self._feed_scheduler.to_dict(now)}"
+                        )
+                        await self.reload_sources()
+                        await self._load_rss_schedule()
+                    cycle_count += 1
+                    window_end = now + RSS_CYCLE_INTERVAL
+                    self._rss_cycle.update({
+                        'cycle':        cycle_count,
+                        'started_at':   now,
+                        'total':        0,
+                        'running':      0,
+                        'done':         0,
+                        'queued':       0,
+                        'processed':    0,
+                        'ok':           0,
+                        'err_http':     0,
+                        'err_content':  0,
+                        'err_timeout':  0,
+                        'err_dns':      0,
+                        'not_modified': 0,
+                        'streamed':     0,
+                        'stream_stopped': 0,
+                        'articles_new': 0,
+                        'cpu_s1_parse':     0.0,
+                        'cpu_s2_normalise': 0.0,
+                        'wall_s2_normalise': 0.0,
+                        'sleeping_until': None,
+                    })
 
-                rc = self._rss_cycle
-                self.logger.info(
-                    f"📡 RSS cycle {cycle_count} complete — "
-                    f"ok={rc['ok']} new_articles={rc['articles_new']} "
-                    f"http_err={rc['err_http']} content_err={rc['err_content']} "
-                    f"timeout={rc['err_timeout']}"
+                # ── Dispatch whatever is due into free Stage-1 slots ─────
+                # Clear before dispatching so a fetch finishing from here
+                # on always wakes the wait below.
+                wake.clear()
+                free = RSS_S1_MAX_CONCURRENT - len(in_flight)
+                if free > 0:
+                    for source in self._feed_scheduler.pop_due(free, now):
+                        task = asyncio.create_task(
+                            self._rss_fetcher(session, source, semaphore, q_s1_s2),
+                            name=f"rss-fetch-{source['id']}",
+                        )
+                        in_flight.add(task)
+                        task.add_done_callback(_on_fetch_done)
+                        self._rss_cycle['total'] += 1
+
+                # ── Wait for the next due feed, a free slot, or window end ─
+                next_due = self._feed_scheduler.seconds_until_next(now)
+                timeout  = window_end - now
+                if next_due is not None and len(in_flight) < RSS_S1_MAX_CONCURRENT:
+                    timeout = min(timeout, next_due)
+                timeout = max(timeout, 0.05)
+                self._rss_cycle['sleeping_until'] = (
+                    now + timeout if not in_flight else None
                 )
+                try:
+                    await asyncio.wait_for(wake.wait(), timeout=timeout)
+                except asyncio.TimeoutError:
+                    pass
+                self._rss_cycle['sleeping_until'] = None
 
-                if not self.shutdown_flag:
-                    sleep_until = time.time() + RSS_CYCLE_INTERVAL
-                    self._rss_cycle['sleeping_until'] = sleep_until
-                    self.logger.info(f"RSS cycle {cycle_count} complete. Sleeping {RSS_CYCLE_INTERVAL}s...")
-                    # Reload sources to pick up any database changes
-                    await self.reload_sources()
-                    await asyncio.sleep(RSS_CYCLE_INTERVAL)
-                    self._rss_cycle['sleeping_until'] = None
+            if in_flight:
+                await asyncio.gather(*in_flight, return_exceptions=True)
         except asyncio.CancelledError:
             self.logger.info("📡 RSS collector cancelled")
         finally:
+            for task in list(in_flight):
+                task.cancel()
+            supervisor.stop()
+            for stage in (stage2, stage3, stage4):
+                stage.signal_upstream_done()
+                await stage.wait_done()
+            if self._rss_s2_pool is not None:
+                self._rss_s2_pool.stop(wait=False)
             self._rss_stage2 = None
             self._rss_q_s2s3 = None
             self._rss_q_s3s4 = None
@@ -2072,42 +2077,99 @@ class NewsGather():
         if self.shutdown_flag:
             return
         parsed_feed = None
+        outcome     = 'error'     # reported to the feed scheduler
+        headers     = None
+        stream = None
+        if RSS_STREAM_ENABLED and source['id'] not in self._stream_fallback:
+            known = self._feed_known_titles.get(source['id'])
+            stream = StreamingFeedParser(
+                is_known=(lambda t, k=known: _make_title_hash(t) in k) if known else None,
+                stop_after=RSS_STREAM_STOP_AFTER,
+            )
         async with semaphore:
             if self.shutdown_flag:
                 return
             self._rss_cycle['running'] += 1
             try:
-                status, content_type, content = await self._fetch_rss_content(
-                    session, source['url'], RSS_TIMEOUT
-                )
+                try:
+                    status, content_type, content, headers = await self._fetch_rss_conditional(
+                        session, source['url'], RSS_TIMEOUT,
+                        validators=self._feed_validators.get(source['id']),
+                        stream=stream,
+                    )
+                except ValueError as stream_err:
+                    # XML too broken for the pull parser — feedparser from now on
+                    self._stream_fallback.add(source['id'])
+                    self._feed_known_titles.pop(source['id'], None)
+                    self.logger.debug(
+                        f"⚠️  [{source['name']}] Streaming parse failed ({stream_err}), refetching"
+                    )
+                    status, content_type, content, headers = await self._fetch_rss_conditional(
+                        session, source['url'], RSS_TIMEOUT,
+                        validators=self._feed_validators.get(source['id']),
+                    )
+                if status == 304:
+                    # Feed unchanged since our last full fetch — nothing for Stages 2–4
+                    outcome = 'not_modified'
+                    self._rss_cycle['not_modified'] += 1
+                    self.logger.debug(f"♻️  [{source['name']}] 304 Not Modified")
+                    return
                 if status != 200:
                     self._rss_cycle['err_http'] += 1
                     self.logger.warning(f"❌ [{source['name']}] HTTP {status}")
                     return
-                if (not self._looks_like_feed_content_type(content_type)
-                        and not self._looks_like_feed_body(content)):
-                    self._rss_cycle['err_content'] += 1
-                    self.logger.warning(f"❌ [{source['name']}] Invalid content type: {content_type}")
-                    return
-                try:
-                    _loop = asyncio.get_event_loop()
-                    feed = await _loop.run_in_executor(None, feedparser.parse, content)
-                except Exception as parse_err:
-                    self._rss_cycle['err_content'] += 1
-                    self.logger.debug(f"⚠️  [{source['name']}] Parser error: {parse_err}")
-                    return
+                if content is None:
+                    # Large feed, parsed incrementally while downloading
+                    feed = stream.result
+                    self._rss_cycle['streamed'] += 1
+                    self._feed_known_titles.setdefault(source['id'], set())
+                    if feed.truncated:
+                        self._rss_cycle['stream_stopped'] += 1
+                        self.logger.debug(
+                            f"✂️  [{source['name']}] Stopped after {len(feed.entries)} entries "
+                            f"({feed.bytes_read // 1024} KB) — rest already stored"
+                        )
+                else:
+                    if (not self._looks_like_feed_content_type(content_type)
+                            and not self._looks_like_feed_body(content)):
+                        self._rss_cycle['err_content'] += 1
+                        self.logger.warning(f"❌ [{source['name']}] Invalid content type: {content_type}")
+                        return
+                    try:
+                        _loop = asyncio.get_event_loop()
+                        feed, cpu_s = await _loop.run_in_executor(None, _parse_feed_timed, content)
+                        self._rss_cycle['cpu_s1_parse'] += cpu_s
+                    except Exception as parse_err:
+                        self._rss_cycle['err_content'] += 1
+                        self.logger.debug(f"⚠️  [{source['name']}] Parser error: {parse_err}")
+                        return
+                    # Small again (or never streamed) — no early-stop set needed
+                    self._feed_known_titles.pop(source['id'], None)
+                outcome = 'ok'
+                validators = self._validators_from_headers(status, headers)
                 if not feed.entries:
                     self.logger.debug(f"⚠️  [{source['name']}] No entries found")
+                    await self._remember_feed_validators(source['id'], validators)
                     return
-                parsed_feed = (source, feed)
+                # Validators travel with the batch and are saved only once its
+                # entries are stored — a crash or shutdown with the batch still
+                # queued must not leave us getting 304s for articles we never wrote.
+                parsed_feed = (source, feed, validators)
             except asyncio.TimeoutError:
                 self._rss_cycle['err_timeout'] += 1
                 self.logger.warning(f"⏱️  [{source['name']}] Fetch timeout ({RSS_TIMEOUT}s)")
             except Exception as e:
-                self.logger.debug(f"❌ [{source['name']}] Fetch error: {str(e)[:80]}")
+                if _dns.is_nxdomain(urlparse(source['url']).hostname or ''):
+                    # Dead feed host — counts toward the source block like a 410
+                    self._rss_cycle['err_dns'] += 1
+                    self.logger.warning(f"🕳️  [{source['name']}] Feed host does not exist (NXDOMAIN)")
+                    await self._increment_blocked_count(source['id'], source['name'], 'NXDOMAIN')
+                else:
+                    self.logger.debug(f"❌ [{source['name']}] Fetch error: {str(e)[:80]}")
             finally:
                 self._rss_cycle['running'] -= 1
                 self._rss_cycle['done']    += 1
+                self._feed_scheduler.record_poll(source['id'], outcome, headers)
         # Semaphore already released — queue.put() can never block a network slot
         if parsed_feed is not None:
             await queue.put(parsed_feed)
@@ -2118,20 +2180,57 @@ class NewsGather():
             # fully completes.
             await asyncio.sleep(0)
 
+    def _remember_feed_titles(self, source_id: str, hashes) -> None:
+        """
+        Add stored title hashes to a streamed feed's early-stop set.  Only
+        feeds that went through the streaming parser keep a set, bounded by
+        ``RSS_STREAM_KNOWN_MAX`` (reset when full — one full parse re-fills it).
+        """
+        known = self._feed_known_titles.get(source_id)
+        if known is None:
+            return
+        if len(known) >= RSS_STREAM_KNOWN_MAX:
+            known.clear()
+        known.update(hashes)
+
+    async def _remember_feed_validators(self, source_id: str, validators: Optional[dict]) -> None:
+        """
+        Keep ``_feed_validators`` and gm_feed_validators in step with the last
+        feed body whose entries are all stored.  Only writes when the values actually change,
+        so feeds that never send ETag / Last-Modified cost nothing.
+        """
+        if self._feed_validators.get(source_id) == validators:
+            return
+        if validators:
+            self._feed_validators[source_id] = validators
+        else:
+            self._feed_validators.pop(source_id, None)
+        try:
+            await self.db.save_feed_validator(
+                source_id,
+                (validators or {}).get('etag'),
+                (validators or {}).get('last_modified'),
+            )
+        except Exception as e:
+            self.logger.debug(f"Could not save feed validators for {source_id}: {e}")
+
     @_watchdog.track
     async def _rss_process_one(self, item: tuple) -> Optional[tuple]:
         """
         Stage 2 handler — CPU + DB-read work for one (source, feed) pair.
 
         Runs as one of N concurrent worker coroutines managed by PipelineStage.
-        All CPU-bound work is dispatched to a ProcessPoolExecutor so that
-        multiple workers can overlap their executor calls in parallel.
-
-        Returns a ``(source_id, source_name, batch, detected_tzs)`` tuple
-        for Stage 3 to write, or ``None`` on error / shutdown / empty feed.
+        Entry normalisation runs in ``_rss_s2_pool`` (spawned processes, so
+        workers really run in parallel instead of sharing the GIL); entries
+        are reduced to plain dicts first so pickling stays cheap.  With
+        ``RSS_S2_PROCESS_WORKERS=0`` — or if the pool fails — it falls back
+        to the default thread executor.
+
+        Returns a ``(source_id, source_name, batch, detected_tzs, validators)``
+        tuple for Stage 3 to write, or ``None`` on error / shutdown / empty feed.
         Always increments ``_rss_cycle['processed']`` regardless of outcome.
         """
-        source, feed = item
+        source, feed, validators = item
         source_id    = source['id']
         source_name  = source['name']
         _loop        = asyncio.get_event_loop()
@@ -2180,58 +2279,32 @@ class NewsGather():
                 _feed_lang_raw = (feed.feed.get('language') or '').strip().lower()
                 _source_declared_lang = _feed_lang_raw[:2] if _feed_lang_raw else ''
 
-            def _prepare_entries(entries, src_tz, use_source_tz, src_lang):
-                prepared = []
-                for entry in entries:
-                    # Title is mandatory — skip entry immediately if absent
-                    title = ' '.join(as_text(entry.get('title', '')).split())
-                    if not title:
-                        continue
-                    url = as_text(entry.get('link', ''))
-                    if not url:
-                        continue
-                    description = as_text(entry.get('summary', entry.get('description', '')))
-                    author      = as_text(entry.get('author', ''))
-                    published   = as_text(entry.get('published', entry.get('updated', '')))
-                    published_gmt, detected_tz = normalize_timestamp_to_utc(
-                        published, src_tz, use_source_timezone=use_source_tz
-                    )
-                    clean_description = sanitize_html_content(description) if description else ''
-                    extracted_image_url, clean_description = (
-                        extract_and_remove_first_image(clean_description)
-                        if clean_description else (None, clean_description)
-                    )
-                    if src_lang:
-                        detected_lang, lang_confidence = src_lang, 1.0
-                    else:
-                        detected_lang, lang_confidence = detect_article_language(
-                            title, clean_description
-                        )
-                    # entry.source has the real publisher URL/name for aggregator
-                    # feeds like Google News (entry.link is always a proxy URL)
-                    _src = entry.get('source', {})
-                    source_href  = as_text(_src.get('href', ''))
-                    source_title = as_text(_src.get('title', ''))
-                    prepared.append({
-                        'title':             title,
-                        'url':               url,
-                        'author':            author,
-                        'published':         published,
-                        'published_gmt':     published_gmt,
-                        'detected_tz':       detected_tz,
-                        'clean_description': clean_description,
-                        'image_url':         extracted_image_url or '',
-                        'detected_lang':     detected_lang,
-                        'lang_confidence':   lang_confidence,
-                        'source_href':       source_href,
-                        'source_title':      source_title,
-                    })
-                return prepared
-
-            prepared_entries = await _loop.run_in_executor(
-                None, _prepare_entries,
-                feed.entries, source_tz, (use_tz == 1), _source_declared_lang,
+            prep_args = (
+                [entry_to_dict(e) for e in feed.entries],
+                source_tz, (use_tz == 1), _source_declared_lang,
             )
+            t0 = time.monotonic()
+            prepared = None
+            if self._rss_s2_pool is not None:
+                result = await self._rss_s2_pool.submit(Task(
+                    kind=TaskKind.CPU,
+                    fn='rss_normalize.prepare_entries_timed',
+                    args=prep_args,
+                ))
+                if result.ok:
+                    prepared = result.result
+                else:
+                    self.logger.warning(
+                        f"⚠️  [{source_name}] Normaliser process failed, using thread: "
+                        f"{result.error.strip().splitlines()[-1]}"
+                    )
+            if prepared is None:
+                prepared = await _loop.run_in_executor(
+                    None, prepare_entries_timed, *prep_args,
+                )
+            prepared_entries, cpu_s = prepared
+            self._rss_cycle['cpu_s2_normalise']  += cpu_s
+            self._rss_cycle['wall_s2_normalise'] += time.monotonic() - t0
 
             # ── Phase 3: build article dicts + bulk dedup read ────────────────────
             now_ms             = int(time.time() * 1000)
@@ -2272,10 +2345,15 @@ class NewsGather():
                     '_source_title':       p.get('source_title', ''),
                 })
 
+            self._feed_scheduler.observe_publish_times(
+                source_id, (p['published_gmt'] for p in prepared_entries)
+            )
+
             if not batch:
+                await self._remember_feed_validators(source_id, validators)
                 return None
 
-            return (source_id, source_name, batch, detected_tzs)
+            return (source_id, source_name, batch, detected_tzs, validators)
 
         except Exception as e:
             self.logger.error(f"❌ RSS processor [{source_name}]: {e}", exc_info=True)
@@ -2297,7 +2375,7 @@ class NewsGather():
         aiosqlite connection (one OS thread per connection) so that N workers
         issue their queries truly in parallel.
         """
-        source_id, source_name, batch, detected_tzs = item
+        source_id, source_name, batch, detected_tzs, validators = item
 
         # ── Per-worker connection (opened once, closed when task exits) ─────
         task = asyncio.current_task()
@@ -2319,16 +2397,38 @@ class NewsGather():
             all_hashes = [a['title_hash'] for a in batch]   # never empty; title always present
             existing   = await self.db.find_existing_title_hashes(all_hashes, conn=conn)
 
+            self._remember_feed_titles(source_id, existing)
             deduped = [a for a in batch if a['title_hash'] not in existing]
             if not deduped:
-                return None   # all already in DB
+                # All already in DB — the feed body is fully stored
+                await self._remember_feed_validators(source_id, validators)
+                return None
 
-            return (source_id, source_name, deduped, detected_tzs)
+            return (source_id, source_name, deduped, detected_tzs, validators)
 
         except Exception as e:
             self.logger.error(f"❌ RSS dedup [{source_name}]: {e}", exc_info=True)
             return item   # pass through unmodified on error
 
+    @staticmethod
+    def _publish_inserted(batch: list, inserted_hashes: list) -> None:
+        """
+        Push freshly committed rows to /api/stream subscribers, in the same
+        shape (and with the same future-date cut-off) as GET /api/articles.
+        """
+        inserted = set(inserted_hashes)
+        now_iso  = datetime.now(timezone.utc).isoformat()
+        items = [
+            {k: a.get(k) for k in _PUSH_ARTICLE_FIELDS}
+            for a in batch
+            if a.get('title_hash') in inserted
+            and (not a.get('published_at_gmt') or a['published_at_gmt'] <= now_iso)
+        ]
+        if items:
+            _push_bus.publish(
+                EVENT_ARTICLES, items, max(a['inserted_at_ms'] or 0 for a in items)
+            )
+
     @_watchdog.track
     async def _rss_write_batch(self, item: tuple) -> None:
         """
@@ -2337,10 +2437,10 @@ class NewsGather():
         Always runs in a single-worker PipelineStage so that SQLite write
         transactions never interleave.  Receives the tuple produced by
         ``_rss_dedup`` and performs:
-          • insert_articles_batch (chunked, INSERT OR IGNORE)
+          • insert_articles_bulk (one multi-row INSERT / COPY per feed)
           • timezone consistency back-fill if all entries share one timezone
         """
-        source_id, source_name, batch, detected_tzs = item
+        source_id, source_name, batch, detected_tzs, validators = item
 
         # ── DB inserts (single-worker → no write contention) ─────────────────
         # Strip internal pipeline-only keys before hitting the DB
@@ -2349,22 +2449,28 @@ class NewsGather():
             {k: v for k, v in a.items() if k not in _STRIP_KEYS}
             for a in batch
         ]
-        BATCH_SIZE        = 10
         articles_total    = len(clean_batch)
         articles_inserted = 0
         try:
-            for i in range(0, articles_total, BATCH_SIZE):
-                articles_inserted += await self.db.insert_articles_batch(
-                    clean_batch[i : i + BATCH_SIZE]
-                )
-            articles_skipped = articles_total - articles_inserted
+            inserted_hashes   = await self.db.insert_articles_bulk(clean_batch)
+            articles_inserted = len(inserted_hashes)
+            articles_skipped  = articles_total - articles_inserted
+            self._remember_feed_titles(source_id, (a['title_hash'] for a in clean_batch))
+            if inserted_hashes:
+                self._publish_inserted(clean_batch, inserted_hashes)
+            # Batch committed — only now may the next poll send these validators
+            await self._remember_feed_validators(source_id, validators)
         except Exception as e:
             self.logger.error(f"Failed to batch-insert RSS articles [{source_name}]: {e}")
             articles_inserted = 0
             articles_skipped  = articles_total
+            # Forget the validators so the next cycle re-downloads the full
+            # feed instead of getting a 304 for articles we never stored.
+            await self._remember_feed_validators(source_id, None)
 
         self._rss_cycle['ok']           += 1
         self._rss_cycle['articles_new'] += articles_inserted
+        self._feed_scheduler.record_new_articles(source_id, articles_inserted)
         if articles_inserted > 0:
             self.logger.debug(
                 f"✅ [{source_name}] {articles_inserted} new, {articles_skipped} existing"
@@ -2431,12 +2537,15 @@ class NewsGather():
                 self.logger.debug(
                     f"🔍 [{source_name}] Probing publisher for RSS: {netloc} ({pub_name})"
                 )
-                async with aiohttp.ClientSession() as _sess:
-                    self.loop.create_task(
-                        self._discover_and_register_domain(
-                            _sess, netloc, derived_id, source_lang, pub_name=pub_name
-                        )
+                if netloc in self._discovering:
+                    continue
+                self._discovering.add(netloc)
+                task = self.loop.create_task(
+                    self._discover_and_register_domain(
+                        self.http.session, netloc, derived_id, source_lang, pub_name=pub_name
                     )
+                )
+                task.add_done_callback(lambda _t, d=netloc: self._discovering.discard(d))
 
         return None  # terminal stage — nothing forwarded downstream
 
@@ -2469,141 +2578,141 @@ class NewsGather():
                     'errors': 0
                 }
                 
-                async with aiohttp.ClientSession() as session:
-                    for i, language in enumerate(languages):
-                        if self.shutdown_flag:
-                            break
+                session = self.http.session
+                for i, language in enumerate(languages):
+                    if self.shutdown_flag:
+                        break
                         
-                        self.logger.info(f"🌍 Collecting MediaStack news for language: {language}")
+                    self.logger.info(f"🌍 Collecting MediaStack news for language: {language}")
                         
-                        try:
-                            # Prepare request
-                            params = {
-                                'access_key': mediastack_key,
-                                'languages': language,
-                                'limit': 25,  # Collect 25 articles per language
-                                'sort': 'published_desc'
-                            }
-                            # On first cycle after restart, add date_range to catch up
-                            # articles published while the service was offline.
-                            if _is_first_cycle and getattr(self, '_startup_since_gmt', None):
-                                from datetime import datetime as _dt
-                                from_date = self._startup_since_gmt[:10]  # YYYY-MM-DD
-                                to_date   = _dt.utcnow().strftime('%Y-%m-%d')
-                                params['date_range'] = f"{from_date},{to_date}"
-                                self.logger.info(
-                                    f"🌍 MediaStack catch-up [{language}]: "
-                                    f"date_range {from_date},{to_date}"
-                                )
+                    try:
+                        # Prepare request
+                        params = {
+                            'access_key': mediastack_key,
+                            'languages': language,
+                            'limit': 25,  # Collect 25 articles per language
+                            'sort': 'published_desc'
+                        }
+                        # On first cycle after restart, add date_range to catch up
+                        # articles published while the service was offline.
+                        if _is_first_cycle and getattr(self, '_startup_since_gmt', None):
+                            from datetime import datetime as _dt
+                            from_date = self._startup_since_gmt[:10]  # YYYY-MM-DD
+                            to_date   = _dt.utcnow().strftime('%Y-%m-%d')
+                            params['date_range'] = f"{from_date},{to_date}"
+                            self.logger.info(
+                                f"🌍 MediaStack catch-up [{language}]: "
+                                f"date_range {from_date},{to_date}"
+                            )
                             
-                            # Fetch news
-                            async with session.get(
-                                MEDIASTACK_BASE_URL, 
-                                params=params, 
-                                headers=self._build_http_headers(MEDIASTACK_BASE_URL),
-                                timeout=aiohttp.ClientTimeout(total=30)
-                            ) as response:
-                                if response.status == 200:
-                                    data = await response.json()
+                        # Fetch news
+                        async with session.get(
+                            MEDIASTACK_BASE_URL, 
+                            params=params, 
+                            headers=self._build_http_headers(MEDIASTACK_BASE_URL),
+                            timeout=aiohttp.ClientTimeout(total=30)
+                        ) as response:
+                            if response.status == 200:
+                                data = await response.json()
                                     
-                                    # Check for API errors
-                                    if 'error' in data:
-                                        error_info = data['error']
-                                        self.logger.error(
-                                            f"❌ MediaStack API Error: {error_info.get('code')} - "
-                                            f"{error_info.get('message')}"
-                                        )
-                                        continue
+                                # Check for API errors
+                                if 'error' in data:
+                                    error_info = data['error']
+                                    self.logger.error(
+                                        f"❌ MediaStack API Error: {error_info.get('code')} - "
+                                        f"{error_info.get('message')}"
+                                    )
+                                    continue
                                     
-                                    articles = data.get('data', [])
-                                    total = data.get('pagination', {}).get('total', 0)
-                                    stats['total_fetched'] += len(articles)
+                                articles = data.get('data', [])
+                                total = data.get('pagination', {}).get('total', 0)
+                                stats['total_fetched'] += len(articles)
                                     
-                                    self.logger.info(
-                                        f"📥 MediaStack [{language}]: Received {len(articles)}/{total} articles"
-                                    )
+                                self.logger.info(
+                                    f"📥 MediaStack [{language}]: Received {len(articles)}/{total} articles"
+                                )
                                     
-                                    # PHASE 1: Agrupar artigos por fonte e detectar problemas de fuso
-                                    articles_by_source = {}
-                                    for article_data in articles:
-                                        source_name = article_data.get('source', 'unknown').strip()
-                                        source_id = f"mediastack-{source_name.lower().replace(' ', '-').replace('_', '-')}"
+                                # PHASE 1: Agrupar artigos por fonte e detectar problemas de fuso
+                                articles_by_source = {}
+                                for article_data in articles:
+                                    source_name = article_data.get('source', 'unknown').strip()
+                                    source_id = f"mediastack-{source_name.lower().replace(' ', '-').replace('_', '-')}"
                                         
-                                        if source_id not in articles_by_source:
-                                            articles_by_source[source_id] = {
-                                                'name': source_name,
-                                                'articles': [],
-                                                'timestamps': []
-                                            }
+                                    if source_id not in articles_by_source:
+                                        articles_by_source[source_id] = {
+                                            'name': source_name,
+                                            'articles': [],
+                                            'timestamps': []
+                                        }
                                         
-                                        articles_by_source[source_id]['articles'].append(article_data)
-                                        if article_data.get('published_at'):
-                                            articles_by_source[source_id]['timestamps'].append(article_data['published_at'])
+                                    articles_by_source[source_id]['articles'].append(article_data)
+                                    if article_data.get('published_at'):
+                                        articles_by_source[source_id]['timestamps'].append(article_data['published_at'])
                                     
-                                    # Detectar fuso incorreto para cada fonte
-                                    for source_id, source_info in articles_by_source.items():
-                                        if source_id in self.sources and self.sources[source_id].get('use_timezone', 0) == 0:
-                                            # Só detectar se não foi configurado manualmente
-                                            corrected_tz, should_enable = detect_timezone_from_articles(
-                                                source_info['timestamps'],
-                                                source_name=f"MediaStack-{source_info['name']}",
-                                                logger=self.logger
-                                            )
+                                # Detectar fuso incorreto para cada fonte
+                                for source_id, source_info in articles_by_source.items():
+                                    if source_id in self.sources and self.sources[source_id].get('use_timezone', 0) == 0:
+                                        # Só detectar se não foi configurado manualmente
+                                        corrected_tz, should_enable = detect_timezone_from_articles(
+                                            source_info['timestamps'],
+                                            source_name=f"MediaStack-{source_info['name']}",
+                                            logger=self.logger
+                                        )
                                             
-                                            if corrected_tz and should_enable:
-                                                # Atualizar banco de dados
-                                                try:
-                                                    async with aiosqlite.connect(self.db_path) as db:
-                                                        await db.execute(
-                                                            'UPDATE gm_sources SET timezone = ?, use_timezone = 1 WHERE id_source = ?',
-                                                            (corrected_tz, source_id)
-                                                        )
-                                                        await db.commit()
+                                        if corrected_tz and should_enable:
+                                            # Atualizar banco de dados
+                                            try:
+                                                async with aiosqlite.connect(self.db_path) as db:
+                                                    await db.execute(
+                                                        'UPDATE gm_sources SET timezone = ?, use_timezone = 1 WHERE id_source = ?',
+                                                        (corrected_tz, source_id)
+                                                    )
+                                                    await db.commit()
                                                     
-                                                    # Atualizar cache em memória
-                                                    if source_id in self.sources:
-                                                        self.sources[source_id]['timezone'] = corrected_tz
-                                                        self.sources[source_id]['use_timezone'] = 1
+                                                # Atualizar cache em memória
+                                                if source_id in self.sources:
+                                                    self.sources[source_id]['timezone'] = corrected_tz
+                                                    self.sources[source_id]['use_timezone'] = 1
                                                     
-                                                    self.logger.info(
-                                                        f"✅ [MediaStack-{source_info['name']}] Fuso corrigido para {corrected_tz}, use_timezone=1"
-                                                    )
-                                                except Exception as e:
-                                                    self.logger.error(f"Failed to update timezone for MediaStack-{source_info['name']}: {e}")
+                                                self.logger.info(
+                                                    f"✅ [MediaStack-{source_info['name']}] Fuso corrigido para {corrected_tz}, use_timezone=1"
+                                                )
+                                            except Exception as e:
+                                                self.logger.error(f"Failed to update timezone for MediaStack-{source_info['name']}: {e}")
                                     
-                                    # PHASE 2: Processar artigos com fuso já corrigido
-                                    for article_data in articles:
-                                        if self.shutdown_flag:
-                                            break
-                                        result = await self.process_mediastack_article(article_data, language, session)
-                                        if result == 'inserted':
-                                            stats['inserted'] += 1
-                                        elif result == 'skipped':
-                                            stats['skipped'] += 1
-                                        else:
-                                            stats['errors'] += 1
+                                # PHASE 2: Processar artigos com fuso já corrigido
+                                for article_data in articles:
+                                    if self.shutdown_flag:
+                                        break
+                                    result = await self.process_mediastack_article(article_data, language, session)
+                                    if result == 'inserted':
+                                        stats['inserted'] += 1
+                                    elif result == 'skipped':
+                                        stats['skipped'] += 1
+                                    else:
+                                        stats['errors'] += 1
                                 
-                                elif response.status == 429:
-                                    self.logger.error(f"❌ MediaStack: Rate limit exceeded (429)")
-                                    break  # Stop processing
-                                elif response.status == 401:
-                                    self.logger.error(f"❌ MediaStack: Invalid API key (401)")
-                                    break
-                                else:
-                                    error_text = await response.text()
-                                    self.logger.error(f"❌ MediaStack: HTTP {response.status} - {error_text[:200]}")
+                            elif response.status == 429:
+                                self.logger.error(f"❌ MediaStack: Rate limit exceeded (429)")
+                                break  # Stop processing
+                            elif response.status == 401:
+                                self.logger.error(f"❌ MediaStack: Invalid API key (401)")
+                                break
+                            else:
+                                error_text = await response.text()
+                                self.logger.error(f"❌ MediaStack: HTTP {response.status} - {error_text[:200]}")
                         
-                        except asyncio.TimeoutError:
-                            self.logger.error(f"⏱️  MediaStack [{language}]: Timeout")
-                            stats['errors'] += 1
-                        except Exception as e:
-                            self.logger.error(f"❌ MediaStack [{language}]: Error - {str(e)}")
-                            stats['errors'] += 1
+                    except asyncio.TimeoutError:
+                        self.logger.error(f"⏱️  MediaStack [{language}]: Timeout")
+                        stats['errors'] += 1
+                    except Exception as e:
+                        self.logger.error(f"❌ MediaStack [{language}]: Error - {str(e)}")
+                        stats['errors'] += 1
                         
-                        # Rate limiting: Wait before next request (except after last one)
-                        if not self.shutdown_flag and i < len(languages) - 1:
-                            self.logger.debug(f"⏳ Waiting {MEDIASTACK_RATE_DELAY}s for rate limiting...")
-                            await asyncio.sleep(MEDIASTACK_RATE_DELAY)
+                    # Rate limiting: Wait before next request (except after last one)
+                    if not self.shutdown_flag and i < len(languages) - 1:
+                        self.logger.debug(f"⏳ Waiting {MEDIASTACK_RATE_DELAY}s for rate limiting...")
+                        await asyncio.sleep(MEDIASTACK_RATE_DELAY)
                 
                 # Log statistics
                 self.logger.info(
@@ -2791,6 +2900,24 @@ class NewsGather():
             f"playwright(concur={PLAYWRIGHT_CONCURRENCY}, t={PLAYWRIGHT_TIMEOUT}s)"
         )
 
+        # Fetch worker settings — applied before the fetchers' lazy start
+        # (python-decouple does not populate os.environ).
+        import cffi_worker as _cffi_worker
+        import requests_worker as _requests_worker
+        import playwright_worker as _pw_worker
+        _cffi_worker.CFFI_INFLIGHT_PER_WORKER             = CFFI_INFLIGHT_PER_WORKER
+        _cffi_worker.CFFI_DNS_CACHE_TTL                   = CFFI_DNS_CACHE_TTL
+        _requests_worker.REQUESTS_INFLIGHT_PER_WORKER     = REQUESTS_INFLIGHT_PER_WORKER
+        _pw_worker.PLAYWRIGHT_PROCESSES             = PLAYWRIGHT_PROCESSES
+        _pw_worker.PLAYWRIGHT_PAGES_PER_WORKER      = PLAYWRIGHT_PAGES_PER_WORKER
+        _pw_worker.PLAYWRIGHT_MAX_PAGES_PER_BROWSER = PLAYWRIGHT_MAX_PAGES_PER_BROWSER
+        _pw_worker.PLAYWRIGHT_MAX_BROWSER_MB        = PLAYWRIGHT_MAX_BROWSER_MB
+        _pw_worker.PLAYWRIGHT_CONTEXT_REUSE         = PLAYWRIGHT_CONTEXT_REUSE
+        _pw_worker.PLAYWRIGHT_BLOCK_TYPES           = PLAYWRIGHT_BLOCK_TYPES
+        _pw_worker.PLAYWRIGHT_BLOCK_DOMAINS         = PLAYWRIGHT_BLOCK_DOMAINS
+        _pw_worker.PLAYWRIGHT_BLOCK_FRAMES          = PLAYWRIGHT_BLOCK_FRAMES
+        _pw_worker.PLAYWRIGHT_BLOCK_RULES_FILE      = PLAYWRIGHT_BLOCK_RULES_FILE
+
         self._cffi_ids.clear()
         self._requests_ids.clear()
         self._playwright_ids.clear()
@@ -2803,6 +2930,20 @@ class NewsGather():
         self._enrich_q_e0, self._enrich_q_e1  = q_e0, q_e1
         self._enrich_q_e2, self._enrich_q_ew  = q_e2, q_ew
 
+        # ── Per-host dispatcher (feeder → tier queues) ────────────────────
+        dispatcher = DomainDispatcher(
+            per_host=ENRICH_HOST_CONCURRENCY,
+            rate=ENRICH_HOST_RATE,
+            burst=ENRICH_HOST_BURST,
+            default_cooldown=ENRICH_HOST_COOLDOWN,
+            max_cooldown=ENRICH_HOST_MAX_COOLDOWN,
+        )
+        self._enrich_dispatcher = dispatcher
+        dispatch_task = asyncio.create_task(
+            dispatcher.run({'cffi': q_e0, 'requests': q_e1, 'playwright': q_e2}),
+            name='enrich-dispatcher',
+        )
+
         # ── Per-tier handler factory ──────────────────────────────────────
         def _make_tier_handler(worker, ids, tier):
             async def _handler(article: dict):
@@ -2810,8 +2951,23 @@ class NewsGather():
                 source_id   = article.get('id_source', '')
                 source_name = article.get('source_name', '')
                 current_try = article.get('_enrich_try', tier)
+                host        = _host_of(article.get('url') or '')
 
-                ok = await worker.enrich_direct(article)
+                throttled = None
+                try:
+                    ok = await worker.enrich_direct(article)
+                finally:
+                    throttled = article.pop('_throttled', None)
+                    dispatcher.done(host, throttled=throttled is not None, retry_after=throttled)
+
+                # 429 / 503: retry on the same tier once the host has cooled down
+                retries = article.get('_throttle_retries', 0)
+                if throttled is not None and retries < ENRICH_THROTTLE_RETRIES:
+                    article['_throttle_retries'] = retries + 1
+                    article.pop('_error_code', None)
+                    article.pop('_blocked_domain', None)
+                    dispatcher.add(worker.backend, host, article)
+                    return None
 
                 # Surface blocking errors to persistent DB tracking
                 error_code     = article.pop('_error_code', None)
@@ -2860,23 +3016,15 @@ class NewsGather():
             return _handler
 
         # ── Write stage handler ───────────────────────────────────────────
-        # Batch counter: accumulate ENRICH_WRITE_BATCH execute()s before
-        # committing.  Reduces fsync frequency under high write load — with
-        # 66 enrichment workers producing simultaneously a single commit per
-        # article saturates the shared aiosqlite thread.
-        _ew_pending = 0
-
+        # Each worker awaits its own write; the DB write coalescer groups the
+        # ENRICH_WRITE_WORKERS writes in flight into a single commit, so one
+        # fsync covers many articles without a hand-rolled batch counter.
         async def _handle_enrich_write(item: tuple):
-            nonlocal _ew_pending
             article, current_try = item
             article_id = article['id_article']
             try:
                 raw_desc    = article.get('description') or ''
                 _desc_text  = re.sub(r'<[^>]+>', '', raw_desc).strip()
-                _ew_pending += 1
-                do_commit = (_ew_pending >= ENRICH_WRITE_BATCH)
-                if do_commit:
-                    _ew_pending = 0
                 await self.db.save_enriched_article(
                     article_id,
                     author=      article.get('author')     or None,
@@ -2884,11 +3032,9 @@ class NewsGather():
                     content=     article.get('content')    or None,
                     url_to_image=article.get('urlToImage') or None,
                     is_enriched= 1,
-                    commit=      do_commit,
                 )
                 self.logger.debug(
                     f"✅ Backfill saved: [{article.get('source_name','')}] {article_id}"
-                    + (" [commit]" if do_commit else "")
                 )
             except Exception as exc:
                 self.logger.error(f"Enrich write failed for {article_id}: {exc}")
@@ -2952,7 +3098,11 @@ class NewsGather():
                     # Back-pressure: don't fetch more work if the queue already
                     # has enough items buffered.  This prevents the playwright
                     # tier from loading thousands of pending articles into RAM.
+                    # Articles the dispatcher holds back for politeness don't
+                    # count, so other hosts keep flowing — up to a hard cap.
                     headroom = batch - q.depth
+                    if dispatcher.pending(backend) >= ENRICH_DISPATCH_MAX_PENDING:
+                        headroom = 0
                     if headroom <= 0:
                         self.logger.debug(
                             f"⏸  Backfill[{backend}]: queue full "
@@ -2989,7 +3139,7 @@ class NewsGather():
                                 '_enrich_try': row.get('enrich_try', tier_id),
                             }
                             ids.add(article['id_article'])
-                            await q.put(article)
+                            dispatcher.add(backend, _host_of(article['url'] or ''), article)
                     except Exception as exc:
                         self.logger.error(
                             f"Backfill[tier{tier_id}] feeder error: {exc}", exc_info=True
@@ -3000,6 +3150,7 @@ class NewsGather():
         except asyncio.CancelledError:
             self.logger.info("🏁 Backfill feeder cancelled — draining stages…")
         finally:
+            dispatch_task.cancel()
             sup.stop()
             for stage in (stage_e0, stage_e1, stage_e2):
                 stage.signal_upstream_done()
@@ -3009,13 +3160,6 @@ class NewsGather():
             )
             stage_ew.signal_upstream_done()
             await stage_ew.wait_done()
-            # Flush any uncommitted writes left in the batch buffer
-            if _ew_pending > 0:
-                try:
-                    await self.db._c.commit()
-                    self.logger.debug(f"🏁 Backfill enrich-write: flushed {_ew_pending} uncommitted write(s)")
-                except Exception as exc:
-                    self.logger.error(f"Backfill enrich-write flush failed: {exc}")
             self.logger.info("🏁 Backfill pipeline drained")
 
     @_watchdog.track
@@ -3282,6 +3426,7 @@ class NewsGather():
                     allow_redirects=True,
                     max_redirects=10,
                     headers=_HEADERS,
+                    timeout=_TIMEOUT,
                 ) as resp:
                     real_url = str(resp.url)
                     # Reject if we ended up back on Google (redirect failed)
@@ -3302,30 +3447,25 @@ class NewsGather():
                 self.logger.debug(f"🔗 Resolving {len(rows)} proxy URLs…")
                 resolved = ok = failed = 0
 
-                async with aiohttp.ClientSession(timeout=_TIMEOUT) as session:
-                    # Process in batches of CONCURRENCY to avoid hammering Google
-                    for i in range(0, len(rows), CONCURRENCY):
-                        if self.shutdown_flag:
-                            break
-                        chunk   = rows[i : i + CONCURRENCY]
-                        results = await asyncio.gather(
-                            *[_resolve_one(session, r) for r in chunk],
-                            return_exceptions=False,
-                        )
-                        for (art_id, real_url) in results:
-                            resolved += 1
-                            if real_url:
-                                await self.db.resolve_proxy_article_url(art_id, real_url)
-                                ok += 1
-                            else:
-                                # Mark as -1 so we don't retry endlessly
-                                await self.db._c.execute(
-                                    "UPDATE gm_articles SET is_enriched = -1 "
-                                    "WHERE id_article = ? AND is_enriched = -2",
-                                    (art_id,),
-                                )
-                                await self.db._c.commit()
-                                failed += 1
+                session = self.http.session
+                # Process in batches of CONCURRENCY to avoid hammering Google
+                for i in range(0, len(rows), CONCURRENCY):
+                    if self.shutdown_flag:
+                        break
+                    chunk   = rows[i : i + CONCURRENCY]
+                    results = await asyncio.gather(
+                        *[_resolve_one(session, r) for r in chunk],
+                        return_exceptions=False,
+                    )
+                    for (art_id, real_url) in results:
+                        resolved += 1
+                        if real_url:
+                            await self.db.resolve_proxy_article_url(art_id, real_url)
+                            ok += 1
+                        else:
+                            # Mark as -1 so we don't retry endlessly
+                            await self.db.mark_proxy_article_unresolved(art_id)
+                            failed += 1
 
                 self.logger.debug(
                     f"🔗 Proxy URL resolve complete: {ok} resolved, {failed} failed "
@@ -3364,11 +3504,25 @@ class NewsGather():
         # the module-level variables here, after config() has been resolved.
         tv.nllb_worker.NLLB_BATCH_SIZE = NLLB_BATCH_SIZE
         tv.nllb_worker.NLLB_NUM_BEAMS  = NLLB_NUM_BEAMS
+        tv.nllb_worker.NLLB_TOKEN_BUDGET   = NLLB_TOKEN_BUDGET
+        tv.nllb_worker.NLLB_SEGMENT_TOKENS = NLLB_SEGMENT_TOKENS
+        tv.nllb_worker.NLLB_RUNTIME        = NLLB_RUNTIME
+        tv.nllb_worker.NLLB_THREADS        = NLLB_THREADS
+        tv.nllb_worker.NLLB_MODEL_DIR      = NLLB_MODEL_DIR
+        tv.nllb_worker.NLLB_POOL_SIZE      = NLLB_POOL_SIZE
         tv._nllb.ASYNC_TIMEOUT         = NLLB_ASYNC_TIMEOUT
+        tv._nllb.TIMEOUT_PER_SEGMENT   = NLLB_TIMEOUT_PER_SEGMENT
+        tv._tm.configure(
+            enabled=TRANSLATION_MEMORY_ENABLED,
+            db_path=TRANSLATION_MEMORY_DB,
+            lru_size=TRANSLATION_MEMORY_LRU_SIZE,
+        )
         self.logger.debug(
             f"[translate-init] NLLB config — "
             f"batch_size={NLLB_BATCH_SIZE}, num_beams={NLLB_NUM_BEAMS}, "
-            f"async_timeout={NLLB_ASYNC_TIMEOUT}s"
+            f"token_budget={NLLB_TOKEN_BUDGET}, segment_tokens={NLLB_SEGMENT_TOKENS}, "
+            f"runtime={NLLB_RUNTIME}, threads={NLLB_THREADS or 'default'}, pool_size={NLLB_POOL_SIZE}, "
+            f"async_timeout={NLLB_ASYNC_TIMEOUT}s +{NLLB_TIMEOUT_PER_SEGMENT}s/segment"
         )
 
         # Start both subprocess workers eagerly so they are warm before use.
@@ -3396,14 +3550,17 @@ class NewsGather():
             description = row['description'] or ''
             content     = row['content']     or ''
 
+            call_info: dict = {}
             (t_title, ok_t), (t_desc, ok_d), (t_cont, ok_c), backend_rec = \
                 await tv.translate_article_fields_async(
-                    title, description, content, lang
+                    title, description, content, lang, info=call_info
                 )
 
             # Only rate-limit Google Translate (API quota); NLLB is local — no delay needed.
             # None = round-robin (may hit Google), so apply delay conservatively.
-            if TRANSLATE_DELAY > 0 and tv._backend_for(lang) in ('google', None):
+            # Articles served entirely from the translation memory cost no quota.
+            if (TRANSLATE_DELAY > 0 and call_info.get('backend_called', True)
+                    and tv._backend_for(lang) in ('google', None)):
                 await asyncio.sleep(TRANSLATE_DELAY)
 
             return (article_id, lang, title, t_title, ok_t, t_desc, ok_d, t_cont, ok_c, backend_rec)
@@ -3425,7 +3582,15 @@ class NewsGather():
                     values['translated_description'] = t_desc
                 if ok_c:
                     values['translated_content'] = t_cont
-                await self.db.save_translation(article_id, values)
+                translated_at_ms = await self.db.save_translation(article_id, values)
+                if translated_at_ms:
+                    _push_bus.publish(EVENT_TRANSLATIONS, [{
+                        'id_article':             article_id,
+                        'translated_title':       values.get('translated_title'),
+                        'translated_description': values.get('translated_description'),
+                        'translated_content':     values.get('translated_content'),
+                        'translated_at_ms':       translated_at_ms,
+                    }], translated_at_ms)
                 if any_translated:
                     self.logger.debug(f"🌐 Translated [{lang}]: {title[:60]}")
                 else:
@@ -3447,7 +3612,7 @@ class NewsGather():
         stage_tw = PipelineStage(
             'translate-write', q_tw, None,
             handler=_handle_translate_write,
-            min_workers=1, max_workers=1,
+            min_workers=TRANSLATE_WRITE_WORKERS, max_workers=TRANSLATE_WRITE_WORKERS,
         )
         self._translate_stage_t0 = stage_t0
         self._translate_stage_tw = stage_tw
@@ -3457,8 +3622,11 @@ class NewsGather():
             f"[translate-init] stage 't0-translate' started — "
             f"{TRANSLATE_MAX_WORKERS} worker(s)"
         )
-        await stage_tw.start(initial=1)
-        self.logger.debug("[translate-init] stage 'tw-write' started — 1 worker")
+        await stage_tw.start(initial=TRANSLATE_WRITE_WORKERS)
+        self.logger.debug(
+            f"[translate-init] stage 'tw-write' started — "
+            f"{TRANSLATE_WRITE_WORKERS} worker(s)"
+        )
 
         # ── DB feeder loop (runs until shutdown_flag or CancelledError) ──
         try:
@@ -3553,9 +3721,12 @@ class NewsGather():
         assert CORSMiddleware is not None
         assert Query is not None
         assert HTTPException is not None
+        assert Request is not None
+        assert JSONResponse is not None
+        assert Response is not None
+        assert StreamingResponse is not None
         assert uvicorn is not None
 
-        from sqlalchemy import func as sa_func
         from typing import cast as typing_cast
 
         api_app = FastAPI(
@@ -3575,6 +3746,27 @@ class NewsGather():
         # Local alias so nested async handlers inherit the narrowed type
         _HTTPException = HTTPException
 
+        from loop_watchdog import api_latency as _api_latency
+
+        @api_app.middleware("http")
+        async def _record_latency(request, call_next):
+            """
+            Per-endpoint latency histogram (GET /api/watchdog?mode=api), keyed
+            on the matched route template so arbitrary paths (scanners, typos,
+            ``/api/articles/{id}``) cannot grow the registry.  The router sets
+            ``scope["route"]`` while handling the request, hence the label is
+            taken afterwards.
+            """
+            t0 = time.monotonic()
+            try:
+                return await call_next(request)
+            finally:
+                route = request.scope.get("route")
+                _api_latency.observe(
+                    getattr(route, "path", None) or "<unmatched>",
+                    (time.monotonic() - t0) * 1000.0,
+                )
+
         def _rss_progress(g) -> dict:
             """Return a serialisable snapshot of the current RSS cycle state."""
             rc  = g._rss_cycle
@@ -3600,18 +3792,29 @@ class NewsGather():
                 'err_http':   rc['err_http'],
                 'err_content': rc['err_content'],
                 'err_timeout': rc['err_timeout'],
+                'err_dns':     rc['err_dns'],
+                'not_modified': rc['not_modified'],
+                'streamed':       rc['streamed'],
+                'stream_stopped': rc['stream_stopped'],
                 # Stage 2 — process (CPU, dynamic workers)
                 'queued':          rc['queued'],
                 'processed':       rc['processed'],
                 'ok':              rc['ok'],
                 'articles_new':    rc['articles_new'],
                 'stage2_workers':  stage2.worker_count if stage2 else 0,
+                'stage2_pool':     g._rss_s2_pool.to_dict() if g._rss_s2_pool else None,
+                # CPU accounting (seconds this window)
+                'cpu_s1_parse':      round(rc['cpu_s1_parse'], 3),
+                'cpu_s2_normalise':  round(rc['cpu_s2_normalise'], 3),
+                'wall_s2_normalise': round(rc['wall_s2_normalise'], 3),
                 's1s2_depth':      stage2.input_queue.depth if stage2 else 0,
                 # Stage 3 — dedup (async reads)
                 's2s3_depth':      q_s2s3.depth if q_s2s3 else 0,
                 # Stage 4 — DB write (serialised)
                 's3s4_depth':      q_s3s4.depth if q_s3s4 else 0,
                 'next_cycle_in_s': round(sleeping_until - now, 1) if sleeping_until and sleeping_until > now else None,
+                # Per-feed adaptive polling
+                'scheduler':       g._feed_scheduler.to_dict(now),
             }
 
 
@@ -3621,15 +3824,18 @@ class NewsGather():
                 "name": "wxNews API", "version": "2.0.0", "status": "running",
                 "endpoints": {
                     "GET /api/health":              "Health check (uptime, DB, service state)",
-                    "GET /api/articles":             "Get articles inserted after ?since=<ms>",
+                    "GET /api/articles":             "Get articles inserted after ?since=<ms> (newest first), or keyset pages with ?order=asc / ?cursor=",
+                    "GET /api/articles/ndjson":      "Stream every article after ?since=<ms> or ?cursor= as NDJSON, oldest first",
                     "GET /api/articles/translations":"Get translation updates after ?since=<ms>",
+                    "GET /api/stream":               "Server-sent events: new articles + translations (?since=&translations_since=&sources=&types=)",
+                    "GET /api/search":               "Ranked full-text search (?q=&sources=&languages=&since=&until=&limit=&offset=)",
                     "GET /api/latest_timestamp":     "Latest inserted_at_ms + total article count",
                     "GET /api/sources":              "All sources with article counts",
                     "GET /api/stats":                "Collection statistics (24h, 1h)",
                     "GET /api/queues":               "Pipeline queue depths and enrichment tiers",
                     "GET /api/monitor":              "Full dashboard stats (enrichment + translation + RSS)",
-                    "GET /api/translate":            "Translation backend telemetry (Google vs NLLB outcomes, latency)",
-                    "GET /api/watchdog":             "Event-loop span profiler (?mode=recent|slow|stats|lag|clear)",
+                    "GET /api/translate":            "Translation backend telemetry (Google vs NLLB outcomes, latency, NLLB worker pool)",
+                    "GET /api/watchdog":             "Event-loop span profiler (?mode=recent|slow|stats|lag|api|clear)",
                 },
                 "database": "connected",
             }
@@ -3638,11 +3844,7 @@ class NewsGather():
         async def get_health():
             """Lightweight health check — returns uptime and DB connectivity."""
             try:
-                with gather.eng.connect() as conn:
-                    row = conn.execute(
-                        select(sa_func.count()).select_from(gather.gm_articles)
-                    ).fetchone()
-                    db_ok = True
+                db_ok = await gather.db.ping()
             except Exception:
                 db_ok = False
             now_ms = int(time.time() * 1000)
@@ -3653,65 +3855,132 @@ class NewsGather():
                 "timestamp_iso": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime(now_ms / 1000)),
             }
 
+        def _dumps(payload) -> str:
+            """Compact JSON, bytes ids decoded like the JSON API."""
+            return json.dumps(
+                payload, ensure_ascii=False, separators=(',', ':'),
+                default=lambda o: o.decode('utf-8', 'replace') if isinstance(o, bytes) else str(o),
+            )
+
+        def _keyset_start(since: Optional[int], cursor: Optional[str]) -> tuple[int, Any]:
+            """``(after_ms, after_id)`` from ?cursor= or ?since= (400 if neither / malformed)."""
+            if cursor:
+                try:
+                    return decode_article_cursor(cursor)
+                except ValueError as e:
+                    raise _HTTPException(status_code=400, detail=str(e))
+            if since is None:
+                raise _HTTPException(status_code=400, detail="since or cursor is required")
+            return since, None
+
         @api_app.get("/api/articles")
         async def get_articles(
-            since: int = Query(..., description="Timestamp in milliseconds"),
+            since: Optional[int] = Query(None, description="Timestamp in milliseconds"),
             limit: int = Query(100, ge=1, le=API_MAX_ARTICLES),
             sources: Optional[str] = Query(None, description="Comma-separated source IDs"),
+            cursor: Optional[str] = Query(None, description="next_cursor from the previous page (implies order=asc)"),
+            order: str = Query('desc', pattern='^(asc|desc)$', description="desc = newest page; asc = keyset pages"),
         ):
-            try:
-                current_time_ms = int(time.time() * 1000)
-                from sqlalchemy import literal_column as lc
-                query = (
-                    select(
-                        gather.gm_articles.c.id_article,
-                        gather.gm_articles.c.id_source,
-                        gather.gm_articles.c.author,
-                        gather.gm_articles.c.title,
-                        gather.gm_articles.c.description,
-                        gather.gm_articles.c.url,
-                        gather.gm_articles.c.urlToImage,
-                        gather.gm_articles.c.publishedAt,
-                        gather.gm_articles.c.published_at_gmt,
-                        gather.gm_articles.c.inserted_at_ms,
-                        gather.gm_articles.c.translated_title,
-                        gather.gm_articles.c.translated_description,
-                        gather.gm_articles.c.translated_content,
-                        gather.gm_articles.c.is_translated,
-                    )
-                    .where(gather.gm_articles.c.inserted_at_ms > since)
-                    .where(gather.gm_articles.c.inserted_at_ms <= current_time_ms)
-                    .where(
-                        (gather.gm_articles.c.published_at_gmt.is_(None))
-                        | (lc("datetime(published_at_gmt)") <= lc("datetime('now')"))
+            """
+            ``order=desc`` (default): the newest *limit* rows after *since*.
+            ``order=asc`` / ``cursor``: keyset pages on ``(inserted_at_ms,
+            id_article)``, oldest first — follow ``next_cursor`` while
+            ``has_more`` and a burst of any size is delivered whole.
+            """
+            current_time_ms = int(time.time() * 1000)
+            src_list = (
+                [s.strip() for s in sources.split(',') if s.strip()] if sources else None
+            )
+            if cursor or order == 'asc':
+                after_ms, after_id = _keyset_start(since, cursor)
+                try:
+                    # One extra row tells us whether another page follows
+                    rows = await gather.db.fetch_articles_after(
+                        after_ms, after_id, current_time_ms, limit + 1, src_list or None
                     )
+                except Exception as e:
+                    self.logger.error(f"API /api/articles error: {e}", exc_info=True)
+                    raise _HTTPException(status_code=500, detail=str(e))
+                has_more = len(rows) > limit
+                articles = rows[:limit]
+                if articles:
+                    last = articles[-1]
+                    next_cursor = encode_article_cursor(last['inserted_at_ms'], last['id_article'])
+                else:
+                    next_cursor = cursor or encode_article_cursor(after_ms, None)
+                return {'success': True, 'count': len(articles), 'since': since,
+                        'latest_timestamp': articles[-1]['inserted_at_ms'] if articles else after_ms,
+                        'has_more': has_more, 'next_cursor': next_cursor,
+                        'articles': articles,
+                        'timestamp': int(time.time() * 1000)}
+            if since is None:
+                raise _HTTPException(status_code=400, detail="since or cursor is required")
+            try:
+                articles = await gather.db.fetch_articles_since(
+                    since, current_time_ms, limit + 1, src_list or None
                 )
-                if sources:
-                    src_list = [s.strip() for s in sources.split(',') if s.strip()]
-                    if src_list:
-                        query = query.where(gather.gm_articles.c.id_source.in_(src_list))
-                query = query.order_by(gather.gm_articles.c.inserted_at_ms.desc()).limit(limit)
-                with gather.eng.connect() as conn:
-                    rows = conn.execute(query).fetchall()
-                articles = [
-                    {
-                        'id_article': r[0], 'id_source': r[1], 'author': r[2],
-                        'title': r[3], 'description': r[4], 'url': r[5],
-                        'urlToImage': r[6], 'publishedAt': r[7],
-                        'published_at_gmt': r[8], 'inserted_at_ms': r[9],
-                        'translated_title': r[10], 'translated_description': r[11],
-                        'translated_content': r[12], 'is_translated': r[13],
-                    }
-                    for r in rows
-                ]
+                has_more = len(articles) > limit     # older part of the burst not returned
+                articles = articles[:limit]
                 latest_ts = articles[0]['inserted_at_ms'] if articles else since
                 return {'success': True, 'count': len(articles), 'since': since,
-                        'latest_timestamp': latest_ts, 'articles': articles,
+                        'latest_timestamp': latest_ts, 'has_more': has_more,
+                        'articles': articles,
                         'timestamp': int(time.time() * 1000)}
             except Exception as e:
                 self.logger.error(f"API /api/articles error: {e}", exc_info=True)
                 raise _HTTPException(status_code=500, detail=str(e))
 
+        @api_app.get("/api/articles/ndjson")
+        async def stream_articles_ndjson(
+            since: Optional[int] = Query(None, description="Timestamp in milliseconds"),
+            cursor: Optional[str] = Query(None, description="Resume after this next_cursor"),
+            sources: Optional[str] = Query(None, description="Comma-separated source IDs"),
+            limit: Optional[int] = Query(None, ge=1, description="Stop after this many rows"),
+        ):
+            """
+            Every article after *since* / *cursor*, oldest first, one JSON
+            object per line, read from a server-side cursor
+            ``API_NDJSON_CHUNK`` rows at a time — memory stays flat however
+            large the catch-up.  The last line is
+            ``{"next_cursor": …, "count": n, "complete": bool}``; resume
+            with that cursor if the stream was cut or *limit* was reached.
+            """
+            after_ms, after_id = _keyset_start(since, cursor)
+            src_list = [x.strip() for x in sources.split(',') if x.strip()] if sources else None
+            until_ms = int(time.time() * 1000)
+
+            async def _lines():
+                count, last = 0, None
+                complete = True
+                rows_iter = gather.db.iter_articles_after(
+                    after_ms, after_id, until_ms, API_NDJSON_CHUNK, src_list or None
+                )
+                try:
+                    async for chunk in rows_iter:
+                        if limit is not None and count + len(chunk) > limit:
+                            chunk = chunk[:limit - count]
+                            complete = False
+                        if chunk:
+                            count += len(chunk)
+                            last = chunk[-1]
+                            yield ''.join(_dumps(r) + '\n' for r in chunk)
+                        if not complete:
+                            break
+                finally:
+                    await rows_iter.aclose()
+                next_cursor = (
+                    encode_article_cursor(last['inserted_at_ms'], last['id_article'])
+                    if last is not None else cursor or encode_article_cursor(after_ms, None)
+                )
+                yield _dumps({'next_cursor': next_cursor, 'count': count,
+                              'complete': complete}) + '\n'
+
+            return StreamingResponse(
+                _lines(),
+                media_type="application/x-ndjson",
+                headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+            )
+
         @api_app.get("/api/articles/translations")
         async def get_translated_articles(
             since: int = Query(..., description="translated_at_ms threshold in milliseconds"),
@@ -3720,32 +3989,7 @@ class NewsGather():
             """Return articles that got translated after *since* ms.
             Used by the reader to update already-displayed article cards."""
             try:
-                t = gather.gm_articles
-                query = (
-                    select(
-                        t.c.id_article,
-                        t.c.translated_title,
-                        t.c.translated_description,
-                        t.c.translated_content,
-                        t.c.translated_at_ms,
-                    )
-                    .where(t.c.translated_at_ms > since)
-                    .where(t.c.is_translated == 1)
-                    .order_by(t.c.translated_at_ms.asc())
-                    .limit(limit)
-                )
-                with gather.eng.connect() as conn:
-                    rows = conn.execute(query).fetchall()
-                updates = [
-                    {
-                        'id_article':             r[0],
-                        'translated_title':       r[1],
-                        'translated_description': r[2],
-                        'translated_content':     r[3],
-                        'translated_at_ms':       r[4],
-                    }
-                    for r in rows
-                ]
+                updates = await gather.db.fetch_translation_updates(since, limit)
                 latest_ts = updates[-1]['translated_at_ms'] if updates else since
                 return {'success': True, 'count': len(updates),
                         'since': since, 'latest_timestamp': latest_ts,
@@ -3755,52 +3999,172 @@ class NewsGather():
                 self.logger.error(f"API /api/articles/translations error: {e}", exc_info=True)
                 raise _HTTPException(status_code=500, detail=str(e))
 
+        @api_app.get("/api/search")
+        async def search_articles(
+            q: str = Query(..., min_length=1, max_length=200, description="Search terms (AND; trailing * = prefix)"),
+            sources: Optional[str] = Query(None, description="Comma-separated source IDs"),
+            languages: Optional[str] = Query(None, description="Comma-separated detected_language codes"),
+            since: Optional[int] = Query(None, description="inserted_at_ms lower bound"),
+            until: Optional[int] = Query(None, description="inserted_at_ms upper bound"),
+            limit: int = Query(20, ge=1, le=API_SEARCH_MAX_LIMIT),
+            offset: int = Query(0, ge=0, le=API_SEARCH_MAX_OFFSET),
+        ):
+            """Index-backed full-text search over original and translated article text."""
+            if not gather.db.search_available:
+                raise _HTTPException(status_code=503, detail="Full-text index not available")
+            src_list  = [x.strip() for x in sources.split(',') if x.strip()] if sources else None
+            lang_list = [x.strip() for x in languages.split(',') if x.strip()] if languages else None
+            try:
+                # One extra row tells us whether a next page exists without a COUNT(*)
+                rows = await gather.db.search_articles(
+                    q, limit=limit + 1, offset=offset,
+                    source_ids=src_list, languages=lang_list,
+                    since_ms=since, until_ms=until,
+                )
+            except Exception as e:
+                self.logger.error(f"API /api/search error: {e}", exc_info=True)
+                raise _HTTPException(status_code=500, detail=str(e))
+            has_more = len(rows) > limit
+            results  = rows[:limit]
+            return {'success': True, 'query': q, 'count': len(results),
+                    'offset': offset, 'limit': limit, 'has_more': has_more,
+                    'next_offset': offset + limit if has_more else None,
+                    'results': results,
+                    'timestamp': int(time.time() * 1000)}
+
+        def _sse(event: str, payload: dict, seq: Optional[int] = None) -> str:
+            """Format one server-sent event frame (bytes ids decoded like the JSON API)."""
+            data = _dumps(payload)
+            head = f"id: {seq}\n" if seq is not None else ""
+            return f"{head}event: {event}\ndata: {data}\n\n"
+
+        @api_app.get("/api/stream")
+        async def stream_events(
+            request: Request,
+            since: Optional[int] = Query(None, description="Replay articles inserted after this ms timestamp"),
+            translations_since: Optional[int] = Query(None, description="Replay translations after this ms timestamp"),
+            sources: Optional[str] = Query(None, description="Comma-separated source IDs"),
+            types: Optional[str] = Query(None, description="Comma-separated: articles,translations"),
+        ):
+            """
+            Push new articles and translation updates as server-sent events.
+
+            On connect the client is subscribed to the broadcast bus first and
+            then back-filled from the DB with its *since* cursors, so nothing
+            committed in between is lost.  A reconnect carrying
+            ``Last-Event-ID`` is served from the bus ring buffer when it still
+            reaches back that far, without touching the DB.
+            """
+            src_list = [x.strip() for x in sources.split(',') if x.strip()] if sources else None
+            type_set = {x.strip() for x in types.split(',') if x.strip()} if types else None
+            if type_set and not type_set <= {EVENT_ARTICLES, EVENT_TRANSLATIONS}:
+                raise _HTTPException(status_code=400, detail=f"Unknown event type in {types!r}")
+            want_articles     = type_set is None or EVENT_ARTICLES in type_set
+            want_translations = type_set is None or EVENT_TRANSLATIONS in type_set
+
+            last_id  = request.headers.get('last-event-id', '')
+            after    = int(last_id) if last_id.isdigit() else None
+            sub, resumed = _push_bus.subscribe(sources=src_list, types=type_set, after_seq=after)
+            base_seq = _push_bus.last_seq
+
+            async def _frames():
+                seen: set = set()   # ids sent by the back-fill, to drop live duplicates
+                try:
+                    yield f"retry: 3000\n: connected seq={base_seq}\n\n"
+                    if after is None or not resumed:
+                        now_ms = int(time.time() * 1000)
+                        if want_articles and since is not None:
+                            # Keyset pages, oldest first, until caught up with
+                            # now_ms — a burst larger than one page is replayed
+                            # whole instead of losing its older part.
+                            after_ms, after_id = since, None
+                            while True:
+                                rows = await gather.db.fetch_articles_after(
+                                    after_ms, after_id, now_ms, API_STREAM_BACKFILL, src_list
+                                )
+                                if not rows:
+                                    break
+                                seen.update(r['id_article'] for r in rows)
+                                yield _sse(EVENT_ARTICLES, {
+                                    'ts': rows[-1]['inserted_at_ms'], 'items': rows,
+                                }, base_seq)
+                                if len(rows) < API_STREAM_BACKFILL or await request.is_disconnected():
+                                    break
+                                after_ms, after_id = rows[-1]['inserted_at_ms'], rows[-1]['id_article']
+                        if want_translations and translations_since is not None:
+                            # Same keyset walk on (translated_at_ms, id_article):
+                            # the reader moves its translation cursor past
+                            # whatever it is sent, so a short replay loses rows.
+                            after_ms, after_id = translations_since, None
+                            while True:
+                                rows = await gather.db.fetch_translation_updates(
+                                    after_ms, API_STREAM_BACKFILL, after_id
+                                )
+                                if not rows:
+                                    break
+                                yield _sse(EVENT_TRANSLATIONS, {
+                                    'ts': rows[-1]['translated_at_ms'], 'items': rows,
+                                }, base_seq)
+                                if len(rows) < API_STREAM_BACKFILL or await request.is_disconnected():
+                                    break
+                                after_ms, after_id = rows[-1]['translated_at_ms'], rows[-1]['id_article']
+                    while True:
+                        ev = await sub.get(timeout=API_STREAM_HEARTBEAT)
+                        if ev is None:
+                            if sub.closed or await request.is_disconnected():
+                                break
+                            yield ": ping\n\n"
+                            continue
+                        items = ev['items']
+                        if seen and ev['type'] == EVENT_ARTICLES:
+                            items = [i for i in items if i['id_article'] not in seen]
+                            if sub.queue.empty():
+                                seen.clear()   # drained everything queued during the back-fill
+                            if not items:
+                                continue
+                        yield _sse(ev['type'], {'ts': ev['ts'], 'items': items}, ev['seq'])
+                finally:
+                    sub.close()
+
+            return StreamingResponse(
+                _frames(),
+                media_type="text/event-stream",
+                headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+            )
+
         @api_app.get("/api/latest_timestamp")
         async def get_latest_timestamp():
             try:
                 latest_published_gmt = await gather.db.get_latest_published_gmt()
-                with gather.eng.connect() as conn:
-                    row = conn.execute(
-                        select(
-                            sa_func.max(gather.gm_articles.c.inserted_at_ms).label('latest_ts'),
-                            sa_func.count().label('total'),
-                        ).where(gather.gm_articles.c.inserted_at_ms.isnot(None))
-                    ).fetchone()
+                latest_ts, total = await gather.db.fetch_latest_inserted()
                 return {'success': True,
-                        'latest_timestamp': (row[0] or 0) if row else 0,
+                        'latest_timestamp': latest_ts,
                         'latest_published_gmt': latest_published_gmt,
-                        'total_articles': (row[1] or 0) if row else 0,
+                        'total_articles': total,
                         'timestamp': int(time.time() * 1000)}
             except Exception as e:
                 raise _HTTPException(status_code=500, detail=str(e))
 
+        # /api/sources payload cache: rebuilt at most every API_SOURCES_CACHE_TTL
+        # seconds from gm_source_stats; the ETag lets readers revalidate cheaply.
+        _sources_cache: dict = {'at': 0.0, 'etag': None, 'body': None}
+
         @api_app.get("/api/sources")
-        async def get_sources():
+        async def get_sources(request: Request):
             try:
-                query = (
-                    select(
-                        gather.gm_sources.c.id_source,
-                        gather.gm_sources.c.name,
-                        gather.gm_sources.c.category,
-                        gather.gm_sources.c.language,
-                        sa_func.count(gather.gm_articles.c.id_article).label('article_count'),
-                    )
-                    .select_from(
-                        gather.gm_sources.outerjoin(
-                            gather.gm_articles,
-                            gather.gm_sources.c.id_source == gather.gm_articles.c.id_source,
-                        )
-                    )
-                    .group_by(gather.gm_sources.c.id_source)
-                    .having(sa_func.count(gather.gm_articles.c.id_article) > 0)
-                    .order_by(gather.gm_sources.c.name)
-                )
-                with gather.eng.connect() as conn:
-                    rows = conn.execute(query).fetchall()
-                return {'success': True, 'count': len(rows),
-                        'sources': [{'id_source': r[0], 'name': r[1],
-                                     'category': r[2], 'language': r[3],
-                                     'article_count': r[4]} for r in rows]}
+                now = time.monotonic()
+                if _sources_cache['body'] is None or now - _sources_cache['at'] >= API_SOURCES_CACHE_TTL:
+                    rows = await gather.db.fetch_sources_with_counts()
+                    body = {'success': True, 'count': len(rows), 'sources': rows}
+                    digest = hashlib.sha1(
+                        json.dumps(rows, sort_keys=True, default=str).encode('utf-8')
+                    ).hexdigest()[:20]
+                    _sources_cache.update(at=now, etag=f'"{digest}"', body=body)
+                etag    = _sources_cache['etag']
+                headers = {'ETag': etag, 'Cache-Control': f'max-age={int(API_SOURCES_CACHE_TTL)}'}
+                if request.headers.get('if-none-match') == etag:
+                    return Response(status_code=304, headers=headers)
+                return JSONResponse(content=_sources_cache['body'], headers=headers)
             except Exception as e:
                 raise _HTTPException(status_code=500, detail=str(e))
 
@@ -3879,6 +4243,8 @@ class NewsGather():
                         "in_flight": cffi_fl + requests_fl + playwright_fl,
                         "pending_db": s["enrich_pending"],
                         "tiers": tiers,
+                        "playwright_net": dict(gather._playwright_worker.net_totals),
+                        "dispatcher": gather._enrich_dispatcher.to_dict() if gather._enrich_dispatcher else None,
                     },
                     "translation": {
                         "stages": {
@@ -3892,6 +4258,10 @@ class NewsGather():
                         "pending_db": s["translate_pending"],
                     },
                     "rss": _rss_progress(gather),
+                    "dns": _dns.to_dict(),
+                    "http_pool": gather.http.to_dict(),
+                    "db_writer": gather.db.write_stats(),
+                    "push":      _push_bus.to_dict(),
                 }
             except Exception as e:
                 raise _HTTPException(status_code=500, detail=str(e))
@@ -3922,7 +4292,7 @@ class NewsGather():
 
         @api_app.get("/api/watchdog")
         async def get_watchdog(
-            mode: str = "recent",        # "recent" | "slow" | "stats" | "lag" | "clear"
+            mode: str = "recent",        # "recent" | "slow" | "stats" | "lag" | "api" | "clear"
             n: int = 100,                # for mode=recent
             min_ms: float = 0.0,         # for mode=recent: min duration filter
             threshold_ms: float = 50.0,  # for mode=slow
@@ -3938,6 +4308,7 @@ class NewsGather():
                              since_s=300 limits to spans in the last 5 minutes
             - mode=lag     → event-loop lag sensor (rolling 60 s window + peak ever)
                              reset_peak=true resets the all-time peak before returning
+            - mode=api     → per-endpoint API latency histograms + read-pool usage
             - mode=clear   → empty the ring buffer
             """
             from loop_watchdog import watchdog as _wd
@@ -3960,6 +4331,10 @@ class NewsGather():
                 if reset_peak:
                     _ls.reset_peak()
                 return {'success': True, 'mode': 'lag', 'data': _ls.stats()}
+            elif mode == "api":
+                return {'success': True, 'mode': 'api',
+                        'data': _api_latency.stats(),
+                        'read_pool': gather.db.api_pool_stats()}
             else:  # recent
                 return {'success': True, 'mode': 'recent', 'n': n, 'min_ms': min_ms,
                         'data': _wd.get_recent(n, min_ms),
@@ -4121,6 +4496,7 @@ if __name__ == '__main__':
     # Run all three collectors in parallel
     async def run_all_collectors():
         await app.open_async_db()
+        await app.http.start()
         app.logger.info("🚀 Starting all news collectors in parallel...")
         app.logger.info(f"   • NewsAPI: every {NEWSAPI_CYCLE_INTERVAL}s ({NEWSAPI_CYCLE_INTERVAL//60} min)")
         app.logger.info(f"   • RSS Feeds: every {RSS_CYCLE_INTERVAL}s ({RSS_CYCLE_INTERVAL//60} min)")
@@ -4170,6 +4546,7 @@ if __name__ == '__main__':
             
             # Wait for all tasks to finish cancellation
             await asyncio.gather(*tasks, return_exceptions=True)
+            await app.http.close()
             if app.db:
                 await app.db.close()
             app.logger.info("🏁 All collectors stopped")
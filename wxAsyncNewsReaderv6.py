@@ -22,6 +22,7 @@ import requests
 import json
 import time
 import asyncio
+import threading
 from typing import Optional, List, Dict
 
 # Article extraction for reader mode
@@ -38,14 +39,23 @@ from asyncio.events import get_event_loop
 import os
 
 from sqlalchemy import (create_engine, Table, Column, Integer, 
-    String, MetaData, Text, select, func, literal_column)
+    String, MetaData, Text, select, func, event, text as sql_text)
+from sqlalchemy.exc import OperationalError
 
 # Load credentials from environment
 from decouple import config
 
+# Decoder for compressed article bodies (zstd is optional)
+import body_codec
+
 # API Configuration
 API_URL = config('NEWS_API_URL', default='http://localhost:8765')
 POLL_INTERVAL_MS = int(config('NEWS_POLL_INTERVAL_MS', default=30000))  # 30 seconds
+# 'sse' = live push via GET /api/stream (falls back to polling), 'poll' = timers only
+PUSH_MODE = str(config('NEWS_PUSH_MODE', default='sse')).lower()
+PUSH_MAX_FAILURES = int(config('NEWS_PUSH_MAX_FAILURES', default=3))  # consecutive failures before falling back to polling
+# Separate article-bodies file used by the collector (ARTICLE_BODIES_DB); '' = main DB
+ARTICLE_BODIES_DB = str(config('ARTICLE_BODIES_DB', default=''))
 
 
 def fix_encoding_if_needed(text):
@@ -111,9 +121,82 @@ def dbOpen():
         connect_args={'timeout': 30, 'check_same_thread': False},
         pool_pre_ping=True
     )
+    if ARTICLE_BODIES_DB:
+        bodies_path = ARTICLE_BODIES_DB
+        if not os.path.isabs(bodies_path):
+            bodies_path = os.path.join(os.path.dirname(db_path), bodies_path)
+
+        @event.listens_for(eng, "connect")
+        def _attach_bodies(dbapi_conn, _record):
+            dbapi_conn.execute("ATTACH DATABASE ? AS bodies", (bodies_path,))
     return eng
 
 
+_BODY_CODEC = body_codec.BodyCodec()
+_BODY_DICT_IDS = set()
+
+
+def loadBodyDicts(con):
+    """Load zstd body dictionaries not seen yet from gm_body_dicts."""
+    try:
+        ids = {r[0] for r in con.execute(sql_text("SELECT dict_id FROM gm_body_dicts")).fetchall()}
+        for dict_id in sorted(ids - _BODY_DICT_IDS):
+            row = con.execute(
+                sql_text("SELECT data FROM gm_body_dicts WHERE dict_id = :d"), {'d': dict_id}
+            ).fetchone()
+            if row:
+                _BODY_CODEC.add_dict(dict_id, row[0])
+                _BODY_DICT_IDS.add(dict_id)
+    except OperationalError:
+        pass
+
+
+def withArticleBodies(con, gm_articles, articles):
+    """
+    Fill content / translated_content of loaded gm_articles rows from
+    gm_article_bodies, where the collector keeps them when bodies are split
+    out (decompressing zstd bodies).  Only the rows on screen are looked up;
+    rows keep their column positions.  Returns the rows unchanged if the
+    table does not exist.
+    """
+    if not articles:
+        return articles
+    keys = list(gm_articles.c.keys())
+    pos = {col: keys.index(col) for col in ('content', 'translated_content') if col in keys}
+    try:
+        bodies = {}
+        ids = [a[0] for a in articles]
+        for i in range(0, len(ids), 500):
+            chunk = ids[i:i + 500]
+            params = {f'id{j}': v for j, v in enumerate(chunk)}
+            rows = con.execute(
+                sql_text(
+                    "SELECT id_article, content, translated_content FROM gm_article_bodies "
+                    f"WHERE id_article IN ({', '.join(':' + k for k in params)})"
+                ),
+                params,
+            ).fetchall()
+            bodies.update({r[0]: r for r in rows})
+    except OperationalError:
+        return articles
+    if not bodies:
+        return articles
+    if any(isinstance(v, bytes) for r in bodies.values() for v in r[1:]):
+        loadBodyDicts(con)
+    patched = []
+    for a in articles:
+        body = bodies.get(a[0])
+        if body is None:
+            patched.append(a)
+            continue
+        row = list(a)
+        for j, col in enumerate(('content', 'translated_content'), start=1):
+            if col in pos and body[j] is not None:
+                row[pos[col]] = _BODY_CODEC.safe_decode(body[j])
+        patched.append(row)
+    return patched
+
+
 class NewsAPIClient:
     """Client for polling new articles from FastAPI server"""
     
@@ -121,12 +204,18 @@ class NewsAPIClient:
         self.api_url = api_url
         self.last_timestamp = 0
         self.enabled = False
+        # Keyset cursor from /api/articles (valid while it still matches last_timestamp)
+        self.article_cursor = None
+        self.article_cursor_ts = 0
+        self.last_event_id = None  # SSE id of the last event seen (resume cursor)
+        self._stream_resp = None
         
     def initialize_timestamp(self):
         """Initialize timestamp with current time after loading articles"""
         try:
             import time
             self.last_timestamp = int(time.time() * 1000)
+            self.article_cursor = None
             self.enabled = True
             logging.info(f"📌 Timestamp initialized: {self.last_timestamp}")
             return self.last_timestamp
@@ -135,55 +224,152 @@ class NewsAPIClient:
             self.enabled = False
         return 0
     
-    def poll_new_articles(self, source_ids=None, limit=50):
-        """Poll for new articles since last check"""
+    def poll_new_articles(self, source_ids=None, limit=50, max_pages=20):
+        """Poll for new articles since last check (newest first).
+
+        Walks /api/articles keyset pages (oldest first, ``next_cursor`` /
+        ``has_more``) so a burst larger than *limit* arrives whole instead
+        of losing its older part.
+        """
         if not self.enabled or self.last_timestamp == 0:
             return []
         
+        collected = []
         try:
             import time
             current_time_ms = int(time.time() * 1000)
             
-            params = {
-                'since': self.last_timestamp,
-                'limit': limit
-            }
-            
-            if source_ids:
-                params['sources'] = ','.join(source_ids)
-            
-            response = requests.get(
-                f"{self.api_url}/api/articles",
-                params=params,
-                timeout=10
-            )
-            
-            if response.status_code == 200:
+            for _ in range(max_pages):
+                params = {'limit': limit}
+                if self.article_cursor and self.article_cursor_ts == self.last_timestamp:
+                    params['cursor'] = self.article_cursor
+                else:
+                    # No cursor yet, or the SSE stream moved last_timestamp on
+                    params['since'] = self.last_timestamp
+                    params['order'] = 'asc'
+                if source_ids:
+                    params['sources'] = ','.join(source_ids)
+                
+                response = requests.get(
+                    f"{self.api_url}/api/articles",
+                    params=params,
+                    timeout=10
+                )
+                if response.status_code != 200:
+                    break
                 data = response.json()
-                if data.get('success'):
-                    articles = data.get('articles', [])
-                    
-                    # Filter out articles with future timestamps (data integrity protection)
-                    valid_articles = [
-                        a for a in articles 
-                        if a.get('inserted_at_ms', 0) <= current_time_ms
-                    ]
-                    
-                    if len(articles) != len(valid_articles):
-                        logging.warning(f"⚠️  Filtered {len(articles) - len(valid_articles)} articles with future timestamps")
-                    
-                    # Update timestamp with the LAST valid article's timestamp (most recent)
-                    if valid_articles:
-                        last_article_ts = valid_articles[0].get('inserted_at_ms', self.last_timestamp)
-                        self.last_timestamp = last_article_ts
-                        logging.info(f"📌 Updated timestamp to: {self.last_timestamp}")
-                    
-                    return valid_articles
+                if not data.get('success'):
+                    break
+                articles = data.get('articles', [])
+                
+                # Filter out articles with future timestamps (data integrity protection)
+                valid_articles = [
+                    a for a in articles 
+                    if a.get('inserted_at_ms', 0) <= current_time_ms
+                ]
+                
+                if len(articles) != len(valid_articles):
+                    logging.warning(f"⚠️  Filtered {len(articles) - len(valid_articles)} articles with future timestamps")
+                
+                collected.extend(valid_articles)
+                self.article_cursor = data.get('next_cursor') or self.article_cursor
+                self.last_timestamp = max(self.last_timestamp,
+                                          data.get('latest_timestamp') or self.last_timestamp)
+                self.article_cursor_ts = self.last_timestamp
+                if not data.get('has_more'):
+                    break
+            
+            if collected:
+                logging.info(f"📌 Updated timestamp to: {self.last_timestamp}")
         except Exception as e:
             logging.warning(f"Failed to poll new articles: {e}")
         
-        return []
+        # Pages are oldest first; callers insert newest first
+        collected.reverse()
+        return collected
     
+    def stream_events(self, on_articles, on_translations, stop_event,
+                      source_ids=None, translations_since=None):
+        """
+        Consume GET /api/stream (server-sent events) until *stop_event* is set
+        or the server ends the stream.  Blocking — run it in an executor.
+        Raises on connection / HTTP errors so the caller can back off.
+
+        on_articles(articles)            — newest first, like poll_new_articles
+        on_translations(updates, ts)     — same rows as /api/articles/translations
+        """
+        params = {'since': self.last_timestamp}
+        if translations_since:
+            params['translations_since'] = translations_since
+        if source_ids:
+            params['sources'] = ','.join(source_ids)
+        headers = {'Accept': 'text/event-stream'}
+        if self.last_event_id is not None:
+            headers['Last-Event-ID'] = str(self.last_event_id)
+
+        # Read timeout > server heartbeat (15 s) so a silent socket is detected
+        with requests.get(f"{self.api_url}/api/stream", params=params, headers=headers,
+                          stream=True, timeout=(10, 60)) as response:
+            response.raise_for_status()
+            response.encoding = 'utf-8'
+            self._stream_resp = response
+            logging.info("📡 Push stream connected")
+            event, data = None, []
+            try:
+                # chunk_size=None → yield data as it arrives, no 512-byte buffering
+                for line in response.iter_lines(chunk_size=None, decode_unicode=True):
+                    if stop_event.is_set():
+                        break
+                    if not line:
+                        if data:
+                            self._dispatch_event(event, '\n'.join(data),
+                                                 on_articles, on_translations)
+                        event, data = None, []
+                        continue
+                    if line.startswith(':'):
+                        continue  # comment / heartbeat
+                    field, _, value = line.partition(':')
+                    if value.startswith(' '):
+                        value = value[1:]
+                    if field == 'event':
+                        event = value
+                    elif field == 'data':
+                        data.append(value)
+                    elif field == 'id' and value.isdigit():
+                        self.last_event_id = int(value)
+            finally:
+                self._stream_resp = None
+
+    def _dispatch_event(self, event, data, on_articles, on_translations):
+        """Decode one SSE frame and hand its rows to the matching callback."""
+        try:
+            payload = json.loads(data)
+        except ValueError:
+            logging.warning(f"⚠️  Malformed push event ({event})")
+            return
+        items = payload.get('items') or []
+        if not items:
+            return
+        if event == 'articles':
+            current_time_ms = int(time.time() * 1000)
+            valid = [a for a in items if (a.get('inserted_at_ms') or 0) <= current_time_ms]
+            if not valid:
+                return
+            self.last_timestamp = max(self.last_timestamp,
+                                      max(a.get('inserted_at_ms') or 0 for a in valid))
+            on_articles(list(reversed(valid)))  # stream is oldest first
+        elif event == 'translations':
+            on_translations(items, payload.get('ts') or 0)
+
+    def close_stream(self):
+        """Abort a blocking stream_events() call from another thread."""
+        resp = self._stream_resp
+        if resp is not None:
+            try:
+                resp.close()
+            except Exception:
+                pass
+
     def is_enabled(self):
         """Check if API polling is enabled"""
         return self.enabled
@@ -647,6 +833,8 @@ class NewsPanel(wx.Panel):
         self.polling_enabled = False
         self.translation_last_ts = 0  # tracks translated_at_ms for update polling
         self.current_source_ids = []  # Track currently displayed sources
+        self.push_active = False      # live SSE stream running instead of poll timers
+        self._push_stop = None        # threading.Event of the current stream connection
         
         # Load data
         wx.CallAfter(self.LoadSources)
@@ -655,6 +843,14 @@ class NewsPanel(wx.Panel):
         # Setup polling timer (will start after API initialization)
         self.poll_timer = wx.Timer(self)
         self.Bind(wx.EVT_TIMER, self.OnPollTimer, self.poll_timer)
+        self.Bind(wx.EVT_WINDOW_DESTROY, self.OnDestroy)
+
+    def OnDestroy(self, event):
+        """Close the live stream so its executor thread does not outlive the UI."""
+        if event.GetEventObject() is self:
+            self.push_active = False
+            self.StopPushConnection()
+        event.Skip()
     
     def InitializeAPIPolling(self):
         """Enable API client (timestamp will be set after first article load)"""
@@ -667,16 +863,82 @@ class NewsPanel(wx.Panel):
         timestamp = self.api_client.initialize_timestamp()
         if timestamp > 0:
             self.polling_enabled = True
-            self.poll_timer.Start(POLL_INTERVAL_MS)
-            # Start translation-update polling: look back 1 min to catch anything
-            # just translated while the initial article load was running
+            # Look back 1 min for translations to catch anything just
+            # translated while the initial article load was running
             self.translation_last_ts = int(time.time() * 1000) - 60_000
             self.translation_poll_timer = wx.Timer(self)
             self.Bind(wx.EVT_TIMER, self.OnTranslationPollTimer, self.translation_poll_timer)
-            self.translation_poll_timer.Start(POLL_INTERVAL_MS)
-            logging.info(f"✅ Polling started (every {POLL_INTERVAL_MS/1000}s)")
+            if PUSH_MODE == 'sse':
+                self.push_active = True
+                asyncio.create_task(self.run_push_stream_async())
+            else:
+                self.StartPollTimers()
         else:
             logging.warning("⚠️  Failed to initialize timestamp")
+
+    def StartPollTimers(self):
+        """Start the article + translation poll timers (poll mode / SSE fallback)."""
+        self.poll_timer.Start(POLL_INTERVAL_MS)
+        self.translation_poll_timer.Start(POLL_INTERVAL_MS)
+        logging.info(f"✅ Polling started (every {POLL_INTERVAL_MS/1000}s)")
+
+    def RestartPushStream(self):
+        """Reconnect the live stream so it picks up a new source filter."""
+        if self.push_active:
+            self.StopPushConnection()
+
+    def StopPushConnection(self):
+        """Signal the current stream connection to end and abort its socket."""
+        if self._push_stop is not None:
+            self._push_stop.set()
+            self.api_client.close_stream()
+
+    async def run_push_stream_async(self):
+        """
+        Keep a GET /api/stream connection open, reconnecting with backoff.
+        Falls back to the poll timers after PUSH_MAX_FAILURES consecutive
+        failed connections (e.g. a server without the push endpoint).
+        """
+        loop = asyncio.get_event_loop()
+
+        def _on_articles(articles):
+            logging.info(f"📡 Push: {len(articles)} new article(s)")
+            wx.CallAfter(self.InsertNewArticles, articles)
+
+        def _on_translations(updates, ts):
+            self.translation_last_ts = max(self.translation_last_ts, ts)
+            logging.info(f"\U0001f310 Push: {len(updates)} article(s) translated")
+            wx.CallAfter(self.ApplyTranslationUpdates, updates)
+
+        failures = 0
+        while self.push_active and self.polling_enabled:
+            stop = threading.Event()
+            self._push_stop = stop
+            source_ids = list(self.current_source_ids) or None
+            since_tr = self.translation_last_ts
+            try:
+                await loop.run_in_executor(
+                    None,
+                    lambda: self.api_client.stream_events(
+                        _on_articles, _on_translations, stop,
+                        source_ids=source_ids, translations_since=since_tr,
+                    ),
+                )
+                failures = 0
+                if not stop.is_set():
+                    await asyncio.sleep(1)  # server ended the stream (restart / lag)
+            except Exception as e:
+                if stop.is_set():
+                    continue  # closed on purpose (source filter changed)
+                failures += 1
+                if failures >= PUSH_MAX_FAILURES:
+                    logging.warning(f"⚠️  Push stream unavailable ({e}) — falling back to polling")
+                    self.push_active = False
+                    wx.CallAfter(self.StartPollTimers)
+                    return
+                delay = min(2 ** failures, 60)
+                logging.warning(f"⚠️  Push stream error: {e} — reconnecting in {delay}s")
+                await asyncio.sleep(delay)
     
     def OnTranslationPollTimer(self, event):
         """Timer: poll for articles that were translated since last check."""
@@ -977,6 +1239,7 @@ class NewsPanel(wx.Panel):
                 
                 # Get sources with article counts
                 MIN_ARTICLES = 10
+                now_epoch = int(time.time())
                 
                 stm = select(gm_sources)
                 rs = con.execute(stm)
@@ -991,9 +1254,9 @@ class NewsPanel(wx.Panel):
                         gm_articles.c.id_source == source_id
                     ).where(
                         # CRITICAL: Never count articles with future timestamps
-                        # Must convert published_at_gmt (ISO format with 'T') to datetime for correct comparison
-                        (gm_articles.c.published_at_gmt.is_(None)) | 
-                        (literal_column("datetime(published_at_gmt)") <= literal_column("datetime('now')"))
+                        # Integer epoch → covered by idx_articles_source_epoch
+                        (gm_articles.c.published_at_epoch.is_(None)) |
+                        (gm_articles.c.published_at_epoch <= now_epoch)
                     )
                     article_count = con.execute(stm_count).scalar() or 0
                     
@@ -1683,12 +1946,14 @@ class NewsPanel(wx.Panel):
         if not checked_source_ids:
             wx.CallAfter(self.ShowWelcomeMessage)
             self.current_source_ids = []
+            self.RestartPushStream()
             return
         
         print(f"\n=== Loading articles from {len(checked_source_ids)} checked sources (Async) ===")
         
         # Update current source IDs for polling
         self.current_source_ids = checked_source_ids
+        self.RestartPushStream()
         
         try:
             loop = asyncio.get_event_loop()
@@ -1703,13 +1968,14 @@ class NewsPanel(wx.Panel):
                 
                 # Load articles from all checked sources
                 # CRITICAL: Never return articles with future timestamps (not even 1 second)
-                # Must convert published_at_gmt (ISO format with 'T') to datetime for correct comparison
+                # Integer epoch → index range scan on (id_source, published_at_epoch DESC)
+                now_epoch = int(time.time())
                 stm = select(gm_articles).where(
                     gm_articles.c.id_source.in_(checked_source_ids),
-                    (gm_articles.c.published_at_gmt.is_(None)) | (literal_column("datetime(published_at_gmt)") <= literal_column("datetime('now')"))
-                ).order_by(gm_articles.c.published_at_gmt.desc().nullslast()).limit(200)
+                    (gm_articles.c.published_at_epoch.is_(None)) | (gm_articles.c.published_at_epoch <= now_epoch)
+                ).order_by(gm_articles.c.published_at_epoch.desc().nullslast()).limit(200)
                 
-                articles = con.execute(stm).fetchall()
+                articles = withArticleBodies(con, gm_articles, con.execute(stm).fetchall())
                 con.close()
                 
                 return articles
@@ -1756,6 +2022,7 @@ class NewsPanel(wx.Panel):
             
             # Update current source IDs for polling
             self.current_source_ids = [source_id]
+            self.RestartPushStream()
             
             loop = asyncio.get_event_loop()
             
@@ -1767,15 +2034,16 @@ class NewsPanel(wx.Panel):
                 
                 con = eng.connect()
                 
-                # Load articles for this source, prefer published_at_gmt
+                # Load articles for this source, newest published first
                 # CRITICAL: Never return articles with future timestamps (not even 1 second)
-                # Must convert published_at_gmt (ISO format with 'T') to datetime for correct comparison
+                # Integer epoch → index range scan on (id_source, published_at_epoch DESC)
+                now_epoch = int(time.time())
                 stm = select(gm_articles).where(
                     gm_articles.c.id_source == source_id,
-                    (gm_articles.c.published_at_gmt.is_(None)) | (literal_column("datetime(published_at_gmt)") <= literal_column("datetime('now')"))
-                ).order_by(gm_articles.c.published_at_gmt.desc().nullslast()).limit(50)
+                    (gm_articles.c.published_at_epoch.is_(None)) | (gm_articles.c.published_at_epoch <= now_epoch)
+                ).order_by(gm_articles.c.published_at_epoch.desc().nullslast()).limit(50)
                 
-                articles = con.execute(stm).fetchall()
+                articles = withArticleBodies(con, gm_articles, con.execute(stm).fetchall())
                 con.close()
                 
                 return articles